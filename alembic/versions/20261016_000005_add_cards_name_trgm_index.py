@@ -0,0 +1,51 @@
+"""add trigram index on cards.name
+
+Revision ID: 20261016_000005
+Revises: 20260215_000004
+Create Date: 2026-10-16 00:00:05
+
+Backs the ``name ILIKE '%q%'`` search in PostgresCardRepository with a
+GIN ``gin_trgm_ops`` index.  ``pg_trgm`` ships with the standard
+PostgreSQL contrib package; on servers without it the index is skipped
+and search keeps working as a sequential scan.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016_000005"
+down_revision = "20260215_000004"
+branch_labels = None
+depends_on = None
+
+_INDEX_NAME = "ix_cards_name_trgm"
+
+
+def _pg_trgm_available() -> bool:
+    bind = op.get_bind()
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    if not _pg_trgm_available():
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        _INDEX_NAME,
+        "cards",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {_INDEX_NAME}")
@@ -0,0 +1,35 @@
+"""create user_lockouts table
+
+Revision ID: 20261016_000006
+Revises: 20261016_000005
+Create Date: 2026-10-16 00:00:06
+
+Moves login lockout counters out of process memory so every worker
+shares them (``PostgresUserStore``).
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016_000006"
+down_revision = "20261016_000005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_lockouts",
+        sa.Column("username", sa.String(length=255), nullable=False),
+        sa.Column("fail_count", sa.Integer(), nullable=False),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("username"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_lockouts")
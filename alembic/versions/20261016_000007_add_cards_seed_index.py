@@ -0,0 +1,27 @@
+"""add index on cards.seed
+
+Revision ID: 20261016_000007
+Revises: 20261016_000006
+Create Date: 2026-10-16 00:00:07
+
+Backs ``PostgresCardRepository.find_by_seed`` (the "apply seed" flow in
+the UI) with a B-tree index instead of a sequential scan.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016_000007"
+down_revision = "20261016_000006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_cards_seed", "cards", ["seed"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cards_seed", table_name="cards")
@@ -0,0 +1,4 @@
+"""Performance benchmarks for scenario generation and map rendering.
+
+Run with ``python -m benchmarks`` (see ``docs/testing/benchmarks.md``).
+"""
@@ -0,0 +1,115 @@
+"""Benchmark runner CLI.
+
+Usage::
+
+    python -m benchmarks                          # run, print a table
+    python -m benchmarks -k render --quick        # subset, short rounds
+    python -m benchmarks --output results.json    # save JSON results
+    python -m benchmarks --compare benchmarks/baseline.json --threshold 0.2
+    python -m benchmarks --save-baseline          # refresh the stored baseline
+
+Exit status is 1 when ``--compare`` finds a regression, 0 otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from benchmarks.cases import all_cases  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    DEFAULT_MIN_TIME_S,
+    DEFAULT_ROUNDS,
+    DEFAULT_THRESHOLD,
+    compare,
+    format_comparisons,
+    format_results,
+    has_regressions,
+    load_results,
+    results_to_json,
+    run_case,
+)
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+QUICK_ROUNDS = 3
+QUICK_MIN_TIME_S = 0.05
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "-k", dest="filter", default="", help="only run cases whose name contains this"
+    )
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME_S,
+        help="minimum seconds per round (calls per round are calibrated)",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help=f"{QUICK_ROUNDS} rounds of {QUICK_MIN_TIME_S}s (smoke runs)",
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as a fraction (0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"write results to {BASELINE_PATH.relative_to(ROOT)}",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    rounds, min_time = args.rounds, args.min_time
+    if args.quick:
+        rounds, min_time = QUICK_ROUNDS, QUICK_MIN_TIME_S
+
+    cases = [c for c in all_cases() if args.filter in c.name]
+    if not cases:
+        print(f"no benchmark matches {args.filter!r}", file=sys.stderr)
+        return 2
+
+    results = []
+    for case in cases:
+        print(f"running {case.name} ...", file=sys.stderr, flush=True)
+        results.append(run_case(case, rounds=rounds, min_time=min_time))
+    print(format_results(results))
+
+    document = results_to_json(results)
+    for path in filter(None, (args.output, args.save_baseline and BASELINE_PATH)):
+        path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        print(f"results written to {path}", file=sys.stderr)
+
+    if args.compare is None:
+        return 0
+    comparisons = compare(document, load_results(args.compare), args.threshold)
+    if args.filter:
+        comparisons = [c for c in comparisons if args.filter in c.name]
+    print()
+    print(format_comparisons(comparisons))
+    if has_regressions(comparisons):
+        print(f"FAIL: regression over {args.threshold:.0%} threshold", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
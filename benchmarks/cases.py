@@ -0,0 +1,263 @@
+"""Benchmark case catalog.
+
+Cases are grouped by the code they exercise:
+
+- ``generate``: ``BasicScenarioGenerator.generate_shapes`` over a fixed
+  seed set, per table preset.
+- ``card``: ``GenerateScenarioCard.execute`` driven by
+  ``generate_from_seed``, per table preset.
+- ``collision``: ``find_first_collision`` on collision-free layouts (the
+  worst case: every candidate pair is tested) per shape count and
+  covered-area density.
+- ``render``: ``SvgMapRenderer.render`` and the list thumbnail per table
+  size and shape count.
+- ``normalize``: ``normalize_svg_xml`` on rendered maps per shape count.
+
+Every workload is deterministic, so results only move when the code does.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+
+from domain.maps.collision import MIN_CLEARANCE_MM
+
+from benchmarks.harness import BenchCase
+
+# Table sizes in mm: the two presets plus the largest custom table allowed.
+TABLE_SIZES: dict[str, tuple[int, int]] = {
+    "standard": (1200, 1200),
+    "massive": (1800, 1200),
+    "max_custom": (3000, 3000),
+}
+SEEDS: tuple[int, ...] = tuple(range(1, 51))
+CARD_SEEDS: tuple[int, ...] = tuple(range(1, 21))
+SHAPE_COUNTS: tuple[int, ...] = (3, 25, 100)
+COLLISION_SHAPE_COUNTS: tuple[int, ...] = (10, 50, 200)
+COLLISION_DENSITIES: tuple[float, ...] = (0.05, 0.2, 0.4)
+THUMBNAIL_SIZES_PX: tuple[int, ...] = (100, 300)
+
+
+def grid_layout(
+    count: int, width_mm: int, height_mm: int, density: float = 0.2
+) -> list[dict]:
+    """Build *count* non-colliding solid shapes covering ~*density* of the table.
+
+    Shapes sit one per grid cell and cycle through rect, circle and
+    polygon; each is shrunk as needed to keep ``MIN_CLEARANCE_MM`` from
+    its neighbours, so the effective density may be lower than asked.
+    """
+    cols = math.ceil(math.sqrt(count * width_mm / height_mm))
+    rows = math.ceil(count / cols)
+    cell_w = width_mm // cols
+    cell_h = height_mm // rows
+    side = math.sqrt(density * width_mm * height_mm / count)
+    side = int(min(side, min(cell_w, cell_h) - 2 * MIN_CLEARANCE_MM))
+    half = side // 2
+    shapes: list[dict] = []
+    for i in range(count):
+        cx = (i % cols) * cell_w + cell_w // 2
+        cy = (i // cols) * cell_h + cell_h // 2
+        kind = ("rect", "circle", "polygon")[i % 3]
+        if kind == "rect":
+            shape = {
+                "type": "rect",
+                "x": cx - half,
+                "y": cy - half,
+                "width": side,
+                "height": side,
+            }
+        elif kind == "circle":
+            shape = {"type": "circle", "cx": cx, "cy": cy, "r": half}
+        else:
+            shape = {
+                "type": "polygon",
+                "points": [
+                    {"x": cx, "y": cy - half},
+                    {"x": cx + half, "y": cy + half},
+                    {"x": cx - half, "y": cy + half},
+                ],
+            }
+        shape["allow_overlap"] = False
+        shape["description"] = f"piece {i}"
+        shapes.append(shape)
+    return shapes
+
+
+def _table_mm(table: str) -> dict:
+    width, height = TABLE_SIZES[table]
+    return {"width_mm": width, "height_mm": height}
+
+
+def _generate_case(table: str) -> Callable[[], Callable[[], object]]:
+    def setup() -> Callable[[], object]:
+        from domain.cards.card import GameMode
+        from domain.maps.table_size import TableSize
+        from infrastructure.scenario_generation.basic_scenario_generator import (
+            BasicScenarioGenerator,
+        )
+
+        generator = BasicScenarioGenerator()
+        size = TableSize(*TABLE_SIZES[table])
+
+        def run() -> object:
+            for seed in SEEDS:
+                generator.generate_shapes(seed, size, GameMode.MATCHED)
+            return None
+
+        return run
+
+    return setup
+
+
+def _card_case(preset: str) -> Callable[[], Callable[[], object]]:
+    def setup() -> Callable[[], object]:
+        from application.use_cases.generate_scenario_card import (
+            GenerateScenarioCard,
+            GenerateScenarioCardRequest,
+        )
+        from infrastructure.generators.secure_seed_generator import (
+            SecureSeedGenerator,
+        )
+        from infrastructure.generators.uuid_id_generator import UuidIdGenerator
+        from infrastructure.scenario_generation.basic_scenario_generator import (
+            BasicScenarioGenerator,
+        )
+
+        use_case = GenerateScenarioCard(
+            id_generator=UuidIdGenerator(),
+            seed_generator=SecureSeedGenerator(),
+            scenario_generator=BasicScenarioGenerator(),
+        )
+        requests = [
+            GenerateScenarioCardRequest(
+                actor_id="bench",
+                mode="matched",
+                seed=None,
+                table_preset=preset,
+                visibility="private",
+                shared_with=None,
+                is_replicable=True,
+                generate_from_seed=seed,
+            )
+            for seed in CARD_SEEDS
+        ]
+
+        def run() -> object:
+            for request in requests:
+                use_case.execute(request)
+            return None
+
+        return run
+
+    return setup
+
+
+def _collision_case(count: int, density: float) -> Callable[[], Callable[[], object]]:
+    def setup() -> Callable[[], object]:
+        from domain.maps.collision import find_first_collision
+
+        shapes = grid_layout(count, *TABLE_SIZES["standard"], density=density)
+        assert find_first_collision(shapes) is None
+        return lambda: find_first_collision(shapes)
+
+    return setup
+
+
+def _render_case(table: str, count: int) -> Callable[[], Callable[[], object]]:
+    def setup() -> Callable[[], object]:
+        from infrastructure.maps.svg_map_renderer import SvgMapRenderer
+
+        table_mm = _table_mm(table)
+        shapes = grid_layout(count, *TABLE_SIZES[table])
+        return lambda: SvgMapRenderer().render(table_mm=table_mm, shapes=shapes)
+
+    return setup
+
+
+def _thumbnail_case(size_px: int) -> Callable[[], Callable[[], object]]:
+    def setup() -> Callable[[], object]:
+        from infrastructure.maps.thumbnail_renderer import render_thumbnail_svg
+
+        table_mm = _table_mm("standard")
+        shapes = grid_layout(25, *TABLE_SIZES["standard"])
+        return lambda: render_thumbnail_svg(table_mm, shapes, size_px)
+
+    return setup
+
+
+def _normalize_case(count: int) -> Callable[[], Callable[[], object]]:
+    def setup() -> Callable[[], object]:
+        from adapters.http_flask.svg_sanitizer import normalize_svg_xml
+        from infrastructure.maps.svg_map_renderer import SvgMapRenderer
+
+        svg = SvgMapRenderer().render(
+            table_mm=_table_mm("standard"),
+            shapes=grid_layout(count, *TABLE_SIZES["standard"]),
+        )
+        return lambda: normalize_svg_xml(svg)
+
+    return setup
+
+
+def all_cases() -> list[BenchCase]:
+    """Return every benchmark case, in reporting order."""
+    cases: list[BenchCase] = []
+    for table in TABLE_SIZES:
+        cases.append(
+            BenchCase(
+                name=f"generate.shapes[{table}]",
+                group="generate",
+                setup=_generate_case(table),
+                params={"table": table, "seeds": len(SEEDS)},
+            )
+        )
+    for preset in ("standard", "massive"):
+        cases.append(
+            BenchCase(
+                name=f"card.generate_from_seed[{preset}]",
+                group="card",
+                setup=_card_case(preset),
+                params={"table": preset, "seeds": len(CARD_SEEDS)},
+            )
+        )
+    for count in COLLISION_SHAPE_COUNTS:
+        for density in COLLISION_DENSITIES:
+            cases.append(
+                BenchCase(
+                    name=f"collision.find_first[n={count},density={density}]",
+                    group="collision",
+                    setup=_collision_case(count, density),
+                    params={"shapes": count, "density": density},
+                )
+            )
+    for table in TABLE_SIZES:
+        for count in SHAPE_COUNTS:
+            cases.append(
+                BenchCase(
+                    name=f"render.svg[{table},n={count}]",
+                    group="render",
+                    setup=_render_case(table, count),
+                    params={"table": table, "shapes": count},
+                )
+            )
+    for size_px in THUMBNAIL_SIZES_PX:
+        cases.append(
+            BenchCase(
+                name=f"render.thumbnail[{size_px}px]",
+                group="render",
+                setup=_thumbnail_case(size_px),
+                params={"size_px": size_px, "shapes": 25},
+            )
+        )
+    for count in SHAPE_COUNTS:
+        cases.append(
+            BenchCase(
+                name=f"normalize.svg_xml[n={count}]",
+                group="normalize",
+                setup=_normalize_case(count),
+                params={"shapes": count},
+            )
+        )
+    return cases
@@ -0,0 +1,236 @@
+"""Benchmark harness: timing, JSON results and baseline comparison.
+
+A :class:`BenchCase` builds its workload in ``setup`` (untimed) and
+returns a zero-argument callable; :func:`run_case` calibrates how many
+calls fit in ``min_time`` seconds and reports per-call statistics over
+several rounds.  Results are plain JSON so they can be stored as a
+baseline and compared by :func:`compare` on a later run.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+RESULTS_SCHEMA_VERSION = 1
+DEFAULT_ROUNDS = 5
+DEFAULT_MIN_TIME_S = 0.2
+# A case is a regression when its median is more than 25% slower.
+DEFAULT_THRESHOLD = 0.25
+
+STATUS_OK = "ok"
+STATUS_REGRESSED = "regressed"
+STATUS_IMPROVED = "improved"
+STATUS_NEW = "new"
+STATUS_MISSING = "missing"
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """One named, parametrized workload."""
+
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], object]]
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Per-call timings of one case (seconds)."""
+
+    name: str
+    group: str
+    params: dict[str, Any]
+    rounds: int
+    loops: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    stdev_s: float
+
+    @property
+    def ops_per_s(self) -> float:
+        return 1.0 / self.median_s if self.median_s > 0 else float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "group": self.group,
+            "params": self.params,
+            "rounds": self.rounds,
+            "loops": self.loops,
+            "min_s": self.min_s,
+            "median_s": self.median_s,
+            "mean_s": self.mean_s,
+            "stdev_s": self.stdev_s,
+        }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Current vs baseline median for one case."""
+
+    name: str
+    status: str
+    baseline_s: float | None
+    current_s: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline_s or self.current_s is None:
+            return None
+        return self.current_s / self.baseline_s
+
+
+def _calibrate(fn: Callable[[], object], min_time: float) -> int:
+    """Return the number of calls per round that takes at least *min_time*."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return loops
+        # Aim slightly past min_time; never grow by more than 10x at once.
+        factor = min_time * 1.2 / elapsed if elapsed > 0 else 10.0
+        loops = max(loops + 1, int(loops * min(factor, 10.0)))
+
+
+def run_case(
+    case: BenchCase,
+    *,
+    rounds: int = DEFAULT_ROUNDS,
+    min_time: float = DEFAULT_MIN_TIME_S,
+) -> BenchResult:
+    """Time *case* and return per-call statistics.
+
+    Raises:
+        ValueError: If rounds or min_time is not positive.
+    """
+    if rounds < 1 or min_time <= 0:
+        raise ValueError("rounds and min_time must be positive")
+    fn = case.setup()
+    fn()  # warm-up (imports, caches)
+    loops = _calibrate(fn, min_time)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return BenchResult(
+        name=case.name,
+        group=case.group,
+        params=dict(case.params),
+        rounds=rounds,
+        loops=loops,
+        min_s=min(samples),
+        median_s=statistics.median(samples),
+        mean_s=statistics.fmean(samples),
+        stdev_s=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def results_to_json(results: Iterable[BenchResult]) -> dict[str, Any]:
+    """Build the JSON document written by the runner."""
+    return {
+        "schema": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {r.name: r.to_dict() for r in results},
+    }
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Load a results document written by :func:`results_to_json`.
+
+    Raises:
+        ValueError: If the file is not a supported results document.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("schema") != RESULTS_SCHEMA_VERSION:
+        raise ValueError(f"{path} is not a schema {RESULTS_SCHEMA_VERSION} result")
+    return data
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare two results documents case by case (by median time).
+
+    A case is ``regressed`` when it is more than ``threshold`` (a
+    fraction, 0.25 = 25%) slower than the baseline and ``improved``
+    when it is that much faster.  Cases only in one document are
+    reported as ``new`` / ``missing``.
+
+    Raises:
+        ValueError: If threshold is negative.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must not be negative")
+    cur = current["results"]
+    base = baseline["results"]
+    comparisons = []
+    for name in sorted(cur.keys() | base.keys()):
+        current_s = cur[name]["median_s"] if name in cur else None
+        baseline_s = base[name]["median_s"] if name in base else None
+        if current_s is None:
+            status = STATUS_MISSING
+        elif baseline_s is None:
+            status = STATUS_NEW
+        elif current_s > baseline_s * (1 + threshold):
+            status = STATUS_REGRESSED
+        elif current_s * (1 + threshold) < baseline_s:
+            status = STATUS_IMPROVED
+        else:
+            status = STATUS_OK
+        comparisons.append(Comparison(name, status, baseline_s, current_s))
+    return comparisons
+
+
+def has_regressions(comparisons: Iterable[Comparison]) -> bool:
+    """Return True when any comparison is a regression."""
+    return any(c.status == STATUS_REGRESSED for c in comparisons)
+
+
+def _fmt_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def format_results(results: Iterable[BenchResult]) -> str:
+    """Render results as a fixed-width text table."""
+    lines = [f"{'case':<52} {'median':>10} {'stdev':>10} {'ops/s':>12}"]
+    for r in results:
+        lines.append(
+            f"{r.name:<52} {_fmt_time(r.median_s):>10} "
+            f"{_fmt_time(r.stdev_s):>10} {r.ops_per_s:>12,.0f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: Iterable[Comparison]) -> str:
+    """Render a baseline comparison as a fixed-width text table."""
+    lines = [f"{'case':<52} {'baseline':>10} {'current':>10} {'ratio':>7}  status"]
+    for c in comparisons:
+        ratio = "-" if c.ratio is None else f"{c.ratio:.2f}x"
+        lines.append(
+            f"{c.name:<52} {_fmt_time(c.baseline_s):>10} "
+            f"{_fmt_time(c.current_s):>10} {ratio:>7}  {c.status}"
+        )
+    return "\n".join(lines)
@@ -6,22 +6,43 @@ to Gradio at ``/sb/``.
 
 Routing priority:
 1. ``GET /``  → redirect to ``/sb/``
-2. ``/sb/**`` → Gradio Blocks application (with sub-route redirects)
-3. Everything else (``/auth/*``, ``/cards/*``, ``/health``, ``/login``, …) → Flask
+2. Hot read-only endpoints (``GET /cards``, ``/cards/<id>``,
+   ``/cards/<id>/map.svg``, ``/favorites``, ``/presets``, ``/health*``)
+   → native async routes (``adapters.http_asgi.read_routes``)
+3. ``/sb/**`` → Gradio Blocks application (with sub-route redirects)
+4. Everything else (``/auth/*``, card writes, ``/login``, …) → Flask
+
+Startup:
+- Each construction phase is timed (``StartupTimer``), logged once and
+  kept on ``app.state.startup_timings``; ``python -m
+  adapters.startup_report`` turns it into a cold-start report.
+
+Background work:
+- The session janitor (PostgreSQL session store only) runs for the
+  lifetime of the app: started on startup, stopped on shutdown.
+- The native read routes' executor is shut down on shutdown.
 """
 
 from __future__ import annotations
 
+import logging
 import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from urllib.parse import urlencode
 
 import gradio as gr
 from a2wsgi import WSGIMiddleware
+from adapters.http_asgi.read_routes import build_read_router, make_read_executor
 from adapters.http_flask.app import create_app as create_flask_app
 from adapters.ui_gradio.app import build_app as build_gradio_app
 from adapters.ui_gradio.ui.router import PAGE_TO_URL
 from fastapi import FastAPI, Request
 from fastapi.responses import RedirectResponse
+from infrastructure.bootstrap import get_session_janitor
+from infrastructure.observability.startup import StartupTimer
+
+logger = logging.getLogger(__name__)
 
 # Query-param names allowed to be forwarded through sub-route redirects.
 _FORWARD_PARAMS: frozenset[str] = frozenset({"id", "seed", "mode", "filter"})
@@ -29,6 +50,22 @@ _FORWARD_PARAMS: frozenset[str] = frozenset({"id", "seed", "mode", "filter"})
 _SAFE_PARAM_VALUE = re.compile(r"^[\w\-.:]+$")
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the session janitor (if configured) while the app is serving."""
+    janitor = get_session_janitor()
+    if janitor is not None:
+        janitor.start()
+    try:
+        yield
+    finally:
+        if janitor is not None:
+            janitor.close()
+        read_executor = getattr(app.state, "read_executor", None)
+        if read_executor is not None:
+            read_executor.shutdown(wait=False)
+
+
 def create_combined_app() -> FastAPI:
     """Build the unified ASGI application.
 
@@ -36,17 +73,22 @@ def create_combined_app() -> FastAPI:
     initialises the PostgreSQL session store, user seeding, and all
     repository backends **before** Gradio tries to use them.
     """
+    timer = StartupTimer()
+
     # 1. Flask — auth authority + REST API (also triggers build_services())
-    flask_app = create_flask_app()
+    with timer.phase("flask"):
+        flask_app = create_flask_app()
 
     # 2. Gradio — UI only (no login form, reads cookie on load)
-    gradio_blocks = build_gradio_app()
+    with timer.phase("gradio"):
+        gradio_blocks = build_gradio_app()
 
     # 3. FastAPI shell
     main_app = FastAPI(
         title="ScenarioBuilder",
         docs_url=None,
         redoc_url=None,
+        lifespan=_lifespan,
     )
 
     # Root redirect → UI
@@ -88,12 +130,22 @@ def create_combined_app() -> FastAPI:
         main_app.add_api_route(clean, _make_redirect(page_name), methods=["GET"])
         main_app.add_api_route(clean + "/", _make_redirect(page_name), methods=["GET"])
 
+    # Native read routes — registered before the Flask catch-all mount
+    read_executor = make_read_executor()
+    main_app.state.read_executor = read_executor
+    main_app.include_router(
+        build_read_router(flask_app.config["services"], read_executor)
+    )
+
     # Mount Gradio at /sb (ASGI sub-app handled by gradio)
-    main_app = gr.mount_gradio_app(main_app, gradio_blocks, path="/sb")
+    with timer.phase("mount"):
+        main_app = gr.mount_gradio_app(main_app, gradio_blocks, path="/sb")
 
     # Mount Flask as WSGI catch-all (auth, API, /login, /health, etc.)
     main_app.mount("/", WSGIMiddleware(flask_app))  # type: ignore[arg-type]
 
+    main_app.state.startup_timings = timer.as_dict()
+    logger.info("startup: %s", timer.summary())
     return main_app
 
 
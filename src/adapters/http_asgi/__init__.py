@@ -0,0 +1 @@
+"""Native ASGI (FastAPI) adapter for the hot read-only endpoints."""
@@ -0,0 +1,307 @@
+"""Native async read routes for the combined app.
+
+``combined_app`` serves Flask behind ``a2wsgi.WSGIMiddleware``: every
+request holds one of the bridge's worker threads for its whole lifetime,
+which caps concurrency under load.  The hot read-only endpoints are
+served here as FastAPI routes, registered ahead of the Flask mount:
+
+- ``GET /cards``, ``GET /cards/{card_id}``, ``GET /cards/{card_id}/map.svg``
+- ``GET /favorites``, ``GET /presets``
+- ``GET /health``; ``GET /health/db`` and ``GET /health/password-hashing``
+  (``ADMIN_DIAGNOSTICS_TOKEN``)
+
+They call the same use cases (the Flask app's ``Services``), apply the
+same session, auth and CSRF checks (``adapters.http_flask.middleware``)
+and build the same JSON bodies and error contract.  The blocking part of
+each request (session lookup + use case) runs on a bounded
+``ThreadPoolExecutor`` sized by ``ASGI_READ_WORKERS`` (default 16), under
+the request profiler when the request carries its admin token.  Large
+JSON and SVG bodies are gzip/brotli-encoded there too, as the Flask
+``after_request`` hook does (``infrastructure.compression``).
+
+Every other method and path (``POST /cards``, ``/auth/*``, ``/login``, …)
+still falls through to Flask.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from adapters.http_flask.constants import KEY_CARD_IDS, KEY_STATUS, STATUS_OK
+from adapters.http_flask.error_contract import (
+    ERROR_FORBIDDEN,
+    ERROR_INTERNAL,
+    ERROR_NOT_FOUND,
+    ERROR_VALIDATION,
+    MSG_FORBIDDEN,
+    MSG_INTERNAL_ERROR,
+    MSG_NOT_FOUND,
+    STATUS_BAD_REQUEST,
+    STATUS_FORBIDDEN,
+    STATUS_INTERNAL_ERROR,
+    STATUS_NOT_FOUND,
+    classify_exception,
+    error_response,
+)
+from adapters.http_flask.middleware import (
+    csrf_token_valid,
+    is_csrf_exempt,
+    requires_auth,
+    session_actor,
+)
+from adapters.http_flask.routes.cards import (
+    build_list_cards_request,
+    card_detail_json,
+    card_list_json,
+    map_svg_headers,
+    sanitized_map_svg,
+)
+from application.use_cases.get_card import GetCardRequest
+from application.use_cases.list_favorites import ListFavoritesRequest
+from application.use_cases.manage_presets import list_presets
+from application.use_cases.render_map_svg import RenderMapSvgRequest
+from domain.errors import ForbiddenError, NotFoundError, ValidationError
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, Response
+from infrastructure.compression import get_response_compressor, weak_etag
+from infrastructure.observability.diagnostics import diagnostics_authorized
+from infrastructure.observability.request_profiler import (
+    get_request_profiler,
+    presented_token,
+)
+from werkzeug.http import parse_etags
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_WORKERS = 16
+
+_COOKIE_NAME = "sb_session"
+_CSRF_HEADER = "X-CSRF-Token"
+
+
+def make_read_executor() -> ThreadPoolExecutor:
+    """Build the executor for blocking read work (``ASGI_READ_WORKERS``).
+
+    Invalid values fall back to ``DEFAULT_READ_WORKERS``.
+    """
+    raw = os.environ.get("ASGI_READ_WORKERS", "").strip()
+    try:
+        workers = int(raw) if raw else DEFAULT_READ_WORKERS
+        if workers < 1:
+            raise ValueError(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid ASGI_READ_WORKERS=%r — using %d.", raw, DEFAULT_READ_WORKERS
+        )
+        workers = DEFAULT_READ_WORKERS
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asgi-read")
+
+
+def _json_error(code: str, message: str, status: int) -> JSONResponse:
+    body, status = error_response(code, message, status)
+    return JSONResponse(body, status_code=status)
+
+
+def _exception_response(exc: Exception) -> JSONResponse:
+    """Map an exception as the Flask app's error handlers do."""
+    if isinstance(exc, ValidationError):
+        return _json_error(ERROR_VALIDATION, str(exc), STATUS_BAD_REQUEST)
+    if isinstance(exc, NotFoundError):
+        return _json_error(ERROR_NOT_FOUND, MSG_NOT_FOUND, STATUS_NOT_FOUND)
+    if isinstance(exc, ForbiddenError):
+        return _json_error(ERROR_FORBIDDEN, MSG_FORBIDDEN, STATUS_FORBIDDEN)
+    classified = classify_exception(exc)
+    if classified is not None:
+        return _json_error(*classified)
+    logger.exception("Unhandled error in native read route")
+    return _json_error(ERROR_INTERNAL, MSG_INTERNAL_ERROR, STATUS_INTERNAL_ERROR)
+
+
+def _authorize(request: Request) -> tuple[str, Response | None]:
+    """Run the Flask middleware checks; return the actor or a refusal."""
+    session_id = request.cookies.get(_COOKIE_NAME, "")
+    actor_id = session_actor(session_id)
+    path = request.url.path
+    if requires_auth(path) and not actor_id:
+        return "", JSONResponse(
+            {"ok": False, "message": "Authentication required."}, status_code=401
+        )
+    if not is_csrf_exempt(request.method, path) and not csrf_token_valid(
+        session_id if actor_id else "", request.headers.get(_CSRF_HEADER, "")
+    ):
+        return "", JSONResponse(
+            {"ok": False, "message": "CSRF token invalid."}, status_code=403
+        )
+    return actor_id, None
+
+
+# Handlers run on the executor with the Services container, the request
+# and the authorized actor.
+_Handler = Callable[[Any, Request, str], Response]
+
+
+def _respond(services: Any, request: Request, handler: _Handler) -> Response:
+    try:
+        actor_id, refusal = _authorize(request)
+        if refusal is not None:
+            return refusal
+        return handler(services, request, actor_id)
+    except Exception as exc:  # mirrors Flask's catch-all error handler
+        return _exception_response(exc)
+
+
+def _compress(request: Request, response: Response) -> Response:
+    """Encode the body with the best coding the client accepts, if worth it."""
+    compressor = get_response_compressor()
+    if (
+        compressor is None
+        or response.status_code != 200
+        or "content-encoding" in response.headers
+    ):
+        return response
+    body = bytes(response.body)
+    content_type = response.headers.get("content-type", "")
+    if not compressor.compressible(content_type, len(body)):
+        return response
+    vary = response.headers.get("vary")
+    response.headers["vary"] = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+    coding = compressor.negotiate(request.headers.get("accept-encoding"))
+    if coding is None:
+        return response
+    etag = response.headers.get("etag", "")
+    response.body = compressor.compress(
+        body, coding, etag=etag, content_type=content_type.split(";", 1)[0]
+    )
+    response.headers["content-encoding"] = coding
+    response.headers["content-length"] = str(len(response.body))
+    if etag:
+        response.headers["etag"] = weak_etag(etag)
+    return response
+
+
+def _serve(services: Any, request: Request, handler: _Handler) -> Response:
+    """Authorize *request* and run *handler* (blocking; runs on the executor).
+
+    Requests carrying the admin profiling token run under the request
+    profiler, like their Flask counterparts.  The body is compressed here,
+    off the event loop.
+    """
+    profiler = get_request_profiler()
+    if profiler is None or not profiler.authorized(
+        presented_token(request.headers, request.cookies)
+    ):
+        return _compress(request, _respond(services, request, handler))
+    profile = profiler.start()
+    if profile is None:
+        return _compress(request, _respond(services, request, handler))
+    try:
+        response = _compress(request, _respond(services, request, handler))
+    finally:
+        saved = profiler.stop(profile, f"{request.method}-{request.url.path}")
+    response.headers["X-Profile-File"] = saved.name
+    return response
+
+
+def _list_cards(services: Any, request: Request, actor_id: str) -> Response:
+    list_request = build_list_cards_request(actor_id, request.query_params)
+    return JSONResponse(card_list_json(services.list_cards.execute(list_request)))
+
+
+def _get_card(services: Any, request: Request, actor_id: str) -> Response:
+    response = services.get_card.execute(
+        GetCardRequest(actor_id=actor_id, card_id=request.path_params["card_id"])
+    )
+    return JSONResponse(card_detail_json(response))
+
+
+def _get_card_map_svg(services: Any, request: Request, actor_id: str) -> Response:
+    uc_response = services.render_map_svg.execute(
+        RenderMapSvgRequest(actor_id=actor_id, card_id=request.path_params["card_id"])
+    )
+    content_hash = getattr(uc_response, "content_hash", "")
+    headers = map_svg_headers(content_hash)
+    if_none_match = parse_etags(request.headers.get("if-none-match"))
+    if content_hash and if_none_match.contains_weak(content_hash):
+        return Response(status_code=304, headers=headers)
+    svg_safe = sanitized_map_svg(uc_response.svg, content_hash)
+    headers["Content-Disposition"] = "inline; filename=map.svg"
+    return Response(
+        svg_safe.encode("utf-8"), media_type="image/svg+xml", headers=headers
+    )
+
+
+def _list_favorites(services: Any, _request: Request, actor_id: str) -> Response:
+    resp = services.list_favorites.execute(ListFavoritesRequest(actor_id=actor_id))
+    return JSONResponse({KEY_CARD_IDS: resp.card_ids})
+
+
+def _presets(_services: Any, _request: Request, _actor_id: str) -> Response:
+    return JSONResponse(list_presets())
+
+
+_GUARDED_ROUTES: tuple[tuple[str, _Handler], ...] = (
+    ("/cards", _list_cards),
+    ("/cards/{card_id}", _get_card),
+    ("/cards/{card_id}/map.svg", _get_card_map_svg),
+    ("/favorites", _list_favorites),
+    ("/presets", _presets),
+)
+
+
+async def _health() -> Response:
+    return JSONResponse({KEY_STATUS: STATUS_OK})
+
+
+def _diagnostics_denied() -> Response:
+    body, status = error_response(ERROR_NOT_FOUND, MSG_NOT_FOUND, STATUS_NOT_FOUND)
+    return JSONResponse(body, status_code=status)
+
+
+async def _password_hashing_health(request: Request) -> Response:
+    if not diagnostics_authorized(request.headers):
+        return _diagnostics_denied()
+    from infrastructure.auth.password_hasher import get_hasher
+
+    return JSONResponse(
+        {KEY_STATUS: STATUS_OK, "password_hashing": get_hasher().stats()}
+    )
+
+
+async def _db_health(request: Request) -> Response:
+    if not diagnostics_authorized(request.headers):
+        return _diagnostics_denied()
+    from infrastructure.db.session import db_stats
+
+    return JSONResponse({KEY_STATUS: STATUS_OK, "db": db_stats()})
+
+
+def build_read_router(services: Any, executor: Executor) -> APIRouter:
+    """Build the native read routes over the Flask app's *services*.
+
+    Args:
+        services: The ``Services`` container built by ``build_services()``.
+        executor: Where blocking session lookups and use cases run.
+    """
+    router = APIRouter()
+
+    def _offloaded(handler: _Handler) -> Callable[[Request], Any]:
+        async def endpoint(request: Request) -> Response:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor, _serve, services, request, handler
+            )
+
+        return endpoint
+
+    for path, handler in _GUARDED_ROUTES:
+        router.add_api_route(path, _offloaded(handler), methods=["GET"])
+    router.add_api_route("/health", _health, methods=["GET"])
+    router.add_api_route(
+        "/health/password-hashing", _password_hashing_health, methods=["GET"]
+    )
+    router.add_api_route("/health/db", _db_health, methods=["GET"])
+    return router
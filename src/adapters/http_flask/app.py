@@ -12,6 +12,7 @@ from adapters.http_flask.error_contract import (
     STATUS_FORBIDDEN,
     STATUS_INTERNAL_ERROR,
     STATUS_NOT_FOUND,
+    classify_exception,
     error_response,
 )
 from adapters.http_flask.middleware import init_middleware
@@ -56,18 +57,6 @@ def _redirect_if_authenticated() -> WerkzeugResponse | None:
     return None
 
 
-def _classify_exception(exc: Exception) -> tuple[str, str, int] | None:
-    """Classify a generic exception as NotFound or Forbidden, or None."""
-    exc_type = type(exc).__name__
-    exc_message = str(exc).lower()
-
-    if exc_type == "NotFound" or "not found" in exc_message:
-        return ERROR_NOT_FOUND, MSG_NOT_FOUND, STATUS_NOT_FOUND
-    if exc_type == "Forbidden" or "forbidden" in exc_message:
-        return ERROR_FORBIDDEN, MSG_FORBIDDEN, STATUS_FORBIDDEN
-    return None
-
-
 def create_app() -> Flask:
     app = Flask(__name__)
 
@@ -145,7 +134,7 @@ def create_app() -> Flask:
         IMPORTANT: For 500 errors, always return a generic message.
         Never expose internal error details to the client.
         """
-        classified = _classify_exception(exc)
+        classified = classify_exception(exc)
         if classified is not None:
             code, msg, st = classified
             body, status = error_response(code, msg, st)
@@ -27,6 +27,12 @@ KEY_NAME = "name"
 KEY_SPECIAL_RULES = "special_rules"
 KEY_DEPLOYMENT_SHAPES = "deployment_shapes"
 KEY_SCENOGRAPHY_SPECS = "scenography_specs"
+KEY_NEXT_CURSOR = "next_cursor"
+
+# Query parameters
+PARAM_LIMIT = "limit"
+PARAM_CURSOR = "cursor"
+PARAM_QUERY = "q"
 
 # Defaults
 DEFAULT_MODE = "casual"
@@ -1,7 +1,7 @@
 """Centralized error response contract for Flask adapter.
 
 This module defines:
-1. Helper to construct consistent error JSON responses
+1. Helpers to construct consistent error JSON responses
 2. Error codes and HTTP status mappings
 3. Error messages (generic safe messages for external API, never leak internals)
 """
@@ -75,3 +75,20 @@ def error_response(
     if details:
         body["details"] = details
     return body, status
+
+
+def classify_exception(exc: Exception) -> tuple[str, str, int] | None:
+    """Classify a generic exception as NotFound or Forbidden, or None.
+
+    Returns:
+        ``(code, message, status)`` for :func:`error_response`, or ``None``
+        when the exception should be reported as an internal error.
+    """
+    exc_type = type(exc).__name__
+    exc_message = str(exc).lower()
+
+    if exc_type == "NotFound" or "not found" in exc_message:
+        return ERROR_NOT_FOUND, MSG_NOT_FOUND, STATUS_NOT_FOUND
+    if exc_type == "Forbidden" or "forbidden" in exc_message:
+        return ERROR_FORBIDDEN, MSG_FORBIDDEN, STATUS_FORBIDDEN
+    return None
@@ -7,14 +7,27 @@ Session lifecycle:
 2. Auth gate: API routes (``/cards``, ``/favorites``, etc.) require valid session.
 3. CSRF check on mutating methods (POST/PUT/PATCH/DELETE) for non-exempt routes.
 4. Routes use ``g.actor_id`` (or the legacy ``X-Actor-Id`` header as fallback).
+
+On-demand profiling (``REQUEST_PROFILING``): a request carrying the
+profiling token runs under ``cProfile`` from the first ``before_request``
+hook to ``after_request``; the saved file is named in ``X-Profile-File``.
+
+Compression (``HTTP_COMPRESSION``): an ``after_request`` hook gzip- or
+brotli-encodes large JSON/SVG/HTML bodies the client accepts
+(``infrastructure.compression``).
 """
 
 from __future__ import annotations
 
 import logging
 
-from flask import Flask, g, jsonify, request
+from flask import Flask, Response, g, jsonify, request
 from infrastructure.auth import session_store
+from infrastructure.compression import get_response_compressor, weak_etag
+from infrastructure.observability.request_profiler import (
+    get_request_profiler,
+    presented_token,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,28 +50,49 @@ _MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 _AUTH_REQUIRED_PREFIXES = ("/cards", "/favorites", "/maps", "/presets")
 
 
-def _load_session() -> None:
-    """Load session from cookie and populate ``g.actor_id``."""
-    session_id = request.cookies.get(_COOKIE_NAME, "")
-    g.session_id = session_id
-    g.actor_id = ""
+# ── Framework-neutral checks (shared with the native ASGI read routes) ──
 
-    if not session_id:
-        return
 
+def session_actor(session_id: str) -> str:
+    """Return the actor of a live session, or ``""`` if there is none."""
+    if not session_id:
+        return ""
     session = session_store.get_session(session_id)
     if session is None:
-        g.session_id = ""
-        return
+        return ""
+    return str(session["actor_id"])
 
-    g.actor_id = session["actor_id"]
 
+def requires_auth(path: str) -> bool:
+    """Return True if *path* is an API route that needs a valid session."""
+    return any(path.startswith(prefix) for prefix in _AUTH_REQUIRED_PREFIXES)
 
-def _is_csrf_exempt() -> bool:
-    """Return True if the current request is exempt from CSRF checks."""
-    if request.method not in _MUTATING_METHODS:
+
+def is_csrf_exempt(method: str, path: str) -> bool:
+    """Return True if a *method* request to *path* skips CSRF checks."""
+    if method not in _MUTATING_METHODS:
         return True
-    return any(request.path.startswith(prefix) for prefix in _CSRF_EXEMPT_PREFIXES)
+    return any(path.startswith(prefix) for prefix in _CSRF_EXEMPT_PREFIXES)
+
+
+def csrf_token_valid(session_id: str, provided_token: str) -> bool:
+    """Double-submit check; sessions without a CSRF token always pass."""
+    if not session_id:
+        return True
+    expected_token = session_store.get_csrf_token(session_id)
+    if not expected_token:
+        return True
+    return bool(provided_token) and provided_token == expected_token
+
+
+# ── Flask hooks ──────────────────────────────────────────────────
+
+
+def _load_session() -> None:
+    """Load session from cookie and populate ``g.actor_id``."""
+    session_id = request.cookies.get(_COOKIE_NAME, "")
+    g.actor_id = session_actor(session_id)
+    g.session_id = session_id if g.actor_id else ""
 
 
 def _verify_csrf():
@@ -66,27 +100,19 @@ def _verify_csrf():
 
     Returns a 403 response tuple if verification fails, or None to proceed.
     """
-    if _is_csrf_exempt():
+    if is_csrf_exempt(request.method, request.path):
         return None
 
     session_id = getattr(g, "session_id", "")
-    if not session_id:
-        return None
-
-    expected_token = session_store.get_csrf_token(session_id)
-    if not expected_token:
+    if csrf_token_valid(session_id, request.headers.get(_CSRF_HEADER, "")):
         return None
 
-    provided_token = request.headers.get(_CSRF_HEADER, "")
-    if not provided_token or provided_token != expected_token:
-        logger.warning(
-            "CSRF verification failed for session=%s path=%s",
-            session_id[:8],
-            request.path,
-        )
-        return jsonify({"ok": False, "message": "CSRF token invalid."}), 403
-
-    return None
+    logger.warning(
+        "CSRF verification failed for session=%s path=%s",
+        session_id[:8],
+        request.path,
+    )
+    return jsonify({"ok": False, "message": "CSRF token invalid."}), 403
 
 
 def _require_auth():
@@ -94,7 +120,7 @@ def _require_auth():
 
     Only applies to paths starting with ``_AUTH_REQUIRED_PREFIXES``.
     """
-    if not any(request.path.startswith(p) for p in _AUTH_REQUIRED_PREFIXES):
+    if not requires_auth(request.path):
         return None
 
     actor_id = getattr(g, "actor_id", "")
@@ -104,8 +130,75 @@ def _require_auth():
     return None
 
 
+def _start_profiling() -> None:
+    """Profile this request if it carries the admin profiling token."""
+    profiler = get_request_profiler()
+    if profiler is not None and profiler.authorized(
+        presented_token(request.headers, request.cookies)
+    ):
+        g.profile = profiler.start()
+
+
+def _finish_profiling() -> str | None:
+    """Save the running profile, if any; return its file name."""
+    profile = g.pop("profile", None)
+    profiler = get_request_profiler()
+    if profile is None or profiler is None:
+        return None
+    return profiler.stop(profile, f"{request.method}-{request.path}").name
+
+
+def _release_profiler(_exc: BaseException | None) -> None:
+    """Save a profile left running by a request that ended without a response."""
+    _finish_profiling()
+
+
+def _stop_profiling(response: Response) -> Response:
+    """Save the request's profile and name the file in ``X-Profile-File``."""
+    saved = _finish_profiling()
+    if saved is not None:
+        response.headers["X-Profile-File"] = saved
+    return response
+
+
+def _compress_response(response: Response) -> Response:
+    """Encode the body with the best coding the client accepts, if worth it."""
+    compressor = get_response_compressor()
+    if (
+        compressor is None
+        or response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    body = response.get_data()
+    if not compressor.compressible(response.mimetype, len(body)):
+        return response
+    response.vary.add("Accept-Encoding")
+    coding = compressor.negotiate(request.headers.get("Accept-Encoding"))
+    if coding is None:
+        return response
+    etag = response.headers.get("ETag", "")
+    response.set_data(
+        compressor.compress(
+            body, coding, etag=etag, content_type=response.mimetype or ""
+        )
+    )
+    response.headers["Content-Encoding"] = coding
+    if etag:
+        response.headers["ETag"] = weak_etag(etag)
+    return response
+
+
 def init_middleware(app: Flask) -> None:
     """Attach ``before_request`` hooks to the Flask application."""
+    app.before_request(_start_profiling)
+    app.after_request(_stop_profiling)
+    # after_request hooks run in reverse: compression is inside the profile.
+    app.after_request(_compress_response)
+    # Requests that end without a response still release the profiler.
+    app.teardown_request(_release_profiler)
     app.before_request(_load_session)
     app.before_request(_require_auth)
     app.before_request(_verify_csrf)
@@ -53,6 +53,17 @@ def _set_session_cookie(
     )
 
 
+def _failure_response(result: dict[str, object], status: int, body: dict):
+    """Build a no-cache failure response (503 + Retry-After when busy)."""
+    retry_after = result.get("retry_after")
+    resp = make_response(jsonify(body), 503 if retry_after else status)
+    if retry_after:
+        resp.headers["Retry-After"] = str(retry_after)
+    for k, v in _NO_CACHE_HEADERS.items():
+        resp.headers[k] = v
+    return resp
+
+
 def _clear_session_cookie(response):
     """Clear both session and CSRF cookies."""
     response.delete_cookie(_COOKIE_NAME, path=_COOKIE_PATH)
@@ -72,13 +83,9 @@ def login():
     result = auth_service.authenticate(username, password)
 
     if not result["ok"]:
-        resp = make_response(
-            jsonify({"ok": False, "message": result["message"]}),
-            401,
+        return _failure_response(
+            result, 401, {"ok": False, "message": result["message"]}
         )
-        for k, v in _NO_CACHE_HEADERS.items():
-            resp.headers[k] = v
-        return resp
 
     session_id = str(result["session_id"])
     csrf_token = str(result["csrf_token"])
@@ -122,13 +129,9 @@ def me():
     result = auth_service.get_me(session_id)
 
     if not result["ok"]:
-        resp = make_response(
-            jsonify({"ok": False, "message": result["message"]}),
-            401,
+        return _failure_response(
+            result, 401, {"ok": False, "message": result["message"]}
         )
-        for k, v in _NO_CACHE_HEADERS.items():
-            resp.headers[k] = v
-        return resp
 
     resp = make_response(jsonify({"ok": True, "profile": result["profile"]}), 200)
     for k, v in _NO_CACHE_HEADERS.items():
@@ -155,14 +158,9 @@ def reauth_route():
     result = auth_service.reauth(session_id, password)
 
     if not result["ok"]:
-        status = 401
-        resp = make_response(
-            jsonify({"ok": False, "message": result["message"]}),
-            status,
+        return _failure_response(
+            result, 401, {"ok": False, "message": result["message"]}
         )
-        for k, v in _NO_CACHE_HEADERS.items():
-            resp.headers[k] = v
-        return resp
 
     new_session_id = str(result["session_id"])
     new_csrf = str(result["csrf_token"])
@@ -191,11 +189,10 @@ def update_profile_route():
 
     result = auth_service.update_profile(session_id, name, email)
 
-    status = 200 if result["ok"] else 400
-    resp = make_response(
-        jsonify({"ok": result["ok"], "message": result["message"]}),
-        status,
-    )
+    body = {"ok": result["ok"], "message": result["message"]}
+    if not result["ok"]:
+        return _failure_response(result, 400, body)
+    resp = make_response(jsonify(body), 200)
     for k, v in _NO_CACHE_HEADERS.items():
         resp.headers[k] = v
     return resp
@@ -223,10 +220,7 @@ def register_route():
         }
         if "errors" in result:
             body["errors"] = result["errors"]
-        resp = make_response(jsonify(body), 400)
-        for k, v in _NO_CACHE_HEADERS.items():
-            resp.headers[k] = v
-        return resp
+        return _failure_response(result, 400, body)
 
     session_id = str(result["session_id"])
     csrf_token = str(result["csrf_token"])
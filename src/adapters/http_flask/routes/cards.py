@@ -6,8 +6,8 @@ delegates to use cases via app.config["services"], and returns JSON responses.
 
 from __future__ import annotations
 
-from io import BytesIO
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from application.use_cases.generate_scenario_card import (
@@ -29,6 +29,7 @@ from adapters.http_flask.constants import (
     KEY_LAYOUT,
     KEY_MODE,
     KEY_NAME,
+    KEY_NEXT_CURSOR,
     KEY_OBJECTIVE_SHAPES,
     KEY_OBJECTIVES,
     KEY_OWNER_ID,
@@ -40,6 +41,9 @@ from adapters.http_flask.constants import (
     KEY_TABLE_MM,
     KEY_TABLE_PRESET,
     KEY_VISIBILITY,
+    PARAM_CURSOR,
+    PARAM_LIMIT,
+    PARAM_QUERY,
 )
 from adapters.http_flask.context import get_actor_id, get_services
 from adapters.http_flask.svg_sanitizer import normalize_svg_xml
@@ -49,10 +53,22 @@ from application.use_cases.get_card import GetCardRequest
 from application.use_cases.list_cards import ListCardsRequest
 from application.use_cases.render_map_svg import RenderMapSvgRequest
 from application.use_cases.save_card import SaveCardRequest
-from flask import Blueprint, jsonify, request, send_file
+from domain.errors import ValidationError
+from flask import Blueprint, Response, jsonify, request
+from infrastructure.maps.svg_render_cache import LruSvgCache
+from werkzeug.http import quote_etag
 
 cards_bp = Blueprint("cards", __name__)
 
+# Sanitized map SVGs keyed by content hash.  Entries are immutable for a
+# given hash, so one process-wide cache is safe across apps and actors.
+_SAFE_SVG_CACHE = LruSvgCache()
+
+_SVG_SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "Content-Security-Policy": "default-src 'none'; sandbox",
+}
+
 
 # ── Shared helpers for create / update ────────────────────────────
 
@@ -149,6 +165,106 @@ def _build_gen_response_dict(gen_response: GenerateScenarioCardResponse) -> dict
     }
 
 
+# ── Shared with the native ASGI read routes (adapters.http_asgi) ───
+
+
+def _optional_arg(args: Mapping[str, str], name: str) -> str | None:
+    """Return a stripped query parameter, or ``None`` when absent/blank."""
+    value = args.get(name, "").strip()
+    return value or None
+
+
+def _parse_limit_arg(args: Mapping[str, str]) -> int | None:
+    """Parse the ``limit`` query parameter (``None`` = unpaginated)."""
+    raw = _optional_arg(args, PARAM_LIMIT)
+    if raw is None:
+        return None
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValidationError("limit must be an integer") from exc
+
+
+def build_list_cards_request(
+    actor_id: str, args: Mapping[str, str]
+) -> ListCardsRequest:
+    """Map ``GET /cards`` query parameters to a ``ListCardsRequest``."""
+    return ListCardsRequest(
+        actor_id=actor_id,
+        filter=args.get(KEY_FILTER, DEFAULT_FILTER),
+        limit=_parse_limit_arg(args),
+        cursor=_optional_arg(args, PARAM_CURSOR),
+        name_query=_optional_arg(args, PARAM_QUERY),
+        mode=_optional_arg(args, KEY_MODE),
+        table_preset=_optional_arg(args, KEY_TABLE_PRESET),
+    )
+
+
+def card_list_json(response: Any) -> dict[str, Any]:
+    """Build the ``GET /cards`` JSON body from a ``ListCardsResponse``."""
+    cards_json = [
+        {
+            KEY_CARD_ID: c.card_id,
+            KEY_OWNER_ID: c.owner_id,
+            KEY_SEED: c.seed,
+            KEY_MODE: c.mode,
+            KEY_VISIBILITY: c.visibility,
+            KEY_NAME: c.name,
+            KEY_TABLE_PRESET: c.table_preset,
+            KEY_TABLE_MM: c.table_mm,
+        }
+        for c in response.cards
+    ]
+    return {KEY_CARDS: cards_json, KEY_NEXT_CURSOR: response.next_cursor}
+
+
+def card_detail_json(response: Any) -> dict[str, Any]:
+    """Build the ``GET /cards/<id>`` JSON body from a ``GetCardResponse``."""
+    return {
+        KEY_CARD_ID: response.card_id,
+        KEY_OWNER_ID: response.owner_id,
+        KEY_SEED: response.seed,
+        KEY_MODE: response.mode,
+        KEY_VISIBILITY: response.visibility,
+        KEY_TABLE_MM: response.table_mm,
+        KEY_TABLE_PRESET: response.table_preset,
+        KEY_NAME: response.name,
+        KEY_SHARED_WITH: response.shared_with or [],
+        KEY_ARMIES: response.armies,
+        KEY_DEPLOYMENT: response.deployment,
+        KEY_LAYOUT: response.layout,
+        KEY_OBJECTIVES: response.objectives,
+        KEY_INITIAL_PRIORITY: response.initial_priority,
+        KEY_SPECIAL_RULES: response.special_rules,
+        KEY_SHAPES: response.shapes or {},
+    }
+
+
+def map_svg_headers(content_hash: str) -> dict[str, str]:
+    """Security and caching headers for a map SVG (or 304) response.
+
+    With a content hash the response carries a strong ETag and may be kept
+    privately as long as it is revalidated; without one nothing is stored.
+    """
+    headers = dict(_SVG_SECURITY_HEADERS)
+    if content_hash:
+        headers["ETag"] = quote_etag(content_hash)
+        headers["Cache-Control"] = "private, no-cache"
+    else:
+        headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+    return headers
+
+
+def sanitized_map_svg(svg_raw: str, content_hash: str) -> str:
+    """Validate and sanitize a rendered SVG, cached by content hash."""
+    svg_safe = _SAFE_SVG_CACHE.get(content_hash) if content_hash else None
+    if svg_safe is None:
+        svg_safe = normalize_svg_xml(svg_raw)
+        if content_hash:
+            _SAFE_SVG_CACHE.put(content_hash, svg_safe)
+    return svg_safe
+
+
 @cards_bp.post("")
 def create_card():
     """POST /cards - Generate and save a new scenario card."""
@@ -180,25 +296,7 @@ def get_card(card_id: str):
     response = services.get_card.execute(get_request)
 
     # 4) Return response
-    response_data = {
-        KEY_CARD_ID: response.card_id,
-        KEY_OWNER_ID: response.owner_id,
-        KEY_SEED: response.seed,
-        KEY_MODE: response.mode,
-        KEY_VISIBILITY: response.visibility,
-        KEY_TABLE_MM: response.table_mm,
-        KEY_TABLE_PRESET: response.table_preset,
-        KEY_NAME: response.name,
-        KEY_SHARED_WITH: response.shared_with or [],
-        KEY_ARMIES: response.armies,
-        KEY_DEPLOYMENT: response.deployment,
-        KEY_LAYOUT: response.layout,
-        KEY_OBJECTIVES: response.objectives,
-        KEY_INITIAL_PRIORITY: response.initial_priority,
-        KEY_SPECIAL_RULES: response.special_rules,
-        KEY_SHAPES: response.shapes or {},
-    }
-    return jsonify(response_data), 200
+    return jsonify(card_detail_json(response)), 200
 
 
 @cards_bp.put("/<card_id>")
@@ -265,36 +363,29 @@ def delete_card(card_id: str):
 
 @cards_bp.get("")
 def list_cards():
-    """GET /cards?filter=... - List cards for the actor."""
+    """GET /cards?filter=...&limit=&cursor=&q=&mode=&table_preset=
+
+    Lists cards for the actor.  ``limit`` enables keyset pagination: the
+    response carries ``next_cursor``, to be sent back as ``cursor`` to
+    fetch the following page.  ``q`` (name substring), ``mode`` and
+    ``table_preset`` are evaluated by the repository.
+    """
     # 1) Get actor_id from header
     actor_id = get_actor_id()
 
-    # 2) Get filter from query params
-    filter_param = request.args.get(KEY_FILTER, DEFAULT_FILTER)
+    # 2) Get filter, paging and search criteria from query params
+    list_request = build_list_cards_request(actor_id, request.args)
 
-    # 3) Get services
-    services = get_services()
+    # 3) Call list_cards use case
+    response = get_services().list_cards.execute(list_request)
 
-    # 4) Call list_cards use case
-    list_request = ListCardsRequest(actor_id=actor_id, filter=filter_param)
-    response = services.list_cards.execute(list_request)
+    # 4) Map cards to JSON
+    return jsonify(card_list_json(response)), 200
 
-    # 5) Map cards to JSON
-    cards_json = [
-        {
-            KEY_CARD_ID: c.card_id,
-            KEY_OWNER_ID: c.owner_id,
-            KEY_SEED: c.seed,
-            KEY_MODE: c.mode,
-            KEY_VISIBILITY: c.visibility,
-            KEY_NAME: c.name,
-            KEY_TABLE_PRESET: c.table_preset,
-            KEY_TABLE_MM: c.table_mm,
-        }
-        for c in response.cards
-    ]
 
-    return jsonify({KEY_CARDS: cards_json}), 200
+def _set_map_svg_headers(response: Response, content_hash: str) -> None:
+    """Apply ``map_svg_headers`` to a map SVG (or 304) response."""
+    response.headers.update(map_svg_headers(content_hash))
 
 
 @cards_bp.get("/<card_id>/map.svg")
@@ -312,25 +403,21 @@ def get_card_map_svg(card_id: str):
 
     # 4) Extract SVG (support both .svg attr and direct string)
     svg_raw = uc_response.svg if hasattr(uc_response, "svg") else str(uc_response)
-
-    # 5) Normalize SVG (validates + sanitizes: XXE/XSS prevention by construction)
-    svg_safe = normalize_svg_xml(svg_raw)
-
-    # 6) Prepare safe SVG as bytes for send_file
-    svg_bytes = BytesIO(svg_safe.encode("utf-8"))
-    svg_bytes.seek(0)
-
-    # 7) Return SVG with defense-in-depth headers
-    response = send_file(
-        svg_bytes,
-        mimetype="image/svg+xml",
-        as_attachment=False,  # Display inline, not download
-        download_name="map.svg",
-    )
-
-    # Add security headers (defense in depth)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["Content-Security-Policy"] = "default-src 'none'; sandbox"
-    response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+    content_hash = getattr(uc_response, "content_hash", "")
+
+    # 5) Conditional GET: the client already holds this exact render
+    if content_hash and request.if_none_match.contains_weak(content_hash):
+        response = Response(status=304)
+        _set_map_svg_headers(response, content_hash)
+        return response
+
+    # 6) Normalize SVG (validates + sanitizes: XXE/XSS prevention by construction)
+    svg_safe = sanitized_map_svg(svg_raw, content_hash)
+
+    # 7) Return SVG with defense-in-depth headers (a plain body, so the
+    #    compression hook can encode it)
+    response = Response(svg_safe.encode("utf-8"), content_type="image/svg+xml")
+    response.headers["Content-Disposition"] = "inline; filename=map.svg"
+    _set_map_svg_headers(response, content_hash)
 
     return response
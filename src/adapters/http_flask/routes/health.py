@@ -1,11 +1,67 @@
 from __future__ import annotations
 
+import functools
+
 from adapters.http_flask.constants import KEY_STATUS, STATUS_OK
-from flask import Blueprint, jsonify
+from adapters.http_flask.error_contract import (
+    ERROR_NOT_FOUND,
+    MSG_NOT_FOUND,
+    STATUS_NOT_FOUND,
+    error_response,
+)
+from flask import Blueprint, Response, jsonify, request
+from infrastructure.observability.diagnostics import diagnostics_authorized
 
 health_bp = Blueprint("health", __name__)
 
 
+def diagnostics_only(view):
+    """Serve *view* only with ``ADMIN_DIAGNOSTICS_TOKEN``; others get a 404."""
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not diagnostics_authorized(request.headers):
+            body, status = error_response(
+                ERROR_NOT_FOUND, MSG_NOT_FOUND, STATUS_NOT_FOUND
+            )
+            return jsonify(body), status
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
 @health_bp.get("/health")
 def health():
     return jsonify({KEY_STATUS: STATUS_OK})
+
+
+@health_bp.get("/health/password-hashing")
+@diagnostics_only
+def password_hashing_health():
+    """Expose the password hashing pool metrics (queue depth, rejections...)."""
+    from infrastructure.auth.password_hasher import get_hasher
+
+    return jsonify({KEY_STATUS: STATUS_OK, "password_hashing": get_hasher().stats()})
+
+
+@health_bp.get("/health/db")
+@diagnostics_only
+def db_health():
+    """Expose pool state and query timings (null without a DB)."""
+    from infrastructure.db.session import db_stats
+
+    return jsonify({KEY_STATUS: STATUS_OK, "db": db_stats()})
+
+
+@health_bp.get("/metrics")
+@diagnostics_only
+def metrics():
+    """Expose per-use-case latency, errors and in-flight calls (Prometheus)."""
+    from infrastructure.observability.use_case_metrics import (
+        PROMETHEUS_CONTENT_TYPE,
+        get_use_case_metrics,
+    )
+
+    return Response(
+        get_use_case_metrics().render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE
+    )
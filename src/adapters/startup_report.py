@@ -0,0 +1,160 @@
+"""Cold-start report CLI.
+
+Usage::
+
+    python -m adapters.startup_report                  # phases + slowest imports
+    python -m adapters.startup_report --top 25         # longer import lists
+    python -m adapters.startup_report --budget 6       # exit 1 when over budget
+    python -m adapters.startup_report --json           # machine-readable report
+
+Imports ``adapters.combined_app`` and calls ``create_combined_app()`` in a
+fresh interpreter running under ``python -X importtime``, then prints:
+
+- total cold-start time (module imports + app construction),
+- the construction phases recorded by ``create_combined_app``,
+- the slowest top-level packages and modules by import self time.
+
+``--budget`` (default ``STARTUP_BUDGET_SECONDS``, unset = no budget) makes
+the command fail when the total exceeds it, so the cold start can be
+checked in CI and in the container image.  ``-X importtime`` adds a few
+percent of overhead to the measured times.
+
+Exit status: 0 OK, 1 over budget, 2 the app failed to start.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess  # nosec B404 — runs this interpreter on a fixed script
+import sys
+from pathlib import Path
+from typing import Any
+
+from infrastructure.observability.startup import (
+    parse_importtime,
+    slowest_modules,
+    slowest_packages,
+)
+
+SRC = Path(__file__).resolve().parents[1]
+DEFAULT_TOP = 15
+
+# Runs in the child interpreter; the JSON line is the last line on stdout.
+_CHILD_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import adapters.combined_app as combined_app
+imported = time.perf_counter()
+app = combined_app.create_combined_app()
+finished = time.perf_counter()
+print(json.dumps({
+    "import_seconds": imported - started,
+    "phases": app.state.startup_timings,
+    "total_seconds": finished - started,
+}))
+"""
+
+
+def _default_budget() -> float | None:
+    raw = os.environ.get("STARTUP_BUDGET_SECONDS", "")
+    try:
+        return float(raw) if raw else None
+    except ValueError:
+        print(f"ignoring invalid STARTUP_BUDGET_SECONDS={raw!r}", file=sys.stderr)
+        return None
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m adapters.startup_report")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=_default_budget(),
+        help="fail when cold start exceeds this many seconds",
+    )
+    parser.add_argument(
+        "--top", type=int, default=DEFAULT_TOP, help="entries per import list"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    return parser.parse_args(argv)
+
+
+def measure_startup(top: int = DEFAULT_TOP) -> dict[str, Any]:
+    """Start the combined app in a fresh interpreter and return the report.
+
+    Raises:
+        RuntimeError: If the app fails to start.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(SRC), env.get("PYTHONPATH"))))
+    child = subprocess.run(  # nosec B603 — fixed argv, no shell
+        [sys.executable, "-X", "importtime", "-c", _CHILD_SCRIPT],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    lines = child.stdout.strip().splitlines()
+    if child.returncode != 0 or not lines:
+        tail = "\n".join(child.stderr.strip().splitlines()[-20:])
+        raise RuntimeError(f"app failed to start (exit {child.returncode}):\n{tail}")
+
+    report: dict[str, Any] = json.loads(lines[-1])
+    records = parse_importtime(child.stderr)
+    report["import_packages"] = [
+        {"package": name, "seconds": seconds}
+        for name, seconds in slowest_packages(records, top)
+    ]
+    report["import_modules"] = [
+        {"module": r.module, "seconds": r.self_seconds}
+        for r in slowest_modules(records, top)
+    ]
+    return report
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render *report* as a plain-text table."""
+    lines = [
+        f"cold start      {report['total_seconds']:8.3f}s",
+        f"  imports       {report['import_seconds']:8.3f}s",
+    ]
+    lines += [
+        f"  {name:<13} {seconds:8.3f}s" for name, seconds in report["phases"].items()
+    ]
+    lines += ["", "slowest packages (import self time)"]
+    lines += [
+        f"  {entry['seconds']:8.3f}s  {entry['package']}"
+        for entry in report["import_packages"]
+    ]
+    lines += ["", "slowest modules (import self time)"]
+    lines += [
+        f"  {entry['seconds']:8.3f}s  {entry['module']}"
+        for entry in report["import_modules"]
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    try:
+        report = measure_startup(args.top)
+    except RuntimeError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    report["budget_seconds"] = args.budget
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    if args.budget is not None and report["total_seconds"] > args.budget:
+        print(
+            f"FAIL: cold start {report['total_seconds']:.3f}s "
+            f"over budget {args.budget:.3f}s",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
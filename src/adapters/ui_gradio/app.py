@@ -24,6 +24,7 @@ if __name__ == "__main__":
         sys.path.insert(0, src_path)
 
 import gradio as gr
+from adapters.ui_gradio.profiling import profile_events
 from adapters.ui_gradio.ui._url_sync_js import build_url_sync_head_js
 from adapters.ui_gradio.ui.components import configure_renderer
 from adapters.ui_gradio.ui.pages.auth_components import (
@@ -223,13 +224,13 @@ def build_app() -> gr.Blocks:
                     home.search_box,
                     home.per_page_dropdown,
                     actor_id_state,
+                    home.cards_cache_state,
                 ],
                 home_reload_outputs=[
                     home.recent_cards_html,
                     home.page_info,
                     home.page_state,
                     home.cards_cache_state,
-                    home.fav_ids_cache_state,
                 ],
             )
         )
@@ -248,7 +249,6 @@ def build_app() -> gr.Blocks:
                 home_next_btn=home.next_btn,
                 home_page_state=home.page_state,
                 home_cards_cache_state=home.cards_cache_state,
-                home_fav_ids_cache_state=home.fav_ids_cache_state,
                 app=app,
                 actor_id_state=actor_id_state,
             )
@@ -270,7 +270,6 @@ def build_app() -> gr.Blocks:
                 list_page_state=lst.page_state,
                 home_browse_btn=home.browse_btn,
                 list_cards_cache_state=lst.cards_cache_state,
-                list_fav_ids_cache_state=lst.fav_ids_cache_state,
                 list_loaded_state=lst.loaded_state,
                 actor_id_state=actor_id_state,
                 session_id_state=session_id_state,
@@ -352,7 +351,6 @@ def build_app() -> gr.Blocks:
                 favorites_page_state=fav.page_state,
                 home_favorites_btn=home.favorites_btn,
                 favorites_cards_cache_state=fav.cards_cache_state,
-                favorites_fav_ids_cache_state=fav.fav_ids_cache_state,
                 favorites_loaded_state=fav.loaded_state,
                 actor_id_state=actor_id_state,
                 session_id_state=session_id_state,
@@ -388,7 +386,6 @@ def build_app() -> gr.Blocks:
             "home_page_info",
             "home_page_state",
             "home_cards_cache_state",
-            "home_fav_ids_cache_state",
             "editing_card_id",
         }
         _payload = {
@@ -408,7 +405,6 @@ def build_app() -> gr.Blocks:
             home_page_info=home.page_info,
             home_page_state=home.page_state,
             home_cards_cache_state=home.cards_cache_state,
-            home_fav_ids_cache_state=home.fav_ids_cache_state,
             editing_card_id=editing_card_id,
         )
 
@@ -450,10 +446,10 @@ def build_app() -> gr.Blocks:
                 home_recent_html=home.recent_cards_html,
                 home_page_info=home.page_info,
                 home_cards_cache_state=home.cards_cache_state,
-                home_fav_ids_cache_state=home.fav_ids_cache_state,
             )
         )
 
+    profile_events(app)
     return app
 
 
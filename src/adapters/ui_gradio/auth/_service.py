@@ -70,7 +70,6 @@ def update_profile(
     validates and changes the password as well.
     """
     from infrastructure.auth.user_store import update_user_profile
-    from infrastructure.auth.validators import validate_registration_password
 
     name = name.strip()
     email = email.strip()
@@ -84,22 +83,19 @@ def update_profile(
     if not validate_email(email):
         return {"ok": False, "message": "Invalid email format."}
 
-    # ── Optional password change ─────────────────────────────────
+    # ── Optional password change (applied before the profile update) ──
     wants_pw_change = bool(new_password or confirm_new_password)
     if wants_pw_change:
-        if new_password != confirm_new_password:
-            return {"ok": False, "message": "Passwords do not match."}
-        pw_ok, pw_errors = validate_registration_password(new_password)
-        if not pw_ok:
-            return {"ok": False, "message": pw_errors[0]}
+        failure = _infra_svc.apply_password_change(
+            actor_id, new_password, confirm_new_password
+        )
+        if failure is not None:
+            return failure
 
     if not update_user_profile(actor_id, name, email):
         return {"ok": False, "message": "User not found."}
 
     if wants_pw_change:
-        from infrastructure.auth.user_store import change_password
-
-        change_password(actor_id, new_password)
         return {"ok": True, "message": "Profile and password updated."}
 
     return {"ok": True, "message": "Profile updated."}
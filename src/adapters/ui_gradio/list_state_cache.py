@@ -0,0 +1,219 @@
+"""Server-side cache for the listing pages' state (home, list, favorites).
+
+Each listing used to keep its page-set — visited keyset cursors, the
+current page of card summaries (with map thumbnails) and the actor's
+favorite ids — in ``gr.State``, i.e. one unbounded copy per browser tab
+for as long as the tab stays open.  The page-set now lives here and
+``gr.State`` holds only an opaque handle.
+
+- **Bounded**: an entry expires ``ttl_seconds`` after its last use and
+  at most ``max_entries`` are kept (LRU).  A handle that expired or was
+  evicted simply starts a fresh page-set on page 1.
+- **Per actor**: a handle only resolves for the actor that created it.
+- **Invalidation**: UI writes mark entries stale — ``invalidate_actor``
+  after a favorite toggle, ``invalidate_all`` after a card is created,
+  updated or deleted.  Stale entries keep their cursors (the user stays
+  on the same page) but drop their cards and favorite ids, so the next
+  render re-fetches them.  Each invalidation bumps the entry's
+  ``version``; a ``put`` made with the version read before a fetch keeps
+  the entry stale if it was invalidated meanwhile.  Writes made elsewhere
+  (REST API, other workers) become visible within ``ttl_seconds``.
+
+Configured by ``LIST_STATE_TTL_SECONDS`` and ``LIST_STATE_MAX_ENTRIES``.
+Thread-safe via ``threading.Lock``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Any
+
+from application.ports.clock import Clock
+from infrastructure.clock import SystemClock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 1800.0
+DEFAULT_MAX_ENTRIES = 2000
+
+
+@dataclass(frozen=True)
+class ListState:
+    """One listing's page-set.
+
+    Attributes:
+        actor_id: Owner of the handle.
+        page_cache: ``search_helpers`` page cache (cards, cursors, next_cursor).
+        fav_ids: The actor's favorite ids, or ``None`` when not loaded.
+        stale: True once a write may have changed the cached cards.
+        version: Invalidations of the entry so far (set by the cache).
+    """
+
+    actor_id: str
+    page_cache: dict[str, Any]
+    fav_ids: list[str] | None
+    stale: bool = False
+    version: int = 0
+
+
+class ListStateCache:
+    """Handle-keyed LRU/TTL store of listing page-sets."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Clock | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Idle time after which an entry expires.
+            max_entries: Maximum number of page-sets kept (LRU eviction).
+            clock: Clock used for TTL checks.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if ttl_seconds <= 0 or max_entries < 1:
+            raise ValueError("invalid list state cache settings")
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_entries = max_entries
+        self._clock = clock or SystemClock()
+        self._lock = threading.Lock()
+        # handle -> (state, last_used_at)
+        self._entries: OrderedDict[str, tuple[ListState, datetime]] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, handle: Any, actor_id: str) -> ListState | None:
+        """Return the page-set behind *handle*, or ``None`` if unknown to *actor_id*."""
+        if not isinstance(handle, str) or not handle:
+            return None
+        now = self._clock.now_utc()
+        with self._lock:
+            entry = self._entries.get(handle)
+            if entry is None:
+                return None
+            state, last_used = entry
+            if now - last_used > self._ttl:
+                del self._entries[handle]
+                return None
+            if state.actor_id != actor_id:
+                return None
+            self._entries[handle] = (state, now)
+            self._entries.move_to_end(handle)
+            return state
+
+    def put(
+        self, state: ListState, handle: Any = "", *, read_version: int | None = None
+    ) -> str:
+        """Store *state* under *handle* (a new one if empty) and return the handle.
+
+        Args:
+            state: Page-set to store.
+            handle: Handle to store it under.
+            read_version: ``version`` of the entry the caller read before
+                fetching *state*.  If the entry was invalidated since, *state*
+                is stored stale so the invalidation is not lost.
+        """
+        if not isinstance(handle, str) or not handle:
+            handle = secrets.token_urlsafe(12)
+        now = self._clock.now_utc()
+        with self._lock:
+            current = self._entries.get(handle)
+            if current is not None:
+                version = current[0].version
+                if read_version is not None and read_version != version:
+                    state = _staled(state, version)
+                else:
+                    state = replace(state, version=version)
+            self._entries[handle] = (state, now)
+            self._entries.move_to_end(handle)
+            self._evict(now)
+        return handle
+
+    def invalidate_actor(self, actor_id: str) -> None:
+        """Mark *actor_id*'s page-sets stale (e.g. a favorite was toggled)."""
+        with self._lock:
+            for handle, (state, last_used) in self._entries.items():
+                if state.actor_id == actor_id:
+                    self._entries[handle] = (_invalidated(state), last_used)
+
+    def invalidate_all(self) -> None:
+        """Mark every page-set stale (a card was created, updated or deleted)."""
+        with self._lock:
+            for handle, (state, last_used) in self._entries.items():
+                self._entries[handle] = (_invalidated(state), last_used)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, now: datetime) -> None:
+        # Entries are ordered by last use, so expired ones sit at the front.
+        while self._entries:
+            _, (_, last_used) = next(iter(self._entries.items()))
+            if now - last_used <= self._ttl and len(self._entries) <= self._max_entries:
+                return
+            self._entries.popitem(last=False)
+
+
+def _staled(state: ListState, version: int) -> ListState:
+    return replace(state, fav_ids=None, stale=True, version=version)
+
+
+def _invalidated(state: ListState) -> ListState:
+    return _staled(state, state.version + 1)
+
+
+# ── Process-wide cache ───────────────────────────────────────────────────────
+_cache_holder: list[ListStateCache | None] = [None]
+_holder_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name, "")
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid %s=%r — using %s.", name, raw, default)
+        return default
+
+
+def _cache_from_env() -> ListStateCache:
+    try:
+        return ListStateCache(
+            ttl_seconds=_env_number("LIST_STATE_TTL_SECONDS", DEFAULT_TTL_SECONDS),
+            max_entries=int(_env_number("LIST_STATE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        )
+    except ValueError:
+        logger.warning("Invalid list state cache settings — using defaults.")
+        return ListStateCache()
+
+
+def get_list_state_cache() -> ListStateCache:
+    """Return the process-wide listing cache (built from env on first use)."""
+    cache = _cache_holder[0]
+    if cache is None:
+        with _holder_lock:
+            cache = _cache_holder[0]
+            if cache is None:
+                cache = _cache_holder[0] = _cache_from_env()
+    return cache
+
+
+def configure_list_state_cache(cache: ListStateCache | None) -> None:
+    """Replace the process-wide cache (``None`` rebuilds it from env)."""
+    with _holder_lock:
+        _cache_holder[0] = cache
@@ -0,0 +1,81 @@
+"""On-demand profiling of Gradio events.
+
+Gradio has no per-request hooks, so ``profile_events(blocks)`` wraps the
+backend function of every plain (non-async, non-generator) event
+listener once the Blocks are built.  When the event's request carries
+the profiling token — in the browser, the ``sb_profile`` cookie — the
+call runs under the request profiler
+(``infrastructure.observability.request_profiler``).
+
+Nothing is wrapped unless ``REQUEST_PROFILING`` is enabled.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any, Callable
+
+import gradio as gr
+from infrastructure.observability.request_profiler import (
+    get_request_profiler,
+    presented_token,
+)
+
+
+def _event_request() -> Any:
+    """Return the ``gr.Request`` of the event being processed, if any."""
+    from gradio.context import LocalContext
+
+    return LocalContext.request.get()
+
+
+def _profiled(fn: Callable[..., Any], label: str) -> Callable[..., Any]:
+    # functools.wraps keeps the signature and type hints Gradio inspects
+    # to inject gr.Request / gr.Progress arguments.
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profiler = get_request_profiler()
+        request = _event_request()
+        if (
+            profiler is None
+            or request is None
+            or not profiler.authorized(
+                presented_token(request.headers, request.cookies)
+            )
+        ):
+            return fn(*args, **kwargs)
+        profile = profiler.start()
+        if profile is None:
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.stop(profile, f"gradio-{label}")
+
+    return wrapper
+
+
+def _is_plain_function(fn: Callable[..., Any] | None) -> bool:
+    return (
+        fn is not None
+        and not inspect.iscoroutinefunction(fn)
+        and not inspect.isgeneratorfunction(fn)
+        and not inspect.isasyncgenfunction(fn)
+    )
+
+
+def profile_events(blocks: gr.Blocks) -> int:
+    """Wrap the event listeners of *blocks* for on-demand profiling.
+
+    Returns:
+        Number of listeners wrapped (0 when profiling is disabled).
+    """
+    if get_request_profiler() is None:
+        return 0
+    wrapped = 0
+    for block_fn in blocks.fns.values():
+        if _is_plain_function(block_fn.fn):
+            block_fn.fn = _profiled(block_fn.fn, block_fn.name or "event")
+            wrapped += 1
+    return wrapped
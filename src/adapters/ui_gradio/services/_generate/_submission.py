@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from adapters.ui_gradio._messages import MSG_NO_PREVIEW
+from adapters.ui_gradio.list_state_cache import get_list_state_cache
 from adapters.ui_gradio.services._generate._card_result import augment_generated_card
 from application.use_cases.generate_scenario_card import GenerateScenarioCardRequest
 from application.use_cases.save_card import SaveCardRequest
@@ -70,6 +71,7 @@ def handle_create_scenario(preview_data: dict[str, Any]) -> dict[str, Any]:
 
         save_req = SaveCardRequest(actor_id=actor_id, card=gen_resp.card)
         svc.save_card.execute(save_req)
+        get_list_state_cache().invalidate_all()
 
         response_json = _gen_response_to_dict(gen_resp)
         preset = preview_data.get("table_preset", "")
@@ -147,6 +149,7 @@ def handle_update_scenario(
 
         save_req = SaveCardRequest(actor_id=actor_id, card=gen_resp.card)
         svc.save_card.execute(save_req)
+        get_list_state_cache().invalidate_all()
 
         response_json = _gen_response_to_dict(gen_resp)
         preset = preview_data.get("table_preset", "")
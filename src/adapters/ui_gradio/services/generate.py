@@ -17,6 +17,7 @@ from adapters.ui_gradio.builders import shapes as shapes_builder
 from adapters.ui_gradio.constants import (
     FIELD_MODE,
 )
+from adapters.ui_gradio.list_state_cache import get_list_state_cache
 
 # ── re-exports from internal modules ─────────────────────────────────────────
 from adapters.ui_gradio.services._generate._card_result import (
@@ -361,6 +362,7 @@ def handle_generate(fs: FormState) -> dict[str, Any]:
 
         save_req = SaveCardRequest(actor_id=actor_id, card=gen_resp.card)
         svc.save_card.execute(save_req)
+        get_list_state_cache().invalidate_all()
 
         response_json = {
             "card_id": gen_resp.card_id,
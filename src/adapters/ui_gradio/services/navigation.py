@@ -8,10 +8,13 @@ from __future__ import annotations
 
 from typing import Any
 
+from adapters.ui_gradio.list_state_cache import get_list_state_cache
 from application.use_cases.delete_card import DeleteCardRequest
 from application.use_cases.get_card import GetCardRequest
 from application.use_cases.list_cards import ListCardsRequest
+from application.use_cases.list_favorite_cards import ListFavoriteCardsRequest
 from application.use_cases.list_favorites import ListFavoritesRequest
+from application.use_cases.render_card_thumbnails import RenderCardThumbnailsRequest
 from application.use_cases.render_map_svg import RenderMapSvgRequest
 from application.use_cases.toggle_favorite import ToggleFavoriteRequest
 from domain.errors import DomainError
@@ -21,30 +24,81 @@ from infrastructure.bootstrap import get_services
 # ============================================================================
 # List cards
 # ============================================================================
+def _card_summary(c: Any) -> dict[str, Any]:
+    """Project a ListCards snapshot onto the dict the wiring layer renders."""
+    return {
+        "card_id": c.card_id,
+        "owner_id": c.owner_id,
+        "seed": c.seed,
+        "mode": c.mode,
+        "visibility": c.visibility,
+        "name": c.name,
+        "table_preset": c.table_preset,
+        "table_mm": c.table_mm,
+    }
+
+
+def _page_summaries(svc: Any, actor_id: str, snapshots: list[Any]) -> list[dict]:
+    """Project a page of snapshots and attach their map thumbnails.
+
+    Thumbnails for the whole page are rendered in one batch call and
+    stored under ``"thumbnail_svg"``.  They are best-effort: on failure
+    the cards are returned without one and the list shows a placeholder.
+    """
+    summaries = [_card_summary(c) for c in snapshots]
+    if not summaries:
+        return summaries
+    try:
+        resp = svc.render_card_thumbnails.execute(
+            RenderCardThumbnailsRequest(
+                actor_id=actor_id,
+                card_ids=[s["card_id"] for s in summaries],
+            )
+        )
+    except (DomainError, OSError, ValueError, KeyError, RuntimeError):
+        return summaries
+    for summary in summaries:
+        svg = resp.thumbnails.get(summary["card_id"])
+        if svg:
+            summary["thumbnail_svg"] = svg
+    return summaries
+
+
 def list_cards(
     actor_id: str,
     filter_value: str = "mine",
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+    name_query: str | None = None,
+    mode: str | None = None,
+    table_preset: str | None = None,
 ) -> dict[str, Any]:
-    """List cards visible to the actor (direct use-case call)."""
+    """List cards visible to the actor (direct use-case call).
+
+    With *limit* set, returns a single keyset page plus ``next_cursor``
+    (``None`` on the last page), with a map thumbnail for each card.
+    """
     try:
         svc = get_services()
         resp = svc.list_cards.execute(
-            ListCardsRequest(actor_id=actor_id, filter=filter_value)
+            ListCardsRequest(
+                actor_id=actor_id,
+                filter=filter_value,
+                limit=limit,
+                cursor=cursor,
+                name_query=name_query,
+                mode=mode,
+                table_preset=table_preset,
+            )
         )
+        if limit is None:
+            cards = [_card_summary(c) for c in resp.cards]
+        else:
+            cards = _page_summaries(svc, actor_id, resp.cards)
         return {
-            "cards": [
-                {
-                    "card_id": c.card_id,
-                    "owner_id": c.owner_id,
-                    "seed": c.seed,
-                    "mode": c.mode,
-                    "visibility": c.visibility,
-                    "name": c.name,
-                    "table_preset": c.table_preset,
-                    "table_mm": c.table_mm,
-                }
-                for c in resp.cards
-            ]
+            "cards": cards,
+            "next_cursor": resp.next_cursor,
         }
     except (DomainError, OSError, ValueError, KeyError, RuntimeError) as exc:
         return {"status": "error", "message": str(exc)}
@@ -90,6 +144,7 @@ def delete_card(actor_id: str, card_id: str) -> dict[str, Any]:
         r = svc.delete_card.execute(
             DeleteCardRequest(actor_id=actor_id, card_id=card_id)
         )
+        get_list_state_cache().invalidate_all()
         return {"card_id": r.card_id, "deleted": r.deleted}
     except (DomainError, OSError, ValueError, KeyError, RuntimeError) as exc:
         return {"status": "error", "message": str(exc)}
@@ -105,6 +160,7 @@ def toggle_favorite(actor_id: str, card_id: str) -> dict[str, Any]:
         r = svc.toggle_favorite.execute(
             ToggleFavoriteRequest(actor_id=actor_id, card_id=card_id)
         )
+        get_list_state_cache().invalidate_actor(actor_id)
         return {"card_id": r.card_id, "is_favorite": r.is_favorite}
     except (DomainError, OSError, ValueError, KeyError, RuntimeError) as exc:
         return {"status": "error", "message": str(exc)}
@@ -123,6 +179,43 @@ def list_favorites(actor_id: str) -> dict[str, Any]:
         return {"status": "error", "message": str(exc)}
 
 
+# ============================================================================
+# List favorite cards (one page)
+# ============================================================================
+def list_favorite_cards(
+    actor_id: str,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+    name_query: str | None = None,
+) -> dict[str, Any]:
+    """Return one page of the actor's favourite cards (direct use-case call).
+
+    Cards are resolved with a single bulk fetch; ``next_cursor`` is
+    ``None`` on the last page.  Paged results carry map thumbnails.
+    """
+    try:
+        svc = get_services()
+        resp = svc.list_favorite_cards.execute(
+            ListFavoriteCardsRequest(
+                actor_id=actor_id,
+                limit=limit,
+                cursor=cursor,
+                name_query=name_query,
+            )
+        )
+        if limit is None:
+            cards = [_card_summary(c) for c in resp.cards]
+        else:
+            cards = _page_summaries(svc, actor_id, resp.cards)
+        return {
+            "cards": cards,
+            "next_cursor": resp.next_cursor,
+        }
+    except (DomainError, OSError, ValueError, KeyError, RuntimeError) as exc:
+        return {"status": "error", "message": str(exc)}
+
+
 # ============================================================================
 # Get card SVG map
 # ============================================================================
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from adapters.ui_gradio.ui.components.points_table import build_points_table
 from adapters.ui_gradio.ui.components.svg_preview import (
     build_svg_preview,
     configure_renderer,
@@ -14,6 +15,7 @@ from adapters.ui_gradio.ui.components.unit_selector import (
 )
 
 __all__ = [
+    "build_points_table",
     "build_svg_preview",
     "build_unit_selector",
     "configure_renderer",
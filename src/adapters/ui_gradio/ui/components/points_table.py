@@ -0,0 +1,59 @@
+"""Points table: a ``gr.Dataframe`` that never imports the pandas Styler.
+
+``gr.Dataframe.postprocess`` imports ``pandas.io.formats.style`` for every
+value, which pulls in matplotlib (~0.5 s).  The scenography polygon
+editor is built at startup, so that import landed on every cold start
+even though the editor only ever shows plain rows.
+
+``build_points_table`` returns a plain ``gr.Dataframe`` whose
+``postprocess`` converts rows, dicts and DataFrames directly and only
+defers to Gradio for anything else.  It is replaced on the instance
+rather than in a subclass: Gradio writes a ``.pyi`` stub next to every
+component subclass on import, which fails on a read-only source tree.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+import gradio as gr
+import pandas as pd  # already loaded by gradio; the Styler is what is slow
+from gradio.components.dataframe import DataframeData
+
+
+def build_points_table(**kwargs: Any) -> gr.Dataframe:
+    """Build an editable table of points (same arguments as ``gr.Dataframe``)."""
+    table = gr.Dataframe.__new__(gr.Dataframe)
+    # Installed before __init__, which already postprocesses the initial value.
+    table.postprocess = functools.partial(_postprocess, table)
+    gr.Dataframe.__init__(table, **kwargs)
+    return table
+
+
+def _postprocess(table: gr.Dataframe, value: Any) -> DataframeData:
+    """Convert *value* like ``gr.Dataframe`` without touching the pandas Styler."""
+    if value is None:
+        return _postprocess(table, table.empty_input)
+    if isinstance(value, dict):
+        if not value:
+            return DataframeData(headers=table.headers, data=[[]])
+        return DataframeData(
+            headers=value.get("headers", []), data=value.get("data", [[]])
+        )
+    if isinstance(value, list):
+        if not value:
+            return DataframeData(headers=table.headers, data=[[]])
+        return DataframeData(headers=_headers_for(table, value[0]), data=value)
+    if isinstance(value, pd.DataFrame):
+        rows = value.to_dict(orient="split")["data"] if len(value) else [[]]
+        return DataframeData(headers=list(value.columns), data=rows)
+    return gr.Dataframe.postprocess(table, value)
+
+
+def _headers_for(table: gr.Dataframe, row: list[Any]) -> list[str]:
+    # Same header padding / truncation as gr.Dataframe for row lists.
+    if len(table.headers) < len(row):
+        extra = range(len(table.headers) + 1, len(row) + 1)
+        return [*table.headers, *(str(i) for i in extra)]
+    return list(table.headers[: len(row)])
@@ -89,6 +89,25 @@ def make_square_placeholder(size_px: int = 100) -> str:
     )
 
 
+def make_square_thumbnail(svg: str, size_px: int = 100) -> str:
+    """Wrap a rendered map thumbnail in the square preview box.
+
+    Args:
+        svg: Thumbnail SVG markup produced by the map renderer.
+        size_px: Side length (px) for the square container.
+
+    Returns:
+        HTML string with the thumbnail centered in the box.
+    """
+    return (
+        f'<div class="card-thumbnail" style="width:{size_px}px;height:{size_px}px;'
+        "flex-shrink:0;display:flex;align-items:center;justify-content:center;"
+        'border:2px solid #ddd;border-radius:8px;background:#f5f5f5;overflow:hidden;">'
+        f"{svg}"
+        "</div>"
+    )
+
+
 # ============================================================================
 # Card HTML helpers (extracted to reduce cognitive complexity)
 # ============================================================================
@@ -239,14 +258,21 @@ def render_card_list_html(
             "No scenarios found.</div>"
         )
     fav_ids = favorite_ids or set()
-    # No longer using SVG previews - use placeholder instead
+    # Thumbnails are pre-rendered per page (``thumbnail_svg``); cards
+    # without one fall back to the placeholder.
     fragments: list[str] = []
     for card in cards:
         cid = card.get("card_id", "")
+        thumbnail = card.get("thumbnail_svg")
+        preview = (
+            make_square_thumbnail(thumbnail, 100)
+            if isinstance(thumbnail, str) and thumbnail
+            else make_square_placeholder(100)
+        )
         fragments.append(
             render_card_html(
                 card,
-                svg_preview=make_square_placeholder(100),
+                svg_preview=preview,
                 is_favorite=cid in fav_ids,
                 unit=unit,
             )
@@ -8,8 +8,9 @@ from __future__ import annotations
 
 import html
 import re
-from typing import Any
+from typing import Any, Callable, Optional
 
+from adapters.ui_gradio.list_state_cache import ListState, get_list_state_cache
 from adapters.ui_gradio.ui.components.scenario_card import render_card_list_html
 
 # ── Per-page options ─────────────────────────────────────────────
@@ -95,48 +96,34 @@ def sanitize_search_query(raw: str) -> str:
     return text[:_MAX_QUERY_LENGTH]
 
 
-def filter_cards_by_name(
-    cards: list[dict[str, Any]],
-    search_query: str,
-) -> list[dict[str, Any]]:
-    """Filter cards by name using case-insensitive substring match.
+def search_query_param(search_raw: str) -> str | None:
+    """Turn raw search-box input into the ``name_query`` sent to the API.
 
-    The *search_query* should already be sanitized.  The match is done
-    against the raw ``name`` field of each card (before HTML escaping)
-    so we un-escape the query first for a fair comparison.
+    The input is sanitized first (tags stripped, length capped) and then
+    un-escaped, because matching happens server-side against the raw
+    ``name`` column, not against escaped HTML.  Returns ``None`` when the
+    box is empty so no name criterion is applied.
     """
-    if not search_query:
-        return cards
-
-    # Un-escape for matching against raw card data
-    query_lower = html.unescape(search_query).lower()
+    query = sanitize_search_query(search_raw)
+    return html.unescape(query) or None
 
-    return [c for c in cards if query_lower in (c.get("name") or "").lower()]
 
+# ── Mode / preset criteria ───────────────────────────────────────
 
-# ── Mode / preset filtering ──────────────────────────────────────
 
+def criterion_or_none(value: object) -> str | None:
+    """Map a filter-radio value to an API criterion.
 
-def filter_by_mode_preset(
-    cards: list[dict[str, Any]],
-    mode_filter: str = "All",
-    preset_filter: str = "All",
-) -> list[dict[str, Any]]:
-    """Filter cards by game mode and/or table preset.
-
-    Comparison is case-insensitive.  The sentinel ``"All"`` skips
-    that filtering dimension.
-    """
-    filtered = cards
-    if mode_filter != "All":
-        mode_lower = mode_filter.lower()
-        filtered = [c for c in filtered if c.get("mode", "").lower() == mode_lower]
-    if preset_filter != "All":
-        preset_lower = preset_filter.lower()
-        filtered = [
-            c for c in filtered if c.get("table_preset", "").lower() == preset_lower
-        ]
-    return filtered
+    The sentinel ``"All"`` (and blank / non-string values) means "no
+    restriction" and yields ``None``; anything else is lower-cased so
+    ``"Matched"`` becomes the ``"matched"`` mode value.
+    """
+    if not isinstance(value, str):
+        return None
+    stripped = value.strip()
+    if not stripped or stripped == "All":
+        return None
+    return stripped.lower()
 
 
 # ── Per-page parsing ─────────────────────────────────────────────
@@ -172,83 +159,306 @@ def validate_page(raw: Any) -> int:
     return max(1, val)
 
 
-# ── Pagination rendering ─────────────────────────────────────────
+# ── Keyset page state ────────────────────────────────────────────
+#
+# Listing pages fetch one page at a time from the API.  Each page-set
+# is a small dict (stored server-side, see ``list_state_cache``):
+#
+#   {"cards": [...current page...],
+#    "cursors": [None, "<last id p1>", ...],   # cursor used for page N
+#    "next_cursor": "<last id of current page>" | None}
+#
+# so Previous/Next can re-fetch any visited page and unit changes can
+# re-render the current page without another API call.
 
 _EMPTY_PAGE_INFO = '<div style="text-align:center">Page 1 of 1</div>'
 
+PageFetcher = Callable[[Optional[str]], dict[str, Any]]
+FavIdsLoader = Callable[[], list[str]]
+
+
+def empty_page_cache() -> dict[str, Any]:
+    """Return the initial (nothing loaded) page-cache value."""
+    return {"cards": [], "cursors": [None], "next_cursor": None}
+
+
+def _coerce_page_cache(cache: Any) -> dict[str, Any]:
+    """Return *cache* if it looks like a page cache, else an empty one.
 
-def render_page(
+    ``gr.State`` may hold legacy or corrupted values (e.g. ``[]``).
+    """
+    if not isinstance(cache, dict):
+        return empty_page_cache()
+    cursors = cache.get("cursors")
+    if not isinstance(cursors, list) or not cursors:
+        cursors = [None]
+    cards = cache.get("cards")
+    return {
+        "cards": cards if isinstance(cards, list) else [],
+        "cursors": cursors,
+        "next_cursor": cache.get("next_cursor") or None,
+    }
+
+
+def cursor_for_page(cache: Any, page: Any) -> tuple[int, str | None]:
+    """Clamp *page* to the reachable range and return ``(page, cursor)``.
+
+    Reachable pages are the ones already visited plus the next one when
+    the current page reported a ``next_cursor``.
+    """
+    state = _coerce_page_cache(cache)
+    cursors: list[str | None] = state["cursors"]
+    reachable = len(cursors) + (1 if state["next_cursor"] else 0)
+    page_num = max(1, min(validate_page(page), reachable))
+    if page_num <= len(cursors):
+        return page_num, cursors[page_num - 1]
+    return page_num, state["next_cursor"]
+
+
+# ── Pagination rendering ─────────────────────────────────────────
+
+
+def render_error_html(message: str) -> str:
+    """Render an API error message (escaped) as a red notice."""
+    safe_msg = escape_html(message)
+    return f'<div style="color:red;padding:20px;">Error: {safe_msg}</div>'
+
+
+def render_keyset_page(
     cards: list[dict[str, Any]],
-    fav_ids: list[str],
+    fav_ids: list[str] | None,
     unit: str,
     page: int,
-    per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    has_next: bool,
     *,
     empty_message: str = "No scenarios match the selected filters.",
     count_label: str = "scenarios",
-) -> tuple[str, str, int]:
-    """Paginate *cards* and render the current page as HTML.
+) -> tuple[str, str]:
+    """Render one already-fetched page of cards as HTML.
 
-    Returns ``(cards_html, page_info_html, clamped_page_number)``.
+    Returns ``(cards_html, page_info_html)``.  The total is only known on
+    the last page, where it is derived from the page number.  Passing
+    ``fav_ids=None`` marks every card as a favorite (favorites page).
     """
-    if not cards:
+    if not cards and page <= 1:
         safe_msg = escape_html(empty_message)
         empty_html = (
             f'<div style="text-align:center;color:#999;padding:30px 0;">'
             f"{safe_msg}</div>"
         )
-        return empty_html, _EMPTY_PAGE_INFO, 1
-
-    total_cards = len(cards)
-    total_pages = max(1, (total_cards + per_page - 1) // per_page)
-    page = max(1, min(page, total_pages))
+        return empty_html, _EMPTY_PAGE_INFO
+
+    if fav_ids is None:  # favorites listing: every card is a favorite
+        favorite_ids = {c.get("card_id", "") for c in cards}
+    else:
+        favorite_ids = set(fav_ids)
+    cards_html: str = render_card_list_html(cards, favorite_ids=favorite_ids, unit=unit)
+    if has_next:
+        label = f"Page {page}"
+    else:
+        safe_label = escape_html(count_label)
+        label = f"Page {page} of {page}"
+        if page == 1:
+            label += f" ({len(cards)} {safe_label})"
+    page_info = f'<div style="text-align:center;padding:10px 0;">{label}</div>'
+    return cards_html, page_info
+
+
+def load_keyset_page(
+    fetch: PageFetcher,
+    fav_ids: list[str] | None,
+    unit: str,
+    page: Any,
+    cache: Any = None,
+    *,
+    empty_message: str = "No scenarios match the selected filters.",
+    count_label: str = "scenarios",
+) -> tuple[str, str, int, dict[str, Any]]:
+    """Fetch page *page* through *fetch* and render it.
 
-    start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    page_cards = cards[start_idx:end_idx]
+    *fetch* receives the keyset cursor for the page and returns the API
+    dict (``{"cards": [...], "next_cursor": ...}`` or an error dict).
+    Passing ``cache=None`` starts a fresh page-set (page 1).
 
-    cards_html: str = render_card_list_html(
-        page_cards, favorite_ids=set(fav_ids), unit=unit
+    Returns ``(cards_html, page_info_html, page, new_cache)``.
+    """
+    state = _coerce_page_cache(cache)
+    page_num, cursor = cursor_for_page(state, page)
+    result = fetch(cursor)
+    if result.get("status") == "error":
+        error_html = render_error_html(result.get("message", "Unknown error"))
+        return error_html, _EMPTY_PAGE_INFO, 1, empty_page_cache()
+
+    cards: list[dict[str, Any]] = result.get("cards", [])
+    next_cursor = result.get("next_cursor") or None
+    new_cache = {
+        "cards": cards,
+        "cursors": [*state["cursors"][: page_num - 1], cursor],
+        "next_cursor": next_cursor,
+    }
+    html_out, page_info = render_keyset_page(
+        cards,
+        fav_ids,
+        unit,
+        page_num,
+        next_cursor is not None,
+        empty_message=empty_message,
+        count_label=count_label,
     )
-    safe_label = escape_html(count_label)
-    page_info = (
-        f'<div style="text-align:center;padding:10px 0;">'
-        f"Page {page} of {total_pages} ({total_cards} {safe_label})"
-        f"</div>"
+    return html_out, page_info, page_num, new_cache
+
+
+def render_cached_page(
+    cache: Any,
+    fav_ids: list[str] | None,
+    unit: str,
+    page: Any,
+    *,
+    empty_message: str = "No scenarios match the selected filters.",
+    count_label: str = "scenarios",
+) -> tuple[str, str, int]:
+    """Re-render the cached current page (e.g. after a unit change)."""
+    state = _coerce_page_cache(cache)
+    page_num = max(1, min(validate_page(page), len(state["cursors"])))
+    html_out, page_info = render_keyset_page(
+        state["cards"],
+        fav_ids,
+        unit,
+        page_num,
+        state["next_cursor"] is not None,
+        empty_message=empty_message,
+        count_label=count_label,
     )
-    return cards_html, page_info, page
+    return html_out, page_info, page_num
 
 
-# ── Composite pipeline ───────────────────────────────────────────
+# ── Server-side page-sets ────────────────────────────────────────
+# The listing pages keep only a handle in ``gr.State``; the page cache
+# and the actor's favorite ids live in ``list_state_cache``.  Passing
+# ``load_fav_ids=None`` marks every card as a favorite (favorites page).
 
 
-def render_filtered_page(
-    cards: list[dict[str, Any]],
-    fav_ids: list[str],
+def _fav_ids_for(
+    state: ListState | None, load_fav_ids: FavIdsLoader | None
+) -> list[str] | None:
+    """Return the cached favorite ids, loading them when missing or stale."""
+    if load_fav_ids is None:
+        return None
+    if state is not None and state.fav_ids is not None:
+        return state.fav_ids
+    return load_fav_ids()
+
+
+def open_page_set(
+    fetch: PageFetcher,
+    actor_id: str,
+    unit: str,
+    handle: Any = "",
+    *,
+    load_fav_ids: FavIdsLoader | None = None,
+    empty_message: str = "No scenarios match the selected filters.",
+    count_label: str = "scenarios",
+) -> tuple[str, str, int, str]:
+    """Fetch page 1 of a new page-set and store it under *handle*.
+
+    The cards are always fetched; the favorite ids are reused from the
+    page-set *handle* pointed to unless it was invalidated.  An empty
+    *handle* allocates a new one.
+
+    Returns ``(cards_html, page_info_html, page, handle)``.
+    """
+    store = get_list_state_cache()
+    state = store.get(handle, actor_id)
+    fav_ids = _fav_ids_for(state, load_fav_ids)
+    html_out, page_info, page_num, cache = load_keyset_page(
+        fetch,
+        fav_ids,
+        unit,
+        1,
+        empty_message=empty_message,
+        count_label=count_label,
+    )
+    handle = store.put(
+        ListState(actor_id, cache, fav_ids),
+        handle,
+        read_version=state.version if state is not None else None,
+    )
+    return html_out, page_info, page_num, handle
+
+
+def load_page_set_page(
+    fetch: PageFetcher,
+    actor_id: str,
     unit: str,
     page: Any,
-    search_raw: str = "",
-    per_page_raw: str | int = "10",
+    handle: Any,
     *,
+    load_fav_ids: FavIdsLoader | None = None,
     empty_message: str = "No scenarios match the selected filters.",
     count_label: str = "scenarios",
-) -> tuple[str, str, int]:
-    """Sanitise, filter, paginate and render cards in one call.
+) -> tuple[str, str, int, str]:
+    """Fetch *page* of the page-set behind *handle* using its cursors.
+
+    An unknown or expired *handle* starts a new page-set on page 1.
 
-    Composes :func:`sanitize_search_query`, :func:`filter_cards_by_name`,
-    :func:`parse_per_page`, :func:`validate_page` and :func:`render_page`
-    so that wiring modules need a single function call instead of
-    repeating the four-step pipeline.
+    Returns ``(cards_html, page_info_html, page, handle)``.
     """
-    query = sanitize_search_query(search_raw)
-    filtered = filter_cards_by_name(cards, query)
-    per_page = parse_per_page(per_page_raw)
-    return render_page(
-        filtered,
+    store = get_list_state_cache()
+    state = store.get(handle, actor_id)
+    fav_ids = _fav_ids_for(state, load_fav_ids)
+    html_out, page_info, page_num, cache = load_keyset_page(
+        fetch,
         fav_ids,
         unit,
-        validate_page(page),
-        per_page,
+        page,
+        state.page_cache if state is not None else None,
+        empty_message=empty_message,
+        count_label=count_label,
+    )
+    handle = store.put(
+        ListState(actor_id, cache, fav_ids),
+        handle,
+        read_version=state.version if state is not None else None,
+    )
+    return html_out, page_info, page_num, handle
+
+
+def render_page_set(
+    fetch: PageFetcher,
+    actor_id: str,
+    unit: str,
+    page: Any,
+    handle: Any,
+    *,
+    load_fav_ids: FavIdsLoader | None = None,
+    empty_message: str = "No scenarios match the selected filters.",
+    count_label: str = "scenarios",
+) -> tuple[str, str, int, str]:
+    """Re-render the current page of *handle* (e.g. after a unit change).
+
+    Served from the cache without an API call, unless the page-set was
+    invalidated by a write or has expired, in which case it is re-fetched.
+
+    Returns ``(cards_html, page_info_html, page, handle)``.
+    """
+    state = get_list_state_cache().get(handle, actor_id)
+    if state is None or state.stale:
+        return load_page_set_page(
+            fetch,
+            actor_id,
+            unit,
+            page,
+            handle,
+            load_fav_ids=load_fav_ids,
+            empty_message=empty_message,
+            count_label=count_label,
+        )
+    html_out, page_info, page_num = render_cached_page(
+        state.page_cache,
+        state.fav_ids,
+        unit,
+        page,
         empty_message=empty_message,
         count_label=count_label,
     )
+    return html_out, page_info, page_num, handle
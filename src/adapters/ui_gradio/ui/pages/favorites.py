@@ -18,7 +18,7 @@ def build_favorites_page() -> SimpleNamespace:
                   search_box, per_page_dropdown, reload_btn,
                   cards_html, back_btn, page_info, prev_btn,
                   next_btn,
-                  cards_cache_state, fav_ids_cache_state,
+                  cards_cache_state,
                   loaded_state, page_state).
     """
     with gr.Column(visible=False, elem_id="page-favorites") as container:
@@ -78,8 +78,8 @@ def build_favorites_page() -> SimpleNamespace:
             )
             next_btn = gr.Button("Next →", scale=1, size="sm")
 
-        cards_cache_state = gr.State(value=[])
-        fav_ids_cache_state = gr.State(value=[])
+        # Handle into the server-side list-state cache (page-set lives there)
+        cards_cache_state = gr.State(value="")
         loaded_state = gr.State(value=False)
         page_state = gr.State(value=1)
 
@@ -95,7 +95,6 @@ def build_favorites_page() -> SimpleNamespace:
         prev_btn=prev_btn,
         next_btn=next_btn,
         cards_cache_state=cards_cache_state,
-        fav_ids_cache_state=fav_ids_cache_state,
         loaded_state=loaded_state,
         page_state=page_state,
     )
@@ -21,7 +21,7 @@ def build_home_page() -> SimpleNamespace:
                   mode_filter, preset_filter, unit_selector,
                   search_box, per_page_dropdown, reload_btn,
                   recent_cards_html, prev_btn, page_info, next_btn, page_state,
-                  cards_cache_state, fav_ids_cache_state).
+                  cards_cache_state).
     """
     with gr.Column(visible=True, elem_id="page-home") as container:
         gr.Markdown("# 🎲 Scenario Builder")
@@ -119,9 +119,8 @@ def build_home_page() -> SimpleNamespace:
         # Hidden state for current page
         page_state = gr.State(value=1)
 
-        # Cached data for client-side paging
-        cards_cache_state = gr.State(value=[])
-        fav_ids_cache_state = gr.State(value=[])
+        # Handle into the server-side list-state cache (page-set lives there)
+        cards_cache_state = gr.State(value="")
 
     return SimpleNamespace(
         container=container,
@@ -140,5 +139,4 @@ def build_home_page() -> SimpleNamespace:
         next_btn=next_btn,
         page_state=page_state,
         cards_cache_state=cards_cache_state,
-        fav_ids_cache_state=fav_ids_cache_state,
     )
@@ -3,7 +3,10 @@
 from typing import Any
 
 import gradio as gr
-from adapters.ui_gradio.ui.components import build_unit_selector
+from adapters.ui_gradio.ui.components import (
+    build_points_table,
+    build_unit_selector,
+)
 
 # Scenography types
 SCENOGRAPHY_TYPES = ["circle", "rect", "polygon"]
@@ -101,7 +104,7 @@ def build_scenography_section() -> tuple[Any, ...]:
                 "_Points are auto-generated for presets. For custom, edit the "
                 "table below. Min: 3 points, Max: 200._"
             )
-            polygon_points = gr.Dataframe(
+            polygon_points = build_points_table(
                 headers=["x", "y"],
                 datatype=["number", "number"],
                 value=[[60, 30], [100, 70], [20, 70]],
@@ -189,7 +189,6 @@ _OPTIONAL_KEYS: frozenset[str] = frozenset(
         "home_page_info",
         "home_page_state",
         "home_cards_cache_state",
-        "home_fav_ids_cache_state",
         "editing_card_id",
         "create_heading_md",
     }
@@ -383,7 +382,6 @@ def wire_events(**kwargs: Any) -> None:
             home_page_info=kwargs.get("home_page_info"),
             home_page_state=kwargs.get("home_page_state"),
             home_cards_cache_state=kwargs.get("home_cards_cache_state"),
-            home_fav_ids_cache_state=kwargs.get("home_fav_ids_cache_state"),
             editing_card_id=kwargs.get("editing_card_id"),
             create_heading_md=kwargs.get("create_heading_md"),
         ),
@@ -192,7 +192,6 @@ class _GenerateBundle:
     home_page_info: gr.HTML | None = None
     home_page_state: gr.State | None = None
     home_cards_cache_state: gr.State | None = None
-    home_fav_ids_cache_state: gr.State | None = None
     editing_card_id: gr.Textbox | None = None
     create_heading_md: gr.Markdown | None = None
 
@@ -605,7 +604,6 @@ def _wire_all(
             home_page_info=gen.home_page_info,
             home_page_state=gen.home_page_state,
             home_cards_cache_state=gen.home_cards_cache_state,
-            home_fav_ids_cache_state=gen.home_fav_ids_cache_state,
             vp_input=vp.vp_input,
             vp_list=vp.vp_list,
             rules_list=rules.rules_list,
@@ -61,7 +61,6 @@ class AuthEventsCtx:
     home_recent_html: gr.HTML
     home_page_info: gr.HTML
     home_cards_cache_state: gr.State
-    home_fav_ids_cache_state: gr.State
 
 
 def wire_auth_events(*, ctx: AuthEventsCtx) -> None:
@@ -264,12 +263,12 @@ def wire_auth_events(*, ctx: AuthEventsCtx) -> None:
             c.home_search_box,
             c.home_per_page_dropdown,
             c.actor_id_state,
+            c.home_cards_cache_state,
         ],
         outputs=[
             c.home_recent_html,
             c.home_page_info,
             c.home_page_state,
             c.home_cards_cache_state,
-            c.home_fav_ids_cache_state,
         ],
     )
@@ -1,6 +1,7 @@
 """Favorites-page wiring — loads favorite cards on page visit.
 
-Fetches favorite IDs, then gets card data for each.
+Fetches one page of favorite cards at a time (keyset over the sorted
+favorite IDs, resolved in bulk) via ``services.navigation``.
 """
 
 from __future__ import annotations
@@ -13,49 +14,42 @@ from adapters.ui_gradio.auth import is_session_valid
 from adapters.ui_gradio.services import navigation as nav_svc
 from adapters.ui_gradio.state_helpers import get_default_actor_id
 from adapters.ui_gradio.ui.components.search_helpers import (
-    escape_html,
-    render_filtered_page,
+    PageFetcher,
+    load_page_set_page,
+    open_page_set,
+    parse_per_page,
+    render_page_set,
+    search_query_param,
 )
 from adapters.ui_gradio.ui.router import PAGE_FAVORITES, navigate_to
 
-# Type alias for the 6-tuple returned by _refresh_cache
-_CacheResult = tuple[str, str, int, list[dict[str, Any]], list[str], bool]
+# Type alias for the 5-tuple returned by _refresh_cache
+_CacheResult = tuple[str, str, int, str, bool]
 
+_EMPTY_FAVORITES_MESSAGE = "No favorites yet. Browse scenarios and ⭐ your favorites!"
+_NO_MATCH_MESSAGE = "No scenarios match the selected filters."
+_COUNT_LABEL = "favorites"
 
-def _build_error_html(message: str) -> str:
-    """Build an error HTML block for the favorites page."""
-    return f'<div style="color:red;padding:20px;">Error: {message}</div>'
 
-
-_EMPTY_FAVORITES_HTML = (
-    '<div style="text-align:center;color:#999;padding:40px 0;">'
-    "No favorites yet. Browse scenarios and ⭐ your favorites!"
-    "</div>"
-)
-
-_ONE_PAGE_INFO = '<div style="text-align:center">Page 1 of 1</div>'
+def _empty_message(search_raw: str) -> str:
+    """Pick the empty-state text depending on whether a search is active."""
+    if search_query_param(search_raw):
+        return _NO_MATCH_MESSAGE
+    return _EMPTY_FAVORITES_MESSAGE
 
 
-def _fetch_favorite_cards(
-    actor_id: str,
-) -> tuple[list[dict[str, Any]], list[str], str | None]:
-    """Return ``(cards, fav_ids, error_html | None)``."""
-    fav_result = nav_svc.list_favorites(actor_id)
-    if fav_result.get("status") == "error":
-        msg = escape_html(fav_result.get("message", "Unknown error"))
-        return [], [], _build_error_html(msg)
-
-    card_ids = fav_result.get("card_ids", [])
-    if not card_ids:
-        return [], [], None  # caller checks empty list
+def _page_fetcher(search_raw: str, per_page_raw: str, actor_id: str) -> PageFetcher:
+    """Build a cursor -> page callable over the actor's favorites."""
 
-    cards: list[dict[str, Any]] = []
-    for cid in card_ids:
-        card_data = nav_svc.get_card(actor_id, cid)
-        if card_data.get("status") != "error":
-            cards.append(card_data)
+    def _fetch(cursor: str | None) -> dict[str, Any]:
+        return nav_svc.list_favorite_cards(
+            actor_id,
+            limit=parse_per_page(per_page_raw),
+            cursor=cursor,
+            name_query=search_query_param(search_raw),
+        )
 
-    return cards, list(card_ids), None
+    return _fetch
 
 
 def _refresh_cache(
@@ -63,47 +57,65 @@ def _refresh_cache(
     search_raw: str = "",
     per_page_raw: str = "10",
     actor_id: str = "",
+    handle: str = "",
 ) -> _CacheResult:
-    """Fetch fresh favorites data from API and render first page."""
+    """Fetch the first page of favorites from the API and render it."""
     if not actor_id:
         actor_id = get_default_actor_id()
 
-    cards, fav_ids, error_html = _fetch_favorite_cards(actor_id)
-    if error_html:
-        return error_html, _ONE_PAGE_INFO, 1, [], [], True
-
-    if not cards and not fav_ids:
-        return _EMPTY_FAVORITES_HTML, _ONE_PAGE_INFO, 1, [], [], True
-
-    html, page_info, new_page = render_filtered_page(
-        cards,
-        fav_ids,
+    fetch = _page_fetcher(search_raw, per_page_raw, actor_id)
+    html, page_info, new_page, handle = open_page_set(
+        fetch,
+        actor_id,
         unit,
-        1,
-        search_raw,
-        per_page_raw,
-        count_label="favorites",
+        handle,
+        empty_message=_empty_message(search_raw),
+        count_label=_COUNT_LABEL,
     )
-    return html, page_info, new_page, cards, fav_ids, True
+    return html, page_info, new_page, handle, True
 
 
 def _render_from_cache(
     unit: str,
     page: int,
-    cards_cache: list[dict[str, Any]],
-    fav_ids_cache: list[str],
+    handle: str,
     search_raw: str = "",
     per_page_raw: str = "10",
-) -> tuple[str, str, int]:
-    """Render a page from the cached cards/fav_ids."""
-    return render_filtered_page(
-        cards_cache,
-        fav_ids_cache,
+    actor_id: str = "",
+) -> tuple[str, str, int, str]:
+    """Re-render the cached page without hitting the API (unit change)."""
+    if not actor_id:
+        actor_id = get_default_actor_id()
+    return render_page_set(
+        _page_fetcher(search_raw, per_page_raw, actor_id),
+        actor_id,
+        unit,
+        page,
+        handle,
+        empty_message=_empty_message(search_raw),
+        count_label=_COUNT_LABEL,
+    )
+
+
+def _load_page(
+    unit: str,
+    page: int,
+    handle: str,
+    search_raw: str,
+    per_page_raw: str,
+    actor_id: str,
+) -> tuple[str, str, int, str]:
+    """Fetch *page* of the current page-set using the cached cursors."""
+    if not actor_id:
+        actor_id = get_default_actor_id()
+    return load_page_set_page(
+        _page_fetcher(search_raw, per_page_raw, actor_id),
+        actor_id,
         unit,
         page,
-        search_raw,
-        per_page_raw,
-        count_label="favorites",
+        handle,
+        empty_message=_empty_message(search_raw),
+        count_label=_COUNT_LABEL,
     )
 
 
@@ -124,7 +136,6 @@ class FavoritesPageCtx:
     favorites_page_state: gr.State
     home_favorites_btn: gr.Button
     favorites_cards_cache_state: gr.State
-    favorites_fav_ids_cache_state: gr.State
     favorites_loaded_state: gr.State
     actor_id_state: gr.State | None = None
     session_id_state: gr.State | None = None
@@ -139,109 +150,98 @@ def wire_favorites_page(*, ctx: FavoritesPageCtx) -> Any:  # noqa: C901
     c = ctx
     n_containers = len(c.page_containers)
 
-    _cache_inputs = [
+    _cache_inputs: list[gr.components.Component] = [
         c.favorites_unit_selector,
         c.favorites_page_state,
         c.favorites_cards_cache_state,
-        c.favorites_fav_ids_cache_state,
         c.favorites_search_box,
         c.favorites_per_page_dropdown,
     ]
-    _page_outputs = [
+    if c.actor_id_state is not None:
+        _cache_inputs.append(c.actor_id_state)
+    _nav_outputs = [
         c.favorites_cards_html,
         c.favorites_page_info,
         c.favorites_page_state,
+        c.favorites_cards_cache_state,
     ]
 
-    # Search / per-page changes → reset to page 1
-    def _cache_reset_page1(
-        unit: str,
-        _page: int,
-        cards_cache: list[dict[str, Any]],
-        fav_ids_cache: list[str],
-        search_raw: str,
-        per_page_raw: str,
-    ) -> tuple[str, str, int]:
-        return _render_from_cache(
-            unit, 1, cards_cache, fav_ids_cache, search_raw, per_page_raw
-        )
+    # Search / per-page changes reuse the page-set handle; the reload
+    # button starts a fresh page-set.
+    _reload_inputs: list[gr.components.Component] = [
+        c.favorites_unit_selector,
+        c.favorites_search_box,
+        c.favorites_per_page_dropdown,
+    ]
+    if c.actor_id_state is not None:
+        _reload_inputs.append(c.actor_id_state)
+    _refresh_inputs = list(_reload_inputs)
+    if c.actor_id_state is not None:
+        _refresh_inputs.append(c.favorites_cards_cache_state)
+    _refresh_outputs = [*_nav_outputs, c.favorites_loaded_state]
 
+    # Search / per-page changes → fetch page 1 of the new query
     for widget in (c.favorites_search_box, c.favorites_per_page_dropdown):
         widget.change(
-            fn=_cache_reset_page1,
-            inputs=_cache_inputs,
-            outputs=_page_outputs,
+            fn=_refresh_cache,
+            inputs=_refresh_inputs,
+            outputs=_refresh_outputs,
         )
 
     # Unit change keeps current page
     c.favorites_unit_selector.change(
         fn=_render_from_cache,
         inputs=_cache_inputs,
-        outputs=_page_outputs,
+        outputs=_nav_outputs,
     )
 
     # Reload favorites on demand
-    _refresh_inputs: list[gr.components.Component] = [
-        c.favorites_unit_selector,
-        c.favorites_search_box,
-        c.favorites_per_page_dropdown,
-    ]
-    if c.actor_id_state is not None:
-        _refresh_inputs.append(c.actor_id_state)
-
     c.favorites_reload_btn.click(
         fn=_refresh_cache,
-        inputs=_refresh_inputs,
-        outputs=[
-            c.favorites_cards_html,
-            c.favorites_page_info,
-            c.favorites_page_state,
-            c.favorites_cards_cache_state,
-            c.favorites_fav_ids_cache_state,
-            c.favorites_loaded_state,
-        ],
+        inputs=_reload_inputs,
+        outputs=_refresh_outputs,
     )
 
     # Pagination
     def _go_prev(
         unit: str,
         current_page: int,
-        cards_cache: list[dict[str, Any]],
-        fav_ids_cache: list[str],
+        handle: str,
         search_raw: str,
         per_page_raw: str,
-    ) -> tuple[str, str, int]:
-        return _render_from_cache(
+        actor_id: str = "",
+    ) -> tuple[str, str, int, str]:
+        return _load_page(
             unit,
             max(1, current_page - 1),
-            cards_cache,
-            fav_ids_cache,
+            handle,
             search_raw,
             per_page_raw,
+            actor_id,
         )
 
     def _go_next(
         unit: str,
         current_page: int,
-        cards_cache: list[dict[str, Any]],
-        fav_ids_cache: list[str],
+        handle: str,
         search_raw: str,
         per_page_raw: str,
-    ) -> tuple[str, str, int]:
-        return _render_from_cache(
+        actor_id: str = "",
+    ) -> tuple[str, str, int, str]:
+        return _load_page(
             unit,
             current_page + 1,
-            cards_cache,
-            fav_ids_cache,
+            handle,
             search_raw,
             per_page_raw,
+            actor_id,
         )
 
-    c.favorites_prev_btn.click(fn=_go_prev, inputs=_cache_inputs, outputs=_page_outputs)
-    c.favorites_next_btn.click(fn=_go_next, inputs=_cache_inputs, outputs=_page_outputs)
+    c.favorites_prev_btn.click(fn=_go_prev, inputs=_cache_inputs, outputs=_nav_outputs)
+    c.favorites_next_btn.click(fn=_go_next, inputs=_cache_inputs, outputs=_nav_outputs)
 
     # Load favorites when navigating to favorites page
-    _n_out = 1 + n_containers + 6
+    _n_out = 1 + n_containers + 5
 
     def _session_expired_noop() -> tuple[Any, ...]:
         return tuple(gr.update() for _ in range(_n_out))
@@ -250,13 +250,14 @@ def wire_favorites_page(*, ctx: FavoritesPageCtx) -> Any:  # noqa: C901
         unit: str,
         sid: str = "",
         actor_id: str = "",
+        handle: str = "",
     ):
         """Navigate to favorites, always loading fresh data from the API."""
         if sid and not is_session_valid(sid):
             return _session_expired_noop()
 
         nav = navigate_to(PAGE_FAVORITES)
-        cache = _refresh_cache(unit, actor_id=actor_id)
+        cache = _refresh_cache(unit, actor_id=actor_id, handle=handle)
         result = (*nav, *cache)
 
         if sid and not is_session_valid(sid):
@@ -270,7 +271,7 @@ def wire_favorites_page(*, ctx: FavoritesPageCtx) -> Any:  # noqa: C901
     if c.session_id_state is not None:
         _nav_inputs.append(c.session_id_state)
     if c.actor_id_state is not None:
-        _nav_inputs.append(c.actor_id_state)
+        _nav_inputs += [c.actor_id_state, c.favorites_cards_cache_state]
 
     favorites_event = c.home_favorites_btn.click(
         fn=_navigate_and_load,
@@ -282,7 +283,6 @@ def wire_favorites_page(*, ctx: FavoritesPageCtx) -> Any:  # noqa: C901
             c.favorites_page_info,
             c.favorites_page_state,
             c.favorites_cards_cache_state,
-            c.favorites_fav_ids_cache_state,
             c.favorites_loaded_state,
         ],
     )
@@ -63,7 +63,6 @@ class GenerateCtx:
     home_page_info: gr.HTML | None = None
     home_page_state: gr.State | None = None
     home_cards_cache_state: gr.State | None = None
-    home_fav_ids_cache_state: gr.State | None = None
     vp_input: gr.Textbox | None = None
     vp_list: gr.Dropdown | None = None
     rules_list: gr.Dropdown | None = None
@@ -106,7 +105,6 @@ class _CreateScenarioCtx:
     home_page_info: gr.HTML | None = None
     home_page_state: gr.State | None = None
     home_cards_cache_state: gr.State | None = None
-    home_fav_ids_cache_state: gr.State | None = None
     vp_input: gr.Textbox | None = None
     vp_list: gr.Dropdown | None = None
     rules_list: gr.Dropdown | None = None
@@ -192,7 +190,6 @@ def wire_generate(*, ctx: GenerateCtx) -> None:
                 home_page_info=c.home_page_info,
                 home_page_state=c.home_page_state,
                 home_cards_cache_state=c.home_cards_cache_state,
-                home_fav_ids_cache_state=c.home_fav_ids_cache_state,
                 scenario_name=c.scenario_name,
                 mode=c.mode,
                 is_replicable=c.is_replicable,
@@ -284,7 +281,6 @@ def _wire_create_scenario(  # noqa: C901
             c.home_page_info,
             c.home_page_state,
             c.home_cards_cache_state,
-            c.home_fav_ids_cache_state,
         ]
         if w is not None
     ]
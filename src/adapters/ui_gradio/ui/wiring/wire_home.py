@@ -1,7 +1,9 @@
 """Home-page wiring — loads recent cards on page arrival with pagination.
 
-Calls the Flask API via ``services.navigation`` and renders results
-using the ``scenario_card`` component.
+Calls the Flask API via ``services.navigation`` one page at a time
+(keyset pagination) and renders results using the ``scenario_card``
+component.  The page-set lives in the server-side list-state cache;
+``home_cards_cache_state`` only holds its handle.
 """
 
 from __future__ import annotations
@@ -13,12 +15,50 @@ import gradio as gr
 from adapters.ui_gradio.services import navigation as nav_svc
 from adapters.ui_gradio.state_helpers import get_default_actor_id
 from adapters.ui_gradio.ui.components.search_helpers import (
-    escape_html,
-    filter_by_mode_preset,
-    render_filtered_page,
+    FavIdsLoader,
+    PageFetcher,
+    criterion_or_none,
+    load_page_set_page,
+    open_page_set,
+    parse_per_page,
+    render_page_set,
+    search_query_param,
 )
 
 
+def _public_page_fetcher(
+    actor_id: str,
+    mode_filter: str,
+    preset_filter: str,
+    search_raw: str,
+    per_page_raw: str,
+) -> PageFetcher:
+    """Build a cursor -> page callable for the public listing."""
+
+    def _fetch(cursor: str | None) -> dict[str, Any]:
+        return nav_svc.list_cards(
+            actor_id,
+            "public",
+            limit=parse_per_page(per_page_raw),
+            cursor=cursor,
+            name_query=search_query_param(search_raw),
+            mode=criterion_or_none(mode_filter),
+            table_preset=criterion_or_none(preset_filter),
+        )
+
+    return _fetch
+
+
+def _fav_ids_loader(actor_id: str) -> FavIdsLoader:
+    """Build a callable returning *actor_id*'s favorite card ids."""
+
+    def _load() -> list[str]:
+        fav_ids: list[str] = nav_svc.list_favorites(actor_id).get("card_ids", [])
+        return fav_ids
+
+    return _load
+
+
 def load_recent_cards(
     mode_filter: str = "All",
     preset_filter: str = "All",
@@ -27,26 +67,22 @@ def load_recent_cards(
     search_raw: str = "",
     per_page_raw: str = "10",
     actor_id: str = "",
-) -> tuple[str, str, int, list[dict[str, Any]], list[str]]:
-    """Fetch cards from Flask and render as HTML with pagination."""
+    cards_handle: str = "",
+) -> tuple[str, str, int, str]:
+    """Fetch the first page of public cards and render it.
+
+    Filtering, search and pagination happen server-side; the page-set is
+    stored in the list-state cache under *cards_handle* (a new handle
+    when empty), which is returned in place of the page cache.
+    """
     if not actor_id:
         actor_id = get_default_actor_id()
-    result = nav_svc.list_cards(actor_id, "public")
-
-    if result.get("status") == "error":
-        safe_msg = escape_html(result.get("message", "Unknown error"))
-        error_html = '<div style="color:red;padding:20px;">' f"Error: {safe_msg}</div>"
-        return error_html, '<div style="text-align:center">Page 1</div>', 1, [], []
-
-    cards: list[dict[str, Any]] = result.get("cards", [])
-    fav_result = nav_svc.list_favorites(actor_id)
-    fav_ids = fav_result.get("card_ids", [])
-
-    filtered = filter_by_mode_preset(cards, mode_filter, preset_filter)
-    html, page_info, new_page = render_filtered_page(
-        filtered, fav_ids, unit, page, search_raw, per_page_raw
+    fetch = _public_page_fetcher(
+        actor_id, mode_filter, preset_filter, search_raw, per_page_raw
+    )
+    return open_page_set(
+        fetch, actor_id, unit, cards_handle, load_fav_ids=_fav_ids_loader(actor_id)
     )
-    return html, page_info, new_page, cards, fav_ids
 
 
 def render_from_cache(
@@ -54,15 +90,50 @@ def render_from_cache(
     preset_filter: str,
     unit: str,
     page: int,
-    cards_cache: list[dict[str, Any]],
-    fav_ids_cache: list[str],
+    cards_handle: str,
     search_raw: str = "",
     per_page_raw: str = "10",
-) -> tuple[str, str, int]:
-    """Re-render from cached cards without hitting the API."""
-    filtered = filter_by_mode_preset(cards_cache, mode_filter, preset_filter)
-    return render_filtered_page(
-        filtered, fav_ids_cache, unit, page, search_raw, per_page_raw
+    actor_id: str = "",
+) -> tuple[str, str, int, str]:
+    """Re-render the cached page without hitting the API (unit change)."""
+    if not actor_id:
+        actor_id = get_default_actor_id()
+    fetch = _public_page_fetcher(
+        actor_id, mode_filter, preset_filter, search_raw, per_page_raw
+    )
+    return render_page_set(
+        fetch,
+        actor_id,
+        unit,
+        page,
+        cards_handle,
+        load_fav_ids=_fav_ids_loader(actor_id),
+    )
+
+
+def _load_page(
+    mode_filter: str,
+    preset_filter: str,
+    unit: str,
+    page: int,
+    cards_handle: str,
+    search_raw: str,
+    per_page_raw: str,
+    actor_id: str,
+) -> tuple[str, str, int, str]:
+    """Fetch *page* of the current page-set using the cached cursors."""
+    if not actor_id:
+        actor_id = get_default_actor_id()
+    fetch = _public_page_fetcher(
+        actor_id, mode_filter, preset_filter, search_raw, per_page_raw
+    )
+    return load_page_set_page(
+        fetch,
+        actor_id,
+        unit,
+        page,
+        cards_handle,
+        load_fav_ids=_fav_ids_loader(actor_id),
     )
 
 
@@ -71,21 +142,21 @@ def go_to_previous_page(
     preset_filter: str,
     unit: str,
     current_page: int,
-    cards_cache: list[dict[str, Any]],
-    fav_ids_cache: list[str],
+    cards_handle: str,
     search_raw: str = "",
     per_page_raw: str = "10",
-) -> tuple[str, str, int]:
+    actor_id: str = "",
+) -> tuple[str, str, int, str]:
     """Navigate to the previous page."""
-    return render_from_cache(
+    return _load_page(
         mode_filter,
         preset_filter,
         unit,
         max(1, current_page - 1),
-        cards_cache,
-        fav_ids_cache,
+        cards_handle,
         search_raw,
         per_page_raw,
+        actor_id,
     )
 
 
@@ -94,21 +165,21 @@ def go_to_next_page(
     preset_filter: str,
     unit: str,
     current_page: int,
-    cards_cache: list[dict[str, Any]],
-    fav_ids_cache: list[str],
+    cards_handle: str,
     search_raw: str = "",
     per_page_raw: str = "10",
-) -> tuple[str, str, int]:
+    actor_id: str = "",
+) -> tuple[str, str, int, str]:
     """Navigate to the next page."""
-    return render_from_cache(
+    return _load_page(
         mode_filter,
         preset_filter,
         unit,
         current_page + 1,
-        cards_cache,
-        fav_ids_cache,
+        cards_handle,
         search_raw,
         per_page_raw,
+        actor_id,
     )
 
 
@@ -128,7 +199,6 @@ class HomePageCtx:
     home_next_btn: gr.Button
     home_page_state: gr.State
     home_cards_cache_state: gr.State
-    home_fav_ids_cache_state: gr.State
     app: gr.Blocks
     actor_id_state: gr.State | None = None
 
@@ -144,45 +214,33 @@ def wire_home_page(*, ctx: HomePageCtx) -> None:
         c.home_search_box,
         c.home_per_page_dropdown,
     ]
-    if c.actor_id_state is not None:
-        _all_inputs.append(c.actor_id_state)
-    _cache_inputs = [
+    _nav_inputs: list[gr.components.Component] = [
         c.home_mode_filter,
         c.home_preset_filter,
         c.home_unit_selector,
         c.home_page_state,
         c.home_cards_cache_state,
-        c.home_fav_ids_cache_state,
         c.home_search_box,
         c.home_per_page_dropdown,
     ]
-    _page_outputs = [c.home_recent_html, c.home_page_info, c.home_page_state]
+    # Filter changes reuse the page-set handle (and its favorite ids);
+    # the reload button starts a fresh page-set.
+    _refresh_inputs = list(_all_inputs)
+    if c.actor_id_state is not None:
+        _all_inputs.append(c.actor_id_state)
+        _refresh_inputs += [c.actor_id_state, c.home_cards_cache_state]
+        _nav_inputs.append(c.actor_id_state)
     _full_outputs = [
         c.home_recent_html,
         c.home_page_info,
         c.home_page_state,
         c.home_cards_cache_state,
-        c.home_fav_ids_cache_state,
     ]
 
     # Load cards on initial page load
-    c.app.load(fn=load_recent_cards, inputs=_all_inputs, outputs=_full_outputs)
-
-    # Filter changes → reset to page 1 from cache
-    def _cache_reset_page1(
-        mode: str,
-        preset: str,
-        unit: str,
-        _page: int,
-        cards: list[dict[str, Any]],
-        fav_ids: list[str],
-        search: str,
-        per_page: str,
-    ) -> tuple[str, str, int]:
-        return render_from_cache(
-            mode, preset, unit, 1, cards, fav_ids, search, per_page
-        )
+    c.app.load(fn=load_recent_cards, inputs=_refresh_inputs, outputs=_full_outputs)
 
+    # Filter / search / per-page changes → fetch page 1 of the new query
     for widget in (
         c.home_mode_filter,
         c.home_preset_filter,
@@ -190,16 +248,16 @@ def wire_home_page(*, ctx: HomePageCtx) -> None:
         c.home_per_page_dropdown,
     ):
         widget.change(
-            fn=_cache_reset_page1,
-            inputs=_cache_inputs,
-            outputs=_page_outputs,
+            fn=load_recent_cards,
+            inputs=_refresh_inputs,
+            outputs=_full_outputs,
         )
 
     # Unit change keeps current page
     c.home_unit_selector.change(
         fn=render_from_cache,
-        inputs=_cache_inputs,
-        outputs=_page_outputs,
+        inputs=_nav_inputs,
+        outputs=_full_outputs,
     )
 
     # Reload from API
@@ -212,11 +270,11 @@ def wire_home_page(*, ctx: HomePageCtx) -> None:
     # Pagination
     c.home_prev_btn.click(
         fn=go_to_previous_page,
-        inputs=_cache_inputs,
-        outputs=_page_outputs,
+        inputs=_nav_inputs,
+        outputs=_full_outputs,
     )
     c.home_next_btn.click(
         fn=go_to_next_page,
-        inputs=_cache_inputs,
-        outputs=_page_outputs,
+        inputs=_nav_inputs,
+        outputs=_full_outputs,
     )
@@ -14,7 +14,13 @@ from adapters.ui_gradio.auth import is_session_valid
 from adapters.ui_gradio.services import navigation as nav_svc
 from adapters.ui_gradio.state_helpers import get_default_actor_id
 from adapters.ui_gradio.ui.components.search_helpers import (
-    render_filtered_page,
+    FavIdsLoader,
+    PageFetcher,
+    load_page_set_page,
+    open_page_set,
+    parse_per_page,
+    render_page_set,
+    search_query_param,
 )
 from adapters.ui_gradio.ui.router import (
     PAGE_LIST,
@@ -25,57 +31,87 @@ from adapters.ui_gradio.ui.router import (
 _n_containers_holder: list[int] = [6]
 
 
+def _page_fetcher(
+    filter_value: str,
+    search_raw: str,
+    per_page_raw: str,
+    actor_id: str,
+) -> PageFetcher:
+    """Build a cursor -> page callable for the selected list filter."""
+
+    def _fetch(cursor: str | None) -> dict[str, Any]:
+        return nav_svc.list_cards(
+            actor_id,
+            filter_value,
+            limit=parse_per_page(per_page_raw),
+            cursor=cursor,
+            name_query=search_query_param(search_raw),
+        )
+
+    return _fetch
+
+
+def _fav_ids_loader(actor_id: str) -> FavIdsLoader:
+    """Build a callable returning *actor_id*'s favorite card ids."""
+
+    def _load() -> list[str]:
+        fav_ids: list[str] = nav_svc.list_favorites(actor_id).get("card_ids", [])
+        return fav_ids
+
+    return _load
+
+
 def _refresh_cache(
     filter_value: str,
     unit: str = "cm",
     search_raw: str = "",
     per_page_raw: str = "10",
     actor_id: str = "",
-) -> tuple[str, str, int, dict[str, list[dict[str, Any]]], list[str], bool]:
-    """Fetch cards from API and return rendered first page plus cache."""
+    handle: str = "",
+) -> tuple[str, str, int, str, bool]:
+    """Fetch the first page for *filter_value* and return it plus the handle."""
     if not actor_id:
         actor_id = get_default_actor_id()
-    cache: dict[str, list[dict[str, Any]]] = {}
-    for key in ["mine", "shared_with_me"]:
-        result = nav_svc.list_cards(actor_id, key)
-        cache[key] = result.get("cards", []) if result.get("status") != "error" else []
-
-    fav_result = nav_svc.list_favorites(actor_id)
-    fav_ids = fav_result.get("card_ids", [])
-
-    cards = cache.get(filter_value, [])
-    html, page_info, new_page = render_filtered_page(
-        cards, fav_ids, unit, 1, search_raw, per_page_raw
+    fetch = _page_fetcher(filter_value, search_raw, per_page_raw, actor_id)
+    html, page_info, new_page, handle = open_page_set(
+        fetch, actor_id, unit, handle, load_fav_ids=_fav_ids_loader(actor_id)
     )
-    return html, page_info, new_page, cache, fav_ids, True
+    return html, page_info, new_page, handle, True
 
 
 def _render_from_cache(
     filter_value: str,
     unit: str,
     page: int,
-    cache: dict[str, list[dict[str, Any]]],
-    fav_ids: list[str],
+    handle: str,
     search_raw: str = "",
     per_page_raw: str = "10",
-) -> tuple[str, str, int]:
-    """Render a page from the in-memory cache."""
-    cards = cache.get(filter_value, []) if isinstance(cache, dict) else []
-    return render_filtered_page(cards, fav_ids, unit, page, search_raw, per_page_raw)
+    actor_id: str = "",
+) -> tuple[str, str, int, str]:
+    """Re-render the cached page without hitting the API (unit change)."""
+    if not actor_id:
+        actor_id = get_default_actor_id()
+    fetch = _page_fetcher(filter_value, search_raw, per_page_raw, actor_id)
+    return render_page_set(
+        fetch, actor_id, unit, page, handle, load_fav_ids=_fav_ids_loader(actor_id)
+    )
 
 
-def _cache_reset_page1(
+def _load_page(
     filter_value: str,
     unit: str,
-    _page: int,
-    cache: dict[str, list[dict[str, Any]]],
-    fav_ids: list[str],
+    page: int,
+    handle: str,
     search_raw: str,
     per_page_raw: str,
-) -> tuple[str, str, int]:
-    """Re-render from cache starting at page 1."""
-    return _render_from_cache(
-        filter_value, unit, 1, cache, fav_ids, search_raw, per_page_raw
+    actor_id: str,
+) -> tuple[str, str, int, str]:
+    """Fetch *page* of the current page-set using the cached cursors."""
+    if not actor_id:
+        actor_id = get_default_actor_id()
+    fetch = _page_fetcher(filter_value, search_raw, per_page_raw, actor_id)
+    return load_page_set_page(
+        fetch, actor_id, unit, page, handle, load_fav_ids=_fav_ids_loader(actor_id)
     )
 
 
@@ -83,20 +119,20 @@ def _go_prev(
     filter_value: str,
     unit: str,
     current_page: int,
-    cache: dict[str, list[dict[str, Any]]],
-    fav_ids: list[str],
+    handle: str,
     search_raw: str,
     per_page_raw: str,
-) -> tuple[str, str, int]:
+    actor_id: str = "",
+) -> tuple[str, str, int, str]:
     """Navigate to the previous page."""
-    return _render_from_cache(
+    return _load_page(
         filter_value,
         unit,
         max(1, current_page - 1),
-        cache,
-        fav_ids,
+        handle,
         search_raw,
         per_page_raw,
+        actor_id,
     )
 
 
@@ -104,20 +140,20 @@ def _go_next(
     filter_value: str,
     unit: str,
     current_page: int,
-    cache: dict[str, list[dict[str, Any]]],
-    fav_ids: list[str],
+    handle: str,
     search_raw: str,
     per_page_raw: str,
-) -> tuple[str, str, int]:
+    actor_id: str = "",
+) -> tuple[str, str, int, str]:
     """Navigate to the next page."""
-    return _render_from_cache(
+    return _load_page(
         filter_value,
         unit,
         current_page + 1,
-        cache,
-        fav_ids,
+        handle,
         search_raw,
         per_page_raw,
+        actor_id,
     )
 
 
@@ -126,6 +162,7 @@ def _navigate_and_load(
     unit: str,
     sid: str = "",
     actor_id: str = "",
+    handle: str = "",
 ):
     """Navigate to list page, always loading fresh data from the API.
 
@@ -133,8 +170,8 @@ def _navigate_and_load(
     returns a full no-op to avoid re-showing page containers after
     the login panel is already displayed.
     """
-    # page_state + containers + 7 data outputs
-    _n_out = 1 + _n_containers_holder[0] + 7
+    # page_state + containers + 6 data outputs
+    _n_out = 1 + _n_containers_holder[0] + 6
 
     # Fast check: if the session is already gone, skip everything.
     if sid and not is_session_valid(sid):
@@ -145,18 +182,16 @@ def _navigate_and_load(
         html,
         page_info,
         new_page,
-        new_cache,
-        new_fav_ids,
+        new_handle,
         loaded_flag,
-    ) = _refresh_cache(filter_value, unit, actor_id=actor_id)
+    ) = _refresh_cache(filter_value, unit, actor_id=actor_id, handle=handle)
     result = (
         *nav,
         filter_value,
         html,
         page_info,
         new_page,
-        new_cache,
-        new_fav_ids,
+        new_handle,
         loaded_flag,
     )
 
@@ -187,7 +222,6 @@ class ListPageCtx:
     list_page_state: gr.State
     home_browse_btn: gr.Button
     list_cards_cache_state: gr.State
-    list_fav_ids_cache_state: gr.State
     list_loaded_state: gr.State
     actor_id_state: gr.State | None = None
     session_id_state: gr.State | None = None
@@ -202,33 +236,27 @@ def wire_list_page(*, ctx: ListPageCtx) -> Any:
     c = ctx
     _n_containers_holder[0] = len(c.page_containers)
 
-    _cache_inputs = [
+    _cache_inputs: list[gr.components.Component] = [
         c.list_filter,
         c.list_unit_selector,
         c.list_page_state,
         c.list_cards_cache_state,
-        c.list_fav_ids_cache_state,
         c.list_search_box,
         c.list_per_page_dropdown,
     ]
-    _page_outputs = [c.list_cards_html, c.list_page_info, c.list_page_state]
-
-    for widget in (c.list_filter, c.list_search_box, c.list_per_page_dropdown):
-        widget.change(
-            fn=_cache_reset_page1,
-            inputs=_cache_inputs,
-            outputs=_page_outputs,
-        )
-
-    # Unit change keeps current page
-    c.list_unit_selector.change(
-        fn=_render_from_cache,
-        inputs=_cache_inputs,
-        outputs=_page_outputs,
-    )
+    if c.actor_id_state is not None:
+        _cache_inputs.append(c.actor_id_state)
+    _nav_outputs = [
+        c.list_cards_html,
+        c.list_page_info,
+        c.list_page_state,
+        c.list_cards_cache_state,
+    ]
 
-    # Refresh button
-    _refresh_inputs: list[gr.components.Component] = list(
+    # Refresh inputs (filter / search / per-page / reload → page 1).
+    # Filter changes reuse the page-set handle (and its favorite ids);
+    # the reload button starts a fresh page-set.
+    _reload_inputs: list[gr.components.Component] = list(
         filter(
             None,
             [
@@ -240,23 +268,35 @@ def wire_list_page(*, ctx: ListPageCtx) -> Any:
             ],
         )
     )
+    _refresh_inputs = list(_reload_inputs)
+    if c.actor_id_state is not None:
+        _refresh_inputs.append(c.list_cards_cache_state)
+    _refresh_outputs = [*_nav_outputs, c.list_loaded_state]
+
+    for widget in (c.list_filter, c.list_search_box, c.list_per_page_dropdown):
+        widget.change(
+            fn=_refresh_cache,
+            inputs=_refresh_inputs,
+            outputs=_refresh_outputs,
+        )
+
+    # Unit change keeps current page
+    c.list_unit_selector.change(
+        fn=_render_from_cache,
+        inputs=_cache_inputs,
+        outputs=_nav_outputs,
+    )
 
+    # Refresh button
     c.list_reload_btn.click(
         fn=_refresh_cache,
-        inputs=_refresh_inputs,
-        outputs=[
-            c.list_cards_html,
-            c.list_page_info,
-            c.list_page_state,
-            c.list_cards_cache_state,
-            c.list_fav_ids_cache_state,
-            c.list_loaded_state,
-        ],
+        inputs=_reload_inputs,
+        outputs=_refresh_outputs,
     )
 
     # Pagination
-    c.list_prev_btn.click(fn=_go_prev, inputs=_cache_inputs, outputs=_page_outputs)
-    c.list_next_btn.click(fn=_go_next, inputs=_cache_inputs, outputs=_page_outputs)
+    c.list_prev_btn.click(fn=_go_prev, inputs=_cache_inputs, outputs=_nav_outputs)
+    c.list_next_btn.click(fn=_go_next, inputs=_cache_inputs, outputs=_nav_outputs)
 
     # Navigate from home → list page
     _nav_inputs: list[gr.components.Component] = [
@@ -266,7 +306,7 @@ def wire_list_page(*, ctx: ListPageCtx) -> Any:
     if c.session_id_state is not None:
         _nav_inputs.append(c.session_id_state)
     if c.actor_id_state is not None:
-        _nav_inputs.append(c.actor_id_state)
+        _nav_inputs += [c.actor_id_state, c.list_cards_cache_state]
 
     browse_event = c.home_browse_btn.click(
         fn=_navigate_and_load,
@@ -279,7 +319,6 @@ def wire_list_page(*, ctx: ListPageCtx) -> Any:
             c.list_page_info,
             c.list_page_state,
             c.list_cards_cache_state,
-            c.list_fav_ids_cache_state,
             c.list_loaded_state,
         ],
     )
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Optional, Protocol, Sequence
 
 
 class MapRenderer(Protocol):
     def render_svg(self, map_spec: dict) -> str: ...
 
     def render(self, table_mm: dict, shapes: list[dict]) -> str: ...
+
+
+class MapRenderCache(Protocol):
+    """Content-addressed store of rendered maps (keyed by content hash)."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def put(self, key: str, svg: str) -> None: ...
+
+
+class ThumbnailRenderer(Protocol):
+    """Renders small map previews for a batch of ``(table_mm, shapes)``."""
+
+    def render_many(self, maps: Sequence[tuple[dict, list[dict]]]) -> list[str]: ...
@@ -6,9 +6,17 @@ Infrastructure provides concrete implementations.
 
 from __future__ import annotations
 
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Sequence
 
-from domain.cards.card import Card
+from domain.cards.card import Card, CardSummary
+
+# =============================================================================
+# LIST FILTERS
+# =============================================================================
+# Filter values accepted by ``CardRepository.list_visible``.
+LIST_FILTER_MINE = "mine"
+LIST_FILTER_PUBLIC = "public"
+LIST_FILTER_SHARED_WITH_ME = "shared_with_me"
 
 
 class CardRepository(Protocol):
@@ -19,8 +27,23 @@ class CardRepository(Protocol):
 
     def save(self, card: Card) -> None: ...
 
+    def save_many(self, cards: Sequence[Card]) -> None:
+        """Save several cards in one batch (last write wins per card_id)."""
+        ...
+
     def get_by_id(self, card_id: str) -> Optional[Card]: ...
 
+    def get_many(self, card_ids: Sequence[str]) -> list[Card]:
+        """Fetch several cards in one round trip.
+
+        Unknown ids are skipped; the result is ordered by card_id.
+        """
+        ...
+
+    def get_summaries(self, card_ids: Sequence[str]) -> list[CardSummary]:
+        """Like ``get_many``, but return summaries (no map shapes loaded)."""
+        ...
+
     def find_by_seed(self, seed: int) -> Optional[Card]: ...
 
     def delete(self, card_id: str) -> bool: ...
@@ -29,6 +52,51 @@ class CardRepository(Protocol):
 
     def list_for_owner(self, owner_id: str) -> list[Card]: ...
 
+    def list_visible(
+        self,
+        actor_id: str,
+        filter_value: str,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        name_query: Optional[str] = None,
+        mode: Optional[str] = None,
+        table_preset: Optional[str] = None,
+    ) -> list[Card]:
+        """Return cards matching *filter_value* for *actor_id*.
+
+        Results are ordered by ``card_id``.  *cursor* is the last
+        ``card_id`` of the previous page (keyset pagination); only cards
+        sorting strictly after it are returned.  *limit* caps the page
+        size (``None`` = no limit).
+
+        Optional narrowing criteria (``None`` = no restriction):
+        *name_query* is a case-insensitive substring of the card name,
+        *mode* a ``GameMode`` value and *table_preset* a
+        ``TableSize.preset_name`` value.  Implementations are expected to
+        serve *name_query* from a name index (trigram) rather than by
+        scanning every card.
+        """
+        ...
+
+    def list_visible_summaries(
+        self,
+        actor_id: str,
+        filter_value: str,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        name_query: Optional[str] = None,
+        mode: Optional[str] = None,
+        table_preset: Optional[str] = None,
+    ) -> list[CardSummary]:
+        """Like ``list_visible``, but return summaries for list pages.
+
+        Implementations should read only the summary columns and must not
+        construct a ``MapSpec``.
+        """
+        ...
+
 
 class FavoritesRepository(Protocol):
     """Port for favorites persistence."""
@@ -39,4 +107,8 @@ class FavoritesRepository(Protocol):
 
     def list_favorites(self, actor_id: str) -> list[str]: ...
 
+    def remove_favorites(self, actor_id: str, card_ids: Sequence[str]) -> None:
+        """Unset several favorites of *actor_id* in one statement."""
+        ...
+
     def remove_all_for_card(self, card_id: str) -> None: ...
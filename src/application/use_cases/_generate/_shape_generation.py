@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import random
-from typing import Any
+from functools import lru_cache
+from typing import Any, cast
 
 from application.use_cases._generate._themes import (
     DEPLOYMENT_DESCRIPTIONS as _DEPLOYMENT_DESCRIPTIONS,
@@ -164,6 +165,20 @@ def _build_non_overlapping_deployments(
     return result
 
 
+# Seeds resolved recently (the UI "apply seed" flow asks for the same
+# seed repeatedly); results are deterministic, so they are memoized.
+SEEDED_SHAPES_CACHE_SIZE = 256
+
+
+def _copy_shapes(value: Any) -> Any:
+    """Copy a JSON-like shape structure (cheaper than ``copy.deepcopy``)."""
+    if isinstance(value, dict):
+        return {key: _copy_shapes(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_shapes(item) for item in value]
+    return value
+
+
 def _generate_seeded_shapes(
     seed: int,
     table_width: int,
@@ -171,6 +186,23 @@ def _generate_seeded_shapes(
 ) -> dict[str, list[dict[str, Any]]]:
     """Generate deterministic shapes from a seed and table dimensions.
 
+    Memoized per ``(seed, table_width, table_height)``; every call
+    returns a fresh copy, so callers may mutate the result.
+    """
+    return cast(
+        dict[str, list[dict[str, Any]]],
+        _copy_shapes(_build_seeded_shapes(seed, table_width, table_height)),
+    )
+
+
+@lru_cache(maxsize=SEEDED_SHAPES_CACHE_SIZE)
+def _build_seeded_shapes(
+    seed: int,
+    table_width: int,
+    table_height: int,
+) -> dict[str, list[dict[str, Any]]]:
+    """Build the shapes for ``_generate_seeded_shapes`` (cached, never mutate).
+
     Uses a separate RNG (seeded from ``f"shapes-{seed}"``) so that shape
     generation is completely independent of text-field auto-fill order.
 
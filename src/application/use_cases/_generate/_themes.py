@@ -7,6 +7,7 @@ resolution helpers used by ``generate_scenario_card``.
 from __future__ import annotations
 
 import random
+from functools import lru_cache
 from typing import Any
 
 # =============================================================================
@@ -838,12 +839,24 @@ SCENOGRAPHY_DESCRIPTIONS_OVERLAP = [
 # =============================================================================
 
 
+# Seeds resolved recently (the UI "apply seed" flow asks for the same
+# seed repeatedly); results are deterministic, so they are memoized.
+SEED_THEMES_CACHE_SIZE = 1024
+
+
 def _resolve_seed_from_themes(seed: int) -> dict[str, str]:
     """Resolve content fields from a seed using theme-based generation.
 
     This is the internal implementation that generates content from
-    ``_CONTENT_THEMES`` without checking existing cards.
+    ``_CONTENT_THEMES`` without checking existing cards.  Memoized per
+    seed; every call returns a fresh dict.
     """
+    return dict(_themes_for_seed(seed))
+
+
+@lru_cache(maxsize=SEED_THEMES_CACHE_SIZE)
+def _themes_for_seed(seed: int) -> dict[str, str]:
+    """Build the fields for ``_resolve_seed_from_themes`` (cached, never mutate)."""
     if seed <= 0:
         return {
             "armies": "",
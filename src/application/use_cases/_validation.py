@@ -6,11 +6,11 @@ so that error messages and logic live in a single place.
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Optional, cast
 
 from application.ports.repositories import CardRepository
 from domain.cards.card import Card
-from domain.errors import ForbiddenError, NotFoundError
+from domain.errors import ForbiddenError, NotFoundError, ValidationError
 from domain.validation import validate_non_empty_str
 
 
@@ -44,6 +44,49 @@ def validate_card_id(card_id: object) -> str:
     return cast(str, validate_non_empty_str("card_id", card_id))
 
 
+# Page-size and search limits shared by the list use cases
+MAX_PAGE_SIZE = 100
+_MAX_CURSOR_LENGTH = 255
+_MAX_NAME_QUERY_LENGTH = 200
+
+
+def validate_page_limit(value: object) -> Optional[int]:
+    """Validate page size: ``None`` (no paging) or an int in 1..MAX_PAGE_SIZE."""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValidationError("limit must be an integer")
+    if not 1 <= value <= MAX_PAGE_SIZE:
+        raise ValidationError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return value
+
+
+def validate_page_cursor(value: object) -> Optional[str]:
+    """Validate keyset cursor (last card_id of the previous page)."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValidationError("cursor must be a string")
+    stripped = value.strip()
+    if len(stripped) > _MAX_CURSOR_LENGTH:
+        raise ValidationError("cursor is too long")
+    return stripped or None
+
+
+def validate_name_query(value: object) -> Optional[str]:
+    """Normalise the name search query (``None`` when empty)."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValidationError("name_query must be a string")
+    stripped = value.strip()
+    if len(stripped) > _MAX_NAME_QUERY_LENGTH:
+        raise ValidationError(
+            f"name_query cannot exceed {_MAX_NAME_QUERY_LENGTH} characters"
+        )
+    return stripped or None
+
+
 def load_card_for_read(repository: CardRepository, card_id: str, actor_id: str) -> Card:
     """Fetch a card and enforce **read** access (anti-IDOR).
 
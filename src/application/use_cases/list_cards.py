@@ -8,15 +8,28 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, List, Optional
 
-from application.ports.repositories import CardRepository
-from application.use_cases._validation import validate_actor_id
+from application.ports.repositories import (
+    LIST_FILTER_MINE,
+    LIST_FILTER_PUBLIC,
+    LIST_FILTER_SHARED_WITH_ME,
+    CardRepository,
+)
+from application.use_cases._validation import (
+    validate_actor_id,
+    validate_name_query,
+    validate_page_cursor,
+    validate_page_limit,
+)
+from domain.cards.card import parse_game_mode
 from domain.errors import ValidationError
-from domain.security.authz import Visibility
 
 # =============================================================================
 # VALID FILTERS
 # =============================================================================
-_VALID_FILTERS = frozenset(["mine", "public", "shared_with_me"])
+_VALID_FILTERS = frozenset(
+    [LIST_FILTER_MINE, LIST_FILTER_PUBLIC, LIST_FILTER_SHARED_WITH_ME]
+)
+_VALID_TABLE_PRESETS = frozenset(["standard", "massive", "custom"])
 
 
 # =============================================================================
@@ -39,6 +52,28 @@ def _validate_filter(value: object) -> str:
     return stripped
 
 
+def _validate_mode(value: object) -> Optional[str]:
+    """Normalise the optional game-mode criterion."""
+    if value is None:
+        return None
+    return parse_game_mode(value).value
+
+
+def _validate_table_preset(value: object) -> Optional[str]:
+    """Normalise the optional table-preset criterion."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValidationError("table_preset must be a string")
+    normalized = value.strip().lower()
+    if normalized not in _VALID_TABLE_PRESETS:
+        raise ValidationError(
+            f"unknown table_preset '{normalized}', "
+            f"must be one of: {', '.join(sorted(_VALID_TABLE_PRESETS))}"
+        )
+    return normalized
+
+
 # =============================================================================
 # REQUEST / RESPONSE DTOs
 # =============================================================================
@@ -48,6 +83,11 @@ class ListCardsRequest:
 
     actor_id: Optional[str]
     filter: Optional[str]
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    name_query: Optional[str] = None
+    mode: Optional[str] = None
+    table_preset: Optional[str] = None
 
 
 @dataclass(frozen=True)
@@ -55,6 +95,7 @@ class ListCardsResponse:
     """Response DTO for ListCards use case."""
 
     cards: List[Any]  # List of card snapshots
+    next_cursor: Optional[str] = None  # None when there is no further page
 
 
 # =============================================================================
@@ -70,76 +111,45 @@ class ListCards:
         """Execute the use case.
 
         Args:
-            request: Request DTO with actor_id and filter.
+            request: Request DTO with actor_id, filter and optional
+                paging (limit / cursor) and search criteria.
 
         Returns:
-            Response DTO with list of visible cards.
+            Response DTO with the visible cards of the requested page and
+            the cursor of the next page (``None`` on the last page).
 
         Raises:
-            ValidationError: If actor_id or filter is invalid.
+            ValidationError: If any request field is invalid.
         """
         # 1) Validate inputs
         actor_id = validate_actor_id(request.actor_id)
         filter_value = _validate_filter(request.filter)
-
-        # 2) Get all cards from repository
-        all_cards = self._repository.list_all()
-
-        # 3) Apply filter
-        filtered = self._apply_filter(all_cards, filter_value, actor_id)
-
-        # 4) Apply security filter (anti-IDOR): only cards user can read
-        visible = [c for c in filtered if c.can_user_read(actor_id)]
-
-        # 5) Build response snapshots
-        items = [self._to_snapshot(c) for c in visible]
-
-        return ListCardsResponse(cards=items)
-
-    def _apply_filter(
-        self, cards: List[Any], filter_value: str, actor_id: str
-    ) -> List[Any]:
-        """Apply filter to cards based on filter type."""
-        if filter_value == "mine":
-            return [c for c in cards if c.owner_id == actor_id]
-
-        if filter_value == "public":
-            return [c for c in cards if c.visibility == Visibility.PUBLIC]
-
-        if filter_value == "shared_with_me":
-            return [
-                c
-                for c in cards
-                if c.visibility == Visibility.SHARED
-                and c.shared_with is not None
-                and actor_id in c.shared_with
-            ]
-
-        return []
-
-    def _to_snapshot(self, card: Any) -> "_CardSnapshot":
-        """Convert card to snapshot DTO."""
-        # Extract table_mm from card.table (TableSize object)
-        table_mm = None
-        table_preset = None
-        if hasattr(card, "table") and card.table:
-            table_mm = {
-                "width_mm": card.table.width_mm,
-                "height_mm": card.table.height_mm,
-            }
-            # Detect preset based on dimensions
-            table_preset = card.table.preset_name
-
-        return _CardSnapshot(
-            card_id=card.card_id,
-            owner_id=card.owner_id,
-            visibility=card.visibility.value,
-            mode=card.mode.value,
-            seed=card.seed,
-            name=card.name or "",  # Now from Card domain model
-            table_preset=table_preset,
-            table_mm=table_mm,
+        limit = validate_page_limit(request.limit)
+
+        # 2) Let the repository apply filter + criteria (indexed query).
+        #    One extra row is fetched to detect whether a next page exists.
+        #    Summaries only: list pages never need the map shapes.
+        fetched = self._repository.list_visible_summaries(
+            actor_id,
+            filter_value,
+            limit=None if limit is None else limit + 1,
+            cursor=validate_page_cursor(request.cursor),
+            name_query=validate_name_query(request.name_query),
+            mode=_validate_mode(request.mode),
+            table_preset=_validate_table_preset(request.table_preset),
         )
+        next_cursor = None
+        if limit is not None and len(fetched) > limit:
+            fetched = fetched[:limit]
+            next_cursor = fetched[-1].card_id
+
+        # 3) Apply security filter (anti-IDOR): only cards user can read
+        visible = [c for c in fetched if c.can_user_read(actor_id)]
+
+        # 4) Build response snapshots
+        items = [card_snapshot(c) for c in visible]
+
+        return ListCardsResponse(cards=items, next_cursor=next_cursor)
 
 
 @dataclass(frozen=True)
@@ -154,3 +164,28 @@ class _CardSnapshot:
     name: str
     table_preset: Optional[str]
     table_mm: Optional[dict[str, int]]
+
+
+def card_snapshot(card: Any) -> _CardSnapshot:
+    """Convert a domain card (or ``CardSummary``) to the list snapshot DTO."""
+    # Extract table_mm from card.table (TableSize object)
+    table_mm = None
+    table_preset = None
+    if hasattr(card, "table") and card.table:
+        table_mm = {
+            "width_mm": card.table.width_mm,
+            "height_mm": card.table.height_mm,
+        }
+        # Detect preset based on dimensions
+        table_preset = card.table.preset_name
+
+    return _CardSnapshot(
+        card_id=card.card_id,
+        owner_id=card.owner_id,
+        visibility=card.visibility.value,
+        mode=card.mode.value,
+        seed=card.seed,
+        name=card.name or "",  # Now from Card domain model
+        table_preset=table_preset,
+        table_mm=table_mm,
+    )
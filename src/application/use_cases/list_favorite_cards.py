@@ -0,0 +1,127 @@
+"""ListFavoriteCards use case.
+
+Returns one page of the actor's favorite cards as list snapshots, so
+callers do not have to resolve favorite ids card by card.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from application.ports.repositories import CardRepository, FavoritesRepository
+from application.use_cases._validation import (
+    validate_actor_id,
+    validate_name_query,
+    validate_page_cursor,
+    validate_page_limit,
+)
+from application.use_cases.list_cards import card_snapshot
+from application.use_cases.list_favorites import partition_favorites
+from domain.cards.card import CardSummary
+
+# Favorites resolved per get_summaries() call while a name search is active
+# (matches are sparse, so small batches would cost extra round trips).
+_SEARCH_BATCH_SIZE = 500
+
+
+# =============================================================================
+# REQUEST / RESPONSE DTOs
+# =============================================================================
+@dataclass(frozen=True)
+class ListFavoriteCardsRequest:
+    """Request DTO for ListFavoriteCards use case."""
+
+    actor_id: Optional[str]
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    name_query: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ListFavoriteCardsResponse:
+    """Response DTO for ListFavoriteCards use case."""
+
+    cards: List[Any]  # List of card snapshots
+    next_cursor: Optional[str] = None  # None when there is no further page
+
+
+# =============================================================================
+# USE CASE
+# =============================================================================
+class ListFavoriteCards:
+    """Use case for listing favorite cards (keyset-paginated by card_id)."""
+
+    def __init__(
+        self,
+        card_repository: CardRepository,
+        favorites_repository: FavoritesRepository,
+    ) -> None:
+        self._card_repository = card_repository
+        self._favorites_repository = favorites_repository
+
+    def execute(self, request: ListFavoriteCardsRequest) -> ListFavoriteCardsResponse:
+        """Execute the use case.
+
+        Args:
+            request: Request DTO with actor_id and optional paging
+                (limit / cursor) and name search.
+
+        Returns:
+            Response DTO with the favorite cards of the requested page and
+            the cursor of the next page (``None`` on the last page).
+
+        Raises:
+            ValidationError: If any request field is invalid.
+        """
+        # 1) Validate inputs
+        actor_id = validate_actor_id(request.actor_id)
+        limit = validate_page_limit(request.limit)
+        cursor = validate_page_cursor(request.cursor)
+        name_query = validate_name_query(request.name_query)
+
+        # 2) Favorite ids after the cursor (list_favorites is sorted)
+        favorite_ids = [
+            cid
+            for cid in self._favorites_repository.list_favorites(actor_id)
+            if cursor is None or cid > cursor
+        ]
+
+        # 3) Resolve in batches (one get_summaries each) until the page plus one
+        #    look-ahead card is full; collect stale ids on the way.
+        batch_size = len(favorite_ids) or 1
+        if limit is not None and name_query is None:
+            batch_size = limit + 1
+        elif limit is not None:
+            batch_size = max(limit + 1, _SEARCH_BATCH_SIZE)
+
+        page: list[CardSummary] = []
+        stale_ids: list[str] = []
+        for start in range(0, len(favorite_ids), batch_size):
+            batch = favorite_ids[start : start + batch_size]
+            cards, stale = partition_favorites(self._card_repository, actor_id, batch)
+            stale_ids.extend(stale)
+            page.extend(c for c in cards if _name_matches(c, name_query))
+            if limit is not None and len(page) > limit:
+                break
+
+        # 4) Prune stale favorites in one statement
+        if stale_ids:
+            self._favorites_repository.remove_favorites(actor_id, stale_ids)
+
+        next_cursor = None
+        if limit is not None and len(page) > limit:
+            page = page[:limit]
+            next_cursor = page[-1].card_id
+
+        return ListFavoriteCardsResponse(
+            cards=[card_snapshot(c) for c in page],
+            next_cursor=next_cursor,
+        )
+
+
+def _name_matches(card: CardSummary, name_query: Optional[str]) -> bool:
+    """Case-insensitive substring match on the card name."""
+    if not name_query:
+        return True
+    return name_query.lower() in (card.name or "").lower()
@@ -7,10 +7,11 @@ filtered to only include cards the actor can still read.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from application.ports.repositories import CardRepository, FavoritesRepository
 from application.use_cases._validation import validate_actor_id
+from domain.cards.card import CardSummary
 
 
 # =============================================================================
@@ -62,20 +63,42 @@ class ListFavorites:
         # 2) Get favorite card_ids from repository
         favorite_ids = self._favorites_repository.list_favorites(actor_id)
 
-        # 3) Filter: only existing cards that actor can read
-        #    Prune stale entries (deleted / no longer accessible) to keep DB clean.
-        visible_ids = []
-        for card_id in favorite_ids:
-            card = self._card_repository.get_by_id(card_id)
-            # Card deleted → remove stale favorite
-            if card is None:
-                self._favorites_repository.set_favorite(actor_id, card_id, False)
-                continue
-            # Card no longer readable → remove stale favorite
-            if not card.can_user_read(actor_id):
-                self._favorites_repository.set_favorite(actor_id, card_id, False)
-                continue
-            visible_ids.append(card_id)
+        # 3) Filter: only existing cards that actor can read (one bulk fetch).
+        #    Stale entries (deleted / no longer accessible) are pruned in a
+        #    single statement to keep the DB clean.
+        visible, stale_ids = partition_favorites(
+            self._card_repository, actor_id, favorite_ids
+        )
+        if stale_ids:
+            self._favorites_repository.remove_favorites(actor_id, stale_ids)
 
         # 4) Return response
-        return ListFavoritesResponse(card_ids=visible_ids)
+        return ListFavoritesResponse(card_ids=[c.card_id for c in visible])
+
+
+def partition_favorites(
+    card_repository: CardRepository,
+    actor_id: str,
+    favorite_ids: Sequence[str],
+) -> tuple[list[CardSummary], list[str]]:
+    """Split favorite ids into readable card summaries and stale ids.
+
+    Args:
+        card_repository: Repository used for the bulk ``get_summaries`` fetch.
+        actor_id: Already-validated actor ID.
+        favorite_ids: Favorite card ids, in the order to preserve.
+
+    Returns:
+        ``(cards, stale_ids)`` — the readable card summaries in *favorite_ids*
+        order, and the ids whose card is gone or no longer readable.
+    """
+    found = {c.card_id: c for c in card_repository.get_summaries(favorite_ids)}
+    cards: list[CardSummary] = []
+    stale_ids: list[str] = []
+    for card_id in favorite_ids:
+        card = found.get(card_id)
+        if card is None or not card.can_user_read(actor_id):
+            stale_ids.append(card_id)
+        else:
+            cards.append(card)
+    return cards, stale_ids
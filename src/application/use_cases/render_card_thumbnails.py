@@ -0,0 +1,96 @@
+"""RenderCardThumbnails use case.
+
+Renders small map previews for one list page of cards in a single call:
+- One bulk ``get_many`` fetch for all requested cards
+- Security: cards the actor cannot read are silently skipped (anti-IDOR)
+- Delegates the batch to a thumbnail renderer port
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+from application.ports.map_renderer import ThumbnailRenderer
+from application.ports.repositories import CardRepository
+from application.use_cases._validation import (
+    MAX_PAGE_SIZE,
+    validate_actor_id,
+    validate_card_id,
+)
+from application.use_cases.render_map_svg import map_render_inputs
+from domain.errors import ValidationError
+
+
+# =============================================================================
+# REQUEST / RESPONSE DTOs
+# =============================================================================
+@dataclass(frozen=True)
+class RenderCardThumbnailsRequest:
+    """Request DTO for RenderCardThumbnails use case."""
+
+    actor_id: Optional[str]
+    card_ids: Sequence[str] = ()
+
+
+@dataclass(frozen=True)
+class RenderCardThumbnailsResponse:
+    """Response DTO for RenderCardThumbnails use case."""
+
+    thumbnails: Dict[str, str]  # card_id -> SVG (readable cards only)
+
+
+# =============================================================================
+# USE CASE
+# =============================================================================
+class RenderCardThumbnails:
+    """Use case for rendering the map thumbnails of a page of cards."""
+
+    def __init__(
+        self,
+        repository: CardRepository,
+        thumbnail_renderer: ThumbnailRenderer,
+    ) -> None:
+        self._repository = repository
+        self._thumbnail_renderer = thumbnail_renderer
+
+    def execute(
+        self, request: RenderCardThumbnailsRequest
+    ) -> RenderCardThumbnailsResponse:
+        """Execute the use case.
+
+        Args:
+            request: Request DTO with actor_id and the page's card_ids.
+
+        Returns:
+            Response DTO mapping each readable card_id to its thumbnail.
+
+        Raises:
+            ValidationError: If inputs are invalid.
+        """
+        # 1) Validate inputs
+        actor_id = validate_actor_id(request.actor_id)
+        if isinstance(request.card_ids, str):
+            raise ValidationError("card_ids must be a list of card ids")
+        if len(request.card_ids) > MAX_PAGE_SIZE:
+            raise ValidationError(f"at most {MAX_PAGE_SIZE} card_ids per call")
+        card_ids = [validate_card_id(cid) for cid in request.card_ids]
+        if not card_ids:
+            return RenderCardThumbnailsResponse(thumbnails={})
+
+        # 2) Bulk-load cards, keeping only the readable ones
+        cards = [
+            card
+            for card in self._repository.get_many(card_ids)
+            if card.can_user_read(actor_id)
+        ]
+
+        # 3) Render the whole page in one batch
+        svgs = self._thumbnail_renderer.render_many(
+            [map_render_inputs(card) for card in cards]
+        )
+        return RenderCardThumbnailsResponse(
+            thumbnails={
+                card.card_id: svg for card, svg in zip(cards, svgs, strict=True)
+            }
+        )
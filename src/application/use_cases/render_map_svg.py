@@ -3,21 +3,64 @@
 Renders a Card's map to SVG format:
 - Delegates rendering to a renderer port (does NOT render directly)
 - Security: actor must be able to read the card (anti-IDOR)
-- Returns SVG string
+- Returns SVG string plus a content hash of the rendered inputs
+- Optionally serves repeat renders from a content-addressed cache
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
 from typing import Optional
 
-from application.ports.map_renderer import MapRenderer
+from application.ports.map_renderer import MapRenderCache, MapRenderer
 from application.ports.repositories import CardRepository
 from application.use_cases._validation import (
     load_card_for_read,
     validate_actor_id,
     validate_card_id,
 )
+from domain.cards.card import Card
+
+# Bump when the renderer output changes for the same inputs, so hashes
+# (and the HTTP ETags derived from them) handed out earlier stop matching.
+RENDER_VERSION = "1"
+
+
+def map_content_hash(table_mm: dict, shapes: list[dict]) -> str:
+    """Return a stable SHA-256 hex digest of the renderer inputs.
+
+    Two cards with the same table size and shapes hash identically, so
+    the digest can key a render cache and act as a strong ETag.
+    """
+    payload = json.dumps(
+        {"v": RENDER_VERSION, "table": table_mm, "shapes": shapes},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def map_render_inputs(card: Card) -> tuple[dict, list[dict]]:
+    """Return the ``(table_mm, shapes)`` renderer inputs for *card*.
+
+    All shape categories (scenography, deployment, objectives) are
+    combined into a single list.
+    """
+    table_mm = {
+        "width_mm": card.table.width_mm,
+        "height_mm": card.table.height_mm,
+    }
+    all_shapes: list[dict] = []
+    if card.map_spec.shapes:
+        all_shapes.extend(card.map_spec.shapes)
+    if card.map_spec.deployment_shapes:
+        all_shapes.extend(card.map_spec.deployment_shapes)
+    if card.map_spec.objective_shapes:
+        all_shapes.extend(card.map_spec.objective_shapes)
+    return table_mm, all_shapes
 
 
 # =============================================================================
@@ -36,6 +79,7 @@ class RenderMapSvgResponse:
     """Response DTO for RenderMapSvg use case."""
 
     svg: str
+    content_hash: str = ""
 
 
 # =============================================================================
@@ -48,9 +92,11 @@ class RenderMapSvg:
         self,
         repository: CardRepository,
         renderer: MapRenderer,
+        render_cache: Optional[MapRenderCache] = None,
     ) -> None:
         self._repository = repository
         self._renderer = renderer
+        self._render_cache = render_cache
 
     def execute(self, request: RenderMapSvgRequest) -> RenderMapSvgResponse:
         """Execute the use case.
@@ -59,7 +105,7 @@ class RenderMapSvg:
             request: Request DTO with actor_id and card_id.
 
         Returns:
-            Response DTO with SVG string.
+            Response DTO with SVG string and content hash.
 
         Raises:
             ValidationError: If inputs are invalid.
@@ -73,22 +119,19 @@ class RenderMapSvg:
         card = load_card_for_read(self._repository, card_id, actor_id)
 
         # 3) Prepare data for renderer
-        table_mm = {
-            "width_mm": card.table.width_mm,
-            "height_mm": card.table.height_mm,
-        }
-
-        # Combine all shape categories into a single list for rendering
-        all_shapes: list[dict] = []
-        if card.map_spec.shapes:
-            all_shapes.extend(card.map_spec.shapes)
-        if card.map_spec.deployment_shapes:
-            all_shapes.extend(card.map_spec.deployment_shapes)
-        if card.map_spec.objective_shapes:
-            all_shapes.extend(card.map_spec.objective_shapes)
+        table_mm, all_shapes = map_render_inputs(card)
+
+        # 4) Serve repeat renders of identical content from the cache
+        content_hash = map_content_hash(table_mm, all_shapes)
+        if self._render_cache is not None:
+            cached = self._render_cache.get(content_hash)
+            if cached is not None:
+                return RenderMapSvgResponse(svg=cached, content_hash=content_hash)
 
         # 5) Delegate rendering to renderer port
         svg = self._renderer.render(table_mm=table_mm, shapes=all_shapes)
+        if self._render_cache is not None:
+            self._render_cache.put(content_hash, svg)
 
         # 6) Return response
-        return RenderMapSvgResponse(svg=svg)
+        return RenderMapSvgResponse(svg=svg, content_hash=content_hash)
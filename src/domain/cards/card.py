@@ -124,3 +124,44 @@ class Card:
     def can_user_write(self, user_id: str) -> bool:
         """Check if user can write this card."""
         return can_write(owner_id=self.owner_id, current_user_id=user_id)
+
+    def summary(self) -> CardSummary:
+        """Return the list-page projection of this card."""
+        return CardSummary(
+            card_id=self.card_id,
+            owner_id=self.owner_id,
+            visibility=self.visibility,
+            shared_with=self.shared_with,
+            mode=self.mode,
+            seed=self.seed,
+            table=self.table,
+            name=self.name,
+        )
+
+
+@dataclass(frozen=True)
+class CardSummary:
+    """Read model for list pages: a Card without map shapes or text fields.
+
+    Repositories build it from the summary columns only, so listing cards
+    never loads shape JSON nor constructs a ``MapSpec``.  Use the full
+    ``Card`` for detail, render and edit paths.
+    """
+
+    card_id: str
+    owner_id: str
+    visibility: Visibility
+    shared_with: Optional[Collection[str]]
+    mode: GameMode
+    seed: int
+    table: TableSize
+    name: Optional[str] = None
+
+    def can_user_read(self, user_id: str) -> bool:
+        """Check if user can read this card."""
+        return can_read(
+            owner_id=self.owner_id,
+            visibility=self.visibility,
+            current_user_id=user_id,
+            shared_with=self.shared_with,
+        )
@@ -1,14 +1,36 @@
 """Collision detection for map shapes.
 
-Supports RectxRect, CirclexCircle, and RectxCircle overlap tests
-with a configurable clearance margin (MIN_CLEARANCE_MM).
+Supports every pairing of rect, circle and polygon with a configurable
+clearance margin (MIN_CLEARANCE_MM).  Each pair test starts with a
+cheap bounding-box rejection; polygons are then tested with the
+separating axis theorem (SAT) on their convex hull, which is exact for
+convex polygons and conservative (may report a near-miss as a
+collision) for concave ones.
+
+Per-shape data needed by the tests -- bounds, hull, SAT axes -- is
+computed once into a :class:`ShapeGeometry`.  It is kept next to the
+shape rather than inside the shape dict, which is persisted as-is.
+
+Multi-shape checks use a uniform-grid broad phase (:class:`SpatialGrid`):
+each shape is bucketed by its bounding box, so a query only runs the
+exact pairwise test against shapes in nearby cells instead of against
+every shape on the table.
 """
 
 from __future__ import annotations
 
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+
 # Minimum gap between any two shapes (mm)
 MIN_CLEARANCE_MM: int = 10
 
+# Side of a broad-phase grid cell (mm).  Roughly the size of a typical
+# scenery piece: small enough to keep buckets short on dense tables,
+# large enough that most shapes span only a few cells.
+DEFAULT_GRID_CELL_MM: int = 250
+
 
 # ---------------------------------------------------------------------------
 # Bounding-box helpers
@@ -28,21 +50,103 @@ def _circle_bounds(shape: dict) -> tuple[int, int, int, int]:
     return (cx - r, cy - r, cx + r, cy + r)
 
 
+def _polygon_bounds(shape: dict) -> tuple[int, int, int, int] | None:
+    """Return axis-aligned bounding box for a polygon (None if no points)."""
+    points = shape.get("points") or []
+    if not points:
+        return None
+    xs = [p["x"] for p in points]
+    ys = [p["y"] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
 # ---------------------------------------------------------------------------
-# Pairwise overlap tests
+# Precomputed geometry
 # ---------------------------------------------------------------------------
 
+Point = tuple[float, float]
 
-def _rects_overlap(a: dict, b: dict, clearance: int) -> bool:
-    """Check if two rects overlap (including clearance margin)."""
-    ax0, ay0, ax1, ay1 = _rect_bounds(a)
-    bx0, by0, bx1, by1 = _rect_bounds(b)
-    return not (
-        ax1 + clearance <= bx0
-        or bx1 + clearance <= ax0
-        or ay1 + clearance <= by0
-        or by1 + clearance <= ay0
-    )
+
+@dataclass(frozen=True, slots=True)
+class ShapeGeometry:
+    """Collision data for one shape, computed once by :func:`shape_geometry`.
+
+    Attributes:
+        shape: The shape dict itself.
+        kind: ``"rect"``, ``"circle"`` or ``"polygon"``.
+        bounds: Axis-aligned bounding box (x_min, y_min, x_max, y_max).
+        hull: Convex hull vertices (counter-clockwise) for rects and
+            polygons; empty for circles.
+        axes: Unit SAT axes (edge normals) of the hull.
+    """
+
+    shape: dict
+    kind: str
+    bounds: tuple[float, float, float, float]
+    hull: tuple[Point, ...] = ()
+    axes: tuple[Point, ...] = ()
+
+
+def _cross(o: Point, a: Point, b: Point) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _convex_hull(points: list[Point]) -> tuple[Point, ...]:
+    """Return the convex hull (counter-clockwise, monotone chain)."""
+    pts = sorted(set(points))
+    if len(pts) <= 2:
+        return tuple(pts)
+    lower: list[Point] = []
+    for p in pts:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper: list[Point] = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return tuple(lower[:-1] + upper[:-1])
+
+
+def _hull_axes(hull: tuple[Point, ...]) -> tuple[Point, ...]:
+    """Return the unit edge normals of *hull* (a segment also yields its direction)."""
+    if len(hull) < 2:
+        return ()
+    edges = list(zip(hull, hull[1:] + hull[:1], strict=True))
+    if len(hull) == 2:
+        edges = edges[:1]
+    axes: list[Point] = []
+    for (x0, y0), (x1, y1) in edges:
+        dx, dy = x1 - x0, y1 - y0
+        length = math.hypot(dx, dy)
+        axes.append((-dy / length, dx / length))
+        if len(hull) == 2:
+            axes.append((dx / length, dy / length))
+    return tuple(axes)
+
+
+def shape_geometry(shape: dict) -> ShapeGeometry | None:
+    """Precompute collision data for *shape* (None for unsupported shapes)."""
+    t = shape.get("type", "")
+    if t == "circle":
+        return ShapeGeometry(shape, t, _circle_bounds(shape))
+    if t == "rect":
+        x0, y0, x1, y1 = _rect_bounds(shape)
+        hull = ((x0, y0), (x1, y0), (x1, y1), (x0, y1))
+        return ShapeGeometry(shape, t, (x0, y0, x1, y1), hull, ((0, 1), (1, 0)))
+    if t == "polygon":
+        bounds = _polygon_bounds(shape)
+        if bounds is None:
+            return None
+        points = _convex_hull([(p["x"], p["y"]) for p in shape["points"]])
+        return ShapeGeometry(shape, t, bounds, points, _hull_axes(points))
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Pairwise overlap tests
+# ---------------------------------------------------------------------------
 
 
 def _circles_overlap(a: dict, b: dict, clearance: int) -> bool:
@@ -73,6 +177,76 @@ def _rect_circle_overlap(rect: dict, circle: dict, clearance: int) -> bool:
     return bool(dist_sq < threshold * threshold)
 
 
+def _project(hull: tuple[Point, ...], axis: Point) -> tuple[float, float]:
+    dots = [x * axis[0] + y * axis[1] for x, y in hull]
+    return min(dots), max(dots)
+
+
+def _separated_on(
+    a: tuple[float, float], b: tuple[float, float], clearance: float
+) -> bool:
+    return a[1] + clearance <= b[0] or b[1] + clearance <= a[0]
+
+
+def _convex_overlap(a: ShapeGeometry, b: ShapeGeometry, clearance: int) -> bool:
+    """SAT test between two hulls: overlap unless some axis separates them."""
+    for axis in a.axes + b.axes:
+        if _separated_on(_project(a.hull, axis), _project(b.hull, axis), clearance):
+            return False
+    return True
+
+
+def _convex_circle_overlap(poly: ShapeGeometry, circle: dict, clearance: int) -> bool:
+    """SAT test between a hull and a circle.
+
+    Besides the hull's edge normals, the axis from the nearest hull vertex
+    to the circle center is tested, which makes the test exact for convex
+    hulls.
+    """
+    cx, cy, r = circle["cx"], circle["cy"], circle["r"]
+    vx, vy = min(poly.hull, key=lambda p: (p[0] - cx) ** 2 + (p[1] - cy) ** 2)
+    axes = poly.axes
+    length = math.hypot(cx - vx, cy - vy)
+    if length:
+        axes = (*axes, ((cx - vx) / length, (cy - vy) / length))
+    for axis in axes:
+        center = cx * axis[0] + cy * axis[1]
+        if _separated_on(
+            _project(poly.hull, axis), (center - r, center + r), clearance
+        ):
+            return False
+    return True
+
+
+def _geometries_overlap(a: ShapeGeometry, b: ShapeGeometry, clearance: int) -> bool:
+    """Narrow phase between two precomputed shapes (allow_overlap not checked)."""
+    # Cheap rejection: bounding boxes further apart than the clearance
+    ax0, ay0, ax1, ay1 = a.bounds
+    bx0, by0, bx1, by1 = b.bounds
+    if (
+        ax1 + clearance <= bx0
+        or bx1 + clearance <= ax0
+        or ay1 + clearance <= by0
+        or by1 + clearance <= ay0
+    ):
+        return False
+
+    kinds = (a.kind, b.kind)
+    if kinds == ("rect", "rect"):
+        return True  # the bounding boxes are the rects
+    if kinds == ("circle", "circle"):
+        return _circles_overlap(a.shape, b.shape, clearance)
+    if kinds == ("rect", "circle"):
+        return _rect_circle_overlap(a.shape, b.shape, clearance)
+    if kinds == ("circle", "rect"):
+        return _rect_circle_overlap(b.shape, a.shape, clearance)
+    if a.kind == "circle":
+        return _convex_circle_overlap(b, a.shape, clearance)
+    if b.kind == "circle":
+        return _convex_circle_overlap(a, b.shape, clearance)
+    return _convex_overlap(a, b, clearance)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -86,7 +260,7 @@ def _allows_overlap(shape: dict) -> bool:
 def shapes_overlap(a: dict, b: dict, clearance: int = MIN_CLEARANCE_MM) -> bool:
     """Check if two shapes overlap with a given clearance.
 
-    Supports: rect, circle. Polygons are skipped (returns False).
+    Supports: rect, circle, polygon (unknown types never overlap).
     If either shape sets allow_overlap=True, collisions are ignored.
 
     Args:
@@ -99,23 +273,93 @@ def shapes_overlap(a: dict, b: dict, clearance: int = MIN_CLEARANCE_MM) -> bool:
     """
     if _allows_overlap(a) or _allows_overlap(b):
         return False
-    ta = a.get("type", "")
-    tb = b.get("type", "")
+    ga = shape_geometry(a)
+    gb = shape_geometry(b)
+    if ga is None or gb is None:
+        return False
+    return _geometries_overlap(ga, gb, clearance)
+
 
-    if ta == "rect" and tb == "rect":
-        return _rects_overlap(a, b, clearance)
+# ---------------------------------------------------------------------------
+# Broad phase (uniform grid)
+# ---------------------------------------------------------------------------
 
-    if ta == "circle" and tb == "circle":
-        return _circles_overlap(a, b, clearance)
 
-    if ta == "rect" and tb == "circle":
-        return _rect_circle_overlap(a, b, clearance)
+class SpatialGrid:
+    """Uniform-grid index of shapes for collision queries.
 
-    if ta == "circle" and tb == "rect":
-        return _rect_circle_overlap(b, a, clearance)
+    Shapes are stored under an integer id (their position in the caller's
+    list) in every cell their bounding box touches, together with their
+    precomputed :class:`ShapeGeometry`.  Queries expand the probe's box by
+    the clearance so near-misses closer than the clearance are still
+    found.  Shapes with ``allow_overlap=True`` or without bounds are never
+    indexed, since they cannot collide.
+    """
 
-    # Polygon or unknown type — skip collision (conservative: no overlap)
-    return False
+    def __init__(
+        self,
+        clearance: int = MIN_CLEARANCE_MM,
+        cell_size: int = DEFAULT_GRID_CELL_MM,
+    ) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self._clearance = clearance
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._geometries: dict[int, ShapeGeometry] = {}
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+    def _cells_for(
+        self, bounds: tuple[float, float, float, float], margin: int = 0
+    ) -> Iterator[tuple[int, int]]:
+        x0, y0, x1, y1 = bounds
+        size = self._cell_size
+        for cx in range(int((x0 - margin) // size), int((x1 + margin) // size) + 1):
+            for cy in range(int((y0 - margin) // size), int((y1 + margin) // size) + 1):
+                yield (cx, cy)
+
+    @staticmethod
+    def _geometry(shape: dict) -> ShapeGeometry | None:
+        if _allows_overlap(shape):
+            return None
+        return shape_geometry(shape)
+
+    def insert(self, shape_id: int, shape: dict) -> None:
+        """Index *shape* under *shape_id*."""
+        geometry = self._geometry(shape)
+        if geometry is None:
+            return
+        self._geometries[shape_id] = geometry
+        for cell in self._cells_for(geometry.bounds):
+            self._cells.setdefault(cell, []).append(shape_id)
+
+    def _candidates(self, geometry: ShapeGeometry) -> list[int]:
+        found: set[int] = set()
+        for cell in self._cells_for(geometry.bounds, self._clearance):
+            found.update(self._cells.get(cell, ()))
+        return sorted(found)
+
+    def candidates(self, shape: dict) -> list[int]:
+        """Return ids of indexed shapes near *shape*, in ascending order."""
+        geometry = self._geometry(shape)
+        return [] if geometry is None else self._candidates(geometry)
+
+    def first_collision(self, shape: dict) -> int | None:
+        """Return the lowest id of an indexed shape overlapping *shape*."""
+        geometry = self._geometry(shape)
+        if geometry is None:
+            return None
+        for shape_id in self._candidates(geometry):
+            other = self._geometries[shape_id]
+            if _geometries_overlap(geometry, other, self._clearance):
+                return shape_id
+        return None
+
+    def collides(self, shape: dict) -> bool:
+        """Return True if *shape* overlaps any indexed shape."""
+        return self.first_collision(shape) is not None
 
 
 def find_first_collision(
@@ -123,6 +367,9 @@ def find_first_collision(
 ) -> tuple[int, int] | None:
     """Find first pair of overlapping shapes.
 
+    Pairs are ordered as in a nested ``i < j`` scan; the broad phase only
+    changes how candidates are found, not which pair is reported.
+
     Args:
         shapes: List of shape dicts.
         clearance: Minimum gap in mm.
@@ -130,12 +377,14 @@ def find_first_collision(
     Returns:
         Tuple (i, j) of first colliding pair indices, or None if no collision.
     """
-    n = len(shapes)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if shapes_overlap(shapes[i], shapes[j], clearance):
-                return (i, j)
-    return None
+    grid = SpatialGrid(clearance)
+    first: tuple[int, int] | None = None
+    for j, shape in enumerate(shapes):
+        i = grid.first_collision(shape)
+        if i is not None and (first is None or i < first[0]):
+            first = (i, j)
+        grid.insert(j, shape)
+    return first
 
 
 def shape_in_bounds(shape: dict, width_mm: int, height_mm: int) -> bool:
@@ -172,6 +421,11 @@ def shape_in_bounds(shape: dict, width_mm: int, height_mm: int) -> bool:
 def has_no_collisions(shapes: list[dict], clearance: int = MIN_CLEARANCE_MM) -> bool:
     """Return True if no pair of shapes overlaps.
 
-    Convenience wrapper around find_first_collision.
+    Stops at the first collision found by the broad phase.
     """
-    return find_first_collision(shapes, clearance) is None
+    grid = SpatialGrid(clearance)
+    for j, shape in enumerate(shapes):
+        if grid.collides(shape):
+            return False
+        grid.insert(j, shape)
+    return True
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 
+from infrastructure.auth.password_hasher import RETRY_AFTER_SECONDS, PasswordHasherBusy
 from infrastructure.auth.session_store import (
     create_session,
     get_session,
@@ -43,9 +44,20 @@ _ACCOUNT_LOCKED_TPL = "Account locked until {until}."
 _SESSION_EXPIRED = "Session expired."
 _REAUTH_REQUIRED = "Re-authentication required."
 _USERNAME_TAKEN = "Username is already taken."
+_SERVER_BUSY = "Server busy. Please try again in a moment."
 _TIME_FMT = "%H:%M:%S UTC"
 
 
+def _busy_result(**extra: object) -> dict[str, object]:
+    """Failure result for a saturated password hashing pool (HTTP 503)."""
+    return {
+        "ok": False,
+        **extra,
+        "message": _SERVER_BUSY,
+        "retry_after": RETRY_AFTER_SECONDS,
+    }
+
+
 def _validate_registration_fields(
     username: str,
     password: str,
@@ -124,7 +136,11 @@ def register(
     if not email:
         email = ""
 
-    created = create_user(username, password, name, email)
+    try:
+        created = create_user(username, password, name, email)
+    except PasswordHasherBusy:
+        logger.warning("register_rejected: busy user=%s", username)
+        return _busy_result(errors=[_SERVER_BUSY])
     if not created:
         return {
             "ok": False,
@@ -186,7 +202,12 @@ def authenticate(username: str, password: str) -> dict[str, object]:
         }
 
     # ── Credential verification ──────────────────────────────────
-    if not verify_credentials(username, password):
+    try:
+        valid = verify_credentials(username, password)
+    except PasswordHasherBusy:
+        logger.warning("login_rejected: busy user=%s", username)
+        return _busy_result(actor_id=None)
+    if not valid:
         now_locked, locked_until = record_failed_attempt(username)
         if now_locked and locked_until is not None:
             logger.warning("login_lockout: user=%s until=%s", username, locked_until)
@@ -266,7 +287,12 @@ def reauth(session_id: str, password: str) -> dict[str, object]:
             ),
         }
 
-    if not verify_credentials(actor_id, password):
+    try:
+        valid = verify_credentials(actor_id, password)
+    except PasswordHasherBusy:
+        logger.warning("reauth_rejected: busy user=%s", actor_id)
+        return _busy_result()
+    if not valid:
         now_locked, locked_until = record_failed_attempt(actor_id)
         if now_locked and locked_until is not None:
             return {
@@ -299,6 +325,28 @@ def check_reauth(session_id: str) -> bool:
     return result
 
 
+def apply_password_change(
+    actor_id: str, new_password: str, confirm_new_password: str
+) -> dict[str, object] | None:
+    """Validate and apply a password change; return a failure result or None.
+
+    Runs before the profile update so that a busy rejection from the
+    hashing pool does not leave a half-applied update.
+    """
+    if new_password != confirm_new_password:
+        return {"ok": False, "message": "Passwords do not match."}
+    pw_ok, pw_errors = validate_registration_password(new_password)
+    if not pw_ok:
+        return {"ok": False, "message": pw_errors[0]}
+    try:
+        changed = change_password(actor_id, new_password)
+    except PasswordHasherBusy:
+        return _busy_result()
+    if not changed:
+        return {"ok": False, "message": "User not found."}
+    return None
+
+
 def update_profile(
     session_id: str,
     name: str,
@@ -332,17 +380,16 @@ def update_profile(
     # ── Optional password change ─────────────────────────────────
     wants_pw_change = bool(new_password or confirm_new_password)
     if wants_pw_change:
-        if new_password != confirm_new_password:
-            return {"ok": False, "message": "Passwords do not match."}
-        pw_ok, pw_errors = validate_registration_password(new_password)
-        if not pw_ok:
-            return {"ok": False, "message": pw_errors[0]}
+        failure = apply_password_change(
+            session["actor_id"], new_password, confirm_new_password
+        )
+        if failure is not None:
+            return failure
 
     if not update_user_profile(session["actor_id"], name, email):
         return {"ok": False, "message": "User not found."}
 
     if wants_pw_change:
-        change_password(session["actor_id"], new_password)
         return {"ok": True, "message": "Profile and password updated."}
 
     return {"ok": True, "message": "Profile updated."}
@@ -0,0 +1,334 @@
+"""Session cache — short-TTL LRU in front of a session store backend.
+
+Every Flask request loads its session (``get_session``), every mutating
+request also reads the CSRF token (``get_csrf_token``), and Gradio
+handlers re-check the session (``is_session_valid`` → ``get_session``).
+Against ``PostgresSessionStore`` each of those is a DB round trip.
+
+``CachedSessionStore`` wraps any backend implementing the
+``SessionStoreBackend`` protocol:
+
+- **One lookup**: a cache miss loads the full record (actor, timestamps,
+  CSRF token) with a single ``get_session``; the CSRF check, reauth check
+  and later ``get_session`` calls within ``ttl_seconds`` are served from
+  memory.
+- **Write-behind touches**: hits update ``last_seen_at`` in memory and
+  queue it; queued touches are flushed every ``flush_interval_seconds``
+  with one batched ``touch_sessions`` call (when the backend has one).
+- **Immediate revocation**: ``invalidate_session``, ``revoke_all_sessions``
+  and ``rotate_session_id`` drop the affected entries before and after
+  delegating, so a revoked session is never served from this process's
+  cache.  They also leave a tombstone: a backend load that was already in
+  flight when the revocation started is returned but not cached.  Other
+  processes see the revocation within ``ttl_seconds``.
+
+Idle timeout and max lifetime are re-checked on every cache hit.
+Thread-safe via ``threading.Lock``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from application.ports.clock import Clock
+from infrastructure.auth.session_store import (
+    REAUTH_WINDOW_MINUTES,
+    SESSION_IDLE_MINUTES,
+    SESSION_MAX_HOURS,
+    SessionRecord,
+    SessionStoreBackend,
+)
+from infrastructure.clock import SystemClock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 5.0
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 15.0
+
+
+class CachedSessionStore:
+    """Session store decorator with an LRU/TTL record cache and batched touches."""
+
+    def __init__(
+        self,
+        backend: SessionStoreBackend,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        clock: Clock | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: The wrapped session store (e.g. ``PostgresSessionStore``).
+            ttl_seconds: How long a loaded record is served from memory.
+            max_entries: Maximum number of cached sessions (LRU eviction).
+            flush_interval_seconds: Period of the background touch flush;
+                ``0`` disables the timer (call ``flush_touches`` manually).
+            clock: Clock used for TTL and expiry checks.
+
+        Raises:
+            ValueError: If a limit is not positive or the interval is negative.
+        """
+        if ttl_seconds <= 0 or max_entries < 1 or flush_interval_seconds < 0:
+            raise ValueError("invalid session cache settings")
+        self._backend = backend
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_entries = max_entries
+        self._clock = clock or SystemClock()
+        self._lock = threading.Lock()
+        # session_id -> (record, cached_at)
+        self._entries: OrderedDict[str, tuple[SessionRecord, datetime]] = OrderedDict()
+        # session_id -> latest unflushed last_seen_at
+        self._pending: dict[str, datetime] = {}
+        # Tombstones (session_id / actor_id -> version at revocation), kept
+        # while backend loads are in flight so their results can be dropped.
+        self._version = 0
+        self._loads_in_flight = 0
+        self._revoked_sessions: dict[str, int] = {}
+        self._revoked_actors: dict[str, int] = {}
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if flush_interval_seconds > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                args=(flush_interval_seconds,),
+                name="session-touch-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    @property
+    def ttl_seconds(self) -> float:
+        """How long a loaded record is served from memory."""
+        return self._ttl.total_seconds()
+
+    # ── cache internals ──────────────────────────────────────────
+
+    def _cached(self, session_id: str, now: datetime) -> SessionRecord | None:
+        """Return the fresh, still-valid cached record.  **Hold _lock.**"""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        record, cached_at = entry
+        if (
+            now - cached_at > self._ttl
+            or now - record["created_at"] > timedelta(hours=SESSION_MAX_HOURS)
+            or now - record["last_seen_at"] > timedelta(minutes=SESSION_IDLE_MINUTES)
+        ):
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        return record
+
+    def _remember(self, record: SessionRecord, now: datetime) -> None:
+        """Cache a copy of *record*.  **Hold _lock.**"""
+        self._entries[record["session_id"]] = (record.copy(), now)
+        self._entries.move_to_end(record["session_id"])
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _forget(self, session_id: str) -> None:
+        """Drop a session's entry and pending touch.  **Hold _lock.**"""
+        self._entries.pop(session_id, None)
+        self._pending.pop(session_id, None)
+
+    def _tombstone(self, session_id: str) -> None:
+        """Drop the cached record and void in-flight loads of it.  **Hold _lock.**"""
+        self._entries.pop(session_id, None)
+        self._version += 1
+        self._revoked_sessions[session_id] = self._version
+
+    def _revoke_session(self, session_id: str) -> None:
+        """Forget *session_id* and tombstone it against in-flight loads."""
+        with self._lock:
+            self._forget(session_id)
+            self._tombstone(session_id)
+
+    def _revoke_actor(self, actor_id: str) -> None:
+        """Forget every session of *actor_id* and tombstone the actor."""
+        with self._lock:
+            for sid in [
+                sid
+                for sid, (record, _) in self._entries.items()
+                if record["actor_id"] == actor_id
+            ]:
+                self._forget(sid)
+            self._version += 1
+            self._revoked_actors[actor_id] = self._version
+
+    def _finish_load(
+        self, record: SessionRecord | None, started: int, now: datetime
+    ) -> None:
+        """Cache a loaded record unless it was revoked mid-load.  **Hold _lock.**"""
+        self._loads_in_flight -= 1
+        if record is not None and (
+            self._revoked_sessions.get(record["session_id"], 0) <= started
+            and self._revoked_actors.get(record["actor_id"], 0) <= started
+        ):
+            self._remember(record, now)
+        if self._loads_in_flight == 0:
+            self._revoked_sessions.clear()
+            self._revoked_actors.clear()
+
+    def _lookup(self, session_id: str, *, touch: bool) -> SessionRecord | None:
+        """Serve *session_id* from the cache, loading it on a miss."""
+        if not session_id:
+            return None
+        now = self._clock.now_utc()
+        with self._lock:
+            record = self._cached(session_id, now)
+            if record is not None:
+                if touch:
+                    record["last_seen_at"] = now
+                    self._pending[session_id] = now
+                return record.copy()
+            has_pending = session_id in self._pending
+            started = self._version
+            self._loads_in_flight += 1
+
+        loaded: SessionRecord | None = None
+        try:
+            # Miss: persist this session's deferred touch first so the
+            # backend's idle check sees the latest activity.
+            if has_pending:
+                self.flush_touches()
+            loaded = self._backend.get_session(session_id)
+        finally:
+            with self._lock:
+                self._finish_load(loaded, started, now)
+        return loaded
+
+    # ── write-behind touches ─────────────────────────────────────
+
+    def flush_touches(self) -> int:
+        """Write queued ``last_seen_at`` touches in one batched call.
+
+        Returns:
+            Number of touches handed to the backend.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        touch_sessions = getattr(self._backend, "touch_sessions", None)
+        if touch_sessions is None:
+            return 0  # backend keeps last_seen_at itself (e.g. in-memory)
+        try:
+            touch_sessions(pending)
+        except Exception:
+            logger.exception("session_touch_flush_failed: count=%d", len(pending))
+            with self._lock:
+                for sid, seen in pending.items():
+                    if self._pending.get(sid, seen) <= seen:
+                        self._pending[sid] = seen
+            return 0
+        return len(pending)
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush_touches()
+
+    def close(self) -> None:
+        """Stop the background flusher and write any queued touches."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self.flush_touches()
+
+    # ── SessionStoreBackend protocol ─────────────────────────────
+
+    def create_session(self, actor_id: str) -> SessionRecord:
+        """Create a session in the backend and cache it."""
+        record = self._backend.create_session(actor_id)
+        with self._lock:
+            self._remember(record, self._clock.now_utc())
+        return record
+
+    def get_session(self, session_id: str) -> SessionRecord | None:
+        """Return a valid session, touching ``last_seen_at`` (write-behind)."""
+        return self._lookup(session_id, touch=True)
+
+    def get_csrf_token(self, session_id: str) -> str | None:
+        """Return the CSRF token of a valid session, or None."""
+        record = self._lookup(session_id, touch=False)
+        return record["csrf_token"] if record is not None else None
+
+    def is_recently_reauthed(self, session_id: str) -> bool:
+        """Return True if the session was re-authenticated within the window."""
+        record = self._lookup(session_id, touch=False)
+        if record is None or record["reauth_at"] is None:
+            return False
+        window = timedelta(minutes=REAUTH_WINDOW_MINUTES)
+        return self._clock.now_utc() - record["reauth_at"] <= window
+
+    def invalidate_session(self, session_id: str) -> bool:
+        """Revoke a session (evicted from the cache before and after)."""
+        self._revoke_session(session_id)
+        try:
+            return self._backend.invalidate_session(session_id)
+        finally:
+            self._revoke_session(session_id)
+
+    def revoke_all_sessions(self, username: str) -> int:
+        """Revoke every session of *username* (evicted before and after).
+
+        Raises:
+            NotImplementedError: If the backend cannot revoke by user.
+        """
+        self._revoke_actor(username)
+        revoke_all = getattr(self._backend, "revoke_all_sessions", None)
+        if revoke_all is None:
+            raise NotImplementedError("backend does not support revoke_all_sessions")
+        try:
+            return int(revoke_all(username))
+        finally:
+            self._revoke_actor(username)
+
+    def rotate_session_id(self, old_session_id: str) -> SessionRecord | None:
+        """Rotate a session ID; the old ID is evicted before and after the call."""
+        self._revoke_session(old_session_id)
+        try:
+            record = self._backend.rotate_session_id(old_session_id)
+        finally:
+            self._revoke_session(old_session_id)
+        if record is not None:
+            with self._lock:
+                self._remember(record, self._clock.now_utc())
+        return record
+
+    def mark_reauth(self, session_id: str) -> bool:
+        """Mark a session as re-authenticated (the cached copy is refreshed)."""
+        with self._lock:
+            self._tombstone(session_id)
+        try:
+            return self._backend.mark_reauth(session_id)
+        finally:
+            with self._lock:
+                self._tombstone(session_id)
+
+    def reset_sessions(self) -> None:
+        """Clear the cache and the backend — **for testing only**."""
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+        self._backend.reset_sessions()
+
+    def active_session_count(self) -> int:
+        """Return the backend's active session count (after flushing touches)."""
+        self.flush_touches()
+        return self._backend.active_session_count()
+
+    def cleanup_expired_sessions(self) -> int:
+        """Delegate housekeeping to the backend (0 when unsupported)."""
+        cleanup = getattr(self._backend, "cleanup_expired_sessions", None)
+        return int(cleanup()) if cleanup is not None else 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
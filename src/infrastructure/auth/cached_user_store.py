@@ -0,0 +1,166 @@
+"""User cache — short-TTL LRU in front of a user store backend.
+
+``get_user_profile`` runs on every ``/auth/me`` and profile page, and
+``user_exists`` on every registration keystroke check.  Against
+``PostgresUserStore`` each of those is a DB round trip.
+
+``CachedUserStore`` wraps any backend implementing the
+``UserStoreBackend`` protocol:
+
+- **Read-through**: ``get_user`` is served from memory for
+  ``ttl_seconds``; a miss loads the record from the backend.  Only
+  existing users are cached, so a registration made on another worker
+  is visible immediately.
+- **Invalidation**: ``update_profile``, ``set_password`` and ``add_user``
+  drop the entry and bump the user's version, so this process never
+  serves a stale profile after its own writes — a load that was already
+  in flight is returned but not cached.  Other processes see the change
+  within ``ttl_seconds``.
+- **Pass-through**: credentials (``get_credentials``) and lockout state
+  are never cached — logins always check the current hash and the shared
+  lockout counters.
+
+Thread-safe via ``threading.Lock``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from application.ports.clock import Clock
+from infrastructure.clock import SystemClock
+
+if TYPE_CHECKING:
+    from infrastructure.auth.user_store import UserRecord, UserStoreBackend
+
+DEFAULT_TTL_SECONDS = 30.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class CachedUserStore:
+    """User store decorator with an LRU/TTL record cache."""
+
+    def __init__(
+        self,
+        backend: UserStoreBackend,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Clock | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: The wrapped user store (e.g. ``PostgresUserStore``).
+            ttl_seconds: How long a loaded record is served from memory.
+            max_entries: Maximum number of cached users (LRU eviction).
+            clock: Clock used for TTL checks.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if ttl_seconds <= 0 or max_entries < 1:
+            raise ValueError("invalid user cache settings")
+        self._backend = backend
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_entries = max_entries
+        self._clock = clock or SystemClock()
+        self._lock = threading.Lock()
+        # username -> (record, cached_at)
+        self._entries: OrderedDict[str, tuple[UserRecord, datetime]] = OrderedDict()
+        # username -> invalidation count, kept while backend loads are in
+        # flight so a load that straddles a write is not cached.
+        self._versions: dict[str, int] = {}
+        self._loads_in_flight = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        """How long a loaded record is served from memory."""
+        return self._ttl.total_seconds()
+
+    def invalidate(self, username: str) -> None:
+        """Drop *username* from the cache."""
+        with self._lock:
+            self._entries.pop(username, None)
+            self._versions[username] = self._versions.get(username, 0) + 1
+
+    # ── UserStoreBackend protocol ────────────────────────────────
+
+    def get_user(self, username: str) -> UserRecord | None:
+        """Return the user's record, from memory when fresh."""
+        now = self._clock.now_utc()
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is not None:
+                record, cached_at = entry
+                if now - cached_at <= self._ttl:
+                    self._entries.move_to_end(username)
+                    return record.copy()
+                del self._entries[username]
+            version = self._versions.get(username, 0)
+            self._loads_in_flight += 1
+
+        loaded: UserRecord | None = None
+        try:
+            loaded = self._backend.get_user(username)
+        finally:
+            with self._lock:
+                self._loads_in_flight -= 1
+                if loaded is not None and self._versions.get(username, 0) == version:
+                    self._entries[username] = (loaded.copy(), now)
+                    self._entries.move_to_end(username)
+                    while len(self._entries) > self._max_entries:
+                        self._entries.popitem(last=False)
+                if self._loads_in_flight == 0:
+                    self._versions.clear()
+        return loaded
+
+    def get_credentials(self, username: str) -> tuple[bytes, bytes] | None:
+        """Return the current ``(password_hash, salt)`` (never cached)."""
+        return self._backend.get_credentials(username)
+
+    def add_user(self, username: str, record: UserRecord) -> bool:
+        """Insert a user in the backend."""
+        self.invalidate(username)
+        return self._backend.add_user(username, record)
+
+    def update_profile(self, username: str, name: str, email: str) -> bool:
+        """Update the profile (the cached copy is dropped)."""
+        self.invalidate(username)
+        try:
+            return self._backend.update_profile(username, name, email)
+        finally:
+            self.invalidate(username)
+
+    def set_password(self, username: str, password_hash: bytes, salt: bytes) -> bool:
+        """Store a new password hash (the cached copy is dropped)."""
+        self.invalidate(username)
+        try:
+            return self._backend.set_password(username, password_hash, salt)
+        finally:
+            self.invalidate(username)
+
+    def is_locked(self, username: str) -> tuple[bool, datetime | None]:
+        """Delegate to the backend (lockout state is never cached)."""
+        return self._backend.is_locked(username)
+
+    def record_failed_attempt(self, username: str) -> tuple[bool, datetime | None]:
+        """Delegate to the backend (lockout state is never cached)."""
+        return self._backend.record_failed_attempt(username)
+
+    def clear_failed_attempts(self, username: str) -> None:
+        """Delegate to the backend (lockout state is never cached)."""
+        self._backend.clear_failed_attempts(username)
+
+    def reset(self) -> None:
+        """Clear the cache and the backend — **for testing only**."""
+        with self._lock:
+            self._entries.clear()
+        self._backend.reset()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,209 @@
+"""Password hashing pool — PBKDF2 off the request threads, with admission control.
+
+PBKDF2-HMAC-SHA256 at 100 000 iterations costs tens of milliseconds of
+CPU per call.  Running it on the request thread lets a burst of logins
+occupy every server thread and stall unrelated requests.
+
+``PasswordHashPool`` runs hashes on a small dedicated
+``ThreadPoolExecutor`` (``hashlib.pbkdf2_hmac`` releases the GIL, so the
+workers use real cores) and bounds the work it accepts:
+
+- at most ``workers + max_queue`` hashes are admitted at once; beyond
+  that ``hash`` fails fast with :class:`PasswordHasherBusy` (the HTTP
+  layer answers 503 + ``Retry-After``) instead of queueing unboundedly;
+- an admitted hash that does not finish within ``timeout_seconds`` also
+  raises :class:`PasswordHasherBusy`.
+
+``stats()`` exposes counters and timings for monitoring.
+
+The process-wide pool is created lazily by :func:`get_hasher` from
+``PASSWORD_HASH_WORKERS`` (default 2), ``PASSWORD_HASH_MAX_QUEUE``
+(default 16) and ``PASSWORD_HASH_TIMEOUT_SECONDS`` (default 10).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+logger = logging.getLogger(__name__)
+
+PBKDF2_ITERATIONS = 100_000
+HASH_ALGO = "sha256"
+DK_LEN = 32
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 16
+DEFAULT_TIMEOUT_SECONDS = 10.0
+# Suggested client back-off when the pool rejects work.
+RETRY_AFTER_SECONDS = 1
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the hashing pool is saturated (maps to HTTP 503)."""
+
+
+def pbkdf2(password: str, salt: bytes) -> bytes:
+    """Compute the PBKDF2-HMAC-SHA256 hash of *password* (no pooling)."""
+    return hashlib.pbkdf2_hmac(
+        HASH_ALGO,
+        password.encode("utf-8"),
+        salt,
+        PBKDF2_ITERATIONS,
+        dklen=DK_LEN,
+    )
+
+
+class PasswordHashPool:
+    """Bounded worker pool for password hashing."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            workers: Number of hashing threads.
+            max_queue: Hashes allowed to wait for a worker.
+            timeout_seconds: Maximum wait for an admitted hash.
+
+        Raises:
+            ValueError: If workers or timeout is not positive, or
+                max_queue is negative.
+        """
+        if workers < 1 or max_queue < 0 or timeout_seconds <= 0:
+            raise ValueError("invalid password hash pool settings")
+        self._workers = workers
+        self._max_queue = max_queue
+        self._timeout = timeout_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="pbkdf2"
+        )
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._hash_seconds_total = 0.0
+        self._hash_seconds_max = 0.0
+        self._wait_seconds_total = 0.0
+
+    def _run(self, password: str, salt: bytes, submitted: float) -> bytes:
+        started = time.perf_counter()
+        try:
+            return pbkdf2(password, salt)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._completed += 1
+                self._hash_seconds_total += elapsed
+                self._hash_seconds_max = max(self._hash_seconds_max, elapsed)
+                self._wait_seconds_total += started - submitted
+
+    def _release(self, _future: object) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def hash(self, password: str, salt: bytes) -> bytes:
+        """Hash *password* on the pool and wait for the result.
+
+        Raises:
+            PasswordHasherBusy: If the pool is full or the hash timed out.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            logger.warning("password_hash_rejected: pool saturated")
+            raise PasswordHasherBusy("password hashing pool is saturated")
+        with self._lock:
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(
+                self._run, password, salt, time.perf_counter()
+            )
+        except RuntimeError:
+            self._release(None)
+            raise
+        # The slot is released when the work finishes, even after a
+        # timeout, so abandoned hashes still count against capacity.
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=self._timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            logger.warning("password_hash_timeout: after %.1fs", self._timeout)
+            raise PasswordHasherBusy("password hashing timed out") from None
+
+    def stats(self) -> dict[str, float | int]:
+        """Return a snapshot of the pool counters and timings."""
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self._workers,
+                "max_queue": self._max_queue,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self._workers),
+                "completed": completed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "hash_seconds_total": self._hash_seconds_total,
+                "hash_seconds_max": self._hash_seconds_max,
+                "hash_seconds_avg": (
+                    self._hash_seconds_total / completed if completed else 0.0
+                ),
+                "wait_seconds_avg": (
+                    self._wait_seconds_total / completed if completed else 0.0
+                ),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the workers (pending hashes are completed)."""
+        self._executor.shutdown(wait=True)
+
+
+# ── Process-wide pool ────────────────────────────────────────────────────────
+_pool_holder: list[PasswordHashPool | None] = [None]
+_pool_lock = threading.Lock()
+
+
+def _pool_from_env() -> PasswordHashPool:
+    """Build the pool from ``PASSWORD_HASH_*`` (defaults on invalid values)."""
+    try:
+        return PasswordHashPool(
+            workers=int(os.environ.get("PASSWORD_HASH_WORKERS", DEFAULT_WORKERS)),
+            max_queue=int(os.environ.get("PASSWORD_HASH_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+            timeout_seconds=float(
+                os.environ.get("PASSWORD_HASH_TIMEOUT_SECONDS", DEFAULT_TIMEOUT_SECONDS)
+            ),
+        )
+    except ValueError:
+        logger.warning("Invalid PASSWORD_HASH_* settings — using defaults.")
+        return PasswordHashPool()
+
+
+def get_hasher() -> PasswordHashPool:
+    """Return the process-wide pool, creating it on first use."""
+    pool = _pool_holder[0]
+    if pool is None:
+        with _pool_lock:
+            pool = _pool_holder[0]
+            if pool is None:
+                pool = _pool_holder[0] = _pool_from_env()
+    return pool
+
+
+def configure_hasher(pool: PasswordHashPool | None) -> None:
+    """Replace the process-wide pool (``None`` = rebuild lazily from env)."""
+    with _pool_lock:
+        _pool_holder[0] = pool
@@ -21,11 +21,21 @@ import logging
 import os
 import secrets
 from datetime import datetime, timedelta
-from typing import Callable, TypedDict
+from typing import Callable, Mapping, TypedDict
 
 from application.ports.clock import Clock
 from infrastructure.clock import SystemClock
 from infrastructure.db.models import SessionModel
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    String,
+    column,
+    delete,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -35,6 +45,7 @@ SESSION_IDLE_MINUTES = int(os.environ.get("SESSION_IDLE_MINUTES", "15"))
 SESSION_MAX_HOURS = int(os.environ.get("SESSION_MAX_HOURS", "12"))
 REAUTH_WINDOW_MINUTES = int(os.environ.get("REAUTH_WINDOW_MINUTES", "10"))
 TOUCH_THROTTLE_SECONDS = int(os.environ.get("SESSION_TOUCH_THROTTLE", "30"))
+CLEANUP_BATCH_SIZE = 1000
 
 _SESSION_ID_BYTES = 32  # 256-bit random
 
@@ -179,6 +190,46 @@ class PostgresSessionStore:
             db.close()
         return record
 
+    def touch_sessions(self, touches: Mapping[str, datetime]) -> int:
+        """Apply deferred ``last_seen_at`` touches in one UPDATE statement.
+
+        Only moves ``last_seen_at`` forward and never touches revoked
+        sessions.  Used by the write-behind session cache.
+
+        Args:
+            touches: Mapping of session_id to its latest activity time.
+
+        Returns:
+            Number of rows updated.
+        """
+        if not touches:
+            return 0
+        touched = values(
+            column("session_id", String(64)),
+            column("seen_at", DateTime(timezone=True)),
+            name="touched",
+        ).data(list(touches.items()))
+        stmt = (
+            update(SessionModel)
+            .where(
+                SessionModel.session_id == touched.c.session_id,
+                SessionModel.last_seen_at < touched.c.seen_at,
+                SessionModel.revoked_at.is_(None),
+            )
+            .values(last_seen_at=touched.c.seen_at)
+            .execution_options(synchronize_session=False)
+        )
+        db = self._sf()
+        try:
+            count = int(db.execute(stmt).rowcount)
+            db.commit()
+            return count
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
     # ── invalidate / revoke ──────────────────────────────────────
 
     def invalidate_session(self, session_id: str) -> bool:
@@ -334,45 +385,63 @@ class PostgresSessionStore:
 
     # ── housekeeping ─────────────────────────────────────────────
 
-    def cleanup_expired_sessions(self) -> int:
-        """Hard-delete sessions that are expired or revoked for > 24h."""
-        cutoff = _now() - timedelta(hours=24)
-        db = self._sf()
-        try:
-            expired = (
-                db.query(SessionModel).filter(SessionModel.expires_at < _now()).count()
-            )
-            db.query(SessionModel).filter(
-                SessionModel.expires_at < _now(),
-            ).delete(synchronize_session="fetch")
+    def cleanup_expired_sessions(self, *, batch_size: int = CLEANUP_BATCH_SIZE) -> int:
+        """Hard-delete sessions that are expired or revoked for > 24h.
 
-            revoked_old = (
-                db.query(SessionModel)
-                .filter(
-                    SessionModel.revoked_at.isnot(None),
-                    SessionModel.revoked_at < cutoff,
-                )
-                .count()
-            )
-            db.query(SessionModel).filter(
-                SessionModel.revoked_at.isnot(None),
-                SessionModel.revoked_at < cutoff,
-            ).delete(synchronize_session="fetch")
+        Deletes in chunks of at most *batch_size* rows, one transaction per
+        chunk, so the table is never locked for long and rows are never
+        loaded into Python.  Each chunk selects its keys through
+        ``ix_sessions_expires_at`` / ``ix_sessions_revoked_at``.
 
-            db.commit()
-            total = int(expired + revoked_old)
-            if total:
-                logger.info(
-                    "sessions_cleaned: expired=%d revoked_old=%d",
-                    expired,
-                    revoked_old,
-                )
-            return total
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        Raises:
+            ValueError: If *batch_size* is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        now = _now()
+        cutoff = now - timedelta(hours=24)
+        expired = self._delete_in_batches(SessionModel.expires_at < now, batch_size)
+        revoked_old = self._delete_in_batches(
+            SessionModel.revoked_at < cutoff, batch_size
+        )
+        total = expired + revoked_old
+        if total:
+            logger.info(
+                "sessions_cleaned: expired=%d revoked_old=%d",
+                expired,
+                revoked_old,
+            )
+        return total
+
+    def _delete_in_batches(
+        self, condition: ColumnElement[bool], batch_size: int
+    ) -> int:
+        """Delete rows matching *condition*, *batch_size* at a time."""
+        chunk = (
+            select(SessionModel.session_id)
+            .where(condition)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(SessionModel)
+            .where(SessionModel.session_id.in_(chunk))
+            .execution_options(synchronize_session=False)
+        )
+        total = 0
+        while True:
+            db = self._sf()
+            try:
+                removed = int(db.execute(stmt).rowcount)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+            total += removed
+            if removed < batch_size:
+                return total
 
     def active_session_count(self) -> int:
         """Return the number of non-revoked, non-expired sessions."""
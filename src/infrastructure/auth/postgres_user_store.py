@@ -0,0 +1,237 @@
+"""PostgreSQL user store — users and lockout state shared by every worker.
+
+Backend for ``user_store.py`` (see ``UserStoreBackend``): users live in
+the ``users`` table and lockout counters in ``user_lockouts``, so with
+``gunicorn -w N`` or several containers a registration made on one
+worker is visible on all of them and brute-force counters cannot be
+reset by landing on another process.
+
+- Registration is a single ``INSERT … ON CONFLICT DO NOTHING``: two
+  workers racing on the same username cannot both succeed.
+- ``record_failed_attempt`` is a single atomic upsert that increments
+  the counter and sets ``locked_until`` once the limit is reached.
+
+Put a ``CachedUserStore`` in front of it to avoid a DB round trip on
+every profile read.
+
+Thread-safety: each operation opens its own SQLAlchemy session
+(same pattern as ``PostgresSessionStore``).
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Callable
+
+from application.ports.clock import Clock
+from infrastructure.auth.user_store import (
+    LOCKOUT_DURATION,
+    MAX_FAILED_ATTEMPTS,
+    UserRecord,
+)
+from infrastructure.clock import SystemClock
+from infrastructure.db.models import UserLockoutModel, UserModel
+from sqlalchemy import case, delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def _model_to_record(model: UserModel) -> UserRecord:
+    """Convert ORM model to the dict contract used by user_store."""
+    return UserRecord(
+        password_hash=bytes(model.password_hash),
+        salt=bytes(model.salt),
+        name=model.name,  # type: ignore[typeddict-item]
+        email=model.email,  # type: ignore[typeddict-item]
+    )
+
+
+class PostgresUserStore:
+    """PostgreSQL-backed user and lockout store.
+
+    All methods follow the session-per-operation pattern: create a
+    SQLAlchemy session, do work, commit/rollback, close.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        clock: Clock | None = None,
+    ) -> None:
+        self._sf = session_factory
+        self._clock = clock or SystemClock()
+
+    # ── users ────────────────────────────────────────────────────
+
+    def get_user(self, username: str) -> UserRecord | None:
+        """Return the user's record, or None."""
+        db = self._sf()
+        try:
+            model = db.get(UserModel, username)
+            return _model_to_record(model) if model is not None else None
+        finally:
+            db.close()
+
+    def get_credentials(self, username: str) -> tuple[bytes, bytes] | None:
+        """Return ``(password_hash, salt)`` for *username*, or None."""
+        db = self._sf()
+        try:
+            row = db.execute(
+                select(UserModel.password_hash, UserModel.salt).where(
+                    UserModel.username == username
+                )
+            ).first()
+        finally:
+            db.close()
+        return (bytes(row[0]), bytes(row[1])) if row is not None else None
+
+    def add_user(self, username: str, record: UserRecord) -> bool:
+        """Insert a user. Return False if the username (or email) is taken."""
+        stmt = (
+            insert(UserModel)
+            .values(
+                username=username,
+                password_hash=record["password_hash"],
+                salt=record["salt"],
+                name=record["name"],
+                email=record["email"],
+                created_at=self._clock.now_utc(),
+            )
+            .on_conflict_do_nothing()
+        )
+        db = self._sf()
+        try:
+            created = db.execute(stmt).rowcount == 1
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        if created:
+            logger.info("user_created: user=%s", username)
+        return created
+
+    def _update_user(self, username: str, **values: object) -> bool:
+        db = self._sf()
+        try:
+            updated = (
+                db.execute(
+                    update(UserModel)
+                    .where(UserModel.username == username)
+                    .values(**values)
+                ).rowcount
+                == 1
+            )
+            db.commit()
+            return updated
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def update_profile(self, username: str, name: str, email: str) -> bool:
+        """Update display name and email. Return True on success."""
+        return self._update_user(username, name=name, email=email)
+
+    def set_password(self, username: str, password_hash: bytes, salt: bytes) -> bool:
+        """Store a new password hash. Return True on success."""
+        return self._update_user(username, password_hash=password_hash, salt=salt)
+
+    # ── lockout ──────────────────────────────────────────────────
+
+    def is_locked(self, username: str) -> tuple[bool, datetime | None]:
+        """Return ``(locked, locked_until)``; expired lockouts are cleared."""
+        now = self._clock.now_utc()
+        db = self._sf()
+        try:
+            model = db.get(UserLockoutModel, username)
+            if model is None or model.locked_until is None:
+                return False, None
+            if now < model.locked_until:
+                return True, model.locked_until  # type: ignore[return-value]
+            # Expired — clear (only if nobody re-locked it meanwhile)
+            db.execute(
+                delete(UserLockoutModel).where(
+                    UserLockoutModel.username == username,
+                    UserLockoutModel.locked_until <= now,
+                )
+            )
+            db.commit()
+            return False, None
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def record_failed_attempt(self, username: str) -> tuple[bool, datetime | None]:
+        """Atomically count a failed attempt; return the new lockout state."""
+        until = self._clock.now_utc() + LOCKOUT_DURATION
+        new_count = UserLockoutModel.fail_count + 1
+        stmt = (
+            insert(UserLockoutModel)
+            .values(
+                username=username,
+                fail_count=1,
+                locked_until=until if MAX_FAILED_ATTEMPTS <= 1 else None,
+            )
+            .on_conflict_do_update(
+                index_elements=[UserLockoutModel.username],
+                set_={
+                    "fail_count": new_count,
+                    "locked_until": case(
+                        (new_count >= MAX_FAILED_ATTEMPTS, until),
+                        else_=UserLockoutModel.locked_until,
+                    ),
+                },
+            )
+            .returning(UserLockoutModel.locked_until)
+        )
+        db = self._sf()
+        try:
+            locked_until = db.execute(stmt).scalar_one()
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        if locked_until is None:
+            return False, None
+        logger.info("user_locked_out: user=%s until=%s", username, locked_until)
+        return True, locked_until
+
+    def clear_failed_attempts(self, username: str) -> None:
+        """Reset the failure counter on successful login."""
+        db = self._sf()
+        try:
+            db.execute(
+                delete(UserLockoutModel).where(UserLockoutModel.username == username)
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ── housekeeping ─────────────────────────────────────────────
+
+    def reset(self) -> None:
+        """Delete all users and lockouts — **for testing only**."""
+        db = self._sf()
+        try:
+            db.execute(delete(UserLockoutModel))
+            db.execute(delete(UserModel))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
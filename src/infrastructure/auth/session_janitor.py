@@ -0,0 +1,176 @@
+"""Session janitor — background purge of expired and old revoked sessions.
+
+``PostgresSessionStore`` only soft-revokes sessions and never deletes
+expired rows on its own, so without housekeeping the ``sessions`` table
+grows without limit and ``active_session_count`` keeps getting slower.
+
+``SessionJanitor`` runs ``cleanup_expired_sessions`` every
+``interval_seconds`` on a daemon thread:
+
+- **Bounded chunks**: the store deletes at most ``batch_size`` rows per
+  transaction, selected through ``ix_sessions_expires_at`` and
+  ``ix_sessions_revoked_at``.
+- **One worker at a time**: each pass takes a PostgreSQL advisory lock
+  (``pg_try_advisory_lock``); with ``gunicorn -w N`` or several
+  containers, the workers that lose the race skip the pass.
+- **Throughput logging**: every pass that removes rows logs the count and
+  rows removed per second.
+
+Started from ``combined_app`` on application startup, stopped on shutdown.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, Protocol
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 300.0
+DEFAULT_BATCH_SIZE = 1000
+
+# Arbitrary, stable 64-bit key identifying the janitor's advisory lock.
+ADVISORY_LOCK_KEY = 0x5342_5345_5353_4A4E  # "SBSESSJN"
+
+
+class CleanableSessionStore(Protocol):
+    """A session store that can purge expired sessions in chunks."""
+
+    def cleanup_expired_sessions(self, *, batch_size: int = ...) -> int: ...
+
+
+@contextmanager
+def _advisory_lock(session_factory: Callable[[], Session]) -> Iterator[bool]:
+    """Try to take the janitor's advisory lock; yield whether it was acquired.
+
+    The lock is session-level, so it is held on one dedicated connection
+    and released before that connection goes back to the pool.
+    """
+    db = session_factory()
+    try:
+        acquired = bool(
+            db.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY}
+            ).scalar()
+        )
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                db.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY}
+                )
+    finally:
+        db.close()
+
+
+class SessionJanitor:
+    """Periodically deletes expired and old revoked sessions."""
+
+    def __init__(
+        self,
+        store: CleanableSessionStore,
+        *,
+        session_factory: Callable[[], Session] | None = None,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize the janitor (the thread is started by ``start``).
+
+        Args:
+            store: The store to purge (e.g. ``PostgresSessionStore``).
+            session_factory: Session factory used for the advisory lock;
+                ``None`` skips the lock (single-process setups and tests).
+            interval_seconds: Pause between two cleanup passes.
+            batch_size: Maximum rows deleted per transaction.
+
+        Raises:
+            ValueError: If the interval or batch size is not positive.
+        """
+        if interval_seconds <= 0 or batch_size < 1:
+            raise ValueError("invalid session janitor settings")
+        self._store = store
+        self._sf = session_factory
+        self._interval = interval_seconds
+        self._batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def interval_seconds(self) -> float:
+        """Pause between two cleanup passes."""
+        return self._interval
+
+    @property
+    def batch_size(self) -> int:
+        """Maximum rows deleted per transaction."""
+        return self._batch_size
+
+    @property
+    def running(self) -> bool:
+        """True while the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_once(self) -> int | None:
+        """Run one cleanup pass.
+
+        Returns:
+            Rows removed, or ``None`` if another worker holds the lock.
+        """
+        if self._sf is None:
+            return self._purge()
+        with _advisory_lock(self._sf) as acquired:
+            if not acquired:
+                logger.debug("session_janitor: lock held by another worker")
+                return None
+            return self._purge()
+
+    def _purge(self) -> int:
+        started = time.perf_counter()
+        removed = self._store.cleanup_expired_sessions(batch_size=self._batch_size)
+        if removed:
+            elapsed = max(time.perf_counter() - started, 1e-9)
+            logger.info(
+                "session_janitor: removed=%d elapsed=%.3fs rate=%.0f rows/s",
+                removed,
+                elapsed,
+                removed / elapsed,
+            )
+        return removed
+
+    def start(self) -> None:
+        """Start the background thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="session-janitor", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "session_janitor: started (interval=%ss batch=%d)",
+            self._interval,
+            self._batch_size,
+        )
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.run_once()
+            except Exception:  # keep the janitor alive across DB hiccups
+                logger.exception("session_janitor: cleanup pass failed")
+
+    def close(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
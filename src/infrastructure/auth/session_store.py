@@ -15,14 +15,15 @@ Expiration policy:
 Backend selection:
 - Call ``configure_store(store)`` with a ``PostgresSessionStore`` instance at
   bootstrap time to switch to PostgreSQL-backed sessions.
-- When no backend is configured, falls back to in-memory + file-backed store
-  (suitable for local dev / testing).
+- When no backend is configured, falls back to an in-memory store persisted
+  to an append-only journal file (suitable for local dev / single node).
 
 Thread-safe via ``threading.Lock`` (in-memory backend).
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
@@ -31,7 +32,7 @@ import re
 import secrets
 import threading
 from datetime import datetime, timedelta
-from typing import Protocol, TypedDict
+from typing import Any, Protocol, TypedDict
 
 from application.ports.clock import Clock
 from infrastructure.clock import SystemClock
@@ -42,11 +43,14 @@ logger = logging.getLogger(__name__)
 SESSION_IDLE_MINUTES = int(os.environ.get("SESSION_IDLE_MINUTES", "15"))
 SESSION_MAX_HOURS = int(os.environ.get("SESSION_MAX_HOURS", "12"))
 REAUTH_WINDOW_MINUTES = int(os.environ.get("REAUTH_WINDOW_MINUTES", "10"))
+JOURNAL_COMPACT_RECORDS = int(os.environ.get("SESSION_JOURNAL_COMPACT_RECORDS", "1000"))
 
 _SESSION_ID_BYTES = 32  # 256-bit random
 
 _PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent.parent
-_DEFAULT_STORE_FILE = ".sessions.json"
+_DEFAULT_STORE_FILE = ".sessions.jsonl"
+# Snapshot file written by versions before the journal (migrated on load)
+_LEGACY_STORE_FILE = ".sessions.json"
 
 # Allowlist: alphanumeric, dots, hyphens, underscores — no slashes/backslashes
 _SAFE_FILENAME_RE = re.compile(r"^[\w.\-]+$")
@@ -129,49 +133,186 @@ _lock = threading.Lock()
 _SESSIONS: dict[str, SessionRecord] = {}
 
 
-# ── File persistence helpers ─────────────────────────────────────────────────
+# ── Journal persistence ──────────────────────────────────────────────────────
+# The file is an append-only journal: one compact JSON line per create,
+# touch, reauth, revoke or rotate.  Mutations only queue their line while
+# holding ``_lock``; ``_flush_journal`` appends queued lines after ``_lock``
+# is released, so disk writes never block other session operations, and
+# a request never waits for another thread's append.
+# Once enough records pile up, the journal is compacted into one ``put``
+# line per live session.
 
+# Serialises appends and compaction (never acquired while holding _lock).
+_journal_lock = threading.Lock()
+# Lines not yet written, in mutation order.  Guarded by ``_lock``.
+_pending: list[str] = []
+# [records in the journal file] — drives compaction.  Guarded by ``_lock``.
+_journal_records: list[int] = [0]
 
-def _save_to_disk() -> None:
-    """Persist ``_SESSIONS`` to a JSON file.  **Must be called with _lock held.**"""
+
+def _fmt(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _parse(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _put_entry(rec: SessionRecord) -> dict[str, Any]:
+    return {
+        "op": "put",
+        "sid": rec["session_id"],
+        "actor": rec["actor_id"],
+        "created": _fmt(rec["created_at"]),
+        "seen": _fmt(rec["last_seen_at"]),
+        "reauth": _fmt(rec["reauth_at"]),
+        "csrf": rec["csrf_token"],
+    }
+
+
+def _dumps(entry: dict[str, Any]) -> str:
+    return json.dumps(entry, separators=(",", ":"))
+
+
+def _journal(entry: dict[str, Any]) -> None:
+    """Queue one journal line.  **Must be called with _lock held.**"""
+    _pending.append(_dumps(entry))
+
+
+def _flush_journal(*, compact: bool = False, wait: bool = False) -> None:
+    """Append queued lines, compacting when due.  **Must NOT hold _lock.**
+
+    Request paths return at once when another thread is writing: that
+    thread re-checks ``_pending`` after releasing ``_journal_lock`` and
+    writes anything queued meanwhile.  Compaction and *wait* (explicit
+    flushes, exit) block until the journal is free.
+    """
+    blocking = compact or wait
+    while _journal_lock.acquire(blocking=blocking):
+        try:
+            _drain_pending(compact=compact)
+        finally:
+            _journal_lock.release()
+        compact = False
+        with _lock:
+            if not _pending:
+                return
+
+
+def _drain_pending(*, compact: bool) -> None:
+    """Write every queued line.  **Must be called with _journal_lock held.**"""
+    with _lock:
+        lines = _pending.copy()
+        _pending.clear()
+        _journal_records[0] += len(lines)
+        compact = compact or _journal_records[0] >= max(
+            JOURNAL_COMPACT_RECORDS, 2 * len(_SESSIONS)
+        )
+        if compact:
+            # The snapshot already reflects every drained line.
+            lines = [_dumps(_put_entry(r)) for r in _SESSIONS.values()]
+            _journal_records[0] = len(lines)
     try:
-        data: dict[str, dict[str, str | None]] = {}
-        for sid, rec in _SESSIONS.items():
-            data[sid] = {
-                "session_id": rec["session_id"],
-                "actor_id": rec["actor_id"],
-                "created_at": rec["created_at"].isoformat(),
-                "last_seen_at": rec["last_seen_at"].isoformat(),
-                "reauth_at": (
-                    rec["reauth_at"].isoformat() if rec["reauth_at"] else None
-                ),
-                "csrf_token": rec["csrf_token"],
-            }
-        _STORE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        if compact:
+            _write_snapshot(lines)
+        elif lines:
+            with _STORE_PATH.open("a", encoding="utf-8") as fh:
+                fh.write("".join(f"{line}\n" for line in lines))
     except OSError:
         pass  # best-effort — in-memory store still works
 
 
-def _load_from_disk() -> None:
-    """Load ``_SESSIONS`` from a JSON file.  **Must be called with _lock held.**"""
+def flush_journal() -> None:
+    """Write every queued journal line, waiting for a concurrent writer."""
+    _flush_journal(wait=True)
+
+
+def _write_snapshot(lines: list[str]) -> None:
+    """Atomically replace the journal with *lines*."""
+    tmp = _STORE_PATH.with_name(_STORE_PATH.name + ".tmp")
+    tmp.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    os.replace(tmp, _STORE_PATH)
+
+
+def _replay(entry: dict[str, Any]) -> None:
+    """Apply one journal entry to ``_SESSIONS``.  **Must be called with _lock held.**"""
+    op, sid = entry["op"], entry["sid"]
+    if op == "put":
+        _SESSIONS[sid] = SessionRecord(
+            session_id=sid,
+            actor_id=entry["actor"],
+            created_at=datetime.fromisoformat(entry["created"]),
+            last_seen_at=datetime.fromisoformat(entry["seen"]),
+            reauth_at=_parse(entry.get("reauth")),
+            csrf_token=entry["csrf"],
+        )
+    elif op == "del":
+        _SESSIONS.pop(sid, None)
+    elif op == "touch" and sid in _SESSIONS:
+        _SESSIONS[sid]["last_seen_at"] = datetime.fromisoformat(entry["at"])
+    elif op == "reauth" and sid in _SESSIONS:
+        _SESSIONS[sid]["reauth_at"] = _parse(entry["at"])
+
+
+def _load_legacy(text: str) -> bool:
+    """Load the pre-journal snapshot format (one ``{sid: record}`` JSON object).
+
+    Returns False when *text* is not such a snapshot.  **Must be called
+    with _lock held.**
+    """
     try:
-        if not _STORE_PATH.exists():
-            return
-        raw = json.loads(_STORE_PATH.read_text(encoding="utf-8"))
-        for sid, rd in raw.items():
+        raw = json.loads(text)
+    except ValueError:
+        return False
+    if not isinstance(raw, dict) or "op" in raw:
+        return False
+    for sid, rd in raw.items():
+        try:
             _SESSIONS[sid] = SessionRecord(
-                session_id=rd["session_id"],
+                session_id=sid,
                 actor_id=rd["actor_id"],
                 created_at=datetime.fromisoformat(rd["created_at"]),
                 last_seen_at=datetime.fromisoformat(rd["last_seen_at"]),
-                reauth_at=(
-                    datetime.fromisoformat(rd["reauth_at"])
-                    if rd.get("reauth_at")
-                    else None
-                ),
+                reauth_at=_parse(rd.get("reauth_at")),
                 csrf_token=rd["csrf_token"],
             )
-    except (OSError, KeyError, ValueError):
+        except (KeyError, TypeError, ValueError):
+            continue
+    return True
+
+
+def _load_from_disk() -> None:
+    """Replay the journal into ``_SESSIONS``.  **Must be called with _lock held.**
+
+    Unreadable lines (e.g. a write torn by a crash) are skipped.  A snapshot
+    in the old ``.sessions.json`` format — in the journal file itself, or
+    left next to it by a previous version when the default path is used —
+    is loaded and rewritten as a compacted journal.
+    """
+    try:
+        source = _STORE_PATH
+        if not source.exists():
+            source = _STORE_PATH.with_name(_LEGACY_STORE_FILE)
+            if _STORE_PATH.name != _DEFAULT_STORE_FILE or not source.exists():
+                return
+        text = source.read_text(encoding="utf-8")
+        if _load_legacy(text):
+            lines = [_dumps(_put_entry(r)) for r in _SESSIONS.values()]
+            _write_snapshot(lines)
+            _journal_records[0] = len(lines)
+            if source != _STORE_PATH:
+                source.unlink()
+            logger.info(
+                "session_store: migrated %d session(s) from %s", len(lines), source
+            )
+            return
+        for line in text.splitlines():
+            try:
+                _replay(json.loads(line))
+            except (KeyError, TypeError, ValueError):
+                continue
+            _journal_records[0] += 1
+    except OSError:
         pass  # best-effort — start with empty store
 
 
@@ -179,6 +320,9 @@ def _load_from_disk() -> None:
 with _lock:
     _load_from_disk()
 
+# Write whatever a busy journal left queued before the process exits
+atexit.register(flush_journal)
+
 
 def _generate_session_id() -> str:
     """Generate a cryptographically secure session ID (hex, 64 chars)."""
@@ -227,7 +371,8 @@ def create_session(actor_id: str) -> SessionRecord:
     )
     with _lock:
         _SESSIONS[session_id] = record
-        _save_to_disk()
+        _journal(_put_entry(record))
+    _flush_journal()
     return record
 
 
@@ -243,25 +388,21 @@ def get_session(session_id: str) -> SessionRecord | None:
             return None
 
         now = _now()
-
-        # Check max lifetime
         max_delta = timedelta(hours=SESSION_MAX_HOURS)
-        if now - record["created_at"] > max_delta:
-            _SESSIONS.pop(session_id, None)
-            _save_to_disk()
-            return None
-
-        # Check idle timeout
         idle_delta = timedelta(minutes=SESSION_IDLE_MINUTES)
-        if now - record["last_seen_at"] > idle_delta:
+        if (
+            now - record["created_at"] > max_delta  # max lifetime
+            or now - record["last_seen_at"] > idle_delta  # idle timeout
+        ):
             _SESSIONS.pop(session_id, None)
-            _save_to_disk()
-            return None
-
-        # Touch the session
-        record["last_seen_at"] = now
-        _save_to_disk()
-        return record
+            _journal({"op": "del", "sid": session_id})
+            record = None
+        else:
+            # Touch the session
+            record["last_seen_at"] = now
+            _journal({"op": "touch", "sid": session_id, "at": _fmt(now)})
+    _flush_journal()
+    return record
 
 
 def invalidate_session(session_id: str) -> bool:
@@ -273,8 +414,10 @@ def invalidate_session(session_id: str) -> bool:
     with _lock:
         removed = _SESSIONS.pop(session_id, None) is not None
         if removed:
-            _save_to_disk()
-        return removed
+            _journal({"op": "del", "sid": session_id})
+    if removed:
+        _flush_journal()
+    return removed
 
 
 def mark_reauth(session_id: str) -> bool:
@@ -288,8 +431,9 @@ def mark_reauth(session_id: str) -> bool:
         if record is None:
             return False
         record["reauth_at"] = _now()
-        _save_to_disk()
-        return True
+        _journal({"op": "reauth", "sid": session_id, "at": _fmt(record["reauth_at"])})
+    _flush_journal()
+    return True
 
 
 def rotate_session_id(old_session_id: str) -> SessionRecord | None:
@@ -314,8 +458,10 @@ def rotate_session_id(old_session_id: str) -> SessionRecord | None:
             csrf_token=new_csrf,
         )
         _SESSIONS[new_id] = new_record
-        _save_to_disk()
-        return new_record
+        _journal({"op": "del", "sid": old_session_id})
+        _journal(_put_entry(new_record))
+    _flush_journal()
+    return new_record
 
 
 def is_recently_reauthed(session_id: str) -> bool:
@@ -357,7 +503,7 @@ def reset_sessions() -> None:
 
     with _lock:
         _SESSIONS.clear()
-        _save_to_disk()
+    _flush_journal(compact=True)
 
 
 def active_session_count() -> int:
@@ -1,27 +1,41 @@
-"""In-memory user store — users, password hashes, profiles, lockout state.
+"""User store — users, password hashes, profiles, lockout state.
 
 Shared across Flask and Gradio adapters.  No framework imports.
 
+Backend selection:
+- Call ``configure_store(store)`` with a ``PostgresUserStore`` (usually
+  wrapped in a ``CachedUserStore``) at bootstrap time so every worker
+  reads users and lockout counters from PostgreSQL.
+- When no backend is configured, falls back to module-level in-memory
+  dicts (suitable for local dev / testing).
+
 Security notes
 ~~~~~~~~~~~~~~
-- Passwords are hashed with PBKDF2-HMAC-SHA256 (100 000 iterations + random salt).
+- Passwords are hashed with PBKDF2-HMAC-SHA256 (100 000 iterations + random salt)
+  on the bounded pool from :mod:`infrastructure.auth.password_hasher`; a
+  saturated pool raises ``PasswordHasherBusy``.  Hashing never runs while
+  ``_lock`` is held, and backends only ever see the resulting hashes.
 - Lockout counters are per-username (anti brute-force).
-- Demo users have ``password == username`` but are stored hashed.
+- Demo users have ``password == username`` but are stored hashed.  In the
+  in-memory fallback they are seeded lazily, on first use of the store,
+  not at import time.
 """
 
 from __future__ import annotations
 
-import hashlib
+import hmac
+import logging
 import os
 import threading
 from datetime import datetime, timedelta, timezone
-from typing import TypedDict
+from typing import Protocol, TypedDict
+
+from infrastructure.auth.password_hasher import get_hasher, pbkdf2
+
+logger = logging.getLogger(__name__)
 
 # ── Constants ────────────────────────────────────────────────────────────────
-_PBKDF2_ITERATIONS = 100_000
 _SALT_LENGTH = 32
-_HASH_ALGO = "sha256"
-_DK_LEN = 32
 
 MAX_FAILED_ATTEMPTS = 3
 LOCKOUT_DURATION = timedelta(hours=1)
@@ -40,25 +54,66 @@ class LockoutRecord(TypedDict):
     locked_until: datetime | None
 
 
+# ── Pluggable backend protocol ───────────────────────────────────────────────
+
+
+class UserStoreBackend(Protocol):
+    """Structural protocol for pluggable user store backends.
+
+    Backends store records only; hashing stays in this module.
+    """
+
+    def get_user(self, username: str) -> UserRecord | None: ...
+    def get_credentials(self, username: str) -> tuple[bytes, bytes] | None: ...
+    def add_user(self, username: str, record: UserRecord) -> bool: ...
+    def update_profile(self, username: str, name: str, email: str) -> bool: ...
+    def set_password(
+        self, username: str, password_hash: bytes, salt: bytes
+    ) -> bool: ...
+    def is_locked(self, username: str) -> tuple[bool, datetime | None]: ...
+    def record_failed_attempt(self, username: str) -> tuple[bool, datetime | None]: ...
+    def clear_failed_attempts(self, username: str) -> None: ...
+    def reset(self) -> None: ...
+
+
+# Mutable containers — avoids ``global`` keyword
+_store_holder: list[UserStoreBackend | None] = [None]
+
+
+def configure_store(store: UserStoreBackend | None) -> None:
+    """Set the user backend (``None`` restores the in-memory fallback).
+
+    Must be called once at application startup (from ``build_services()``).
+    After this call every module-level function delegates to *store*.
+    """
+    _store_holder[0] = store
+    logger.info(
+        "user_store: backend configured → %s",
+        type(store).__name__ if store is not None else "in_memory",
+    )
+
+
+def get_store() -> UserStoreBackend | None:
+    """Return the currently configured store (or None for in-memory)."""
+    return _store_holder[0]
+
+
 # ── Hashing helpers ──────────────────────────────────────────────────────────
 def _hash_password(password: str, salt: bytes | None = None) -> tuple[bytes, bytes]:
-    """Hash *password* with PBKDF2-HMAC and return ``(hash, salt)``."""
+    """Hash *password* on the hashing pool and return ``(hash, salt)``.
+
+    Raises:
+        PasswordHasherBusy: If the hashing pool is saturated.
+    """
     if salt is None:
         salt = os.urandom(_SALT_LENGTH)
-    pw_hash = hashlib.pbkdf2_hmac(
-        _HASH_ALGO,
-        password.encode("utf-8"),
-        salt,
-        _PBKDF2_ITERATIONS,
-        dklen=_DK_LEN,
-    )
-    return pw_hash, salt
+    return get_hasher().hash(password, salt), salt
 
 
 def _verify_password(password: str, pw_hash: bytes, salt: bytes) -> bool:
     """Return True if *password* matches the stored hash."""
     candidate, _ = _hash_password(password, salt)
-    return candidate == pw_hash
+    return hmac.compare_digest(candidate, pw_hash)
 
 
 # ── In-memory stores (module-level, protected by lock) ───────────────────────
@@ -67,49 +122,102 @@ _lock = threading.Lock()
 _USERS: dict[str, UserRecord] = {}
 _LOCKOUT: dict[str, LockoutRecord] = {}
 
+_DEMO_ACCOUNTS: dict[str, dict[str, str]] = {
+    "demo-user": {"name": "Demo User", "email": "demo@example.com"},
+    "alice": {"name": "Alice", "email": "alice@example.com"},
+    "bob": {"name": "Bob", "email": "bob@example.com"},
+    "charlie": {"name": "Charlie", "email": "charlie@example.com"},
+    "dave": {"name": "Dave", "email": "dave@example.com"},
+}
+
+# Lazy demo seeding: [seeded?] — set once the demo users are in _USERS.
+_seeded: list[bool] = [False]
+_seed_lock = threading.Lock()
+
 
 def _seed_demo_users() -> None:
-    """Populate demo users (idempotent)."""
-    demo_accounts = {
-        "demo-user": {"name": "Demo User", "email": "demo@example.com"},
-        "alice": {"name": "Alice", "email": "alice@example.com"},
-        "bob": {"name": "Bob", "email": "bob@example.com"},
-        "charlie": {"name": "Charlie", "email": "charlie@example.com"},
-        "dave": {"name": "Dave", "email": "dave@example.com"},
-    }
-    for username, info in demo_accounts.items():
-        if username not in _USERS:
-            pw_hash, salt = _hash_password(username)  # password == username
-            _USERS[username] = UserRecord(
-                password_hash=pw_hash,
-                salt=salt,
-                name=info["name"],
-                email=info["email"],
+    """Populate demo users (idempotent).
+
+    Hashes run directly (not on the admission-controlled pool): seeding
+    happens once per process and must not be rejected.
+    """
+    missing = [u for u in _DEMO_ACCOUNTS if u not in _USERS]
+    hashed = {}
+    for username in missing:
+        salt = os.urandom(_SALT_LENGTH)
+        hashed[username] = (pbkdf2(username, salt), salt)  # password == username
+    with _lock:
+        for username, (pw_hash, salt) in hashed.items():
+            info = _DEMO_ACCOUNTS[username]
+            _USERS.setdefault(
+                username,
+                UserRecord(
+                    password_hash=pw_hash,
+                    salt=salt,
+                    name=info["name"],
+                    email=info["email"],
+                ),
             )
 
 
-# Seed on import so they're always available
-_seed_demo_users()
+def _ensure_seeded() -> None:
+    """Seed the demo users on first use of the store."""
+    if _seeded[0]:
+        return
+    with _seed_lock:
+        if not _seeded[0]:
+            _seed_demo_users()
+            _seeded[0] = True
 
 
 # ── Public API ───────────────────────────────────────────────────────────────
+# Each function delegates to ``get_store()`` if configured, otherwise uses
+# the in-memory fallback.
+
+
 def user_exists(username: str) -> bool:
     """Return True if *username* is a registered user."""
+    store = get_store()
+    if store is not None:
+        return store.get_user(username) is not None
+
+    _ensure_seeded()
     with _lock:
         return username in _USERS
 
 
 def verify_credentials(username: str, password: str) -> bool:
-    """Return True if credentials are valid. Does NOT check lockout."""
+    """Return True if credentials are valid. Does NOT check lockout.
+
+    Always reads the current hash from the backend (never a cached copy),
+    so a password change on another worker takes effect immediately.
+
+    Raises:
+        PasswordHasherBusy: If the hashing pool is saturated.
+    """
+    store = get_store()
+    if store is not None:
+        credentials = store.get_credentials(username)
+        if credentials is None:
+            return False
+        pw_hash, salt = credentials
+        return _verify_password(password, pw_hash, salt)
+
+    _ensure_seeded()
     with _lock:
         user = _USERS.get(username)
         if user is None:
             return False
-        return _verify_password(password, user["password_hash"], user["salt"])
+        pw_hash, salt = user["password_hash"], user["salt"]
+    return _verify_password(password, pw_hash, salt)
 
 
 def is_locked(username: str) -> tuple[bool, datetime | None]:
     """Return ``(locked, locked_until)`` for *username*."""
+    store = get_store()
+    if store is not None:
+        return store.is_locked(username)
+
     with _lock:
         rec = _LOCKOUT.get(username)
         if rec is None:
@@ -126,6 +234,10 @@ def is_locked(username: str) -> tuple[bool, datetime | None]:
 
 def record_failed_attempt(username: str) -> tuple[bool, datetime | None]:
     """Record a failed login attempt; return new lockout state."""
+    store = get_store()
+    if store is not None:
+        return store.record_failed_attempt(username)
+
     with _lock:
         rec = _LOCKOUT.setdefault(
             username,
@@ -141,12 +253,25 @@ def record_failed_attempt(username: str) -> tuple[bool, datetime | None]:
 
 def clear_failed_attempts(username: str) -> None:
     """Reset failure counter on successful login."""
+    store = get_store()
+    if store is not None:
+        store.clear_failed_attempts(username)
+        return
+
     with _lock:
         _LOCKOUT.pop(username, None)
 
 
 def get_user_profile(username: str) -> dict[str, str] | None:
     """Return ``{username, name, email}`` or None."""
+    store = get_store()
+    if store is not None:
+        record = store.get_user(username)
+        if record is None:
+            return None
+        return {"username": username, "name": record["name"], "email": record["email"]}
+
+    _ensure_seeded()
     with _lock:
         user = _USERS.get(username)
         if user is None:
@@ -160,6 +285,11 @@ def get_user_profile(username: str) -> dict[str, str] | None:
 
 def update_user_profile(username: str, name: str, email: str) -> bool:
     """Update display name and email. Return True on success."""
+    store = get_store()
+    if store is not None:
+        return store.update_profile(username, name, email)
+
+    _ensure_seeded()
     with _lock:
         user = _USERS.get(username)
         if user is None:
@@ -170,23 +300,40 @@ def update_user_profile(username: str, name: str, email: str) -> bool:
 
 
 def change_password(username: str, new_password: str) -> bool:
-    """Change the password for *username*. Return True on success."""
+    """Change the password for *username*. Return True on success.
+
+    Raises:
+        PasswordHasherBusy: If the hashing pool is saturated.
+    """
+    if not user_exists(username):
+        return False
+    pw_hash, salt = _hash_password(new_password)
+
+    store = get_store()
+    if store is not None:
+        return store.set_password(username, pw_hash, salt)
+
     with _lock:
         user = _USERS.get(username)
         if user is None:
             return False
-        pw_hash, salt = _hash_password(new_password)
         user["password_hash"] = pw_hash
         user["salt"] = salt
     return True
 
 
 def reset_stores() -> None:
-    """Reset all in-memory stores — **for testing only**."""
+    """Reset all stores — **for testing only**."""
+    store = get_store()
+    if store is not None:
+        store.reset()
+        return
+
     with _lock:
         _USERS.clear()
         _LOCKOUT.clear()
-    _seed_demo_users()
+    with _seed_lock:
+        _seeded[0] = False
 
 
 def create_user(
@@ -197,20 +344,27 @@ def create_user(
 ) -> bool:
     """Create a new user with hashed password.
 
-    Stores in the in-memory store and optionally in PostgreSQL.
+    Stores in the configured backend, or in the in-memory store with a
+    best-effort copy in PostgreSQL.
 
     Returns True on success, False if the username already exists.
+
+    Raises:
+        PasswordHasherBusy: If the hashing pool is saturated.
     """
+    if user_exists(username):
+        return False
+    pw_hash, salt = _hash_password(password)
+    record = UserRecord(password_hash=pw_hash, salt=salt, name=name, email=email)
+
+    store = get_store()
+    if store is not None:
+        return store.add_user(username, record)
+
     with _lock:
         if username in _USERS:
             return False
-        pw_hash, salt = _hash_password(password)
-        _USERS[username] = UserRecord(
-            password_hash=pw_hash,
-            salt=salt,
-            name=name,
-            email=email,
-        )
+        _USERS[username] = record
 
     # Best-effort persistence to PostgreSQL
     _persist_user_to_database(username)
@@ -263,17 +417,10 @@ def seed_demo_users_to_database() -> None:
         from infrastructure.db.session import SessionLocal
         from sqlalchemy.exc import SQLAlchemyError
 
-        demo_accounts = {
-            "demo-user": {"name": "Demo User", "email": "demo@example.com"},
-            "alice": {"name": "Alice", "email": "alice@example.com"},
-            "bob": {"name": "Bob", "email": "bob@example.com"},
-            "charlie": {"name": "Charlie", "email": "charlie@example.com"},
-            "dave": {"name": "Dave", "email": "dave@example.com"},
-        }
-
+        _ensure_seeded()
         session = SessionLocal()
         try:
-            for username, _info in demo_accounts.items():
+            for username in _DEMO_ACCOUNTS:
                 existing = session.query(UserModel).filter_by(username=username).first()
                 if existing is None and username in _USERS:
                     user_rec = _USERS[username]
@@ -12,9 +12,11 @@ Environment modes
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Callable
 
 # Load .env early so DATABASE_URL is available
 try:
@@ -30,7 +32,9 @@ from application.use_cases.delete_card import DeleteCard
 from application.use_cases.generate_scenario_card import GenerateScenarioCard
 from application.use_cases.get_card import GetCard
 from application.use_cases.list_cards import ListCards
+from application.use_cases.list_favorite_cards import ListFavoriteCards
 from application.use_cases.list_favorites import ListFavorites
+from application.use_cases.render_card_thumbnails import RenderCardThumbnails
 from application.use_cases.render_map_svg import RenderMapSvg
 from application.use_cases.save_card import SaveCard
 from application.use_cases.toggle_favorite import ToggleFavorite
@@ -41,6 +45,18 @@ from infrastructure.generators.uuid_id_generator import UuidIdGenerator
 
 # Infrastructure rendering
 from infrastructure.maps.svg_map_renderer import SvgMapRenderer
+from infrastructure.maps.svg_render_cache import LruSvgCache
+from infrastructure.maps.thumbnail_renderer import (
+    POOL_NONE,
+    SvgThumbnailRenderer,
+    make_thumbnail_executor,
+)
+
+# Infrastructure instrumentation
+from infrastructure.observability.use_case_metrics import (
+    get_use_case_metrics,
+    instrument_use_case,
+)
 
 # Infrastructure repositories
 from infrastructure.repositories.in_memory_card_repository import InMemoryCardRepository
@@ -53,11 +69,20 @@ from infrastructure.scenario_generation.basic_scenario_generator import (
     BasicScenarioGenerator,
 )
 
+if TYPE_CHECKING:
+    from infrastructure.auth.postgres_session_store import PostgresSessionStore
+    from infrastructure.auth.session_janitor import SessionJanitor
+    from infrastructure.auth.session_store import SessionStoreBackend
+    from sqlalchemy.orm import Session
+
 logger = logging.getLogger(__name__)
 
 # Module-level singleton: shared by Flask and Gradio in the combined app.
 _services_holder: list["Services | None"] = [None]
 
+# Session janitor built with the Postgres session store (started by the app).
+_janitor_holder: list["SessionJanitor | None"] = [None]
+
 _LOG_BACKEND_IN_MEMORY = "Using SessionStore backend: in_memory"
 
 
@@ -87,7 +112,7 @@ def get_services() -> "Services":
 # =============================================================================
 # SESSION STORE WIRING
 # =============================================================================
-def _build_session_store() -> None:
+def _build_session_store() -> Callable[[], Session] | None:
     """Configure session store backend based on ``DATABASE_URL`` and ``APP_ENV``.
 
     Production (``APP_ENV=prod``)
@@ -97,6 +122,10 @@ def _build_session_store() -> None:
     Development / test (any other ``APP_ENV``)
         Failures are logged as warnings and the in-memory session store
         is used as a fallback.
+
+    Returns:
+        The reachable PostgreSQL session factory, or ``None`` when the
+        in-memory session store is used.
     """
     prod = _is_prod()
     database_url = _get_env("DATABASE_URL")
@@ -109,7 +138,7 @@ def _build_session_store() -> None:
                 "Reason: DATABASE_URL is not set."
             )
         logger.info("%s (no DATABASE_URL)", _LOG_BACKEND_IN_MEMORY)
-        return
+        return None
 
     # --- 2) Must be a PostgreSQL URL --------------------------------------
     if not database_url.startswith("postgres"):
@@ -123,7 +152,7 @@ def _build_session_store() -> None:
             "falling back to in-memory session store."
         )
         logger.info(_LOG_BACKEND_IN_MEMORY)
-        return
+        return None
 
     # --- 3) SQLAlchemy / psycopg2 must be importable ---------------------
     try:
@@ -141,7 +170,7 @@ def _build_session_store() -> None:
             "installed. Falling back to in-memory session store."
         )
         logger.info(_LOG_BACKEND_IN_MEMORY)
-        return
+        return None
 
     # --- 4) DB must be reachable ------------------------------------------
     try:
@@ -160,11 +189,122 @@ def _build_session_store() -> None:
             exc,
         )
         logger.info(_LOG_BACKEND_IN_MEMORY)
-        return
+        return None
 
     store = PostgresSessionStore(session_factory=SessionLocal)
-    configure_store(store)
+    configure_store(_wrap_session_cache(store))
     logger.info("Using SessionStore backend: postgres")
+    _janitor_holder[0] = _build_session_janitor(store, SessionLocal)
+    return SessionLocal
+
+
+def _wrap_session_cache(store: PostgresSessionStore) -> SessionStoreBackend:
+    """Put the in-process session cache in front of *store*.
+
+    ``SESSION_CACHE_TTL_SECONDS`` (default 5, ``0`` disables the cache),
+    ``SESSION_CACHE_MAX_ENTRIES`` and ``SESSION_TOUCH_FLUSH_SECONDS``
+    tune it.  Invalid values fall back to the defaults.
+    """
+    from infrastructure.auth.cached_session_store import (
+        DEFAULT_FLUSH_INTERVAL_SECONDS,
+        DEFAULT_MAX_ENTRIES,
+        DEFAULT_TTL_SECONDS,
+        CachedSessionStore,
+    )
+
+    try:
+        ttl = float(_get_env("SESSION_CACHE_TTL_SECONDS") or DEFAULT_TTL_SECONDS)
+        max_entries = int(_get_env("SESSION_CACHE_MAX_ENTRIES") or DEFAULT_MAX_ENTRIES)
+        flush = float(
+            _get_env("SESSION_TOUCH_FLUSH_SECONDS") or DEFAULT_FLUSH_INTERVAL_SECONDS
+        )
+        if ttl <= 0:
+            logger.info("Session cache disabled (SESSION_CACHE_TTL_SECONDS=0)")
+            return store
+        cached = CachedSessionStore(
+            store,
+            ttl_seconds=ttl,
+            max_entries=max_entries,
+            flush_interval_seconds=flush,
+        )
+    except ValueError:
+        logger.warning("Invalid session cache settings — using defaults.")
+        cached = CachedSessionStore(store)
+    atexit.register(cached.close)
+    logger.info("Session cache enabled (ttl=%ss)", cached.ttl_seconds)
+    return cached
+
+
+def _build_session_janitor(
+    store: PostgresSessionStore, session_factory: Callable[[], Session]
+) -> SessionJanitor | None:
+    """Build (but do not start) the janitor purging old sessions from *store*.
+
+    ``SESSION_JANITOR_INTERVAL_SECONDS`` (default 300, ``0`` disables it)
+    and ``SESSION_JANITOR_BATCH_SIZE`` tune it.  Invalid values fall back
+    to the defaults.
+    """
+    from infrastructure.auth.session_janitor import (
+        DEFAULT_BATCH_SIZE,
+        DEFAULT_INTERVAL_SECONDS,
+        SessionJanitor,
+    )
+
+    try:
+        interval = float(
+            _get_env("SESSION_JANITOR_INTERVAL_SECONDS") or DEFAULT_INTERVAL_SECONDS
+        )
+        batch_size = int(_get_env("SESSION_JANITOR_BATCH_SIZE") or DEFAULT_BATCH_SIZE)
+        if interval <= 0:
+            logger.info("Session janitor disabled (SESSION_JANITOR_INTERVAL_SECONDS=0)")
+            return None
+        janitor = SessionJanitor(
+            store,
+            session_factory=session_factory,
+            interval_seconds=interval,
+            batch_size=batch_size,
+        )
+    except ValueError:
+        logger.warning("Invalid session janitor settings — using defaults.")
+        janitor = SessionJanitor(store, session_factory=session_factory)
+    atexit.register(janitor.close)
+    return janitor
+
+
+def get_session_janitor() -> SessionJanitor | None:
+    """Return the session janitor, or None without a Postgres session store."""
+    return _janitor_holder[0]
+
+
+def _build_user_store(session_factory: Callable[[], Session]) -> None:
+    """Configure the PostgreSQL user store behind a read-through cache.
+
+    ``USER_CACHE_TTL_SECONDS`` (default 30, ``0`` disables the cache) and
+    ``USER_CACHE_MAX_ENTRIES`` tune the cache.  Invalid values fall back
+    to the defaults.
+    """
+    from infrastructure.auth.cached_user_store import (
+        DEFAULT_MAX_ENTRIES,
+        DEFAULT_TTL_SECONDS,
+        CachedUserStore,
+    )
+    from infrastructure.auth.postgres_user_store import PostgresUserStore
+    from infrastructure.auth.user_store import configure_store
+
+    store = PostgresUserStore(session_factory=session_factory)
+    try:
+        ttl = float(_get_env("USER_CACHE_TTL_SECONDS") or DEFAULT_TTL_SECONDS)
+        max_entries = int(_get_env("USER_CACHE_MAX_ENTRIES") or DEFAULT_MAX_ENTRIES)
+        if ttl <= 0:
+            logger.info("User cache disabled (USER_CACHE_TTL_SECONDS=0)")
+            configure_store(store)
+            return
+        cached = CachedUserStore(store, ttl_seconds=ttl, max_entries=max_entries)
+    except ValueError:
+        logger.warning("Invalid user cache settings — using defaults.")
+        cached = CachedUserStore(store)
+    configure_store(cached)
+    logger.info("Using UserStore backend: postgres (cache ttl=%ss)", cached.ttl_seconds)
 
 
 # =============================================================================
@@ -183,9 +323,11 @@ class Services:
     list_cards: ListCards
     toggle_favorite: ToggleFavorite
     list_favorites: ListFavorites
+    list_favorite_cards: ListFavoriteCards
     create_variant: CreateVariant
     render_map_svg: RenderMapSvg
     delete_card: DeleteCard
+    render_card_thumbnails: RenderCardThumbnails
 
 
 # =============================================================================
@@ -248,6 +390,29 @@ def _build_favorites_repository():
     return InMemoryFavoritesRepository()
 
 
+def _build_thumbnail_renderer() -> SvgThumbnailRenderer:
+    """Build the list-page thumbnail renderer.
+
+    ``THUMBNAIL_POOL`` selects where large batches render (``none``,
+    ``thread`` or ``process``) and ``THUMBNAIL_POOL_WORKERS`` sizes the
+    pool.  Invalid values fall back to serial rendering.
+    """
+    kind = _get_env("THUMBNAIL_POOL", POOL_NONE).lower() or POOL_NONE
+    workers_raw = _get_env("THUMBNAIL_POOL_WORKERS")
+    try:
+        workers = int(workers_raw) if workers_raw else None
+        executor = make_thumbnail_executor(kind, workers)
+    except ValueError:
+        logger.warning(
+            "Invalid THUMBNAIL_POOL=%r / THUMBNAIL_POOL_WORKERS=%r — "
+            "rendering thumbnails serially.",
+            kind,
+            workers_raw,
+        )
+        executor = None
+    return SvgThumbnailRenderer(executor=executor)
+
+
 def build_services() -> Services:
     """Build and wire all use cases with their dependencies.
 
@@ -258,7 +423,11 @@ def build_services() -> Services:
         Services container with all use cases wired up.
     """
     # 0) Configure session store backend (postgres or in-memory)
-    _build_session_store()
+    session_factory = _build_session_store()
+
+    # 0a) Users and lockout state live in the same database as sessions
+    if session_factory is not None:
+        _build_user_store(session_factory)
 
     # 0b) Seed demo users (dev only, opt-in via SEED_DEMO_USERS=1)
     seed_requested = _get_env("SEED_DEMO_USERS") in ("1", "true", "yes")
@@ -305,6 +474,11 @@ def build_services() -> Services:
         favorites_repository=favorites_repo,
     )
 
+    list_favorite_cards = ListFavoriteCards(
+        card_repository=card_repo,
+        favorites_repository=favorites_repo,
+    )
+
     create_variant = CreateVariant(
         repository=card_repo,
         id_generator=id_gen,
@@ -315,6 +489,7 @@ def build_services() -> Services:
     render_map_svg = RenderMapSvg(
         repository=card_repo,
         renderer=renderer,
+        render_cache=LruSvgCache(),
     )
 
     delete_card = DeleteCard(
@@ -322,6 +497,11 @@ def build_services() -> Services:
         favorites_repository=favorites_repo,
     )
 
+    render_card_thumbnails = RenderCardThumbnails(
+        repository=card_repo,
+        thumbnail_renderer=_build_thumbnail_renderer(),
+    )
+
     # 3) Build services container and cache as singleton
     svc = Services(
         generate_scenario_card=generate_scenario_card,
@@ -330,9 +510,23 @@ def build_services() -> Services:
         list_cards=list_cards,
         toggle_favorite=toggle_favorite,
         list_favorites=list_favorites,
+        list_favorite_cards=list_favorite_cards,
         create_variant=create_variant,
         render_map_svg=render_map_svg,
         delete_card=delete_card,
+        render_card_thumbnails=render_card_thumbnails,
     )
+    svc = _instrument_services(svc)
     _services_holder[0] = svc
     return svc
+
+
+def _instrument_services(svc: Services) -> Services:
+    """Wrap every use case so its calls feed the ``/metrics`` registry."""
+    metrics = get_use_case_metrics()
+    return Services(
+        **{
+            f.name: instrument_use_case(f.name, getattr(svc, f.name), metrics)
+            for f in fields(svc)
+        }
+    )
@@ -0,0 +1,279 @@
+"""HTTP response compression (gzip, brotli) with a precompressed cache.
+
+Framework-neutral: the Flask ``after_request`` hook
+(``adapters.http_flask.middleware``) and the native ASGI read routes
+(``adapters.http_asgi.read_routes``) both go through ``ResponseCompressor``.
+
+- **Negotiation**: ``br`` (when the optional ``brotli`` package is
+  installed) is preferred over ``gzip``; ``Accept-Encoding`` q-values and
+  ``*`` are honoured.  Only text-like types (JSON, SVG, HTML, CSS, JS,
+  plain text) of at least ``min_size`` bytes are compressed — below that
+  the framing overhead outweighs the savings.
+- **Precompressed cache**: a response with a strong ``ETag`` is content
+  addressed (map SVGs carry their render hash), so its compressed bodies
+  are kept in a bounded LRU under ``(ETag, type, encoding)`` and repeat
+  hits skip compression.  Those bodies are compressed once at a higher
+  level; one-off bodies use a cheaper one.
+- Compressed responses carry ``Content-Encoding`` and ``Vary:
+  Accept-Encoding``, and a strong ``ETag`` is downgraded to a weak one
+  (the bytes differ per encoding), which still matches the weak
+  ``If-None-Match`` comparison used for 304s.
+
+Configured by ``HTTP_COMPRESSION`` (default on),
+``HTTP_COMPRESSION_MIN_BYTES`` (default 1024),
+``HTTP_COMPRESSION_CACHE_MAX_BYTES`` (default 16 MiB).
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import threading
+from collections import OrderedDict
+from types import ModuleType
+
+try:
+    import brotli as _brotli
+except ImportError:  # optional dependency: gzip only
+    _brotli = None
+
+logger = logging.getLogger(__name__)
+
+GZIP = "gzip"
+BROTLI = "br"
+
+DEFAULT_MIN_SIZE = 1024
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# (gzip level, brotli quality) for one-off and for cached bodies.
+_DYNAMIC_LEVELS = (6, 5)
+_CACHED_LEVELS = (9, 9)
+
+COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "image/svg+xml",
+        "text/css",
+        "text/html",
+        "text/javascript",
+        "text/plain",
+    }
+)
+
+
+def _accepted_codings(accept_encoding: str) -> dict[str, float]:
+    """Parse ``Accept-Encoding`` into ``{coding: q}`` (lower-cased)."""
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def weak_etag(etag: str) -> str:
+    """Return *etag* as a weak validator (unchanged if already weak)."""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+class CompressedBodyCache:
+    """Thread-safe LRU of compressed bodies, bounded by count and size."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("cache limits must be positive")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached bodies."""
+        with self._lock:
+            return self._total_bytes
+
+    def get(self, key: str) -> bytes | None:
+        """Return the body cached under *key* (marking it recently used)."""
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Cache *body* under *key*, evicting least recently used entries."""
+        if len(body) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous)
+            self._entries[key] = body
+            self._total_bytes += len(body)
+            while (
+                len(self._entries) > self._max_entries
+                or self._total_bytes > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached body."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+class ResponseCompressor:
+    """Chooses and applies a content coding for response bodies."""
+
+    def __init__(
+        self,
+        *,
+        min_size: int = DEFAULT_MIN_SIZE,
+        cache: CompressedBodyCache | None = None,
+        brotli: ModuleType | None = _brotli,
+    ) -> None:
+        """Initialize the compressor.
+
+        Args:
+            min_size: Smallest body (in bytes) worth compressing.
+            cache: Store for compressed content-addressed bodies.
+            brotli: The ``brotli`` module, or ``None`` to offer gzip only.
+
+        Raises:
+            ValueError: If *min_size* is negative.
+        """
+        if min_size < 0:
+            raise ValueError("invalid response compression settings")
+        self._min_size = min_size
+        self._cache = cache if cache is not None else CompressedBodyCache()
+        self._brotli = brotli
+        self._offered = (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+    @property
+    def cache(self) -> CompressedBodyCache:
+        """The precompressed body cache."""
+        return self._cache
+
+    def compressible(self, content_type: str | None, size: int) -> bool:
+        """Return True if a body of this type and size is worth compressing."""
+        mimetype = (content_type or "").split(";", 1)[0].strip().lower()
+        return mimetype in COMPRESSIBLE_TYPES and size >= self._min_size
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        """Pick the coding to use for *accept_encoding* (``None`` = identity)."""
+        if not accept_encoding:
+            return None
+        accepted = _accepted_codings(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best, best_q = None, 0.0
+        for coding in self._offered:  # server preference breaks ties
+            quality = accepted.get(coding, wildcard)
+            if quality > best_q:
+                best, best_q = coding, quality
+        return best
+
+    def compress(
+        self, body: bytes, coding: str, *, etag: str = "", content_type: str = ""
+    ) -> bytes:
+        """Return *body* encoded with *coding*.
+
+        A strong *etag* marks the body as content addressed: the result is
+        cached and later calls with the same validator skip compression.
+        """
+        cacheable = bool(etag) and not etag.startswith("W/")
+        if not cacheable:
+            return self._encode(body, coding, _DYNAMIC_LEVELS)
+        key = f"{etag}|{content_type}|{coding}"
+        encoded = self._cache.get(key)
+        if encoded is None:
+            encoded = self._encode(body, coding, _CACHED_LEVELS)
+            self._cache.put(key, encoded)
+        return encoded
+
+    def _encode(self, body: bytes, coding: str, levels: tuple[int, int]) -> bytes:
+        gzip_level, brotli_quality = levels
+        if coding == BROTLI and self._brotli is not None:
+            return bytes(self._brotli.compress(body, quality=brotli_quality))
+        if coding == GZIP:
+            return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+        raise ValueError(f"unsupported content coding: {coding}")
+
+
+# ── Process-wide compressor ──────────────────────────────────────────────────
+_compressor_holder: list[ResponseCompressor | None] = [None]
+_loaded = [False]
+_holder_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "")
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid %s=%r — using %d.", name, raw, default)
+        return default
+
+
+def _compressor_from_env() -> ResponseCompressor | None:
+    """Build the compressor from ``HTTP_COMPRESSION*`` (``None`` = disabled)."""
+    if os.environ.get("HTTP_COMPRESSION", "1").lower() in ("0", "false", "no"):
+        return None
+    try:
+        return ResponseCompressor(
+            min_size=_env_int("HTTP_COMPRESSION_MIN_BYTES", DEFAULT_MIN_SIZE),
+            cache=CompressedBodyCache(
+                max_bytes=_env_int(
+                    "HTTP_COMPRESSION_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES
+                )
+            ),
+        )
+    except ValueError:
+        logger.warning("Invalid HTTP_COMPRESSION settings — using defaults.")
+        return ResponseCompressor()
+
+
+def get_response_compressor() -> ResponseCompressor | None:
+    """Return the process-wide compressor, or ``None`` when compression is off."""
+    if not _loaded[0]:
+        with _holder_lock:
+            if not _loaded[0]:
+                _compressor_holder[0] = _compressor_from_env()
+                _loaded[0] = True
+    return _compressor_holder[0]
+
+
+def configure_response_compressor(compressor: ResponseCompressor | None) -> None:
+    """Replace the process-wide compressor (``None`` disables compression)."""
+    with _holder_lock:
+        _compressor_holder[0] = compressor
+        _loaded[0] = True
@@ -0,0 +1,172 @@
+"""Connection pool and query instrumentation for the SQLAlchemy engine.
+
+Tells pool starvation apart from slow queries:
+
+- **Checkout wait**: ``InstrumentedQueuePool`` times every connection
+  checkout, including the time spent blocked on a full pool, and counts
+  checkouts that gave up after ``pool_timeout``.
+- **Saturation**: each checkout records how many connections were in use
+  against the pool capacity (``pool_size + max_overflow``).
+- **Statement latency**: ``before/after_cursor_execute`` hooks time every
+  statement; statements slower than ``slow_query_ms`` are counted and
+  logged.
+
+``DbStats.snapshot()`` returns the counters; ``infrastructure.db.session``
+exposes them (plus live pool state) via ``db_stats()``.
+
+Thread-safe via ``threading.Lock``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_MS = 500.0
+
+# Key under ``Connection.info`` holding statement start times.
+_STARTED_KEY = "instrumentation.started"
+
+
+class DbStats:
+    """Counters and timings for pool checkouts and statements."""
+
+    def __init__(self, slow_query_ms: float = DEFAULT_SLOW_QUERY_MS) -> None:
+        self._slow_seconds = slow_query_ms / 1000.0
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        with self._lock:
+            self._checkouts = 0
+            self._checkout_timeouts = 0
+            self._wait_seconds_total = 0.0
+            self._wait_seconds_max = 0.0
+            self._saturated_checkouts = 0
+            self._in_use_max = 0
+            self._statements = 0
+            self._slow_statements = 0
+            self._statement_seconds_total = 0.0
+            self._statement_seconds_max = 0.0
+
+    def record_checkout(self, wait_seconds: float, in_use: int, capacity: int) -> None:
+        """Record one successful checkout (*in_use* includes this one)."""
+        with self._lock:
+            self._checkouts += 1
+            self._wait_seconds_total += wait_seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+            self._in_use_max = max(self._in_use_max, in_use)
+            if in_use >= capacity:
+                self._saturated_checkouts += 1
+
+    def record_checkout_timeout(self, wait_seconds: float) -> None:
+        """Record a checkout that gave up after ``pool_timeout``."""
+        with self._lock:
+            self._checkout_timeouts += 1
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+
+    def record_statement(self, seconds: float, statement: str) -> None:
+        """Record one executed statement."""
+        slow = seconds >= self._slow_seconds
+        with self._lock:
+            self._statements += 1
+            self._statement_seconds_total += seconds
+            self._statement_seconds_max = max(self._statement_seconds_max, seconds)
+            if slow:
+                self._slow_statements += 1
+        if slow:
+            logger.warning(
+                "db_slow_statement: %.1fms %s", seconds * 1000, statement[:200]
+            )
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Return a snapshot of the counters and timings."""
+        with self._lock:
+            checkouts = self._checkouts
+            statements = self._statements
+            return {
+                "checkouts": checkouts,
+                "checkout_timeouts": self._checkout_timeouts,
+                "checkout_wait_seconds_avg": (
+                    self._wait_seconds_total / checkouts if checkouts else 0.0
+                ),
+                "checkout_wait_seconds_max": self._wait_seconds_max,
+                "saturated_checkouts": self._saturated_checkouts,
+                "in_use_max": self._in_use_max,
+                "statements": statements,
+                "slow_statements": self._slow_statements,
+                "statement_seconds_avg": (
+                    self._statement_seconds_total / statements if statements else 0.0
+                ),
+                "statement_seconds_max": self._statement_seconds_max,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that reports checkout wait and saturation to ``DbStats``.
+
+    ``create_engine`` builds the pool itself, so ``instrument_engine``
+    attaches the stats object afterwards; ``recreate`` carries it over.
+    """
+
+    stats: DbStats | None = None
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.stats = self.stats
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except PoolTimeoutError:
+            if self.stats is not None:
+                self.stats.record_checkout_timeout(time.perf_counter() - started)
+            raise
+        if self.stats is not None:
+            self.stats.record_checkout(
+                time.perf_counter() - started,
+                in_use=self.checkedout(),
+                capacity=self.size() + max(self._max_overflow, 0),
+            )
+        return entry
+
+
+def _before_cursor_execute(conn: Any, *_args: Any) -> None:
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _handle_error(context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute.
+    conn = context.connection
+    started = conn.info.get(_STARTED_KEY) if conn is not None else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: Engine, stats: DbStats) -> None:
+    """Attach *stats* to *engine*'s pool and statement events."""
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.stats = stats
+
+    def _after_cursor_execute(
+        conn: Any, _cursor: Any, statement: str, *_args: Any
+    ) -> None:
+        started = conn.info.get(_STARTED_KEY)
+        if started:
+            stats.record_statement(time.perf_counter() - started.pop(), statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
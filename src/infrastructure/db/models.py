@@ -35,7 +35,7 @@ class CardModel(Base):
 
     # Core scenario attributes
     mode = Column(String(20), nullable=False, index=True)  # CASUAL/NARRATIVE/MATCHED
-    seed = Column(Integer, nullable=False)
+    seed = Column(Integer, nullable=False, index=True)
     table_width = Column(Integer, nullable=False)
     table_height = Column(Integer, nullable=False)
     table_unit = Column(String(10), nullable=False)  # cm/inch
@@ -118,6 +118,27 @@ class UserModel(Base):
         return f"<UserModel(username={self.username!r}, name={self.name!r})>"
 
 
+class UserLockoutModel(Base):
+    """SQLAlchemy model for login lockout state.
+
+    Maps to user_lockouts table in PostgreSQL.
+    One row per username with failed attempts; shared by every worker so
+    brute-force counters cannot be reset by hitting another process.
+    """
+
+    __tablename__ = "user_lockouts"
+
+    username = Column(String(255), primary_key=True, nullable=False)
+    fail_count = Column(Integer, nullable=False, default=0)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserLockoutModel(username={self.username!r}, "
+            f"fail_count={self.fail_count!r})>"
+        )
+
+
 class SessionModel(Base):
     """SQLAlchemy model for server-side sessions.
 
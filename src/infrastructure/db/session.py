@@ -14,14 +14,25 @@ from __future__ import annotations
 import logging
 import os
 from contextlib import contextmanager
-from typing import Callable, Iterator
+from typing import Any, Callable, Iterator
 from urllib.parse import quote_plus
 
+from infrastructure.db.instrumentation import (
+    DEFAULT_SLOW_QUERY_MS,
+    DbStats,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE_SECONDS = 1800
+DEFAULT_POOL_TIMEOUT_SECONDS = 30.0
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -43,21 +54,69 @@ def _escape_password_in_url(url_str: str) -> str:
     return f"{scheme_part}://{user}:{escaped_password}@{host_part}"
 
 
+def _env_number(name: str, default: float) -> float:
+    """Read a numeric setting (the default on missing/invalid values)."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r — using %s.", name, raw, default)
+        return default
+
+
+def _pool_kwargs() -> dict[str, Any]:
+    """Pool settings for a PostgreSQL engine, from ``DB_*`` variables.
+
+    ``DB_POOL_SIZE`` (5), ``DB_MAX_OVERFLOW`` (10),
+    ``DB_POOL_RECYCLE_SECONDS`` (1800), ``DB_POOL_TIMEOUT_SECONDS`` (30)
+    and ``DB_STATEMENT_TIMEOUT_MS`` (0 = no server-side limit).
+    """
+    kwargs: dict[str, Any] = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": max(1, int(_env_number("DB_POOL_SIZE", DEFAULT_POOL_SIZE))),
+        "max_overflow": max(
+            0, int(_env_number("DB_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW))
+        ),
+        "pool_recycle": int(
+            _env_number("DB_POOL_RECYCLE_SECONDS", DEFAULT_POOL_RECYCLE_SECONDS)
+        ),
+        "pool_timeout": _env_number(
+            "DB_POOL_TIMEOUT_SECONDS", DEFAULT_POOL_TIMEOUT_SECONDS
+        ),
+    }
+    statement_timeout_ms = int(_env_number("DB_STATEMENT_TIMEOUT_MS", 0))
+    if statement_timeout_ms > 0:
+        kwargs["connect_args"] = {
+            "options": f"-c statement_timeout={statement_timeout_ms}"
+        }
+    return kwargs
+
+
 def _build_engine() -> Engine | None:
     """Build SQLAlchemy engine from DATABASE_URL.
 
     Returns ``None`` when DATABASE_URL is empty/unset so that importing
-    this module never raises.
+    this module never raises.  PostgreSQL engines get the ``DB_*`` pool
+    settings; every engine is instrumented (see ``db_stats``).
     """
     raw_url = os.environ.get("DATABASE_URL", "")
     if not raw_url:
         return None
     url = _escape_password_in_url(raw_url)
-    return create_engine(
+    pool_kwargs = _pool_kwargs() if url.startswith("postgres") else {}
+    eng = create_engine(
         url,
         echo=os.environ.get("SQL_ECHO", "false").lower() == "true",
         pool_pre_ping=True,
+        **pool_kwargs,
+    )
+    _LazyState.stats = DbStats(
+        slow_query_ms=_env_number("DB_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS)
     )
+    instrument_engine(eng, _LazyState.stats)
+    return eng
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +133,7 @@ class _LazyState:
 
     engine: Engine | None = None
     session_local: sessionmaker[Session] | None = None
+    stats: DbStats | None = None
 
 
 def _get_engine() -> Engine | None:
@@ -156,6 +216,28 @@ def get_session() -> Iterator[Session]:
         session.close()
 
 
+def db_stats() -> dict[str, Any] | None:
+    """Return pool state and query timings, or None if no engine was built.
+
+    Does not create the engine: before the first database access there is
+    nothing to report.
+    """
+    eng, stats = _LazyState.engine, _LazyState.stats
+    if eng is None or stats is None:
+        return None
+    pool = eng.pool
+    snapshot: dict[str, Any] = {"pool_class": type(pool).__name__, **stats.snapshot()}
+    if isinstance(pool, InstrumentedQueuePool):
+        snapshot.update(
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            idle=pool.checkedin(),
+        )
+    return snapshot
+
+
 def init_db() -> None:
     """Create database tables based on ORM models.
 
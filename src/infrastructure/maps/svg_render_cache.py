@@ -0,0 +1,87 @@
+"""LruSvgCache - bounded, content-addressed cache for rendered SVG maps.
+
+Keys are content hashes (see
+:func:`application.use_cases.render_map_svg.map_content_hash`), so an
+entry never goes stale: a card edit changes its hash and the old entry
+simply ages out.  The cache is bounded both by entry count and by the
+total size of the stored documents; the least recently used entries are
+evicted first.  All operations are thread-safe.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class LruSvgCache:
+    """Thread-safe LRU cache of SVG documents keyed by content hash."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of documents kept.
+            max_bytes: Maximum total size (in characters) of kept documents.
+                A single document larger than this is never cached.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("cache limits must be positive")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached documents."""
+        with self._lock:
+            return self._total_bytes
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the document cached under *key* (marking it recently used)."""
+        with self._lock:
+            svg = self._entries.get(key)
+            if svg is not None:
+                self._entries.move_to_end(key)
+            return svg
+
+    def put(self, key: str, svg: str) -> None:
+        """Cache *svg* under *key*, evicting least recently used entries."""
+        size = len(svg)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous)
+            self._entries[key] = svg
+            self._total_bytes += size
+            while (
+                len(self._entries) > self._max_entries
+                or self._total_bytes > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
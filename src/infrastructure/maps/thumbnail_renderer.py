@@ -0,0 +1,141 @@
+"""SvgThumbnailRenderer - batch rendering of small map previews for list pages.
+
+A thumbnail is the full :class:`SvgMapRenderer` output simplified for a
+~100px square: shape labels are dropped (unreadable at that size) and
+the ``<svg>`` element is resized while keeping the table ``viewBox``,
+so the browser does the downscaling.
+
+``render_many`` renders one list page in a single call:
+
+1. Thumbnails already in the (content-addressed) cache are reused.
+2. Identical maps on the same page are rendered once.
+3. The remaining renders run serially, or on the injected executor
+   (thread or process pool) once there are enough of them to pay for
+   the dispatch overhead.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Sequence
+
+from application.use_cases.render_map_svg import map_content_hash
+from infrastructure.maps._renderer._primitives import svg_header
+from infrastructure.maps.svg_map_renderer import SvgMapRenderer
+from infrastructure.maps.svg_render_cache import LruSvgCache
+
+DEFAULT_THUMBNAIL_SIZE_PX = 100
+# Below this many cache misses a pool round trip costs more than it saves.
+DEFAULT_PARALLEL_THRESHOLD = 8
+
+POOL_NONE = "none"
+POOL_THREAD = "thread"
+POOL_PROCESS = "process"
+VALID_POOL_KINDS = frozenset({POOL_NONE, POOL_THREAD, POOL_PROCESS})
+
+
+def render_thumbnail_svg(table_mm: dict, shapes: list[dict], size_px: int) -> str:
+    """Render one simplified, downscaled SVG map.
+
+    Module-level (and stateless) so it can be shipped to a process pool;
+    each call uses its own renderer because ``SvgMapRenderer.render``
+    keeps per-render state on the instance.
+    """
+    width = int(table_mm["width_mm"])
+    height = int(table_mm["height_mm"])
+    unlabeled = [{k: v for k, v in s.items() if k != "description"} for s in shapes]
+    svg = SvgMapRenderer().render(table_mm=table_mm, shapes=unlabeled)
+    # Keep the table viewBox, shrink the viewport to the thumbnail box.
+    scale = size_px / max(width, height, 1)
+    thumb_header = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{max(1, round(width * scale))}" '
+        f'height="{max(1, round(height * scale))}" '
+        f'viewBox="0 0 {width} {height}">'
+    )
+    return svg.replace(svg_header(width, height), thumb_header, 1)
+
+
+def _render_job(job: tuple[dict, list[dict], int]) -> str:
+    """Unpack a ``(table_mm, shapes, size_px)`` job for ``Executor.map``."""
+    table_mm, shapes, size_px = job
+    return render_thumbnail_svg(table_mm, shapes, size_px)
+
+
+def make_thumbnail_executor(
+    kind: str, max_workers: Optional[int] = None
+) -> Optional[Executor]:
+    """Build the executor for *kind* (``"none"``, ``"thread"``, ``"process"``).
+
+    Raises:
+        ValueError: If *kind* is unknown.
+    """
+    if kind not in VALID_POOL_KINDS:
+        raise ValueError(
+            f"unknown thumbnail pool {kind!r}; "
+            f"expected one of {sorted(VALID_POOL_KINDS)}"
+        )
+    if kind == POOL_THREAD:
+        return ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="thumbnails"
+        )
+    if kind == POOL_PROCESS:
+        return ProcessPoolExecutor(max_workers=max_workers)
+    return None
+
+
+class SvgThumbnailRenderer:
+    """Batch thumbnail renderer with caching and an optional worker pool."""
+
+    def __init__(
+        self,
+        *,
+        size_px: int = DEFAULT_THUMBNAIL_SIZE_PX,
+        cache: Optional[LruSvgCache] = None,
+        executor: Optional[Executor] = None,
+        parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+    ) -> None:
+        """Initialize the renderer.
+
+        Args:
+            size_px: Longest side of the rendered thumbnail, in pixels.
+            cache: Thumbnail cache (a private one is created when omitted).
+            executor: Pool used for large batches (``None`` = always serial).
+            parallel_threshold: Minimum number of renders sent to the pool.
+        """
+        self._size_px = size_px
+        self._cache = cache if cache is not None else LruSvgCache()
+        self._executor = executor
+        self._parallel_threshold = parallel_threshold
+
+    def render_many(self, maps: Sequence[tuple[dict, list[dict]]]) -> list[str]:
+        """Render a thumbnail for every ``(table_mm, shapes)`` pair.
+
+        Returns:
+            The thumbnails, in the order of *maps*.
+        """
+        keys = [
+            f"{map_content_hash(table_mm, shapes)}:{self._size_px}"
+            for table_mm, shapes in maps
+        ]
+        results: dict[str, str] = {}
+        jobs: dict[str, tuple[dict, list[dict], int]] = {}
+        for key, (table_mm, shapes) in zip(keys, maps, strict=True):
+            if key in results or key in jobs:
+                continue
+            cached = self._cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                jobs[key] = (table_mm, shapes, self._size_px)
+
+        if jobs:
+            if self._executor is not None and len(jobs) >= self._parallel_threshold:
+                rendered = list(self._executor.map(_render_job, jobs.values()))
+            else:
+                rendered = [_render_job(job) for job in jobs.values()]
+            for key, svg in zip(jobs, rendered, strict=True):
+                self._cache.put(key, svg)
+                results[key] = svg
+
+        return [results[key] for key in keys]
@@ -0,0 +1 @@
+"""Runtime instrumentation (use-case metrics, request profiling, startup timing)."""
@@ -0,0 +1,51 @@
+"""Access policy for the internal diagnostics endpoints.
+
+``GET /health/db``, ``GET /health/password-hashing`` and ``GET /metrics``
+expose pool state, query timings and per-use-case traffic.  They are served
+only to requests presenting ``ADMIN_DIAGNOSTICS_TOKEN`` as a bearer token
+(``Authorization: Bearer <token>``, which Prometheus scrape configs support
+natively); everyone else gets a 404.  With the setting unset the endpoints
+are disabled.  Independent of request profiling (``REQUEST_PROFILING``).
+"""
+
+from __future__ import annotations
+
+import hmac
+import os
+import threading
+
+from infrastructure.observability.request_profiler import StrLookup
+
+_BEARER_PREFIX = "Bearer "
+
+# Mutable containers — avoids ``global`` keyword
+_token_holder: list[bytes | None] = [None]
+_loaded = [False]
+_holder_lock = threading.Lock()
+
+
+def _diagnostics_token() -> bytes | None:
+    if not _loaded[0]:
+        with _holder_lock:
+            if not _loaded[0]:
+                token = os.environ.get("ADMIN_DIAGNOSTICS_TOKEN", "")
+                _token_holder[0] = token.encode("utf-8") if token else None
+                _loaded[0] = True
+    return _token_holder[0]
+
+
+def diagnostics_authorized(headers: StrLookup) -> bool:
+    """Return True if the request carries ``ADMIN_DIAGNOSTICS_TOKEN``."""
+    token = _diagnostics_token()
+    auth = headers.get("Authorization") or ""
+    if token is None or not auth.startswith(_BEARER_PREFIX):
+        return False
+    provided = auth[len(_BEARER_PREFIX) :].strip().encode("utf-8")
+    return hmac.compare_digest(provided, token)
+
+
+def configure_diagnostics_token(token: str | None) -> None:
+    """Replace the diagnostics token (``None`` or empty disables the endpoints)."""
+    with _holder_lock:
+        _token_holder[0] = token.encode("utf-8") if token else None
+        _loaded[0] = True
@@ -0,0 +1,167 @@
+"""On-demand profiling of single production requests.
+
+Opt-in and admin-only: profiling runs only when ``REQUEST_PROFILING=1``
+**and** the request presents ``REQUEST_PROFILING_TOKEN``, either as the
+``X-Profile-Token`` header (API clients, curl) or as the ``sb_profile``
+cookie (browser sessions driving the Gradio UI).  Anyone without the
+token gets the normal, unprofiled code path.
+
+A profiled request runs under ``cProfile`` and its stats are written as
+``<timestamp>-<label>.pstats`` in ``REQUEST_PROFILING_DIR`` (default
+``.profiles``); only the newest ``REQUEST_PROFILING_KEEP`` files (default
+20) are kept.  Inspect them with ``python -m pstats <file>`` or snakeviz.
+
+One request is profiled at a time (``cProfile`` cannot nest); a profiled
+request arriving while another is being captured is served unprofiled.
+
+Hooks: Flask ``before_request``/``after_request``
+(``adapters.http_flask.middleware``), the native ASGI read routes and the
+Gradio event wrapper (``adapters.ui_gradio.profiling``).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import hmac
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile-Token"
+PROFILE_COOKIE = "sb_profile"
+
+DEFAULT_OUTPUT_DIR = ".profiles"
+DEFAULT_KEEP = 20
+
+_UNSAFE_LABEL_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class StrLookup(Protocol):
+    """Anything with ``.get(key)``: a mapping, werkzeug ``Headers``, cookies."""
+
+    def get(self, key: str) -> str | None: ...
+
+
+def presented_token(headers: StrLookup, cookies: StrLookup) -> str:
+    """Return the profiling token carried by a request (header, then cookie)."""
+    return headers.get(PROFILE_HEADER) or cookies.get(PROFILE_COOKIE) or ""
+
+
+class RequestProfiler:
+    """Profiles single requests into a bounded directory of ``.pstats`` files."""
+
+    def __init__(
+        self,
+        token: str,
+        output_dir: str | Path = DEFAULT_OUTPUT_DIR,
+        keep: int = DEFAULT_KEEP,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            token: Secret a request must present to be profiled.
+            output_dir: Where ``.pstats`` files are written.
+            keep: Maximum number of files retained (oldest are deleted).
+
+        Raises:
+            ValueError: If the token is empty or *keep* is not positive.
+        """
+        if not token or keep < 1:
+            raise ValueError("invalid request profiler settings")
+        self._token = token.encode("utf-8")
+        self._dir = Path(output_dir)
+        self._keep = keep
+        self._busy = threading.Lock()
+
+    @property
+    def output_dir(self) -> Path:
+        """Directory holding the ``.pstats`` files."""
+        return self._dir
+
+    def authorized(self, provided: str | None) -> bool:
+        """Return True if *provided* is the profiling token."""
+        if not provided:
+            return False
+        return hmac.compare_digest(provided.encode("utf-8"), self._token)
+
+    def start(self) -> cProfile.Profile | None:
+        """Start profiling the calling thread (``None`` if one is running)."""
+        if not self._busy.acquire(blocking=False):
+            logger.info("request_profiler: busy, serving request unprofiled")
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another profiler (e.g. a debugger) is active
+            self._busy.release()
+            return None
+        return profile
+
+    def stop(self, profile: cProfile.Profile, label: str) -> Path:
+        """Stop *profile*, save it under *label* and apply the retention cap."""
+        try:
+            profile.disable()
+        finally:
+            self._busy.release()
+        self._dir.mkdir(parents=True, exist_ok=True)
+        slug = _UNSAFE_LABEL_CHARS.sub("_", label).strip("_")[:80] or "request"
+        now_ns = time.time_ns()
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now_ns // 10**9))
+        path = self._dir / f"{stamp}.{now_ns % 10**9:09d}-{slug}.pstats"
+        profile.dump_stats(path)
+        self._prune()
+        logger.info("request_profiler: saved %s", path)
+        return path
+
+    def _prune(self) -> None:
+        files = sorted(self._dir.glob("*.pstats"), key=lambda p: p.stat().st_mtime_ns)
+        for stale in files[: max(len(files) - self._keep, 0)]:
+            stale.unlink(missing_ok=True)
+
+
+# ── Process-wide profiler ────────────────────────────────────────────────────
+_profiler_holder: list[RequestProfiler | None] = [None]
+_loaded = [False]
+_holder_lock = threading.Lock()
+
+
+def _profiler_from_env() -> RequestProfiler | None:
+    """Build the profiler from ``REQUEST_PROFILING*`` (``None`` = disabled)."""
+    if os.environ.get("REQUEST_PROFILING", "").lower() not in ("1", "true", "yes"):
+        return None
+    token = os.environ.get("REQUEST_PROFILING_TOKEN", "")
+    if not token:
+        logger.warning("REQUEST_PROFILING ignored: REQUEST_PROFILING_TOKEN is unset")
+        return None
+    try:
+        return RequestProfiler(
+            token,
+            os.environ.get("REQUEST_PROFILING_DIR") or DEFAULT_OUTPUT_DIR,
+            int(os.environ.get("REQUEST_PROFILING_KEEP") or DEFAULT_KEEP),
+        )
+    except ValueError:
+        logger.warning("Invalid REQUEST_PROFILING_KEEP — using %d.", DEFAULT_KEEP)
+        return RequestProfiler(token, DEFAULT_OUTPUT_DIR, DEFAULT_KEEP)
+
+
+def get_request_profiler() -> RequestProfiler | None:
+    """Return the process-wide profiler, or ``None`` when profiling is off."""
+    if not _loaded[0]:
+        with _holder_lock:
+            if not _loaded[0]:
+                _profiler_holder[0] = _profiler_from_env()
+                _loaded[0] = True
+    return _profiler_holder[0]
+
+
+def configure_request_profiler(profiler: RequestProfiler | None) -> None:
+    """Replace the process-wide profiler (``None`` disables profiling)."""
+    with _holder_lock:
+        _profiler_holder[0] = profiler
+        _loaded[0] = True
@@ -0,0 +1,90 @@
+"""Startup-time measurement.
+
+- ``StartupTimer`` times the named phases of app construction;
+  ``create_combined_app`` logs them and keeps them on
+  ``app.state.startup_timings``.
+- ``parse_importtime`` reads the report written to stderr by
+  ``python -X importtime``; ``slowest_modules`` / ``slowest_packages``
+  rank it by self time.
+
+The ``python -m adapters.startup_report`` CLI combines both.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+class StartupTimer:
+    """Wall-clock durations of named startup phases, in call order."""
+
+    def __init__(self) -> None:
+        self._phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase *name*."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = time.perf_counter() - started
+
+    def as_dict(self) -> dict[str, float]:
+        """Return ``{phase: seconds}``."""
+        return dict(self._phases)
+
+    def summary(self) -> str:
+        """Return e.g. ``"flask=0.012s gradio=0.331s (total 0.343s)"``."""
+        parts = [f"{name}={seconds:.3f}s" for name, seconds in self._phases.items()]
+        return f"{' '.join(parts)} (total {sum(self._phases.values()):.3f}s)"
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``python -X importtime`` output (times in seconds)."""
+
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+    depth: int
+
+
+def parse_importtime(text: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` output; unrelated lines are ignored."""
+    records = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_seconds=int(self_us) / 1e6,
+                cumulative_seconds=int(cumulative_us) / 1e6,
+                depth=len(indent) // 2,
+            )
+        )
+    return records
+
+
+def slowest_modules(records: list[ImportRecord], top: int) -> list[ImportRecord]:
+    """Return the *top* modules by self (exclusive) import time."""
+    return sorted(records, key=lambda r: r.self_seconds, reverse=True)[:top]
+
+
+def slowest_packages(records: list[ImportRecord], top: int) -> list[tuple[str, float]]:
+    """Return the *top* top-level packages by summed self import time."""
+    totals: dict[str, float] = defaultdict(float)
+    for record in records:
+        totals[record.module.split(".", 1)[0]] += record.self_seconds
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
@@ -0,0 +1,226 @@
+"""Per-use-case latency, error and in-flight metrics.
+
+``InstrumentedUseCase`` wraps a use case so that every ``execute`` call
+records into a ``UseCaseMetrics`` registry:
+
+- **Latency histogram** (``use_case_duration_seconds``): cumulative
+  buckets from ``DEFAULT_BUCKETS`` plus ``_sum`` / ``_count``, so p50 /
+  p99 per use case can be derived by the scraper.
+- **Errors** (``use_case_errors_total``): counted per exception class.
+- **In flight** (``use_case_in_flight``): calls currently executing.
+
+The composition root (``infrastructure.bootstrap.build_services``) wraps
+every use case in ``Services`` with ``instrument_use_case``, which types
+the proxy as the use case it wraps; ``render_prometheus()`` backs the Flask
+``GET /metrics`` endpoint (Prometheus text exposition format 0.0.4).
+
+Thread-safe via ``threading.Lock``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Generic, TypeVar, cast
+
+UseCaseT = TypeVar("UseCaseT")
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Series:
+    """Counters for one use case (guarded by the registry lock)."""
+
+    def __init__(self, n_buckets: int) -> None:
+        self.buckets = [0] * (n_buckets + 1)  # last slot = +Inf
+        self.count = 0
+        self.total_seconds = 0.0
+        self.in_flight = 0
+        self.errors: dict[str, int] = {}
+
+    def copy(self) -> _Series:
+        clone = _Series(0)
+        clone.buckets = list(self.buckets)
+        clone.count = self.count
+        clone.total_seconds = self.total_seconds
+        clone.in_flight = self.in_flight
+        clone.errors = dict(self.errors)
+        return clone
+
+
+class UseCaseMetrics:
+    """Registry of latency histograms, error counts and in-flight gauges."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("buckets must be strictly increasing")
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._series: dict[str, _Series] = {}
+
+    def _get(self, name: str) -> _Series:
+        series = self._series.get(name)
+        if series is None:
+            series = self._series[name] = _Series(len(self._buckets))
+        return series
+
+    def register(self, name: str) -> None:
+        """Expose *name* with zeroed counters before its first call."""
+        with self._lock:
+            self._get(name)
+
+    def started(self, name: str) -> None:
+        """Record that a call to *name* began."""
+        with self._lock:
+            self._get(name).in_flight += 1
+
+    def finished(self, name: str, seconds: float, error: str | None = None) -> None:
+        """Record that a call to *name* ended after *seconds*.
+
+        Args:
+            name: The use case name.
+            seconds: Wall-clock duration of the call.
+            error: Exception class name if the call raised, else ``None``.
+        """
+        slot = bisect_left(self._buckets, seconds)
+        with self._lock:
+            series = self._get(name)
+            series.in_flight -= 1
+            series.buckets[slot] += 1
+            series.count += 1
+            series.total_seconds += seconds
+            if error is not None:
+                series.errors[error] = series.errors.get(error, 0) + 1
+
+    def reset(self) -> None:
+        """Drop every series."""
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return ``{use_case: {count, errors, in_flight, seconds_avg}}``."""
+        with self._lock:
+            return {
+                name: {
+                    "count": s.count,
+                    "errors": sum(s.errors.values()),
+                    "in_flight": s.in_flight,
+                    "seconds_avg": s.total_seconds / s.count if s.count else 0.0,
+                }
+                for name, s in sorted(self._series.items())
+            }
+
+    def render_prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format."""
+        with self._lock:
+            series = sorted((name, s.copy()) for name, s in self._series.items())
+        lines = [
+            "# HELP use_case_duration_seconds Use case execution time.",
+            "# TYPE use_case_duration_seconds histogram",
+        ]
+        for name, s in series:
+            lines += self._histogram_lines(name, s)
+        lines += [
+            "# HELP use_case_errors_total Use case calls that raised, by exception.",
+            "# TYPE use_case_errors_total counter",
+        ]
+        for name, s in series:
+            lines += [
+                f'use_case_errors_total{{use_case="{name}",error="{error}"}} {hits}'
+                for error, hits in sorted(s.errors.items())
+            ]
+        lines += [
+            "# HELP use_case_in_flight Use case calls currently executing.",
+            "# TYPE use_case_in_flight gauge",
+        ]
+        lines += [
+            f'use_case_in_flight{{use_case="{name}"}} {s.in_flight}'
+            for name, s in series
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _histogram_lines(self, name: str, series: _Series) -> list[str]:
+        prefix = f'use_case_duration_seconds_bucket{{use_case="{name}",le='
+        lines = []
+        cumulative = 0
+        for bound, hits in zip(self._buckets, series.buckets, strict=False):
+            cumulative += hits
+            lines.append(f'{prefix}"{float(bound)!r}"}} {cumulative}')
+        lines.append(f'{prefix}"+Inf"}} {series.count}')
+        lines.append(
+            f'use_case_duration_seconds_sum{{use_case="{name}"}} {series.total_seconds}'
+        )
+        lines.append(
+            f'use_case_duration_seconds_count{{use_case="{name}"}} {series.count}'
+        )
+        return lines
+
+
+class InstrumentedUseCase(Generic[UseCaseT]):
+    """Use case proxy that records every ``execute`` call into the metrics.
+
+    Any other attribute (e.g. ``GenerateScenarioCard.resolve_seed_preview``)
+    is delegated to the wrapped use case untouched.
+    """
+
+    def __init__(self, name: str, use_case: UseCaseT, metrics: UseCaseMetrics) -> None:
+        self._name = name
+        self._use_case: Any = use_case
+        self._metrics = metrics
+        metrics.register(name)
+
+    @property
+    def wrapped(self) -> UseCaseT:
+        """The instrumented use case."""
+        return cast(UseCaseT, self._use_case)
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        self._metrics.started(self._name)
+        started = time.perf_counter()
+        error: str | None = None
+        try:
+            return self._use_case.execute(*args, **kwargs)
+        except Exception as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            self._metrics.finished(self._name, time.perf_counter() - started, error)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._use_case, attr)
+
+
+def instrument_use_case(
+    name: str, use_case: UseCaseT, metrics: UseCaseMetrics
+) -> UseCaseT:
+    """Wrap *use_case* in an ``InstrumentedUseCase`` typed as *use_case*.
+
+    The proxy forwards every attribute, so callers (``Services`` fields)
+    keep the wrapped use case's type.
+    """
+    return cast(UseCaseT, InstrumentedUseCase(name, use_case, metrics))
+
+
+# ── Process-wide registry ────────────────────────────────────────────────────
+_metrics = UseCaseMetrics()
+
+
+def get_use_case_metrics() -> UseCaseMetrics:
+    """Return the process-wide registry (shared by Flask and Gradio)."""
+    return _metrics
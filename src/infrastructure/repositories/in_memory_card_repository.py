@@ -3,13 +3,75 @@
 A simple in-memory implementation of the CardRepository port.
 Each instance maintains its own isolated storage (no shared state).
 Last-write-wins semantics for duplicate card_ids.
+
+Secondary indexes (per owner, per visibility and per SHARED grantee)
+keep ``list_visible`` proportional to the size of the result instead
+of the size of the repository; a seed index makes ``find_by_seed`` a
+dict lookup.  Name search is served by a trigram
+inverted index (see :mod:`infrastructure.repositories.trigram_index`).
 """
 
 from __future__ import annotations
 
+from bisect import bisect_right, insort
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
 from typing import Optional
 
-from domain.cards.card import Card
+from application.ports.repositories import (
+    LIST_FILTER_MINE,
+    LIST_FILTER_PUBLIC,
+    LIST_FILTER_SHARED_WITH_ME,
+)
+from domain.cards.card import Card, CardSummary
+from domain.security.authz import Visibility
+from infrastructure.repositories.trigram_index import TrigramIndex
+
+
+def _index_add(index: dict[str, list[str]], key: str, card_id: str) -> None:
+    """Insert *card_id* into the sorted bucket for *key*."""
+    insort(index.setdefault(key, []), card_id)
+
+
+def _index_remove(index: dict[str, list[str]], key: str, card_id: str) -> None:
+    """Remove *card_id* from the sorted bucket for *key* (drops empty buckets)."""
+    bucket = index.get(key)
+    if not bucket:
+        return
+    pos = bisect_right(bucket, card_id) - 1
+    if pos >= 0 and bucket[pos] == card_id:
+        del bucket[pos]
+    if not bucket:
+        del index[key]
+
+
+def _matches(
+    card: Card,
+    name_query: Optional[str],
+    mode: Optional[str],
+    table_preset: Optional[str],
+) -> bool:
+    """Return True when *card* satisfies the optional list criteria."""
+    if mode is not None and card.mode.value != mode:
+        return False
+    if table_preset is not None and card.table.preset_name != table_preset:
+        return False
+    if name_query:
+        return name_query.lower() in (card.name or "").lower()
+    return True
+
+
+def _in_filter(card: Card, actor_id: str, filter_value: str) -> bool:
+    """Return True when *card* belongs to the *filter_value* bucket."""
+    if filter_value == LIST_FILTER_MINE:
+        return card.owner_id == actor_id
+    if filter_value == LIST_FILTER_PUBLIC:
+        return card.visibility == Visibility.PUBLIC
+    if filter_value == LIST_FILTER_SHARED_WITH_ME:
+        return card.visibility == Visibility.SHARED and actor_id in {
+            g.strip() for g in (card.shared_with or ())
+        }
+    return False
 
 
 class InMemoryCardRepository:
@@ -22,6 +84,45 @@ class InMemoryCardRepository:
     def __init__(self) -> None:
         """Initialize empty repository."""
         self._cards: dict[str, Card] = {}
+        # Sorted card_id buckets used by list_visible()
+        self._by_owner: dict[str, list[str]] = {}
+        self._by_visibility: dict[str, list[str]] = {}
+        self._by_grantee: dict[str, list[str]] = {}
+        # Card ids per seed, in save order, used by find_by_seed()
+        self._by_seed: dict[int, dict[str, None]] = {}
+        # Trigram index over card names used for name_query
+        self._names = TrigramIndex()
+
+    # ── Index maintenance ────────────────────────────────────────────────────
+
+    def _index(self, card: Card) -> None:
+        """Add *card* to all secondary indexes."""
+        _index_add(self._by_owner, card.owner_id, card.card_id)
+        _index_add(self._by_visibility, card.visibility.value, card.card_id)
+        if card.visibility == Visibility.SHARED and card.shared_with:
+            for grantee in {g.strip() for g in card.shared_with}:
+                _index_add(self._by_grantee, grantee, card.card_id)
+        self._names.add(card.card_id, card.name)
+
+    def _unindex(self, card: Card) -> None:
+        """Remove *card* from all secondary indexes."""
+        _index_remove(self._by_owner, card.owner_id, card.card_id)
+        _index_remove(self._by_visibility, card.visibility.value, card.card_id)
+        if card.visibility == Visibility.SHARED and card.shared_with:
+            for grantee in {g.strip() for g in card.shared_with}:
+                _index_remove(self._by_grantee, grantee, card.card_id)
+        self._names.remove(card.card_id)
+
+    def _unindex_seed(self, card: Card) -> None:
+        """Remove *card* from the seed index (drops empty buckets)."""
+        bucket = self._by_seed.get(card.seed)
+        if bucket is None:
+            return
+        bucket.pop(card.card_id, None)
+        if not bucket:
+            del self._by_seed[card.seed]
+
+    # ── CardRepository port ──────────────────────────────────────────────────
 
     def save(self, card: Card) -> None:
         """Save a card to the repository.
@@ -31,7 +132,26 @@ class InMemoryCardRepository:
         Args:
             card: The card to save.
         """
+        previous = self._cards.get(card.card_id)
+        if previous is not None:
+            self._unindex(previous)
         self._cards[card.card_id] = card
+        self._index(card)
+        # Kept apart from _index() so an overwrite that keeps its seed
+        # keeps its place among the cards sharing that seed.
+        if previous is None or previous.seed != card.seed:
+            if previous is not None:
+                self._unindex_seed(previous)
+            self._by_seed.setdefault(card.seed, {})[card.card_id] = None
+
+    def save_many(self, cards: Sequence[Card]) -> None:
+        """Save several cards (last write wins per card_id).
+
+        Args:
+            cards: The cards to save.
+        """
+        for card in cards:
+            self.save(card)
 
     def get_by_id(self, card_id: str) -> Optional[Card]:
         """Retrieve a card by its id.
@@ -44,6 +164,28 @@ class InMemoryCardRepository:
         """
         return self._cards.get(card_id)
 
+    def get_many(self, card_ids: Sequence[str]) -> list[Card]:
+        """Retrieve several cards by id.
+
+        Args:
+            card_ids: The card ids to look up (unknown ids are skipped).
+
+        Returns:
+            The found cards ordered by card_id.
+        """
+        return [self._cards[cid] for cid in sorted(set(card_ids)) if cid in self._cards]
+
+    def get_summaries(self, card_ids: Sequence[str]) -> list[CardSummary]:
+        """Retrieve summaries of several cards by id.
+
+        Args:
+            card_ids: The card ids to look up (unknown ids are skipped).
+
+        Returns:
+            The found card summaries ordered by card_id.
+        """
+        return [c.summary() for c in self.get_many(card_ids)]
+
     def delete(self, card_id: str) -> bool:
         """Delete a card by its id.
 
@@ -53,13 +195,15 @@ class InMemoryCardRepository:
         Returns:
             True if the card was deleted, False if not found.
         """
-        if card_id in self._cards:
-            del self._cards[card_id]
-            return True
-        return False
+        card = self._cards.pop(card_id, None)
+        if card is None:
+            return False
+        self._unindex(card)
+        self._unindex_seed(card)
+        return True
 
     def find_by_seed(self, seed: int) -> Optional[Card]:
-        """Find the first card matching a given seed.
+        """Find the first card saved with a given seed.
 
         Args:
             seed: The seed value to search for.
@@ -67,10 +211,10 @@ class InMemoryCardRepository:
         Returns:
             The first card with a matching seed, or None.
         """
-        for card in self._cards.values():
-            if card.seed == seed:
-                return card
-        return None
+        bucket = self._by_seed.get(seed)
+        if not bucket:
+            return None
+        return self._cards[next(iter(bucket))]
 
     def list_all(self) -> list[Card]:
         """List all cards in the repository.
@@ -87,6 +231,97 @@ class InMemoryCardRepository:
             owner_id: The owner's user ID.
 
         Returns:
-            List of cards owned by the given user.
+            List of cards owned by the given user, ordered by card_id.
+        """
+        return [self._cards[cid] for cid in self._by_owner.get(owner_id, [])]
+
+    def list_visible(
+        self,
+        actor_id: str,
+        filter_value: str,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        name_query: Optional[str] = None,
+        mode: Optional[str] = None,
+        table_preset: Optional[str] = None,
+    ) -> list[Card]:
+        """List cards matching a list filter, using the secondary indexes.
+
+        Args:
+            actor_id: The requesting user's ID.
+            filter_value: ``"mine"``, ``"public"`` or ``"shared_with_me"``.
+            limit: Maximum number of cards to return (``None`` = all).
+            cursor: Return only cards whose card_id sorts after this value.
+            name_query: Case-insensitive substring of the card name.
+            mode: Game mode value (``"casual"``, ``"narrative"``, ...).
+            table_preset: Table preset (``"standard"``, ``"massive"``, ...).
+
+        Returns:
+            Matching cards ordered by card_id (empty for unknown filters).
+        """
+        if filter_value == LIST_FILTER_MINE:
+            bucket = self._by_owner.get(actor_id, [])
+        elif filter_value == LIST_FILTER_PUBLIC:
+            bucket = self._by_visibility.get(Visibility.PUBLIC.value, [])
+        elif filter_value == LIST_FILTER_SHARED_WITH_ME:
+            bucket = self._by_grantee.get(actor_id, [])
+        else:
+            return []
+
+        start = bisect_right(bucket, cursor) if cursor else 0
+        if not (name_query or mode or table_preset):
+            stop = len(bucket) if limit is None else start + max(0, limit)
+            return [self._cards[cid] for cid in bucket[start:stop]]
+
+        candidates = self._names.candidates(name_query) if name_query else None
+        ids: Iterable[str]
+        cards: Iterator[Card]
+        if candidates is not None and len(candidates) < len(bucket) - start:
+            # Few name matches: walk the (sorted) candidates instead.
+            ids = sorted(cid for cid in candidates if not cursor or cid > cursor)
+            cards = (self._cards[cid] for cid in ids)
+            cards = (c for c in cards if _in_filter(c, actor_id, filter_value))
+        else:
+            ids = islice(bucket, start, None)
+            if candidates is not None:
+                ids = (cid for cid in ids if cid in candidates)
+            cards = (self._cards[cid] for cid in ids)
+
+        # Narrowed query: walk until the page is full.
+        result: list[Card] = []
+        for card in cards:
+            if limit is not None and len(result) >= limit:
+                break
+            if _matches(card, name_query, mode, table_preset):
+                result.append(card)
+        return result
+
+    def list_visible_summaries(
+        self,
+        actor_id: str,
+        filter_value: str,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        name_query: Optional[str] = None,
+        mode: Optional[str] = None,
+        table_preset: Optional[str] = None,
+    ) -> list[CardSummary]:
+        """List card summaries matching a list filter.
+
+        Same arguments and ordering as :meth:`list_visible`.
+
+        Returns:
+            Summaries of the matching cards ordered by card_id.
         """
-        return [c for c in self._cards.values() if c.owner_id == owner_id]
+        cards = self.list_visible(
+            actor_id,
+            filter_value,
+            limit=limit,
+            cursor=cursor,
+            name_query=name_query,
+            mode=mode,
+            table_preset=table_preset,
+        )
+        return [c.summary() for c in cards]
@@ -6,6 +6,8 @@ Each instance maintains its own isolated storage (no shared state).
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 
 class InMemoryFavoritesRepository:
     """In-memory favorites repository for testing and development.
@@ -75,6 +77,15 @@ class InMemoryFavoritesRepository:
         """
         return self._get_actor_favorites(actor_id)
 
+    def remove_favorites(self, actor_id: str, card_ids: Sequence[str]) -> None:
+        """Unset several favorites of an actor at once.
+
+        Args:
+            actor_id: The actor id.
+            card_ids: The card ids to remove (absent ids are ignored).
+        """
+        self._favorites.difference_update((actor_id, c) for c in card_ids)
+
     def remove_all_for_card(self, card_id: str) -> None:
         """Remove all favorites referencing a card.
 
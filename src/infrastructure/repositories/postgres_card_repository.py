@@ -5,14 +5,96 @@ Maps between domain.cards.card.Card and infrastructure.db.models.CardModel.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, Sequence
 
-from domain.cards.card import Card, parse_game_mode
+from application.ports.repositories import (
+    LIST_FILTER_MINE,
+    LIST_FILTER_PUBLIC,
+    LIST_FILTER_SHARED_WITH_ME,
+)
+from domain.cards.card import Card, CardSummary, parse_game_mode
 from domain.maps.map_spec import MapSpec
 from domain.maps.table_size import TableSize
 from domain.security.authz import Visibility
 from infrastructure.db.models import CardModel
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, Row, and_, cast, not_, or_
+from sqlalchemy.dialects.postgresql import JSONB, Insert, insert
+from sqlalchemy.orm import Query, Session
+
+# Table presets that map to fixed dimensions; anything else is "custom".
+_PRESET_DIMENSIONS: dict[str, tuple[int, int]] = {
+    t.preset_name: (t.width_mm, t.height_mm)
+    for t in (TableSize.standard(), TableSize.massive())
+}
+
+
+# Cards per multi-row upsert statement in save_many (bounds bind parameters).
+_SAVE_MANY_CHUNK = 500
+
+# Columns never overwritten when an existing card is saved again.
+_INSERT_ONLY_COLUMNS = frozenset({"card_id", "created_at"})
+
+
+def _upsert(rows: list[dict[str, Any]]) -> Insert:
+    """``INSERT ... ON CONFLICT (card_id) DO UPDATE`` for *rows*."""
+    stmt = insert(CardModel).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[CardModel.card_id],
+        set_={
+            name: stmt.excluded[name]
+            for name in rows[0]
+            if name not in _INSERT_ONLY_COLUMNS
+        },
+    )
+
+
+# Columns read for list pages: no map_spec JSON, no long text fields.
+_SUMMARY_COLUMNS = (
+    CardModel.card_id,
+    CardModel.owner_id,
+    CardModel.visibility,
+    CardModel.shared_with,
+    CardModel.mode,
+    CardModel.seed,
+    CardModel.table_width,
+    CardModel.table_height,
+    CardModel.name,
+)
+
+
+def _row_to_summary(row: Row[Any]) -> CardSummary:
+    """Convert a ``_SUMMARY_COLUMNS`` row → CardSummary (no MapSpec built)."""
+    return CardSummary(
+        card_id=row.card_id,
+        owner_id=row.owner_id,
+        visibility=Visibility(row.visibility),
+        shared_with=row.shared_with if row.shared_with else None,
+        mode=parse_game_mode(row.mode),
+        seed=row.seed,
+        table=TableSize(width_mm=row.table_width, height_mm=row.table_height),
+        name=row.name,
+    )
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _table_preset_clause(table_preset: str) -> ColumnElement[bool]:
+    """SQL condition matching ``TableSize.preset_name == table_preset``."""
+    dims = _PRESET_DIMENSIONS.get(table_preset)
+    if dims is not None:
+        return and_(CardModel.table_width == dims[0], CardModel.table_height == dims[1])
+    return not_(
+        or_(
+            *(
+                and_(CardModel.table_width == w, CardModel.table_height == h)
+                for w, h in _PRESET_DIMENSIONS.values()
+            )
+        )
+    )
 
 
 class PostgresCardRepository:
@@ -29,38 +111,26 @@ class PostgresCardRepository:
     def save(self, card: Card) -> None:
         """Save a card to PostgreSQL.
 
-        Converts domain Card → CardModel, then insert or update (upsert).
+        A single ``INSERT ... ON CONFLICT (card_id) DO UPDATE`` statement:
+        one round trip, no prior SELECT and no ORM flush.
         """
-        session = self._session_factory()
-        try:
-            model = session.query(CardModel).filter_by(card_id=card.card_id).first()
+        self.save_many([card])
 
-            if model is None:
-                model = CardModel(card_id=card.card_id)
-
-            model.owner_id = card.owner_id  # type: ignore[assignment]
-            model.visibility = card.visibility.value  # type: ignore[assignment]
-            model.shared_with = list(card.shared_with) if card.shared_with else None  # type: ignore[assignment]
-            model.mode = card.mode.value  # type: ignore[assignment]
-            model.seed = card.seed  # type: ignore[assignment]
-            model.table_width = card.table.width_mm  # type: ignore[assignment]
-            model.table_height = card.table.height_mm  # type: ignore[assignment]
-            model.table_unit = "mm"  # type: ignore[assignment]
-            model.map_spec = self._map_spec_to_json(card.map_spec)  # type: ignore[assignment]
-            model.name = card.name  # type: ignore[assignment]
-            model.armies = card.armies  # type: ignore[assignment]
-            model.deployment = card.deployment  # type: ignore[assignment]
-            model.layout = card.layout  # type: ignore[assignment]
-            _obj = (
-                card.objectives
-                if isinstance(card.objectives, (dict, type(None)))
-                else str(card.objectives)
-            )
-            model.objectives = _obj  # type: ignore[assignment]
-            model.initial_priority = card.initial_priority  # type: ignore[assignment]
-            model.special_rules = card.special_rules  # type: ignore[assignment]
+    def save_many(self, cards: Sequence[Card]) -> None:
+        """Save several cards in one transaction.
 
-            session.add(model)
+        Rows are written with multi-row upserts of up to
+        ``_SAVE_MANY_CHUNK`` cards each.  If a card_id repeats, the last
+        card wins (as with repeated ``save`` calls).
+        """
+        if not cards:
+            return
+        now = datetime.now(timezone.utc)
+        rows = list({c.card_id: self._domain_to_row(c, now) for c in cards}.values())
+        session = self._session_factory()
+        try:
+            for start in range(0, len(rows), _SAVE_MANY_CHUNK):
+                session.execute(_upsert(rows[start : start + _SAVE_MANY_CHUNK]))
             session.commit()
         except Exception:
             session.rollback()
@@ -79,6 +149,38 @@ class PostgresCardRepository:
         finally:
             session.close()
 
+    def get_many(self, card_ids: Sequence[str]) -> list[Card]:
+        """Retrieve several cards with one ``card_id IN (...)`` query."""
+        if not card_ids:
+            return []
+        session = self._session_factory()
+        try:
+            models = (
+                session.query(CardModel)
+                .filter(CardModel.card_id.in_(set(card_ids)))
+                .order_by(CardModel.card_id)
+                .all()
+            )
+            return [self._model_to_domain(m) for m in models]
+        finally:
+            session.close()
+
+    def get_summaries(self, card_ids: Sequence[str]) -> list[CardSummary]:
+        """Like ``get_many``, selecting only the summary columns."""
+        if not card_ids:
+            return []
+        session = self._session_factory()
+        try:
+            rows = (
+                session.query(*_SUMMARY_COLUMNS)
+                .filter(CardModel.card_id.in_(set(card_ids)))
+                .order_by(CardModel.card_id)
+                .all()
+            )
+            return [_row_to_summary(r) for r in rows]
+        finally:
+            session.close()
+
     def delete(self, card_id: str) -> bool:
         """Delete a card by ID. Returns True if found and deleted."""
         session = self._session_factory()
@@ -96,10 +198,18 @@ class PostgresCardRepository:
             session.close()
 
     def find_by_seed(self, seed: int) -> Optional[Card]:
-        """Find the first card matching a given seed, or None."""
+        """Find the first card saved with a given seed, or None.
+
+        Served by ``ix_cards_seed``; ties are broken by creation time.
+        """
         session = self._session_factory()
         try:
-            model = session.query(CardModel).filter_by(seed=seed).first()
+            model = (
+                session.query(CardModel)
+                .filter_by(seed=seed)
+                .order_by(CardModel.created_at, CardModel.card_id)
+                .first()
+            )
             if model is None:
                 return None
             return self._model_to_domain(model)
@@ -115,8 +225,167 @@ class PostgresCardRepository:
         finally:
             session.close()
 
+    def list_for_owner(self, owner_id: str) -> list[Card]:
+        """List all cards owned by *owner_id*, ordered by card_id."""
+        return self.list_visible(owner_id, LIST_FILTER_MINE)
+
+    def list_visible(
+        self,
+        actor_id: str,
+        filter_value: str,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        name_query: Optional[str] = None,
+        mode: Optional[str] = None,
+        table_preset: Optional[str] = None,
+    ) -> list[Card]:
+        """List cards matching a list filter with a single indexed query.
+
+        ``mine`` uses ``ix_cards_owner_id``; ``public`` and
+        ``shared_with_me`` use ``ix_cards_visibility``.  Results are
+        ordered by card_id; *cursor* / *limit* implement keyset paging.
+        Name, mode and table-preset criteria are evaluated in SQL.
+        """
+        session = self._session_factory()
+        try:
+            query = self._visible_query(
+                session,
+                actor_id,
+                filter_value,
+                limit=limit,
+                cursor=cursor,
+                name_query=name_query,
+                mode=mode,
+                table_preset=table_preset,
+            )
+            if query is None:
+                return []
+            return [self._model_to_domain(m) for m in query.all()]
+        finally:
+            session.close()
+
+    def list_visible_summaries(
+        self,
+        actor_id: str,
+        filter_value: str,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        name_query: Optional[str] = None,
+        mode: Optional[str] = None,
+        table_preset: Optional[str] = None,
+    ) -> list[CardSummary]:
+        """Same query as ``list_visible``, selecting only summary columns."""
+        session = self._session_factory()
+        try:
+            query = self._visible_query(
+                session,
+                actor_id,
+                filter_value,
+                limit=limit,
+                cursor=cursor,
+                name_query=name_query,
+                mode=mode,
+                table_preset=table_preset,
+            )
+            if query is None:
+                return []
+            rows = query.with_entities(*_SUMMARY_COLUMNS).all()
+            return [_row_to_summary(r) for r in rows]
+        finally:
+            session.close()
+
+    def _visible_query(
+        self,
+        session: Session,
+        actor_id: str,
+        filter_value: str,
+        *,
+        limit: Optional[int],
+        cursor: Optional[str],
+        name_query: Optional[str],
+        mode: Optional[str],
+        table_preset: Optional[str],
+    ) -> Optional[Query[CardModel]]:
+        """Build the ordered, paged list query (``None`` if unknown filter)."""
+        query = self._filtered_query(session, actor_id, filter_value)
+        if query is None:
+            return None
+        query = self._narrow_query(query, name_query, mode, table_preset)
+        if cursor:
+            query = query.filter(CardModel.card_id > cursor)
+        query = query.order_by(CardModel.card_id)
+        if limit is not None:
+            query = query.limit(max(0, limit))
+        return query
+
+    @staticmethod
+    def _filtered_query(
+        session: Session, actor_id: str, filter_value: str
+    ) -> Optional[Query[CardModel]]:
+        """Build the WHERE clause for a list filter (``None`` if unknown)."""
+        query = session.query(CardModel)
+        if filter_value == LIST_FILTER_MINE:
+            return query.filter(CardModel.owner_id == actor_id)
+        if filter_value == LIST_FILTER_PUBLIC:
+            return query.filter(CardModel.visibility == Visibility.PUBLIC.value)
+        if filter_value == LIST_FILTER_SHARED_WITH_ME:
+            return query.filter(
+                CardModel.visibility == Visibility.SHARED.value,
+                cast(CardModel.shared_with, JSONB).contains([actor_id]),
+            )
+        return None
+
+    @staticmethod
+    def _narrow_query(
+        query: Query[CardModel],
+        name_query: Optional[str],
+        mode: Optional[str],
+        table_preset: Optional[str],
+    ) -> Query[CardModel]:
+        """Apply the optional name / mode / table-preset criteria."""
+        if mode is not None:
+            query = query.filter(CardModel.mode == mode)
+        if table_preset is not None:
+            query = query.filter(_table_preset_clause(table_preset))
+        if name_query:
+            # Served by the ix_cards_name_trgm GIN index (pg_trgm).
+            pattern = f"%{_escape_like(name_query)}%"
+            query = query.filter(CardModel.name.ilike(pattern, escape="\\"))
+        return query
+
     # ── Serialization helpers ────────────────────────────────────────────────
 
+    @classmethod
+    def _domain_to_row(cls, card: Card, now: datetime) -> dict[str, Any]:
+        """Convert Card (domain) → column values for an upsert."""
+        return {
+            "card_id": card.card_id,
+            "owner_id": card.owner_id,
+            "visibility": card.visibility.value,
+            "shared_with": list(card.shared_with) if card.shared_with else None,
+            "mode": card.mode.value,
+            "seed": card.seed,
+            "table_width": card.table.width_mm,
+            "table_height": card.table.height_mm,
+            "table_unit": "mm",
+            "map_spec": cls._map_spec_to_json(card.map_spec),
+            "name": card.name,
+            "armies": card.armies,
+            "deployment": card.deployment,
+            "layout": card.layout,
+            "objectives": (
+                card.objectives
+                if isinstance(card.objectives, (dict, type(None)))
+                else str(card.objectives)
+            ),
+            "initial_priority": card.initial_priority,
+            "special_rules": card.special_rules,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     @staticmethod
     def _map_spec_to_json(map_spec: MapSpec) -> dict[str, Any]:
         """Convert MapSpec domain object to JSON-serializable dict."""
@@ -6,6 +6,7 @@ infrastructure.db.models.FavoritesModel.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import Callable
 
@@ -85,6 +86,23 @@ class PostgresFavoritesRepository:
         finally:
             session.close()
 
+    def remove_favorites(self, actor_id: str, card_ids: Sequence[str]) -> None:
+        """Unset several favorites of an actor with a single DELETE."""
+        if not card_ids:
+            return
+        session = self._session_factory()
+        try:
+            session.query(FavoritesModel).filter(
+                FavoritesModel.actor_id == actor_id,
+                FavoritesModel.card_id.in_(list(card_ids)),
+            ).delete(synchronize_session=False)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     def remove_all_for_card(self, card_id: str) -> None:
         """Remove all favorites referencing a card."""
         session = self._session_factory()
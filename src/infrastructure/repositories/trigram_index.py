@@ -0,0 +1,77 @@
+"""TrigramIndex - in-memory n-gram inverted index for substring search.
+
+Each indexed document is lower-cased and split into overlapping
+3-character grams.  A substring query can only match documents that
+contain *every* gram of the query, so intersecting the posting sets
+yields a small candidate set that the caller then verifies with a real
+substring check (gram sets are necessary, not sufficient).
+
+Queries shorter than :data:`GRAM_SIZE` have no grams; ``candidates``
+returns ``None`` for them so callers fall back to a scan.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+GRAM_SIZE = 3
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the set of lower-cased 3-grams in *text*."""
+    lowered = text.lower()
+    return {lowered[i : i + GRAM_SIZE] for i in range(len(lowered) - GRAM_SIZE + 1)}
+
+
+class TrigramIndex:
+    """Inverted index mapping 3-grams to the ids of documents containing them."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._postings: dict[str, set[str]] = {}
+        self._grams_by_doc: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._grams_by_doc)
+
+    def add(self, doc_id: str, text: Optional[str]) -> None:
+        """Index *text* under *doc_id*, replacing any previous entry."""
+        self.remove(doc_id)
+        grams = trigrams(text or "")
+        if not grams:
+            return
+        self._grams_by_doc[doc_id] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id: str) -> None:
+        """Drop *doc_id* from the index (no-op when absent)."""
+        grams = self._grams_by_doc.pop(doc_id, None)
+        if not grams:
+            return
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[gram]
+
+    def candidates(self, query: str) -> Optional[set[str]]:
+        """Return ids of documents that may contain *query* as a substring.
+
+        Returns:
+            The candidate id set (possibly empty), or ``None`` when the
+            query is too short to be served by the index.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return None
+        # Intersect from the rarest gram up so the working set stays small.
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
@@ -1,24 +1,25 @@
 """BasicScenarioGenerator - Robust deterministic shape generation.
 
 A placement-based implementation of ScenarioGenerator that:
-- Places shapes one-by-one with collision checks
+- Places shapes one-by-one with collision checks (rects, circles and
+  polygons, see ``domain.maps.collision``)
+- Produces MapSpec-valid layouts by construction (bounds, solid count)
 - Uses derive_attempt_seed for deterministic retries
-- Validates final output with MapSpec
 """
 
 from __future__ import annotations
 
+import math
 import random
+from collections.abc import Iterable
+from concurrent.futures import Executor
 
 from domain.cards.card import GameMode
-from domain.errors import ValidationError
 from domain.maps.collision import (
     MIN_CLEARANCE_MM,
-    has_no_collisions,
+    SpatialGrid,
     shape_in_bounds,
-    shapes_overlap,
 )
-from domain.maps.map_spec import MapSpec
 from domain.maps.table_size import TableSize
 from domain.seed import derive_attempt_seed
 from infrastructure.scenario_generation._catalogs import (
@@ -26,15 +27,32 @@ from infrastructure.scenario_generation._catalogs import (
 )
 
 # Generation constants
-GENERATOR_VERSION: str = "sceno-v1"
+# v2: compact polygons that take part in collision checks, at most
+# MAX_SOLID_SHAPES shapes per layout.
+GENERATOR_VERSION: str = "sceno-v2"
 MAX_GLOBAL_ATTEMPTS: int = 50
 MAX_PLACEMENT_TRIES_PER_SHAPE: int = 200
+# MapSpec allows at most 3 solid (allow_overlap=False) scenography shapes.
+MAX_SOLID_SHAPES: int = 3
+# Seeds handed to one worker per task by generate_many(executor=...).
+DEFAULT_BATCH_CHUNK_SIZE: int = 256
+
+_THEME_NAMES: tuple[str, ...] = tuple(_SCENERY_THEMES)
+
+
+def _generate_chunk(
+    job: tuple[list[int], TableSize, GameMode],
+) -> list[list[dict]]:
+    """Generate layouts for a chunk of seeds (module-level for process pools)."""
+    seeds, table, mode = job
+    generator = BasicScenarioGenerator()
+    return [generator.generate_shapes(seed, table, mode) for seed in seeds]
 
 
 class BasicScenarioGenerator:
     """Robust scenario generator with placement-based collision avoidance.
 
-    Generates 2-5 random shapes (rectangles, circles, polygons) that are:
+    Generates 2-3 random shapes (rectangles, circles, polygons) that are:
     - Guaranteed to fit within table bounds
     - Non-overlapping (with MIN_CLEARANCE_MM gap)
     - Valid for MapSpec construction
@@ -54,7 +72,7 @@ class BasicScenarioGenerator:
     # -----------------------------------------------------------------
 
     def _pick_theme(self, rng: random.Random) -> str:
-        return rng.choice(list(_SCENERY_THEMES.keys()))
+        return rng.choice(_THEME_NAMES)
 
     def _rect_shape(self, rng: random.Random, w: int, h: int, theme: str) -> dict:
         max_width = max(50, min(300, w // 3))
@@ -90,8 +108,23 @@ class BasicScenarioGenerator:
         }
 
     def _polygon_shape(self, rng: random.Random, w: int, h: int, theme: str) -> dict:
+        # Star-shaped around a center (vertices sorted by angle), sized
+        # like a circle piece so it can be placed among the others.
+        max_r = max(30, min(200, w // 6, h // 6))
+        r = rng.randint(30, max_r)
+        cx = rng.randint(r, w - r)
+        cy = rng.randint(r, h - r)
         n = rng.randint(3, 6)
-        points = [{"x": rng.randint(0, w), "y": rng.randint(0, h)} for _ in range(n)]
+        angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(n))
+        points = []
+        for angle in angles:
+            dist = rng.randint(r // 2, r)
+            points.append(
+                {
+                    "x": round(cx + dist * math.cos(angle)),
+                    "y": round(cy + dist * math.sin(angle)),
+                }
+            )
         description = rng.choice(_SCENERY_THEMES[theme]["polygon"])
         return {
             "type": "polygon",
@@ -108,14 +141,15 @@ class BasicScenarioGenerator:
         self,
         rng: random.Random,
         kind: str,
-        placed: list[dict],
+        placed: SpatialGrid,
         w: int,
         h: int,
         theme: str,
     ) -> dict | None:
         """Try to place a single shape without collision.
 
-        Makes up to MAX_PLACEMENT_TRIES_PER_SHAPE attempts.
+        Makes up to MAX_PLACEMENT_TRIES_PER_SHAPE attempts, checking each
+        candidate only against the already-placed shapes near it.
         Returns the shape dict if successful, None if all attempts fail.
         """
         for _ in range(MAX_PLACEMENT_TRIES_PER_SHAPE):
@@ -130,13 +164,8 @@ class BasicScenarioGenerator:
             if not shape_in_bounds(candidate, w, h):
                 continue
 
-            # Check collision with already-placed shapes
-            collision = False
-            for existing in placed:
-                if shapes_overlap(candidate, existing, MIN_CLEARANCE_MM):
-                    collision = True
-                    break
-            if not collision:
+            # Check collision with already-placed shapes (grid broad phase)
+            if not placed.collides(candidate):
                 return candidate
 
         return None
@@ -149,13 +178,15 @@ class BasicScenarioGenerator:
         Returns list of shapes if all can be placed, None if placement fails.
         """
         shapes: list[dict] = []
-        count = rng.randint(2, 5)
+        placed = SpatialGrid(MIN_CLEARANCE_MM)
+        count = rng.randint(2, MAX_SOLID_SHAPES)
 
         for _ in range(count):
             kind = rng.choice(["rect", "circle", "polygon"])
-            shape = self._try_place_shape(rng, kind, shapes, w, h, theme)
+            shape = self._try_place_shape(rng, kind, placed, w, h, theme)
             if shape is None:
                 return None  # Could not place this shape → global retry
+            placed.insert(len(shapes), shape)
             shapes.append(shape)
 
         return shapes
@@ -169,9 +200,10 @@ class BasicScenarioGenerator:
     ) -> list[dict]:
         """Generate shapes for a scenario map.
 
-        Uses a placement-based algorithm with collision avoidance.
-        If placement fails, retries with a derived seed up to
-        MAX_GLOBAL_ATTEMPTS times. Validates output with MapSpec.
+        Uses a placement-based algorithm with collision avoidance.  Every
+        placed shape is in bounds and clear of the others, so a completed
+        placement is final; only a placement that runs out of tries is
+        retried, with a derived seed, up to MAX_GLOBAL_ATTEMPTS times.
 
         Args:
             seed: Random seed for deterministic generation.
@@ -197,16 +229,6 @@ class BasicScenarioGenerator:
             if shapes is None:
                 continue
 
-            # Validate with MapSpec (catches any edge-case domain violations)
-            try:
-                MapSpec(table=table, shapes=shapes)
-            except ValidationError:
-                continue
-
-            # Verify no collisions (belt-and-suspenders)
-            if not has_no_collisions(shapes, MIN_CLEARANCE_MM):
-                continue
-
             # Success — record metadata
             self.last_attempt_index = attempt
             return shapes
@@ -216,3 +238,48 @@ class BasicScenarioGenerator:
             f"Failed to generate valid shapes after {MAX_GLOBAL_ATTEMPTS} "
             f"attempts for seed={seed}, table={w}x{h}mm"
         )
+
+    def generate_many(
+        self,
+        seeds: Iterable[int],
+        table: TableSize,
+        mode: GameMode,
+        *,
+        executor: Executor | None = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> list[list[dict]]:
+        """Generate one layout per seed (bulk entry point).
+
+        Each layout is exactly what ``generate_shapes(seed, table, mode)``
+        returns: seeds are independent, so they are processed in chunks
+        that can be spread across *executor* (e.g. a ProcessPoolExecutor)
+        without changing the results.  ``last_attempt_index`` is not
+        updated by this method.
+
+        Args:
+            seeds: Seeds to generate, in the order of the returned list.
+            table: Table size shared by every layout.
+            mode: Game mode shared by every layout.
+            executor: Optional pool the chunks are mapped over.
+            chunk_size: Number of seeds per chunk.
+
+        Returns:
+            One list of shape dicts per seed, in seed order.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+            RuntimeError: If any seed exhausts its retry attempts.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        seed_list = list(seeds)
+        jobs = [
+            (seed_list[i : i + chunk_size], table, mode)
+            for i in range(0, len(seed_list), chunk_size)
+        ]
+        chunks: Iterable[list[list[dict]]]
+        if executor is None or len(jobs) <= 1:
+            chunks = map(_generate_chunk, jobs)
+        else:
+            chunks = executor.map(_generate_chunk, jobs)
+        return [layout for chunk in chunks for layout in chunk]
@@ -12,8 +12,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from unittest.mock import MagicMock
 
+import pytest
 from adapters.http_flask.app import create_app
 from domain.errors import ValidationError
+from infrastructure.observability.diagnostics import configure_diagnostics_token
+
+ADMIN_HEADERS = {"Authorization": "Bearer tok"}
 
 
 # =============================================================================
@@ -33,6 +37,14 @@ class FakeServices:
     render_map_svg: MagicMock = None  # type: ignore[assignment]
 
 
+@pytest.fixture()
+def diagnostics_token():
+    """Enable the diagnostics endpoints with the ``tok`` admin token."""
+    configure_diagnostics_token("tok")
+    yield "tok"
+    configure_diagnostics_token(None)
+
+
 # =============================================================================
 # TEST: build_services is called once and stored in config
 # =============================================================================
@@ -112,6 +124,81 @@ class TestCreateAppRegistersBlueprintsCorrectly:
         # Assert: endpoint returns 200 OK
         assert response.status_code == 200, "/health endpoint should return 200"
 
+    def test_password_hashing_stats_endpoint(self, monkeypatch, diagnostics_token):
+        """Hashing pool metrics are exported next to the health check."""
+        monkeypatch.setattr(
+            "adapters.http_flask.app.build_services", lambda: FakeServices()
+        )
+        client = create_app().test_client()
+
+        response = client.get("/health/password-hashing", headers=ADMIN_HEADERS)
+
+        assert response.status_code == 200
+        stats = response.get_json()["password_hashing"]
+        assert {"workers", "in_flight", "rejected", "timed_out"} <= set(stats)
+
+    def test_db_stats_endpoint(self, monkeypatch, diagnostics_token):
+        """DB pool metrics are exported to requests carrying the admin token."""
+        monkeypatch.setattr(
+            "adapters.http_flask.app.build_services", lambda: FakeServices()
+        )
+        monkeypatch.setattr(
+            "infrastructure.db.session.db_stats", lambda: {"checkouts": 3}
+        )
+        client = create_app().test_client()
+
+        response = client.get("/health/db", headers=ADMIN_HEADERS)
+
+        assert response.status_code == 200
+        assert response.get_json()["db"] == {"checkouts": 3}
+
+    @pytest.mark.parametrize(
+        "path", ["/health/db", "/health/password-hashing", "/metrics"]
+    )
+    def test_diagnostics_require_admin_token(self, monkeypatch, path):
+        """Every diagnostics endpoint follows the same policy: 404 without it."""
+        monkeypatch.setattr(
+            "adapters.http_flask.app.build_services", lambda: FakeServices()
+        )
+        client = create_app().test_client()
+        try:
+            configure_diagnostics_token(None)
+            disabled = client.get(path, headers=ADMIN_HEADERS)
+            configure_diagnostics_token("tok")
+            anonymous = client.get(path)
+            wrong = client.get(path, headers={"Authorization": "Bearer nope"})
+            admin = client.get(path, headers=ADMIN_HEADERS)
+        finally:
+            configure_diagnostics_token(None)
+
+        assert [r.status_code for r in (disabled, anonymous, wrong)] == [404] * 3
+        assert anonymous.get_json()["error"] == "NotFound"
+        assert admin.status_code == 200
+
+    def test_metrics_endpoint_exports_use_case_latency(
+        self, monkeypatch, diagnostics_token
+    ):
+        """Use-case metrics are exported in the Prometheus text format."""
+        from infrastructure.observability.use_case_metrics import UseCaseMetrics
+
+        metrics = UseCaseMetrics()
+        metrics.register("list_cards")
+        monkeypatch.setattr(
+            "adapters.http_flask.app.build_services", lambda: FakeServices()
+        )
+        monkeypatch.setattr(
+            "infrastructure.observability.use_case_metrics._metrics", metrics
+        )
+        client = create_app().test_client()
+
+        response = client.get("/metrics", headers=ADMIN_HEADERS)
+
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain; version=0.0.4")
+        assert 'use_case_in_flight{use_case="list_cards"} 0' in response.get_data(
+            as_text=True
+        )
+
 
 # =============================================================================
 # TEST: get_actor_id helper is exposed
@@ -392,3 +479,101 @@ class TestErrorResponseJsonStructure:
         assert (
             json_data["message"] == "Access denied"
         ), "403 should return standard 'Access denied' message"
+
+
+# =============================================================================
+# TEST: on-demand request profiling
+# =============================================================================
+class TestRequestProfiling:
+    """Requests presenting the profiling token are captured with cProfile."""
+
+    def _client(self, monkeypatch, tmp_path):
+        from infrastructure.observability.request_profiler import (
+            RequestProfiler,
+            configure_request_profiler,
+        )
+
+        monkeypatch.setattr(
+            "adapters.http_flask.app.build_services", lambda: FakeServices()
+        )
+        configure_request_profiler(RequestProfiler("tok", tmp_path, keep=2))
+        return create_app().test_client()
+
+    def teardown_method(self):
+        from infrastructure.observability.request_profiler import (
+            configure_request_profiler,
+        )
+
+        configure_request_profiler(None)
+
+    def test_token_header_profiles_the_request(self, monkeypatch, tmp_path):
+        client = self._client(monkeypatch, tmp_path)
+
+        response = client.get("/health", headers={"X-Profile-Token": "tok"})
+
+        assert response.status_code == 200
+        profile_file = response.headers["X-Profile-File"]
+        assert (tmp_path / profile_file).is_file()
+
+    def test_requests_without_token_are_not_profiled(self, monkeypatch, tmp_path):
+        client = self._client(monkeypatch, tmp_path)
+
+        plain = client.get("/health")
+        wrong = client.get("/health", headers={"X-Profile-Token": "nope"})
+
+        assert "X-Profile-File" not in plain.headers
+        assert "X-Profile-File" not in wrong.headers
+        assert list(tmp_path.glob("*.pstats")) == []
+
+
+class TestResponseCompression:
+    """The after_request hook gzip-encodes large enough JSON bodies."""
+
+    def _client(self, monkeypatch, min_size: int):
+        from infrastructure.compression import (
+            ResponseCompressor,
+            configure_response_compressor,
+            get_response_compressor,
+        )
+
+        monkeypatch.setattr(
+            "adapters.http_flask.app.build_services", lambda: FakeServices()
+        )
+        self._previous = get_response_compressor()
+        configure_response_compressor(
+            ResponseCompressor(min_size=min_size, brotli=None)
+        )
+        return create_app().test_client()
+
+    def teardown_method(self):
+        from infrastructure.compression import configure_response_compressor
+
+        configure_response_compressor(self._previous)
+
+    def test_json_gzip_when_accepted(self, monkeypatch):
+        import gzip
+        import json
+
+        client = self._client(monkeypatch, min_size=1)
+
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert json.loads(gzip.decompress(response.data)) == {"status": "ok"}
+
+    def test_identity_without_accept_encoding(self, monkeypatch):
+        client = self._client(monkeypatch, min_size=1)
+
+        response = client.get("/health")
+
+        assert "Content-Encoding" not in response.headers
+        assert response.get_json() == {"status": "ok"}
+
+    def test_small_bodies_not_compressed(self, monkeypatch):
+        client = self._client(monkeypatch, min_size=1024)
+
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert "Vary" not in response.headers
@@ -112,6 +112,21 @@ class TestLogin:
         resp = _login(client, username="nobody", password="nobody")
         assert resp.status_code == 401
 
+    def test_hashing_pool_saturated_returns_503(self, client, monkeypatch):
+        from infrastructure.auth.password_hasher import PasswordHasherBusy
+
+        def reject(password, salt=None):
+            raise PasswordHasherBusy("saturated")
+
+        monkeypatch.setattr(user_store, "_hash_password", reject)
+
+        resp = _login(client)
+
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"] == "1"
+        assert resp.get_json()["ok"] is False
+        assert _get_session_cookie(resp) is None
+
 
 # ── POST /auth/logout ────────────────────────────────────────────────────────
 
@@ -169,6 +169,7 @@ class FakeListCardsResponse:
     """Fake response from ListCards."""
 
     cards: list = field(default_factory=list)
+    next_cursor: Optional[str] = None
 
 
 class FakeListCards:
@@ -501,6 +502,36 @@ class TestListCardsHappyPath:
         assert response.status_code == 200
         assert fake_list.last_request.filter == "shared_with_me"
 
+    def test_list_cards_passes_paging_and_search_params(self, client, fake_list):
+        """limit / cursor / q / mode / table_preset reach the use case."""
+        response = client.get(
+            "/cards?filter=public&limit=20&cursor=card-001"
+            "&q=osgiliath&mode=matched&table_preset=standard"
+        )
+
+        assert response.status_code == 200
+        req = fake_list.last_request
+        assert req.limit == 20
+        assert req.cursor == "card-001"
+        assert req.name_query == "osgiliath"
+        assert req.mode == "matched"
+        assert req.table_preset == "standard"
+        assert "next_cursor" in response.get_json()
+
+    def test_list_cards_blank_params_are_omitted(self, client, fake_list):
+        """Blank optional params are passed as None (unpaginated)."""
+        response = client.get("/cards?filter=mine&limit=&q=%20")
+
+        assert response.status_code == 200
+        assert fake_list.last_request.limit is None
+        assert fake_list.last_request.name_query is None
+
+    def test_list_cards_non_integer_limit_returns_400(self, client):
+        """A non-numeric limit is a validation error."""
+        response = client.get("/cards?filter=mine&limit=ten")
+
+        assert response.status_code == 400
+
 
 # =============================================================================
 # TEST: GET /cards?filter=... - missing actor ID
@@ -200,3 +200,147 @@ class TestGetMapSvgForbidden:
         assert json_data is not None, "Response should be JSON"
         assert "error" in json_data, "JSON should contain 'error' key"
         assert "message" in json_data, "JSON should contain 'message' key"
+
+
+# =============================================================================
+# TEST: GET /cards/<card_id>/map.svg - ETag / conditional GET
+# =============================================================================
+_HASH = "ab" * 32
+
+
+@dataclass
+class FakeRenderMapSvgResponseWithHash(FakeRenderMapSvgResponse):
+    """Fake response that also carries the render content hash."""
+
+    content_hash: str = ""
+
+
+@pytest.fixture
+def hashed_client(session_factory):
+    """Client whose fake use case reports a content hash."""
+    fake = FakeRenderMapSvg(
+        response=FakeRenderMapSvgResponseWithHash(content_hash=_HASH)
+    )
+    app = create_app()
+    app.config["services"] = FakeServices(render_map_svg=fake)
+    c = app.test_client()
+    session_factory(c, "u1")
+    return c
+
+
+class TestGetMapSvgConditional:
+    """ETag / If-None-Match handling for map SVGs."""
+
+    def test_response_carries_strong_etag(self, hashed_client):
+        response = hashed_client.get("/cards/card-001/map.svg")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == f'"{_HASH}"'
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    def test_matching_if_none_match_returns_304(self, hashed_client):
+        response = hashed_client.get(
+            "/cards/card-001/map.svg", headers={"If-None-Match": f'"{_HASH}"'}
+        )
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == f'"{_HASH}"'
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert (
+            response.headers["Content-Security-Policy"] == "default-src 'none'; sandbox"
+        )
+
+    def test_stale_if_none_match_returns_200(self, hashed_client):
+        response = hashed_client.get(
+            "/cards/card-001/map.svg", headers={"If-None-Match": '"other"'}
+        )
+
+        assert response.status_code == 200
+        assert b"<svg" in response.data
+
+    def test_sanitized_svg_reused_for_same_hash(self, hashed_client, monkeypatch):
+        from adapters.http_flask.routes import cards as cards_routes
+
+        calls: list[str] = []
+        real_normalize = cards_routes.normalize_svg_xml
+
+        def counting_normalize(svg: str) -> str:
+            calls.append(svg)
+            return real_normalize(svg)
+
+        cards_routes._SAFE_SVG_CACHE.clear()
+        monkeypatch.setattr(cards_routes, "normalize_svg_xml", counting_normalize)
+
+        first = hashed_client.get("/cards/card-001/map.svg")
+        second = hashed_client.get("/cards/card-001/map.svg")
+
+        assert first.data == second.data
+        assert len(calls) == 1
+
+    def test_no_hash_keeps_no_store(self, client):
+        response = client.get("/cards/card-001/map.svg")
+
+        assert "ETag" not in response.headers
+        assert "no-store" in response.headers["Cache-Control"]
+
+
+# =============================================================================
+# TEST: GET /cards/<card_id>/map.svg - response compression
+# =============================================================================
+@pytest.fixture
+def compressor():
+    from infrastructure.compression import (
+        ResponseCompressor,
+        configure_response_compressor,
+        get_response_compressor,
+    )
+
+    previous = get_response_compressor()
+    compressor = ResponseCompressor(min_size=1, brotli=None)
+    configure_response_compressor(compressor)
+    yield compressor
+    configure_response_compressor(previous)
+
+
+class TestGetMapSvgCompression:
+    """gzip negotiation and the precompressed cache for map SVGs."""
+
+    def test_gzip_when_accepted(self, hashed_client, compressor):
+        import gzip
+
+        plain = hashed_client.get("/cards/card-001/map.svg")
+        encoded = hashed_client.get(
+            "/cards/card-001/map.svg", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert encoded.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(encoded.data) == plain.data
+        assert encoded.headers["Content-Type"] == "image/svg+xml"
+        assert "Accept-Encoding" in encoded.headers["Vary"]
+        assert encoded.headers["ETag"] == f'W/"{_HASH}"'
+
+    def test_identity_keeps_strong_etag(self, hashed_client, compressor):
+        response = hashed_client.get("/cards/card-001/map.svg")
+
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["ETag"] == f'"{_HASH}"'
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    def test_weak_etag_revalidates(self, hashed_client, compressor):
+        response = hashed_client.get(
+            "/cards/card-001/map.svg",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": f'W/"{_HASH}"'},
+        )
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_repeat_hits_reuse_compressed_body(self, hashed_client, compressor):
+        headers = {"Accept-Encoding": "gzip"}
+
+        first = hashed_client.get("/cards/card-001/map.svg", headers=headers)
+        second = hashed_client.get("/cards/card-001/map.svg", headers=headers)
+
+        assert first.data == second.data
+        assert len(compressor.cache) == 1
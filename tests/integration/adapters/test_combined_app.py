@@ -110,3 +110,201 @@ class TestCombinedRouting:
         # API should now be 401
         resp = combined_client.get("/cards/")
         assert resp.status_code == 401
+
+
+def _login(client) -> str:
+    """Log in as alice and return the CSRF token."""
+    resp = client.post("/auth/login", json={"username": "alice", "password": "alice"})
+    return resp.cookies.get("sb_csrf", "")
+
+
+class TestNativeReadRoutes:
+    def test_read_routes_registered_ahead_of_flask(self, combined_client):
+        from fastapi.routing import APIRoute
+
+        native = {
+            r.path
+            for r in combined_client.app.routes
+            if isinstance(r, APIRoute) and "GET" in r.methods
+        }
+        assert {
+            "/cards",
+            "/cards/{card_id}",
+            "/cards/{card_id}/map.svg",
+            "/favorites",
+            "/presets",
+            "/health",
+            "/health/db",
+        } <= native
+
+    def test_card_reads_served_natively(self, combined_client):
+        csrf = _login(combined_client)
+        created = combined_client.post(
+            "/cards",
+            json={"mode": "matched", "table_preset": "standard", "name": "Osgiliath"},
+            headers={"X-CSRF-Token": csrf},
+        )
+        assert created.status_code == 201
+        card_id = created.json()["card_id"]
+
+        listed = combined_client.get("/cards", params={"filter": "mine", "q": "osg"})
+        detail = combined_client.get(f"/cards/{card_id}")
+
+        assert listed.status_code == 200
+        assert [c["card_id"] for c in listed.json()["cards"]] == [card_id]
+        assert listed.json()["next_cursor"] is None
+        assert detail.status_code == 200
+        assert detail.json()["name"] == "Osgiliath"
+        assert "shapes" in detail.json()
+
+    def test_map_svg_and_conditional_get(self, combined_client):
+        csrf = _login(combined_client)
+        card_id = combined_client.post(
+            "/cards",
+            json={"mode": "matched", "table_preset": "standard"},
+            headers={"X-CSRF-Token": csrf},
+        ).json()["card_id"]
+
+        svg = combined_client.get(f"/cards/{card_id}/map.svg")
+        etag = svg.headers["ETag"]
+        again = combined_client.get(
+            f"/cards/{card_id}/map.svg", headers={"If-None-Match": etag}
+        )
+
+        assert svg.status_code == 200
+        assert svg.headers["content-type"].startswith("image/svg+xml")
+        assert svg.headers["X-Content-Type-Options"] == "nosniff"
+        assert b"<svg" in svg.content
+        assert again.status_code == 304
+        assert again.headers["ETag"] == etag
+
+    def test_native_reads_require_session(self, combined_client):
+        resp = combined_client.get("/cards")
+        assert resp.status_code == 401
+        assert resp.json() == {"ok": False, "message": "Authentication required."}
+        assert combined_client.get("/favorites").status_code == 401
+
+    def test_native_errors_follow_error_contract(self, combined_client):
+        _login(combined_client)
+
+        bad_limit = combined_client.get("/cards", params={"limit": "many"})
+        missing = combined_client.get("/cards/does-not-exist")
+
+        assert bad_limit.status_code == 400
+        assert bad_limit.json()["error"] == "ValidationError"
+        assert missing.status_code == 404
+        assert missing.json() == {"error": "NotFound", "message": "Resource not found"}
+
+    def test_favorites_presets_and_health(self, combined_client):
+        _login(combined_client)
+
+        assert combined_client.get("/favorites").json() == {"card_ids": []}
+        assert combined_client.get("/presets").status_code == 200
+        assert combined_client.get("/health/db").status_code == 404
+
+    @pytest.mark.parametrize("path", ["/health/db", "/health/password-hashing"])
+    def test_diagnostics_require_admin_token(self, combined_client, path):
+        from infrastructure.observability.diagnostics import (
+            configure_diagnostics_token,
+        )
+
+        configure_diagnostics_token("tok")
+        try:
+            anonymous = combined_client.get(path)
+            profiling = combined_client.get(path, headers={"X-Profile-Token": "tok"})
+            admin = combined_client.get(path, headers={"Authorization": "Bearer tok"})
+        finally:
+            configure_diagnostics_token(None)
+
+        assert anonymous.status_code == 404
+        assert profiling.status_code == 404
+        assert admin.json()["status"] == "ok"
+
+    def test_profiling_token_profiles_native_read(self, combined_client, tmp_path):
+        from infrastructure.observability.request_profiler import (
+            RequestProfiler,
+            configure_request_profiler,
+        )
+
+        _login(combined_client)
+        configure_request_profiler(RequestProfiler("tok", tmp_path))
+        try:
+            plain = combined_client.get("/cards", params={"filter": "mine"})
+            profiled = combined_client.get(
+                "/cards", params={"filter": "mine"}, headers={"X-Profile-Token": "tok"}
+            )
+        finally:
+            configure_request_profiler(None)
+
+        assert "X-Profile-File" not in plain.headers
+        assert profiled.status_code == 200
+        assert (tmp_path / profiled.headers["X-Profile-File"]).is_file()
+
+    def test_native_reads_are_compressed(self, combined_client):
+        from infrastructure.compression import (
+            ResponseCompressor,
+            configure_response_compressor,
+            get_response_compressor,
+        )
+
+        csrf = _login(combined_client)
+        card_id = combined_client.post(
+            "/cards",
+            json={"mode": "matched", "table_preset": "standard"},
+            headers={"X-CSRF-Token": csrf},
+        ).json()["card_id"]
+        previous = get_response_compressor()
+        configure_response_compressor(ResponseCompressor(min_size=1, brotli=None))
+        try:
+            listed = combined_client.get(
+                "/cards", params={"filter": "mine"}, headers={"Accept-Encoding": "gzip"}
+            )
+            svg = combined_client.get(
+                f"/cards/{card_id}/map.svg", headers={"Accept-Encoding": "gzip"}
+            )
+            plain = combined_client.get(
+                "/cards", params={"filter": "mine"}, headers={"Accept-Encoding": ""}
+            )
+        finally:
+            configure_response_compressor(previous)
+
+        assert listed.headers["content-encoding"] == "gzip"
+        assert listed.headers["vary"] == "Accept-Encoding"
+        assert [c["card_id"] for c in listed.json()["cards"]] == [card_id]
+        assert svg.headers["content-encoding"] == "gzip"
+        assert svg.headers["etag"].startswith('W/"')
+        assert b"<svg" in svg.content
+        assert "content-encoding" not in plain.headers
+
+
+class TestReadExecutor:
+    def test_workers_from_env(self, monkeypatch):
+        from adapters.http_asgi.read_routes import make_read_executor
+
+        monkeypatch.setenv("ASGI_READ_WORKERS", "3")
+        executor = make_read_executor()
+        try:
+            assert executor._max_workers == 3
+        finally:
+            executor.shutdown()
+
+    def test_invalid_workers_fall_back_to_default(self, monkeypatch):
+        from adapters.http_asgi.read_routes import (
+            DEFAULT_READ_WORKERS,
+            make_read_executor,
+        )
+
+        monkeypatch.setenv("ASGI_READ_WORKERS", "zero")
+        executor = make_read_executor()
+        try:
+            assert executor._max_workers == DEFAULT_READ_WORKERS
+        finally:
+            executor.shutdown()
+
+
+class TestStartupTimings:
+    def test_construction_phases_are_recorded(self, combined_client):
+        timings = combined_client.app.state.startup_timings
+
+        assert list(timings) == ["flask", "gradio", "mount"]
+        assert all(seconds >= 0 for seconds in timings.values())
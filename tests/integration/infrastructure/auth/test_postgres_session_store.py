@@ -15,6 +15,8 @@ These tests exercise the full CRUD lifecycle of sessions, including:
 
 from __future__ import annotations
 
+from datetime import timedelta
+
 import pytest
 
 from tests.helpers.fake_clock import FakeClock
@@ -336,6 +338,25 @@ class TestCleanupExpiredSessions:
         removed = store.cleanup_expired_sessions()
         assert removed >= 1
 
+    def test_deletes_in_batches(self, store, fake_clock):
+        for _ in range(5):
+            store.create_session("alice")
+        fake_clock.advance(hours=13)
+        removed = store.cleanup_expired_sessions(batch_size=2)
+        assert removed == 5
+        assert store.cleanup_expired_sessions(batch_size=2) == 0
+
+    def test_keeps_active_sessions(self, store, fake_clock):
+        store.create_session("alice")
+        fake_clock.advance(hours=13)
+        store.create_session("bob")
+        store.cleanup_expired_sessions(batch_size=1)
+        assert store.active_session_count() == 1
+
+    def test_rejects_non_positive_batch(self, store):
+        with pytest.raises(ValueError):
+            store.cleanup_expired_sessions(batch_size=0)
+
 
 # ── reset_sessions ──────────────────────────────────────────────────────────
 
@@ -372,3 +393,55 @@ class TestTouchThrottling:
         result = store.get_session(rec["session_id"])
         assert result is not None
         assert result["last_seen_at"] > initial_last_seen
+
+
+# ── batched touches (write-behind cache) ───────────────────────────────────
+
+
+class TestTouchSessions:
+    def test_updates_many_sessions_in_one_call(self, store, fake_clock):
+        a = store.create_session("alice")
+        b = store.create_session("bob")
+        fake_clock.advance(minutes=10)
+        seen = fake_clock.now_utc()
+
+        assert store.touch_sessions({a["session_id"]: seen, b["session_id"]: seen}) == 2
+
+        # Past the original idle limit, alive thanks to the touch
+        fake_clock.advance(minutes=10)
+        assert store.get_session(a["session_id"]) is not None
+        assert store.get_session(b["session_id"]) is not None
+
+    def test_never_moves_last_seen_backwards(self, store, fake_clock):
+        rec = store.create_session("alice")
+        earlier = rec["last_seen_at"] - timedelta(minutes=1)
+
+        assert store.touch_sessions({rec["session_id"]: earlier}) == 0
+
+    def test_skips_revoked_sessions(self, store, fake_clock):
+        rec = store.create_session("alice")
+        store.invalidate_session(rec["session_id"])
+        fake_clock.advance(minutes=1)
+
+        assert store.touch_sessions({rec["session_id"]: fake_clock.now_utc()}) == 0
+
+    def test_empty_batch_is_noop(self, store):
+        assert store.touch_sessions({}) == 0
+
+
+class TestCachedPostgresSessionStore:
+    def test_cache_over_postgres_revokes_immediately(self, store, fake_clock):
+        from infrastructure.auth.cached_session_store import CachedSessionStore
+
+        cache = CachedSessionStore(store, flush_interval_seconds=0, clock=fake_clock)
+        rec = cache.create_session("alice")
+        sid = rec["session_id"]
+        assert cache.get_csrf_token(sid) == rec["csrf_token"]
+
+        fake_clock.advance(seconds=2)
+        cache.get_session(sid)
+        assert cache.flush_touches() == 1
+        assert cache.revoke_all_sessions("alice") == 1
+
+        assert cache.get_session(sid) is None
+        assert store.get_session(sid) is None
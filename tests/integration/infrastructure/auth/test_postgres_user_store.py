@@ -0,0 +1,124 @@
+"""Integration tests for PostgresUserStore — users and lockouts in PostgreSQL.
+
+Requires a running PostgreSQL instance (``RUN_DB_TESTS=1``).
+These tests exercise:
+  - create + read back (what another worker would see)
+  - duplicate registration rejected by the database
+  - profile and password updates
+  - shared lockout counters (atomic upsert, expiry)
+  - the read-through cache in front of the store
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.helpers.fake_clock import FakeClock
+
+pytestmark = pytest.mark.db
+
+
+def _record(name: str = "Erin", email: str = "erin@example.com"):
+    from infrastructure.auth.user_store import UserRecord
+
+    return UserRecord(password_hash=b"h" * 32, salt=b"s" * 32, name=name, email=email)
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def store(clock):
+    """Fresh PostgresUserStore, cleaned before and after."""
+    from infrastructure.auth.postgres_user_store import PostgresUserStore
+    from infrastructure.db.session import SessionLocal
+
+    s = PostgresUserStore(session_factory=SessionLocal, clock=clock)
+    s.reset()
+    yield s
+    s.reset()
+
+
+@pytest.fixture()
+def other_worker(clock):
+    """A second store instance — stands in for another process."""
+    from infrastructure.auth.postgres_user_store import PostgresUserStore
+    from infrastructure.db.session import SessionLocal
+
+    return PostgresUserStore(session_factory=SessionLocal, clock=clock)
+
+
+class TestUsers:
+    def test_registration_visible_to_other_workers(self, store, other_worker):
+        assert store.add_user("erin", _record()) is True
+
+        assert other_worker.get_user("erin") == _record()
+        assert other_worker.get_credentials("erin") == (b"h" * 32, b"s" * 32)
+
+    def test_duplicate_username_rejected(self, store, other_worker):
+        store.add_user("erin", _record())
+
+        assert other_worker.add_user("erin", _record(email="x@example.com")) is False
+
+    def test_unknown_user(self, store):
+        assert store.get_user("nobody") is None
+        assert store.get_credentials("nobody") is None
+        assert store.update_profile("nobody", "N", "n@example.com") is False
+        assert store.set_password("nobody", b"h", b"s") is False
+
+    def test_profile_and_password_updates(self, store):
+        store.add_user("erin", _record())
+
+        assert store.update_profile("erin", "Erin B", "eb@example.com") is True
+        assert store.set_password("erin", b"n" * 32, b"t" * 32) is True
+
+        record = store.get_user("erin")
+        assert record["name"] == "Erin B"
+        assert record["email"] == "eb@example.com"
+        assert store.get_credentials("erin") == (b"n" * 32, b"t" * 32)
+
+
+class TestLockout:
+    def test_counters_shared_across_workers(self, store, other_worker):
+        from infrastructure.auth.user_store import LOCKOUT_DURATION
+
+        assert store.record_failed_attempt("erin") == (False, None)
+        assert other_worker.record_failed_attempt("erin") == (False, None)
+        locked, until = store.record_failed_attempt("erin")
+
+        assert locked is True
+        assert until is not None
+        assert other_worker.is_locked("erin") == (True, until)
+        assert until - store._clock.now_utc() == LOCKOUT_DURATION
+
+    def test_lockout_expires_and_resets_counter(self, store, clock):
+        for _ in range(3):
+            store.record_failed_attempt("erin")
+        clock.advance(hours=1, seconds=1)
+
+        assert store.is_locked("erin") == (False, None)
+        assert store.record_failed_attempt("erin") == (False, None)
+
+    def test_clear_failed_attempts(self, store):
+        store.record_failed_attempt("erin")
+        store.record_failed_attempt("erin")
+        store.clear_failed_attempts("erin")
+
+        assert store.record_failed_attempt("erin") == (False, None)
+
+
+class TestCachedPostgresUserStore:
+    def test_cache_invalidated_on_own_writes(self, store, other_worker, clock):
+        from infrastructure.auth.cached_user_store import CachedUserStore
+
+        cache = CachedUserStore(store, ttl_seconds=30, clock=clock)
+        store.add_user("erin", _record())
+        assert cache.get_user("erin")["name"] == "Erin"
+
+        other_worker.update_profile("erin", "Stale?", "erin@example.com")
+        assert cache.get_user("erin")["name"] == "Erin"  # within TTL
+
+        cache.update_profile("erin", "Erin B", "erin@example.com")
+        assert cache.get_user("erin")["name"] == "Erin B"
@@ -177,3 +177,133 @@ class TestPostgresCardRepository:
         loaded = repo.get_by_id("obj-dict")
         assert loaded is not None
         assert loaded.objectives == objectives_dict
+
+    def test_list_visible_filters_in_sql(self, session_factory) -> None:
+        """list_visible applies mine / public / shared_with_me in the query."""
+        repo = _make_repo(session_factory)
+        repo.save(_make_card(card_id="v-1", owner_id="owner-a"))
+        repo.save(
+            _make_card(card_id="v-2", owner_id="owner-b", visibility=Visibility.PUBLIC)
+        )
+        repo.save(
+            _make_card(
+                card_id="v-3",
+                owner_id="owner-b",
+                visibility=Visibility.SHARED,
+                shared_with=["owner-a"],
+            )
+        )
+
+        mine = [c.card_id for c in repo.list_visible("owner-a", "mine")]
+        public = [c.card_id for c in repo.list_visible("owner-a", "public")]
+        shared = [c.card_id for c in repo.list_visible("owner-a", "shared_with_me")]
+
+        assert mine == ["v-1"]
+        assert public == ["v-2"]
+        assert shared == ["v-3"]
+
+    def test_list_visible_keyset_pagination(self, session_factory) -> None:
+        """cursor + limit walk the result set ordered by card_id."""
+        repo = _make_repo(session_factory)
+        for cid in ("p-1", "p-2", "p-3"):
+            repo.save(_make_card(card_id=cid))
+
+        first = repo.list_visible("owner-a", "mine", limit=2)
+        rest = repo.list_visible("owner-a", "mine", cursor=first[-1].card_id)
+
+        assert [c.card_id for c in first] == ["p-1", "p-2"]
+        assert [c.card_id for c in rest] == ["p-3"]
+
+    def test_list_visible_name_query_is_case_insensitive_substring(
+        self, session_factory
+    ) -> None:
+        """name_query matches anywhere in the name; LIKE wildcards are literal."""
+        repo = _make_repo(session_factory)
+        repo.save(_make_card(card_id="n-1", name="Batalla de Osgiliath"))
+        repo.save(_make_card(card_id="n-2", name="Minas Tirith"))
+        repo.save(_make_card(card_id="n-3", name="100% Osgiliath"))
+
+        osg = repo.list_visible("owner-a", "mine", name_query="OSGIL")
+        pct = repo.list_visible("owner-a", "mine", name_query="100%")
+
+        assert [c.card_id for c in osg] == ["n-1", "n-3"]
+        assert [c.card_id for c in pct] == ["n-3"]
+
+    def test_get_many_single_query(self, session_factory) -> None:
+        """get_many returns found cards ordered by card_id, skipping unknown ids."""
+        repo = _make_repo(session_factory)
+        for cid in ("m-3", "m-1", "m-2"):
+            repo.save(_make_card(card_id=cid))
+
+        cards = repo.get_many(["m-3", "missing", "m-1"])
+
+        assert [c.card_id for c in cards] == ["m-1", "m-3"]
+        assert repo.get_many([]) == []
+
+    def test_summaries_match_full_cards(self, session_factory) -> None:
+        """Summary projections carry the list fields of the full cards."""
+        repo = _make_repo(session_factory)
+        repo.save(_make_card(card_id="s-2", name="Osgiliath", seed=7))
+        repo.save(
+            _make_card(
+                card_id="s-1",
+                visibility=Visibility.SHARED,
+                shared_with=["owner-b"],
+            )
+        )
+
+        listed = repo.list_visible_summaries("owner-a", "mine", limit=1)
+        found = repo.get_summaries(["s-2", "missing", "s-1"])
+
+        assert [s.card_id for s in listed] == ["s-1"]
+        assert [s.card_id for s in found] == ["s-1", "s-2"]
+        assert found[0].can_user_read("owner-b")
+        assert (found[1].seed, found[1].name) == (7, "Osgiliath")
+        assert found[1].table == TableSize(width_mm=1200, height_mm=1200)
+        assert repo.get_summaries([]) == []
+
+    def test_find_by_seed_returns_first_saved(self, session_factory) -> None:
+        """find_by_seed returns the oldest card sharing the seed."""
+        repo = _make_repo(session_factory)
+        repo.save(_make_card(card_id="seed-b", seed=4242))
+        repo.save(_make_card(card_id="seed-a", seed=4242))
+
+        found = repo.find_by_seed(4242)
+
+        assert found is not None
+        assert found.card_id == "seed-b"
+        assert repo.find_by_seed(999_999) is None
+
+    def test_save_many_upserts_batch(self, session_factory) -> None:
+        """save_many inserts new cards and updates existing ones in one batch."""
+        repo = _make_repo(session_factory)
+        repo.save(_make_card(card_id="bulk-1", name="Original"))
+
+        repo.save_many(
+            [
+                _make_card(card_id="bulk-1", name="Updated"),
+                _make_card(card_id="bulk-2", name="New"),
+                _make_card(card_id="bulk-2", name="Newer"),
+            ]
+        )
+
+        cards = repo.get_many(["bulk-1", "bulk-2"])
+        assert [(c.card_id, c.name) for c in cards] == [
+            ("bulk-1", "Updated"),
+            ("bulk-2", "Newer"),
+        ]
+
+    def test_save_many_spans_several_statements(self, session_factory) -> None:
+        """Batches larger than one statement are all written."""
+        from infrastructure.repositories import postgres_card_repository
+
+        repo = _make_repo(session_factory)
+        ids = [
+            f"chunk-{i:03d}"
+            for i in range(postgres_card_repository._SAVE_MANY_CHUNK + 3)
+        ]
+
+        repo.save_many([_make_card(card_id=cid) for cid in ids])
+
+        assert [c.card_id for c in repo.get_many(ids)] == ids
+        repo.save_many([])
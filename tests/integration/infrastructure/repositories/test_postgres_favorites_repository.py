@@ -86,3 +86,16 @@ class TestPostgresFavoritesRepository:
         assert repo.list_favorites("bob") == ["card-2"]
         assert repo.is_favorite("alice", "card-2") is False
         assert repo.is_favorite("bob", "card-1") is False
+
+    def test_remove_favorites_bulk(self, session_factory) -> None:
+        """remove_favorites deletes several ids of one actor at once."""
+        repo = _make_repo(session_factory)
+        for card_id in ("card-1", "card-2", "card-3"):
+            repo.set_favorite("alice", card_id, True)
+        repo.set_favorite("bob", "card-1", True)
+
+        repo.remove_favorites("alice", ["card-1", "card-3", "missing"])
+        repo.remove_favorites("alice", [])  # noop
+
+        assert repo.list_favorites("alice") == ["card-2"]
+        assert repo.list_favorites("bob") == ["card-1"]
@@ -235,3 +235,60 @@ class TestScenarioGeneratorContract:
         # Assert - shapes must be compatible with MapSpec (domain contract)
         map_spec = MapSpec(table=table, shapes=result)
         assert map_spec is not None
+
+
+# =============================================================================
+# BATCH GENERATION
+# =============================================================================
+class TestGenerateMany:
+    """generate_many must match generate_shapes seed for seed."""
+
+    SEEDS = (0, 1, 42, 123, 999_999, 2**31 - 1, 7, 7)
+
+    def _scalar(self, table, mode) -> list[list[dict]]:
+        from infrastructure.scenario_generation.basic_scenario_generator import (
+            BasicScenarioGenerator,
+        )
+
+        gen = BasicScenarioGenerator()
+        return [gen.generate_shapes(s, table, mode) for s in self.SEEDS]
+
+    def test_serial_batch_matches_scalar_path(self, table, mode):
+        from infrastructure.scenario_generation.basic_scenario_generator import (
+            BasicScenarioGenerator,
+        )
+
+        result = BasicScenarioGenerator().generate_many(
+            self.SEEDS, table, mode, chunk_size=3
+        )
+
+        assert result == self._scalar(table, mode)
+
+    def test_process_pool_batch_matches_scalar_path(self, table, mode):
+        from concurrent.futures import ProcessPoolExecutor
+
+        from infrastructure.scenario_generation.basic_scenario_generator import (
+            BasicScenarioGenerator,
+        )
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            result = BasicScenarioGenerator().generate_many(
+                self.SEEDS, table, mode, executor=pool, chunk_size=3
+            )
+
+        assert result == self._scalar(table, mode)
+
+    def test_empty_seeds_returns_empty_list(self, table, mode):
+        from infrastructure.scenario_generation.basic_scenario_generator import (
+            BasicScenarioGenerator,
+        )
+
+        assert BasicScenarioGenerator().generate_many([], table, mode) == []
+
+    def test_non_positive_chunk_size_raises(self, table, mode):
+        from infrastructure.scenario_generation.basic_scenario_generator import (
+            BasicScenarioGenerator,
+        )
+
+        with pytest.raises(ValueError):
+            BasicScenarioGenerator().generate_many([1], table, mode, chunk_size=0)
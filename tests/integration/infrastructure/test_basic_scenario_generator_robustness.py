@@ -171,11 +171,11 @@ class TestGeneratorMetadata:
     ) -> None:
         assert gen.generator_version == GENERATOR_VERSION
 
-    def test_generator_version_equals_sceno_v1(
+    def test_generator_version_equals_sceno_v2(
         self,
         gen: BasicScenarioGenerator,
     ) -> None:
-        assert gen.generator_version == "sceno-v1"
+        assert gen.generator_version == "sceno-v2"
 
 
 # =============================================================================
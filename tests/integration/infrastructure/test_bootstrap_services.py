@@ -311,3 +311,142 @@ class TestBootstrapServicesOptionalUseCases:
         # Assert - document expected interface
         if hasattr(services, "render_map_svg"):
             assert services.render_map_svg is not None
+
+
+# =============================================================================
+# SESSION CACHE WIRING
+# =============================================================================
+class TestUseCaseInstrumentation:
+    """build_services() wraps every use case with latency metrics."""
+
+    def test_use_case_calls_are_recorded(self) -> None:
+        from application.use_cases.list_cards import ListCardsRequest
+        from infrastructure.bootstrap import build_services
+        from infrastructure.observability.use_case_metrics import (
+            InstrumentedUseCase,
+            get_use_case_metrics,
+        )
+
+        services = build_services()
+        before = get_use_case_metrics().snapshot()["list_cards"]["count"]
+
+        services.list_cards.execute(ListCardsRequest(actor_id="u1", filter="mine"))
+
+        assert isinstance(services.get_card, InstrumentedUseCase)
+        assert get_use_case_metrics().snapshot()["list_cards"]["count"] == before + 1
+
+
+class TestSessionCacheWiring:
+    """The Postgres session store is wrapped by the in-process cache."""
+
+    def test_wraps_store_by_default(self, monkeypatch) -> None:
+        from unittest.mock import MagicMock
+
+        from infrastructure.auth.cached_session_store import CachedSessionStore
+        from infrastructure.bootstrap import _wrap_session_cache
+
+        monkeypatch.delenv("SESSION_CACHE_TTL_SECONDS", raising=False)
+        monkeypatch.setenv("SESSION_TOUCH_FLUSH_SECONDS", "0")
+
+        wrapped = _wrap_session_cache(MagicMock())
+
+        assert isinstance(wrapped, CachedSessionStore)
+        assert wrapped.ttl_seconds == 5
+
+    def test_zero_ttl_disables_cache(self, monkeypatch) -> None:
+        from unittest.mock import MagicMock
+
+        from infrastructure.bootstrap import _wrap_session_cache
+
+        monkeypatch.setenv("SESSION_CACHE_TTL_SECONDS", "0")
+        store = MagicMock()
+
+        assert _wrap_session_cache(store) is store
+
+
+class TestUserStoreWiring:
+    """The Postgres user store is configured behind the read-through cache."""
+
+    @pytest.fixture(autouse=True)
+    def _restore_user_store(self):
+        from infrastructure.auth import user_store
+
+        yield
+        user_store.configure_store(None)
+
+    def test_wraps_store_by_default(self, monkeypatch) -> None:
+        from unittest.mock import MagicMock
+
+        from infrastructure.auth import user_store
+        from infrastructure.auth.cached_user_store import CachedUserStore
+        from infrastructure.bootstrap import _build_user_store
+
+        monkeypatch.delenv("USER_CACHE_TTL_SECONDS", raising=False)
+
+        _build_user_store(MagicMock())
+
+        configured = user_store.get_store()
+        assert isinstance(configured, CachedUserStore)
+        assert configured.ttl_seconds == 30
+
+    def test_zero_ttl_disables_cache(self, monkeypatch) -> None:
+        from unittest.mock import MagicMock
+
+        from infrastructure.auth import user_store
+        from infrastructure.auth.postgres_user_store import PostgresUserStore
+        from infrastructure.bootstrap import _build_user_store
+
+        monkeypatch.setenv("USER_CACHE_TTL_SECONDS", "0")
+
+        _build_user_store(MagicMock())
+
+        assert isinstance(user_store.get_store(), PostgresUserStore)
+
+    @pytest.mark.parametrize("has_database", [True, False])
+    def test_build_services_wires_user_store_with_sessions(
+        self, monkeypatch, has_database
+    ) -> None:
+        from unittest.mock import MagicMock
+
+        from infrastructure import bootstrap
+
+        factory = MagicMock() if has_database else None
+        built = MagicMock()
+        monkeypatch.setattr(bootstrap, "_build_session_store", lambda: factory)
+        monkeypatch.setattr(bootstrap, "_build_user_store", built)
+
+        bootstrap.build_services()
+
+        if has_database:
+            built.assert_called_once_with(factory)
+        else:
+            built.assert_not_called()
+
+
+class TestSessionJanitorWiring:
+    """The session janitor is built with the Postgres session store."""
+
+    def test_builds_janitor_with_settings(self, monkeypatch) -> None:
+        from unittest.mock import MagicMock
+
+        from infrastructure.auth.session_janitor import SessionJanitor
+        from infrastructure.bootstrap import _build_session_janitor
+
+        monkeypatch.setenv("SESSION_JANITOR_INTERVAL_SECONDS", "60")
+        monkeypatch.setenv("SESSION_JANITOR_BATCH_SIZE", "250")
+
+        janitor = _build_session_janitor(MagicMock(), MagicMock())
+
+        assert isinstance(janitor, SessionJanitor)
+        assert janitor.interval_seconds == 60
+        assert janitor.batch_size == 250
+        assert not janitor.running
+
+    def test_zero_interval_disables_janitor(self, monkeypatch) -> None:
+        from unittest.mock import MagicMock
+
+        from infrastructure.bootstrap import _build_session_janitor
+
+        monkeypatch.setenv("SESSION_JANITOR_INTERVAL_SECONDS", "0")
+
+        assert _build_session_janitor(MagicMock(), MagicMock()) is None
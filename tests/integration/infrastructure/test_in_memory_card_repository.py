@@ -19,6 +19,9 @@ def make_card(
     card_id: str,
     owner_id: str = "u1",
     seed: int = 123,
+    visibility: Visibility = Visibility.PRIVATE,
+    shared_with: frozenset[str] = frozenset(),
+    name: str = "",
 ) -> Card:
     """Create a valid Card for testing."""
     table = TableSize.standard()
@@ -27,12 +30,13 @@ def make_card(
     return Card(
         card_id=card_id,
         owner_id=owner_id,
-        visibility=Visibility.PRIVATE,
-        shared_with=frozenset(),
+        visibility=visibility,
+        shared_with=shared_with,
         mode=GameMode.MATCHED,
         seed=seed,
         table=table,
         map_spec=map_spec,
+        name=name,
     )
 
 
@@ -100,6 +104,28 @@ class TestInMemoryCardRepositorySaveAndGet:
         all_cards = repo.list_all()
         assert len(all_cards) == 1
 
+    def test_save_many_saves_batch_last_write_wins(self) -> None:
+        """save_many stores every card; a repeated card_id keeps the last one."""
+        from infrastructure.repositories.in_memory_card_repository import (
+            InMemoryCardRepository,
+        )
+
+        # Arrange
+        repo = InMemoryCardRepository()
+        cards = [
+            make_card(card_id="c1", owner_id="u1"),
+            make_card(card_id="c2", owner_id="u1"),
+            make_card(card_id="c1", owner_id="u2"),
+        ]
+
+        # Act
+        repo.save_many(cards)
+
+        # Assert
+        assert [c.card_id for c in repo.list_all()] == ["c1", "c2"]
+        assert repo.get_by_id("c1").owner_id == "u2"  # type: ignore[union-attr]
+        assert [c.card_id for c in repo.list_for_owner("u1")] == ["c2"]
+
 
 # =============================================================================
 # LIST_ALL TESTS
@@ -216,6 +242,28 @@ class TestInMemoryCardRepositoryFindBySeed:
         assert result is not None
         assert result.card_id == "c1"  # first inserted
 
+    def test_find_by_seed_follows_overwrites_and_deletes(self) -> None:
+        """The seed index tracks seed changes and deletions."""
+        from infrastructure.repositories.in_memory_card_repository import (
+            InMemoryCardRepository,
+        )
+
+        repo = InMemoryCardRepository()
+        repo.save(make_card(card_id="c1", seed=42))
+        repo.save(make_card(card_id="c2", seed=42))
+        repo.save(make_card(card_id="c1", seed=42, name="renamed"))
+
+        first = repo.find_by_seed(42)
+        assert first is not None
+        assert (first.card_id, first.name) == ("c1", "renamed")
+
+        repo.save(make_card(card_id="c1", seed=7))
+        assert repo.find_by_seed(42).card_id == "c2"  # type: ignore[union-attr]
+        assert repo.find_by_seed(7).card_id == "c1"  # type: ignore[union-attr]
+
+        repo.delete("c2")
+        assert repo.find_by_seed(42) is None
+
     def test_find_by_seed_empty_repo(self) -> None:
         """find_by_seed returns None for an empty repository."""
         from infrastructure.repositories.in_memory_card_repository import (
@@ -226,6 +274,175 @@ class TestInMemoryCardRepositoryFindBySeed:
         assert repo.find_by_seed(42) is None
 
 
+# =============================================================================
+# LIST_VISIBLE TESTS
+# =============================================================================
+class TestInMemoryCardRepositoryListVisible:
+    """Tests for the indexed list_visible query."""
+
+    def _repo(self):
+        from infrastructure.repositories.in_memory_card_repository import (
+            InMemoryCardRepository,
+        )
+
+        return InMemoryCardRepository()
+
+    def test_mine_returns_owned_cards_sorted_by_id(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c3", owner_id="u1"))
+        repo.save(make_card("c1", owner_id="u1", visibility=Visibility.PUBLIC))
+        repo.save(make_card("c2", owner_id="u2"))
+
+        ids = [c.card_id for c in repo.list_visible("u1", "mine")]
+
+        assert ids == ["c1", "c3"]
+
+    def test_public_returns_public_cards_of_any_owner(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c1", owner_id="u1", visibility=Visibility.PUBLIC))
+        repo.save(make_card("c2", owner_id="u2", visibility=Visibility.PUBLIC))
+        repo.save(make_card("c3", owner_id="u2"))
+
+        ids = [c.card_id for c in repo.list_visible("u9", "public")]
+
+        assert ids == ["c1", "c2"]
+
+    def test_shared_with_me_uses_grantee_index(self) -> None:
+        repo = self._repo()
+        repo.save(
+            make_card(
+                "c1",
+                owner_id="u1",
+                visibility=Visibility.SHARED,
+                shared_with=frozenset({"u2"}),
+            )
+        )
+        repo.save(
+            make_card(
+                "c2",
+                owner_id="u1",
+                visibility=Visibility.SHARED,
+                shared_with=frozenset({"u3"}),
+            )
+        )
+
+        ids = [c.card_id for c in repo.list_visible("u2", "shared_with_me")]
+
+        assert ids == ["c1"]
+
+    def test_overwrite_moves_card_between_indexes(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c1", owner_id="u1", visibility=Visibility.PUBLIC))
+        repo.save(make_card("c1", owner_id="u1", visibility=Visibility.PRIVATE))
+
+        assert repo.list_visible("u9", "public") == []
+        assert [c.card_id for c in repo.list_visible("u1", "mine")] == ["c1"]
+
+    def test_delete_removes_card_from_indexes(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c1", owner_id="u1", visibility=Visibility.PUBLIC))
+
+        repo.delete("c1")
+
+        assert repo.list_visible("u1", "mine") == []
+        assert repo.list_visible("u1", "public") == []
+
+    def test_cursor_and_limit_page_through_results(self) -> None:
+        repo = self._repo()
+        for cid in ("c1", "c2", "c3", "c4", "c5"):
+            repo.save(make_card(cid, owner_id="u1"))
+
+        first = repo.list_visible("u1", "mine", limit=2)
+        second = repo.list_visible("u1", "mine", limit=2, cursor=first[-1].card_id)
+        rest = repo.list_visible("u1", "mine", cursor=second[-1].card_id)
+
+        assert [c.card_id for c in first] == ["c1", "c2"]
+        assert [c.card_id for c in second] == ["c3", "c4"]
+        assert [c.card_id for c in rest] == ["c5"]
+
+    def test_unknown_filter_returns_empty(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c1", owner_id="u1"))
+
+        assert repo.list_visible("u1", "everything") == []
+
+    def test_name_query_uses_trigram_index(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c1", name="Batalla de Osgiliath"))
+        repo.save(make_card("c2", name="Minas Tirith"))
+        repo.save(make_card("c3", name="Alcantarillas de OSGILIATH"))
+        repo.save(make_card("c4", owner_id="u2", name="Osgiliath ruins"))
+
+        ids = [c.card_id for c in repo.list_visible("u1", "mine", name_query="osgil")]
+
+        assert ids == ["c1", "c3"]
+
+    def test_name_query_candidates_respect_cursor_and_limit(self) -> None:
+        repo = self._repo()
+        for cid in ("c1", "c2", "c3", "c4"):
+            repo.save(make_card(cid, name=f"Osgiliath {cid}"))
+        for cid in ("d1", "d2", "d3", "d4", "d5", "d6"):
+            repo.save(make_card(cid, name="Minas Tirith"))
+
+        first = repo.list_visible("u1", "mine", limit=2, name_query="osg")
+        rest = repo.list_visible(
+            "u1", "mine", cursor=first[-1].card_id, name_query="osg"
+        )
+
+        assert [c.card_id for c in first] == ["c1", "c2"]
+        assert [c.card_id for c in rest] == ["c3", "c4"]
+
+    def test_short_name_query_falls_back_to_scan(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c1", name="Osgiliath"))
+        repo.save(make_card("c2", name="Minas Tirith"))
+
+        ids = [c.card_id for c in repo.list_visible("u1", "mine", name_query="Mi")]
+
+        assert ids == ["c2"]
+
+    def test_rename_reindexes_name(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c1", name="Osgiliath"))
+        repo.save(make_card("c1", name="Minas Tirith"))
+
+        assert repo.list_visible("u1", "mine", name_query="osgil") == []
+        assert len(repo.list_visible("u1", "mine", name_query="tirith")) == 1
+
+    def test_get_many_returns_found_cards_sorted(self) -> None:
+        repo = self._repo()
+        for cid in ("c3", "c1", "c2"):
+            repo.save(make_card(cid))
+
+        ids = [c.card_id for c in repo.get_many(["c3", "missing", "c1", "c3"])]
+
+        assert ids == ["c1", "c3"]
+        assert repo.get_many([]) == []
+
+    def test_summaries_mirror_full_cards(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c2", owner_id="u1", seed=7, name="Osgiliath"))
+        repo.save(make_card("c1", owner_id="u1", visibility=Visibility.PUBLIC))
+
+        summaries = repo.list_visible_summaries("u1", "mine", name_query="osgil")
+        by_id = repo.get_summaries(["c2", "missing", "c1"])
+
+        assert [s.card_id for s in summaries] == ["c2"]
+        assert summaries[0].seed == 7
+        assert summaries[0].name == "Osgiliath"
+        assert not hasattr(summaries[0], "map_spec")
+        assert [s.card_id for s in by_id] == ["c1", "c2"]
+        assert by_id[0].can_user_read("u9")
+        assert not by_id[1].can_user_read("u9")
+
+    def test_deleted_card_not_found_by_name(self) -> None:
+        repo = self._repo()
+        repo.save(make_card("c1", name="Osgiliath"))
+        repo.delete("c1")
+
+        assert repo.list_visible("u1", "mine", name_query="osgil") == []
+
+
 # =============================================================================
 # ISOLATION TESTS
 # =============================================================================
@@ -220,6 +220,29 @@ class TestInMemoryFavoritesRepositoryRemoveAllForCard:
         repo.remove_all_for_card("c1")  # should not raise
 
 
+# =============================================================================
+# REMOVE_FAVORITES TESTS
+# =============================================================================
+class TestInMemoryFavoritesRepositoryRemoveFavorites:
+    """Tests for the bulk remove_favorites operation."""
+
+    def test_removes_only_given_ids_for_actor(self) -> None:
+        """remove_favorites unsets the listed ids of one actor only."""
+        from infrastructure.repositories.in_memory_favorites_repository import (
+            InMemoryFavoritesRepository,
+        )
+
+        repo = InMemoryFavoritesRepository()
+        for card_id in ("c1", "c2", "c3"):
+            repo.set_favorite("u1", card_id, True)
+        repo.set_favorite("u2", "c1", True)
+
+        repo.remove_favorites("u1", ["c1", "c3", "missing"])
+
+        assert repo.list_favorites("u1") == ["c2"]
+        assert repo.list_favorites("u2") == ["c1"]
+
+
 # =============================================================================
 # ISOLATION TESTS
 # =============================================================================
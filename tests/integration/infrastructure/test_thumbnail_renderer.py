@@ -0,0 +1,111 @@
+"""Integration tests for SvgThumbnailRenderer (batch list-page previews)."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from infrastructure.maps.svg_render_cache import LruSvgCache
+from infrastructure.maps.thumbnail_renderer import (
+    SvgThumbnailRenderer,
+    make_thumbnail_executor,
+    render_thumbnail_svg,
+)
+
+TABLE = {"width_mm": 1200, "height_mm": 800}
+LABELED = [
+    {
+        "type": "rect",
+        "x": 100,
+        "y": 100,
+        "width": 200,
+        "height": 200,
+        "description": "Deployment A",
+    }
+]
+
+
+def _maps(n: int) -> list[tuple[dict, list[dict]]]:
+    return [
+        (TABLE, [{"type": "circle", "cx": 100 + i, "cy": 100, "r": 50}])
+        for i in range(n)
+    ]
+
+
+class CountingCache(LruSvgCache):
+    """LruSvgCache that counts stores."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.puts = 0
+
+    def put(self, key: str, svg: str) -> None:
+        self.puts += 1
+        super().put(key, svg)
+
+
+class TestRenderThumbnailSvg:
+    def test_downscales_viewport_and_keeps_viewbox(self):
+        svg = render_thumbnail_svg(TABLE, LABELED, 100)
+
+        assert svg.startswith('<svg xmlns="http://www.w3.org/2000/svg" ')
+        assert 'width="100" height="67" viewBox="0 0 1200 800"' in svg
+        assert "<rect" in svg
+
+    def test_drops_shape_labels(self):
+        svg = render_thumbnail_svg(TABLE, LABELED, 100)
+
+        assert "Deployment A" not in svg
+        assert "<text" not in svg
+
+
+class TestSvgThumbnailRenderer:
+    def test_returns_one_thumbnail_per_map_in_order(self):
+        maps = _maps(3)
+        thumbs = SvgThumbnailRenderer().render_many(maps)
+
+        assert thumbs == [render_thumbnail_svg(t, s, 100) for t, s in maps]
+
+    def test_identical_maps_render_once(self):
+        cache = CountingCache()
+        renderer = SvgThumbnailRenderer(cache=cache)
+
+        thumbs = renderer.render_many(_maps(1) * 3)
+
+        assert len(set(thumbs)) == 1
+        assert cache.puts == 1
+
+    def test_second_page_load_is_served_from_cache(self):
+        cache = CountingCache()
+        renderer = SvgThumbnailRenderer(cache=cache)
+
+        first = renderer.render_many(_maps(4))
+        second = renderer.render_many(_maps(4))
+
+        assert first == second
+        assert cache.puts == 4
+
+    def test_large_batches_use_the_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            renderer = SvgThumbnailRenderer(executor=pool, parallel_threshold=2)
+            pooled = renderer.render_many(_maps(5))
+
+        assert pooled == SvgThumbnailRenderer().render_many(_maps(5))
+
+    def test_process_pool_renders_batch(self):
+        executor = make_thumbnail_executor("process", 2)
+        assert executor is not None
+        with executor:
+            renderer = SvgThumbnailRenderer(executor=executor, parallel_threshold=1)
+            pooled = renderer.render_many(_maps(2))
+
+        assert pooled == SvgThumbnailRenderer().render_many(_maps(2))
+
+
+class TestMakeThumbnailExecutor:
+    def test_none_means_serial(self):
+        assert make_thumbnail_executor("none") is None
+
+    def test_unknown_kind_raises(self):
+        with pytest.raises(ValueError):
+            make_thumbnail_executor("gpu")
@@ -0,0 +1,55 @@
+"""Unit tests for the cold-start report CLI (adapters.startup_report)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from adapters import startup_report
+
+_REPORT = {
+    "import_seconds": 2.5,
+    "phases": {"flask": 0.01, "gradio": 0.3, "mount": 0.05},
+    "total_seconds": 2.9,
+    "import_packages": [{"package": "gradio", "seconds": 1.9}],
+    "import_modules": [{"module": "gradio.templates", "seconds": 0.26}],
+}
+
+
+@pytest.fixture()
+def measured(monkeypatch):
+    monkeypatch.setattr(startup_report, "measure_startup", lambda top: dict(_REPORT))
+
+
+def test_format_report_lists_phases_and_imports():
+    text = startup_report.format_report(_REPORT)
+
+    assert "cold start         2.900s" in text
+    assert "  gradio           0.300s" in text
+    assert "1.900s  gradio" in text
+    assert "0.260s  gradio.templates" in text
+
+
+def test_within_budget_exits_zero(measured, capsys):
+    assert startup_report.main(["--budget", "5", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["budget_seconds"] == 5
+
+
+def test_over_budget_exits_one(measured, capsys):
+    assert startup_report.main(["--budget", "1"]) == 1
+    assert "over budget" in capsys.readouterr().err
+
+
+def test_budget_from_env(measured, monkeypatch):
+    monkeypatch.setenv("STARTUP_BUDGET_SECONDS", "1")
+    assert startup_report.main([]) == 1
+
+
+def test_startup_failure_exits_two(monkeypatch, capsys):
+    def _fail(top):
+        raise RuntimeError("app failed to start (exit 1)")
+
+    monkeypatch.setattr(startup_report, "measure_startup", _fail)
+
+    assert startup_report.main([]) == 2
+    assert "failed to start" in capsys.readouterr().err
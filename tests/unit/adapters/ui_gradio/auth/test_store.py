@@ -64,7 +64,14 @@ class TestPasswordHashing:
 # Demo users
 # =====================================================================
 class TestDemoUsers:
-    """Demo users must be seeded on import."""
+    """Demo users are seeded lazily, on first use of the store."""
+
+    def test_not_seeded_until_first_use(self):
+        from infrastructure.auth import user_store
+
+        assert user_store._USERS == {}
+        assert user_exists("alice") is True
+        assert set(user_store._USERS) >= {"demo-user", "alice", "bob"}
 
     @pytest.mark.parametrize(
         "username",
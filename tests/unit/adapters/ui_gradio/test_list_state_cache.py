@@ -0,0 +1,166 @@
+"""Unit tests for adapters.ui_gradio.list_state_cache.
+
+Contract:
+1. put() allocates a handle (or reuses the given one); get() resolves it
+2. A handle only resolves for the actor that stored it
+3. Entries expire after the TTL since last use and are LRU-bounded
+4. invalidate_actor / invalidate_all mark entries stale, keeping cursors;
+   a put based on a read older than the invalidation stays stale
+5. The process-wide cache is built from env, falling back to defaults
+"""
+
+from __future__ import annotations
+
+import pytest
+from adapters.ui_gradio import list_state_cache as lsc
+from adapters.ui_gradio.list_state_cache import ListState, ListStateCache
+
+from tests.helpers.fake_clock import FakeClock
+
+
+def _state(actor_id: str = "u1", fav_ids: list[str] | None = None) -> ListState:
+    cache = {"cards": [{"card_id": "c1"}], "cursors": [None, "c0"], "next_cursor": None}
+    return ListState(actor_id, cache, fav_ids if fav_ids is not None else ["c1"])
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def cache(clock: FakeClock) -> ListStateCache:
+    return ListStateCache(ttl_seconds=60, max_entries=3, clock=clock)
+
+
+class TestHandles:
+    def test_put_allocates_distinct_handles(self, cache):
+        first = cache.put(_state())
+        second = cache.put(_state())
+        assert first and second and first != second
+        assert cache.get(first, "u1") == _state()
+
+    def test_put_reuses_given_handle(self, cache):
+        handle = cache.put(_state())
+        assert cache.put(_state(fav_ids=["c9"]), handle) == handle
+        assert cache.get(handle, "u1").fav_ids == ["c9"]
+        assert len(cache) == 1
+
+    @pytest.mark.parametrize("handle", ["", None, {}, "unknown"])
+    def test_unknown_handle_is_a_miss(self, cache, handle):
+        assert cache.get(handle, "u1") is None
+
+    def test_other_actor_cannot_resolve_handle(self, cache):
+        handle = cache.put(_state("u1"))
+        assert cache.get(handle, "u2") is None
+        assert cache.get(handle, "u1") is not None
+
+
+class TestBounds:
+    def test_entry_expires_after_idle_ttl(self, cache, clock):
+        handle = cache.put(_state())
+        clock.advance(seconds=61)
+        assert cache.get(handle, "u1") is None
+        assert len(cache) == 0
+
+    def test_use_refreshes_ttl(self, cache, clock):
+        handle = cache.put(_state())
+        clock.advance(seconds=40)
+        assert cache.get(handle, "u1") is not None
+        clock.advance(seconds=40)
+        assert cache.get(handle, "u1") is not None
+
+    def test_least_recently_used_is_evicted(self, cache):
+        handles = [cache.put(_state()) for _ in range(3)]
+        cache.get(handles[0], "u1")
+        cache.put(_state())
+        assert len(cache) == 3
+        assert cache.get(handles[1], "u1") is None
+        assert cache.get(handles[0], "u1") is not None
+
+    def test_expired_entries_dropped_on_put(self, cache, clock):
+        cache.put(_state())
+        clock.advance(seconds=61)
+        cache.put(_state())
+        assert len(cache) == 1
+
+    @pytest.mark.parametrize(
+        ("ttl", "max_entries"), [(0, 10), (-1, 10), (60, 0), (60, -5)]
+    )
+    def test_invalid_settings_rejected(self, ttl, max_entries):
+        with pytest.raises(ValueError, match="invalid list state cache settings"):
+            ListStateCache(ttl_seconds=ttl, max_entries=max_entries)
+
+
+class TestInvalidation:
+    def test_invalidate_actor_marks_only_that_actor(self, cache):
+        mine = cache.put(_state("u1"))
+        theirs = cache.put(_state("u2"))
+        cache.invalidate_actor("u1")
+
+        stale = cache.get(mine, "u1")
+        assert stale.stale and stale.fav_ids is None
+        assert stale.page_cache["cursors"] == [None, "c0"]
+        assert not cache.get(theirs, "u2").stale
+
+    def test_invalidate_all_marks_every_entry(self, cache):
+        handles = [cache.put(_state("u1")), cache.put(_state("u2"))]
+        cache.invalidate_all()
+        assert cache.get(handles[0], "u1").stale
+        assert cache.get(handles[1], "u2").stale
+
+    def test_put_after_invalidation_is_fresh(self, cache):
+        handle = cache.put(_state())
+        cache.invalidate_all()
+        cache.put(_state(), handle)
+        assert not cache.get(handle, "u1").stale
+
+    def test_put_read_before_invalidation_stays_stale(self, cache):
+        handle = cache.put(_state())
+        read = cache.get(handle, "u1")
+        cache.invalidate_actor("u1")  # lands while the caller fetches
+
+        cache.put(_state(), handle, read_version=read.version)
+
+        stored = cache.get(handle, "u1")
+        assert stored.stale and stored.fav_ids is None
+        assert stored.page_cache == _state().page_cache
+
+    def test_put_read_after_invalidation_is_fresh(self, cache):
+        handle = cache.put(_state())
+        cache.invalidate_all()
+        read = cache.get(handle, "u1")
+
+        cache.put(_state(), handle, read_version=read.version)
+
+        assert not cache.get(handle, "u1").stale
+        cache.invalidate_all()
+        assert cache.get(handle, "u1").version == read.version + 1
+
+
+class TestProcessWideCache:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        lsc.configure_list_state_cache(None)
+        yield
+        lsc.configure_list_state_cache(None)
+
+    def test_configured_cache_is_returned(self, cache):
+        lsc.configure_list_state_cache(cache)
+        assert lsc.get_list_state_cache() is cache
+
+    def test_built_from_env(self, monkeypatch):
+        monkeypatch.setenv("LIST_STATE_TTL_SECONDS", "5")
+        monkeypatch.setenv("LIST_STATE_MAX_ENTRIES", "1")
+        built = lsc.get_list_state_cache()
+        built.put(_state())
+        built.put(_state())
+        assert len(built) == 1
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [("LIST_STATE_TTL_SECONDS", "soon"), ("LIST_STATE_MAX_ENTRIES", "0")],
+    )
+    def test_invalid_env_falls_back_to_defaults(self, monkeypatch, name, value):
+        monkeypatch.setenv(name, value)
+        assert isinstance(lsc.get_list_state_cache(), ListStateCache)
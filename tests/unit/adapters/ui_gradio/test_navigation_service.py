@@ -9,6 +9,7 @@ from adapters.ui_gradio.services.navigation import (
     get_card,
     get_card_svg,
     list_cards,
+    list_favorite_cards,
     list_favorites,
     toggle_favorite,
 )
@@ -62,6 +63,29 @@ class TestListCards:
         assert len(result["cards"]) == 1
         assert result["cards"][0]["card_id"] == "c1"
 
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_page_criteria_forwarded(self, mock_get):
+        uc = MagicMock()
+        resp = MagicMock()
+        resp.cards = [_card_snapshot(card_id="c1")]
+        resp.next_cursor = "c1"
+        uc.execute.return_value = resp
+        mock_get.return_value = MagicMock(list_cards=uc)
+
+        result = list_cards(
+            "actor1",
+            "public",
+            limit=1,
+            cursor="c0",
+            name_query="osg",
+            mode="matched",
+            table_preset="standard",
+        )
+        req = uc.execute.call_args.args[0]
+        assert (req.limit, req.cursor, req.name_query) == (1, "c0", "osg")
+        assert (req.mode, req.table_preset) == ("matched", "standard")
+        assert result["next_cursor"] == "c1"
+
     @patch("adapters.ui_gradio.services.navigation.get_services")
     def test_error_status(self, mock_get):
         uc = MagicMock()
@@ -79,6 +103,53 @@ class TestListCards:
         assert result["status"] == "error"
 
 
+class TestPageThumbnails:
+    """Paged listings attach one batch of map thumbnails."""
+
+    @staticmethod
+    def _services(thumbnails_uc):
+        uc = MagicMock()
+        resp = MagicMock()
+        resp.cards = [_card_snapshot(card_id="c1"), _card_snapshot(card_id="c2")]
+        resp.next_cursor = None
+        uc.execute.return_value = resp
+        return MagicMock(list_cards=uc, render_card_thumbnails=thumbnails_uc)
+
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_page_gets_thumbnails_in_one_call(self, mock_get):
+        thumbs = MagicMock()
+        thumbs.execute.return_value = MagicMock(thumbnails={"c1": "<svg/>"})
+        mock_get.return_value = self._services(thumbs)
+
+        result = list_cards("actor1", "public", limit=10)
+
+        req = thumbs.execute.call_args.args[0]
+        assert (req.actor_id, list(req.card_ids)) == ("actor1", ["c1", "c2"])
+        assert thumbs.execute.call_count == 1
+        assert result["cards"][0]["thumbnail_svg"] == "<svg/>"
+        assert "thumbnail_svg" not in result["cards"][1]
+
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_thumbnail_failure_keeps_cards(self, mock_get):
+        thumbs = MagicMock()
+        thumbs.execute.side_effect = RuntimeError("renderer down")
+        mock_get.return_value = self._services(thumbs)
+
+        result = list_cards("actor1", "public", limit=10)
+
+        assert [c["card_id"] for c in result["cards"]] == ["c1", "c2"]
+        assert all("thumbnail_svg" not in c for c in result["cards"])
+
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_unpaged_listing_skips_thumbnails(self, mock_get):
+        thumbs = MagicMock()
+        mock_get.return_value = self._services(thumbs)
+
+        list_cards("actor1", "public")
+
+        thumbs.execute.assert_not_called()
+
+
 class TestGetCard:
     """get_card() via direct use-case call."""
 
@@ -133,6 +204,14 @@ class TestToggleFavorite:
         result = toggle_favorite("actor1", "c1")
         assert result["is_favorite"] is True
 
+    @patch("adapters.ui_gradio.services.navigation.get_list_state_cache")
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_invalidates_actor_list_state(self, mock_get, mock_cache):
+        mock_get.return_value = MagicMock(toggle_favorite=MagicMock())
+
+        toggle_favorite("actor1", "c1")
+        mock_cache.return_value.invalidate_actor.assert_called_once_with("actor1")
+
     @patch("adapters.ui_gradio.services.navigation.get_services")
     def test_error(self, mock_get):
         uc = MagicMock()
@@ -158,6 +237,24 @@ class TestDeleteCard:
         result = delete_card("actor1", "c1")
         assert result == {"card_id": "c1", "deleted": True}
 
+    @patch("adapters.ui_gradio.services.navigation.get_list_state_cache")
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_invalidates_all_list_state(self, mock_get, mock_cache):
+        mock_get.return_value = MagicMock(delete_card=MagicMock())
+
+        delete_card("actor1", "c1")
+        mock_cache.return_value.invalidate_all.assert_called_once_with()
+
+    @patch("adapters.ui_gradio.services.navigation.get_list_state_cache")
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_failed_delete_keeps_list_state(self, mock_get, mock_cache):
+        uc = MagicMock()
+        uc.execute.side_effect = RuntimeError("fail")
+        mock_get.return_value = MagicMock(delete_card=uc)
+
+        delete_card("actor1", "c1")
+        mock_cache.return_value.invalidate_all.assert_not_called()
+
 
 class TestListFavorites:
     """list_favorites() via direct use-case call."""
@@ -174,6 +271,40 @@ class TestListFavorites:
         assert result == {"card_ids": ["c1", "c2"]}
 
 
+class TestListFavoriteCards:
+    """list_favorite_cards() via direct use-case call."""
+
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_success(self, mock_get):
+        uc = MagicMock()
+        resp = MagicMock()
+        resp.cards = [_card_snapshot(card_id="c1")]
+        resp.next_cursor = "c1"
+        uc.execute.return_value = resp
+        mock_get.return_value = MagicMock(list_favorite_cards=uc)
+
+        result = list_favorite_cards("actor1", limit=1, cursor="c0", name_query="t")
+
+        req = uc.execute.call_args.args[0]
+        assert (req.actor_id, req.limit, req.cursor, req.name_query) == (
+            "actor1",
+            1,
+            "c0",
+            "t",
+        )
+        assert [c["card_id"] for c in result["cards"]] == ["c1"]
+        assert result["next_cursor"] == "c1"
+
+    @patch("adapters.ui_gradio.services.navigation.get_services")
+    def test_error(self, mock_get):
+        uc = MagicMock()
+        uc.execute.side_effect = ValueError("boom")
+        mock_get.return_value = MagicMock(list_favorite_cards=uc)
+
+        result = list_favorite_cards("actor1", limit=10)
+        assert result == {"status": "error", "message": "boom"}
+
+
 class TestGetCardSvg:
     """get_card_svg() via direct use-case call."""
 
@@ -0,0 +1,75 @@
+"""Unit tests for adapters.ui_gradio.profiling (Gradio event profiling)."""
+
+from __future__ import annotations
+
+import inspect
+from types import SimpleNamespace
+
+import pytest
+from adapters.ui_gradio import profiling
+from infrastructure.observability.request_profiler import (
+    RequestProfiler,
+    configure_request_profiler,
+)
+
+
+@pytest.fixture()
+def profiler(tmp_path):
+    configured = RequestProfiler("tok", tmp_path)
+    configure_request_profiler(configured)
+    yield configured
+    configure_request_profiler(None)
+
+
+def _handler(value: str, request=None) -> str:
+    return value.upper()
+
+
+async def _async_handler(value: str) -> str:
+    return value
+
+
+def _blocks(*fns):
+    block_fns = [
+        SimpleNamespace(fn=fn, name=getattr(fn, "__name__", None)) for fn in fns
+    ]
+    return SimpleNamespace(fns=dict(enumerate(block_fns))), block_fns
+
+
+def test_disabled_profiler_leaves_events_untouched():
+    configure_request_profiler(None)
+    blocks, block_fns = _blocks(_handler)
+
+    assert profiling.profile_events(blocks) == 0
+    assert block_fns[0].fn is _handler
+
+
+def test_only_plain_functions_are_wrapped(profiler):
+    blocks, block_fns = _blocks(_handler, _async_handler, None)
+
+    assert profiling.profile_events(blocks) == 1
+    assert block_fns[0].fn is not _handler
+    assert inspect.signature(block_fns[0].fn) == inspect.signature(_handler)
+    assert block_fns[1].fn is _async_handler
+
+
+def test_event_with_token_cookie_is_profiled(profiler, monkeypatch):
+    request = SimpleNamespace(headers={}, cookies={"sb_profile": "tok"})
+    monkeypatch.setattr(profiling, "_event_request", lambda: request)
+    blocks, block_fns = _blocks(_handler)
+    profiling.profile_events(blocks)
+
+    assert block_fns[0].fn("a") == "A"
+    saved = list(profiler.output_dir.glob("*.pstats"))
+    assert len(saved) == 1
+    assert saved[0].name.endswith("-gradio-_handler.pstats")
+
+
+def test_event_without_token_is_not_profiled(profiler, monkeypatch):
+    request = SimpleNamespace(headers={}, cookies={})
+    monkeypatch.setattr(profiling, "_event_request", lambda: request)
+    blocks, block_fns = _blocks(_handler)
+    profiling.profile_events(blocks)
+
+    assert block_fns[0].fn("a") == "A"
+    assert list(profiler.output_dir.glob("*.pstats")) == []
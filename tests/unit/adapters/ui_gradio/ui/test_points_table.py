@@ -0,0 +1,87 @@
+"""
+Unit tests for the points table component (polygon points editor).
+
+The points table must render and convert exactly like gr.Dataframe while
+never importing the pandas Styler (and with it matplotlib) on the startup
+path, nor writing Gradio stubs next to the sources.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import gradio as gr
+import pandas as pd
+import pytest
+from adapters.ui_gradio.ui.components import build_points_table, points_table
+
+SRC = Path(points_table.__file__).resolve().parents[4]
+
+
+def _tables() -> tuple[gr.Dataframe, gr.Dataframe]:
+    kwargs = {
+        "headers": ["x", "y"],
+        "datatype": ["number", "number"],
+        "value": [[60, 30], [100, 70], [20, 70]],
+        "col_count": (2, "fixed"),
+    }
+    return build_points_table(**kwargs), gr.Dataframe(**kwargs)
+
+
+class TestBuildPointsTable:
+    def test_uses_the_dataframe_frontend(self):
+        table, _ = _tables()
+        assert type(table) is gr.Dataframe
+        assert table.get_block_name() == "dataframe"
+
+    def test_initial_value_converted(self):
+        table, reference = _tables()
+        assert table.value == reference.value
+
+    def test_no_gradio_stub_written(self):
+        assert not Path(points_table.__file__).with_suffix(".pyi").exists()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            [],
+            [[1, 2], [3, 4]],
+            [[1, 2, 3]],
+            [[1]],
+            {},
+            {"headers": ["x", "y"], "data": [[5, 6]]},
+            pd.DataFrame([[1, 2]], columns=["x", "y"]),
+            pd.DataFrame(columns=["x", "y"]),
+        ],
+    )
+    def test_converts_like_gradio_dataframe(self, value):
+        table, reference = _tables()
+        assert table.postprocess(value) == reference.postprocess(value)
+
+    def test_building_does_not_import_pandas_styler(self):
+        script = textwrap.dedent(
+            """
+            import sys
+            import gradio as gr
+            from adapters.ui_gradio.ui.sections.scenography_section import (
+                build_scenography_section,
+            )
+            with gr.Blocks():
+                build_scenography_section()
+            assert "pandas.io.formats.style" not in sys.modules
+            assert "matplotlib" not in sys.modules
+            """
+        )
+        result = subprocess.run(  # nosec B603
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(SRC)},
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr[-2000:]
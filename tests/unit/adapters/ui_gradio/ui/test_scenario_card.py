@@ -78,3 +78,19 @@ class TestRenderCardListHtml:
         # c1 should have filled star, c2 empty star
         assert "★" in html
         assert "☆" in html
+
+    def test_thumbnail_replaces_placeholder(self):
+        cards = [
+            {
+                "card_id": "c1",
+                "name": "One",
+                "mode": "m",
+                "owner_id": "u",
+                "thumbnail_svg": '<svg id="thumb"></svg>',
+            },
+            {"card_id": "c2", "name": "Two", "mode": "m", "owner_id": "u"},
+        ]
+        html = render_card_list_html(cards)
+        assert '<svg id="thumb"></svg>' in html
+        assert html.count("card-thumbnail") == 1
+        assert html.count(">?</span>") == 1  # c2 keeps the placeholder
@@ -1,4 +1,4 @@
-"""Unit tests for search_helpers — sanitization, filtering, parsing, pagination.
+"""Unit tests for search_helpers — sanitization, parsing, keyset pagination.
 
 Security-focused tests ensure XSS payloads, edge inputs, and boundary
 values are correctly neutralised or rejected.
@@ -9,16 +9,26 @@ from __future__ import annotations
 from typing import ClassVar
 
 import pytest
+from adapters.ui_gradio.list_state_cache import (
+    ListStateCache,
+    configure_list_state_cache,
+)
 from adapters.ui_gradio.ui.components.search_helpers import (
     DEFAULT_ITEMS_PER_PAGE,
     ITEMS_PER_PAGE_CHOICES,
+    criterion_or_none,
+    cursor_for_page,
+    empty_page_cache,
     escape_html,
-    filter_by_mode_preset,
-    filter_cards_by_name,
+    load_keyset_page,
+    load_page_set_page,
+    open_page_set,
     parse_per_page,
-    render_filtered_page,
-    render_page,
+    render_cached_page,
+    render_keyset_page,
+    render_page_set,
     sanitize_search_query,
+    search_query_param,
     validate_page,
 )
 
@@ -72,50 +82,44 @@ class TestSanitizeSearchQuery:
         assert sanitize_search_query("Señor de los Anillos") == "Señor de los Anillos"
 
 
-# ── filter_cards_by_name ─────────────────────────────────────────
+# ── search_query_param / criterion_or_none ───────────────────────
 
 
-class TestFilterCardsByName:
-    """Substring matching tests."""
+class TestSearchQueryParam:
+    """Search-box input → API ``name_query``."""
 
-    CARDS: ClassVar[list[dict]] = [
-        {"name": "Batalla de Osgiliath", "card_id": "c1"},
-        {"name": "Alcantarillas de Osgiliath", "card_id": "c2"},
-        {"name": "Minas Tirith", "card_id": "c3"},
-        {"name": None, "card_id": "c4"},
-        {"card_id": "c5"},  # no name field
-    ]
+    def test_empty_returns_none(self):
+        assert search_query_param("") is None
+        assert search_query_param("   ") is None
+
+    def test_none_returns_none(self):
+        assert search_query_param(None) is None  # type: ignore[arg-type]
 
-    def test_empty_query_returns_all(self):
-        result = filter_cards_by_name(self.CARDS, "")
-        assert len(result) == len(self.CARDS)
+    def test_plain_text_passes_through(self):
+        assert search_query_param("Osgiliath") == "Osgiliath"
 
-    def test_case_insensitive_match(self):
-        result = filter_cards_by_name(self.CARDS, "osgiliath")
-        assert len(result) == 2
+    def test_tags_stripped(self):
+        assert search_query_param("<b>alert</b>") == "alert"
 
-    def test_partial_match(self):
-        result = filter_cards_by_name(self.CARDS, "Minas")
-        assert len(result) == 1
-        assert result[0]["card_id"] == "c3"
+    def test_escaped_chars_unescaped_for_matching(self):
+        assert search_query_param("A & B") == "A & B"
+
+    def test_length_capped(self):
+        result = search_query_param("x" * 300)
+        assert result is not None
+        assert len(result) == 200
 
-    def test_no_match_returns_empty(self):
-        result = filter_cards_by_name(self.CARDS, "Mordor")
-        assert result == []
 
-    def test_cards_without_name_skipped(self):
-        result = filter_cards_by_name(self.CARDS, "Batalla")
-        assert all(c.get("name") for c in result)
+class TestCriterionOrNone:
+    """Filter-radio value → API criterion."""
 
-    def test_html_escaped_query_still_matches(self):
-        # sanitize_search_query escapes & to &amp;
-        # filter_cards_by_name should unescape before matching
-        cards = [{"name": "A & B", "card_id": "x"}]
-        result = filter_cards_by_name(cards, "&amp;")
-        assert len(result) == 1
+    @pytest.mark.parametrize("value", ["All", "", "  ", None, 3])
+    def test_no_restriction(self, value):
+        assert criterion_or_none(value) is None
 
-    def test_empty_cards_list(self):
-        assert filter_cards_by_name([], "anything") == []
+    def test_lower_cased(self):
+        assert criterion_or_none("Matched") == "matched"
+        assert criterion_or_none(" Standard ") == "standard"
 
 
 # ── parse_per_page ───────────────────────────────────────────────
@@ -145,81 +149,257 @@ class TestParsePerPage:
         assert parse_per_page("") == DEFAULT_ITEMS_PER_PAGE
 
 
-# ── render_page ──────────────────────────────────────────────────
+# ── render_keyset_page ───────────────────────────────────────────
+
 
+def _make_cards(n: int, start: int = 0) -> list[dict]:
+    return [
+        {"card_id": f"c{i:02d}", "name": f"Card {i}"} for i in range(start, start + n)
+    ]
 
-class TestRenderPage:
-    """Pagination rendering logic."""
 
-    def _make_cards(self, n: int) -> list[dict]:
-        return [{"card_id": f"c{i}", "name": f"Card {i}"} for i in range(n)]
+class TestRenderKeysetPage:
+    """Rendering of one already-fetched page."""
 
-    def test_empty_cards_returns_empty_html(self):
-        html, info, page = render_page([], [], "cm", 1, 10)
+    def test_empty_first_page_returns_empty_html(self):
+        html, info = render_keyset_page([], [], "cm", 1, False)
         assert "No scenarios match" in html
-        assert page == 1
+        assert "Page 1 of 1" in info
 
     def test_custom_empty_message(self):
-        html, _, _ = render_page([], [], "cm", 1, 10, empty_message="Nothing here!")
-        assert "Nothing here!" in html
+        html, _ = render_keyset_page([], [], "cm", 1, False, empty_message="Nothing!")
+        assert "Nothing!" in html
 
-    def test_single_page(self):
-        cards = self._make_cards(5)
-        html, info, page = render_page(cards, [], "cm", 1, 10)
+    def test_single_page_shows_total(self):
+        _, info = render_keyset_page(_make_cards(3), [], "cm", 1, False)
         assert "Page 1 of 1" in info
-        assert "(5 scenarios)" in info
-        assert page == 1
+        assert "(3 scenarios)" in info
 
-    def test_multi_page_first(self):
-        cards = self._make_cards(25)
-        html, info, page = render_page(cards, [], "cm", 1, 10)
-        assert "Page 1 of 3" in info
-        assert "(25 scenarios)" in info
-        assert page == 1
+    def test_more_pages_shows_page_number_only(self):
+        _, info = render_keyset_page(_make_cards(10), [], "cm", 2, True)
+        assert "Page 2" in info
+        assert " of " not in info
 
-    def test_multi_page_last(self):
-        cards = self._make_cards(25)
-        html, info, page = render_page(cards, [], "cm", 3, 10)
+    def test_last_page_shows_page_count(self):
+        _, info = render_keyset_page(_make_cards(2), [], "cm", 3, False)
         assert "Page 3 of 3" in info
-        assert page == 3
-
-    def test_page_clamped_to_max(self):
-        cards = self._make_cards(5)
-        _, _, page = render_page(cards, [], "cm", 99, 10)
-        assert page == 1  # only 1 page exists
-
-    def test_page_clamped_to_min(self):
-        cards = self._make_cards(5)
-        _, _, page = render_page(cards, [], "cm", 0, 10)
-        assert page == 1
 
     def test_custom_count_label(self):
-        cards = self._make_cards(3)
-        _, info, _ = render_page(cards, [], "cm", 1, 10, count_label="favorites")
+        _, info = render_keyset_page(
+            _make_cards(3), [], "cm", 1, False, count_label="favorites"
+        )
         assert "(3 favorites)" in info
 
-    def test_exact_page_boundary(self):
-        cards = self._make_cards(10)
-        _, info, page = render_page(cards, [], "cm", 1, 10)
-        assert "Page 1 of 1" in info
+    def test_cards_rendered(self):
+        html, _ = render_keyset_page(_make_cards(2), ["c00"], "cm", 1, False)
+        assert "c00" in html
+        assert "c01" in html
+
+
+# ── open_page_set / load_page_set_page / render_page_set ─────────
+
+
+class TestPageSets:
+    """Handle-based page-sets backed by the list-state cache."""
+
+    @pytest.fixture(autouse=True)
+    def _cache(self):
+        self.cache = ListStateCache()
+        configure_list_state_cache(self.cache)
+        yield
+        configure_list_state_cache(None)
+
+    def _fav_loader(self, ids: list[str]):
+        self.fav_loads = 0
+
+        def _load() -> list[str]:
+            self.fav_loads += 1
+            return ids
+
+        return _load
+
+    def test_open_allocates_handle_and_stores_page(self):
+        api = _FakeApi(12, 5)
+        html, _, page, handle = open_page_set(api, "u1", "cm")
+        assert handle and page == 1 and "c00" in html
+        state = self.cache.get(handle, "u1")
+        assert state.page_cache["next_cursor"] == "c04"
+        assert state.fav_ids is None
+
+    def test_walk_pages_through_handle(self):
+        api = _FakeApi(12, 5)
+        *_, handle = open_page_set(api, "u1", "cm")
+        _, _, page, same = load_page_set_page(api, "u1", "cm", 2, handle)
+        assert (page, same) == (2, handle)
+        assert api.cursors == [None, "c04"]
+
+    def test_unknown_handle_starts_on_page_one(self):
+        api = _FakeApi(12, 5)
+        _, _, page, handle = load_page_set_page(api, "u1", "cm", 3, "gone")
+        assert page == 1 and handle == "gone"
+        assert api.cursors == [None]
+
+    def test_fav_ids_loaded_once_per_page_set(self):
+        api = _FakeApi(12, 5)
+        load = self._fav_loader(["c01"])
+        *_, handle = open_page_set(api, "u1", "cm", load_fav_ids=load)
+        load_page_set_page(api, "u1", "cm", 2, handle, load_fav_ids=load)
+        open_page_set(api, "u1", "cm", handle, load_fav_ids=load)
+        assert self.fav_loads == 1
+
+    def test_render_serves_from_cache(self):
+        api = _FakeApi(12, 5)
+        *_, handle = open_page_set(api, "u1", "cm")
+        html, _, page, _ = render_page_set(api, "u1", "in", 1, handle)
+        assert page == 1 and "c00" in html
+        assert api.cursors == [None]
+
+    def test_render_refetches_current_page_when_stale(self):
+        api = _FakeApi(12, 5)
+        load = self._fav_loader(["c05"])
+        *_, handle = open_page_set(api, "u1", "cm", load_fav_ids=load)
+        load_page_set_page(api, "u1", "cm", 2, handle, load_fav_ids=load)
+        self.cache.invalidate_actor("u1")
+
+        _, _, page, _ = render_page_set(api, "u1", "in", 2, handle, load_fav_ids=load)
+        assert page == 2
+        assert api.cursors == [None, "c04", "c04"]
+        assert self.fav_loads == 2
+
+    @pytest.mark.parametrize("open_first", [True, False])
+    def test_invalidation_during_fetch_is_kept(self, open_first):
+        api = _FakeApi(12, 5)
+        load = self._fav_loader(["c01"])
+        *_, handle = open_page_set(api, "u1", "cm", load_fav_ids=load)
+
+        def fetch(cursor):
+            page = api(cursor)
+            self.cache.invalidate_actor("u1")  # a favorite toggled meanwhile
+            return page
+
+        if open_first:
+            open_page_set(fetch, "u1", "cm", handle, load_fav_ids=load)
+        else:
+            load_page_set_page(fetch, "u1", "cm", 2, handle, load_fav_ids=load)
+
+        state = self.cache.get(handle, "u1")
+        assert state.stale and state.fav_ids is None
+
+    def test_other_actor_gets_own_page_set(self):
+        api = _FakeApi(12, 5)
+        *_, handle = open_page_set(api, "u1", "cm")
+        load_page_set_page(api, "u1", "cm", 2, handle)
+        _, _, page, _ = load_page_set_page(api, "u2", "cm", 2, handle)
         assert page == 1
 
-    def test_one_over_boundary(self):
-        cards = self._make_cards(11)
-        _, info, page = render_page(cards, [], "cm", 2, 10)
-        assert "Page 2 of 2" in info
+
+# ── cursor_for_page / load_keyset_page / render_cached_page ──────
+
+
+class _FakeApi:
+    """Keyset fetcher over a sorted list of cards, recording cursors."""
+
+    def __init__(self, n: int, per_page: int) -> None:
+        self.cards = _make_cards(n)
+        self.per_page = per_page
+        self.cursors: list[str | None] = []
+
+    def __call__(self, cursor: str | None) -> dict:
+        self.cursors.append(cursor)
+        rest = [c for c in self.cards if cursor is None or c["card_id"] > cursor]
+        page = rest[: self.per_page]
+        has_next = len(rest) > self.per_page
+        return {
+            "cards": page,
+            "next_cursor": page[-1]["card_id"] if has_next else None,
+        }
+
+
+class TestCursorForPage:
+    """Cursor lookup and page clamping against the page cache."""
+
+    def test_empty_cache_is_page_one(self):
+        assert cursor_for_page(empty_page_cache(), 5) == (1, None)
+
+    def test_non_dict_cache_treated_as_empty(self):
+        assert cursor_for_page([], 3) == (1, None)
+
+    def test_next_page_uses_next_cursor(self):
+        cache = {"cards": [], "cursors": [None], "next_cursor": "c9"}
+        assert cursor_for_page(cache, 2) == (2, "c9")
+
+    def test_visited_page_uses_stored_cursor(self):
+        cache = {"cards": [], "cursors": [None, "c4", "c9"], "next_cursor": None}
+        assert cursor_for_page(cache, 2) == (2, "c4")
+
+    def test_page_beyond_reachable_clamped(self):
+        cache = {"cards": [], "cursors": [None, "c4"], "next_cursor": None}
+        assert cursor_for_page(cache, 99) == (2, "c4")
+
+    @pytest.mark.parametrize("page", [0, -5, None, "abc"])
+    def test_invalid_page_clamped_to_one(self, page):
+        assert cursor_for_page(empty_page_cache(), page) == (1, None)
+
+
+class TestLoadKeysetPage:
+    """Fetch-and-render of a single page."""
+
+    def test_first_page(self):
+        api = _FakeApi(12, 5)
+        html, info, page, cache = load_keyset_page(api, [], "cm", 1)
+        assert page == 1
+        assert "Page 1" in info
+        assert api.cursors == [None]
+        assert cache["next_cursor"] == "c04"
+        assert [c["card_id"] for c in cache["cards"]] == _ids(0, 5)
+
+    def test_walk_forward_and_back(self):
+        api = _FakeApi(12, 5)
+        _, _, _, cache = load_keyset_page(api, [], "cm", 1)
+        _, _, page, cache = load_keyset_page(api, [], "cm", 2, cache)
         assert page == 2
+        _, info, page, cache = load_keyset_page(api, [], "cm", 3, cache)
+        assert page == 3
+        assert "Page 3 of 3" in info
+        assert cache["next_cursor"] is None
+        _, _, page, cache = load_keyset_page(api, [], "cm", 2, cache)
+        assert page == 2
+        assert api.cursors == [None, "c04", "c09", "c04"]
+        assert [c["card_id"] for c in cache["cards"]] == _ids(5, 5)
+
+    def test_next_past_last_page_stays(self):
+        api = _FakeApi(3, 5)
+        _, _, _, cache = load_keyset_page(api, [], "cm", 1)
+        _, _, page, _ = load_keyset_page(api, [], "cm", 2, cache)
+        assert page == 1
+
+    def test_error_renders_escaped_message(self):
+        def _fail(_cursor):
+            return {"status": "error", "message": "<b>boom</b>"}
+
+        html, _, page, cache = load_keyset_page(_fail, [], "cm", 1)
+        assert "color:red" in html
+        assert "&lt;b&gt;boom" in html
+        assert page == 1
+        assert cache == empty_page_cache()
+
+    def test_render_cached_page_does_not_fetch(self):
+        api = _FakeApi(3, 5)
+        _, _, _, cache = load_keyset_page(api, [], "cm", 1)
+        html, info, page = render_cached_page(cache, [], "in", 1)
+        assert api.cursors == [None]
+        assert "c02" in html
+        assert page == 1
+        assert "(3 scenarios)" in info
+
+    def test_render_cached_page_with_bad_cache(self):
+        html, _, page = render_cached_page(None, [], "cm", 4)
+        assert "No scenarios match" in html
+        assert page == 1
 
-    def test_per_page_5(self):
-        cards = self._make_cards(12)
-        _, info, page = render_page(cards, [], "cm", 1, 5)
-        assert "Page 1 of 3" in info
 
-    def test_favorites_marked_in_html(self):
-        cards = self._make_cards(2)
-        html, _, _ = render_page(cards, ["c0"], "cm", 1, 10)
-        # The render_card_list_html should include the fav marker
-        assert isinstance(html, str)
+def _ids(start: int, n: int) -> list[str]:
+    return [f"c{i:02d}" for i in range(start, start + n)]
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -398,7 +578,7 @@ class TestValidatePage:
         assert validate_page("") == 1
 
     def test_very_large_int(self):
-        """Huge page numbers are accepted — clamping happens in render_page."""
+        """Huge page numbers are accepted — clamping happens in cursor_for_page."""
         assert validate_page(999_999) == 999_999
 
     def test_string_with_spaces(self):
@@ -447,165 +627,29 @@ class TestParsePerPageSecurity:
         assert parse_per_page("<script>10</script>") == DEFAULT_ITEMS_PER_PAGE
 
 
-class TestRenderPageSecurity:
-    """Verify parameter escaping in render_page HTML output."""
-
-    def _make_cards(self, n: int) -> list[dict]:
-        return [{"card_id": f"c{i}", "name": f"Card {i}"} for i in range(n)]
+class TestRenderKeysetPageSecurity:
+    """Verify parameter escaping in rendered page HTML output."""
 
     def test_empty_message_xss_escaped(self):
-        html_out, _, _ = render_page(
+        html_out, _ = render_keyset_page(
             [],
             [],
             "cm",
             1,
-            10,
+            False,
             empty_message='<script>alert("xss")</script>',
         )
         assert "<script>" not in html_out
         assert "&lt;script&gt;" in html_out
 
     def test_count_label_xss_escaped(self):
-        cards = self._make_cards(3)
-        _, info, _ = render_page(
-            cards,
+        _, info = render_keyset_page(
+            _make_cards(3),
             [],
             "cm",
             1,
-            10,
+            False,
             count_label='<img onerror="alert(1)">',
         )
         assert "<img" not in info
         assert "&lt;img" in info
-
-    def test_negative_page_clamped(self):
-        cards = self._make_cards(5)
-        _, _, page = render_page(cards, [], "cm", -5, 10)
-        assert page == 1
-
-    def test_zero_page_clamped(self):
-        cards = self._make_cards(5)
-        _, _, page = render_page(cards, [], "cm", 0, 10)
-        assert page == 1
-
-    def test_page_exceeding_max_clamped(self):
-        cards = self._make_cards(5)
-        _, _, page = render_page(cards, [], "cm", 999, 10)
-        assert page == 1  # 5 cards / 10 per page = 1 total page
-
-
-# ═══════════════════════════════════════════════════════════════════
-# SOLID REFACTOR — EXTRACTED UNITS
-# ═══════════════════════════════════════════════════════════════════
-
-
-class TestFilterByModePreset:
-    """Mode/preset filtering (SRP extraction from wire_home)."""
-
-    CARDS: ClassVar[list[dict]] = [
-        {"name": "A", "mode": "battle", "table_preset": "standard", "card_id": "c1"},
-        {"name": "B", "mode": "narrative", "table_preset": "standard", "card_id": "c2"},
-        {"name": "C", "mode": "battle", "table_preset": "custom", "card_id": "c3"},
-        {"name": "D", "mode": "narrative", "table_preset": "custom", "card_id": "c4"},
-    ]
-
-    def test_all_all_returns_all(self):
-        assert len(filter_by_mode_preset(self.CARDS, "All", "All")) == 4
-
-    def test_filter_by_mode(self):
-        result = filter_by_mode_preset(self.CARDS, "battle", "All")
-        assert len(result) == 2
-        assert all(c["mode"] == "battle" for c in result)
-
-    def test_filter_by_preset(self):
-        result = filter_by_mode_preset(self.CARDS, "All", "standard")
-        assert len(result) == 2
-        assert all(c["table_preset"] == "standard" for c in result)
-
-    def test_filter_by_both(self):
-        result = filter_by_mode_preset(self.CARDS, "battle", "custom")
-        assert len(result) == 1
-        assert result[0]["name"] == "C"
-
-    def test_case_insensitive_mode(self):
-        assert len(filter_by_mode_preset(self.CARDS, "Battle", "All")) == 2
-
-    def test_case_insensitive_preset(self):
-        assert len(filter_by_mode_preset(self.CARDS, "All", "Standard")) == 2
-
-    def test_no_match(self):
-        assert filter_by_mode_preset(self.CARDS, "nonexistent", "All") == []
-
-    def test_empty_cards(self):
-        assert filter_by_mode_preset([], "battle", "All") == []
-
-    def test_missing_mode_field(self):
-        cards: list[dict] = [{"name": "X", "card_id": "x1"}]
-        assert filter_by_mode_preset(cards, "battle", "All") == []
-
-    def test_missing_preset_field(self):
-        cards: list[dict] = [{"name": "X", "mode": "battle", "card_id": "x1"}]
-        assert filter_by_mode_preset(cards, "All", "standard") == []
-
-    def test_defaults_return_all(self):
-        assert len(filter_by_mode_preset(self.CARDS)) == 4
-
-
-class TestRenderFilteredPage:
-    """End-to-end composition: sanitise → filter → paginate → render."""
-
-    def _make_cards(self, n: int) -> list[dict]:
-        return [{"card_id": f"c{i}", "name": f"Card {i}"} for i in range(n)]
-
-    def test_basic_rendering(self):
-        cards = self._make_cards(5)
-        html_out, info, page = render_filtered_page(cards, [], "cm", 1)
-        assert "Page 1 of 1" in info
-        assert page == 1
-
-    def test_search_filters_cards(self):
-        cards = self._make_cards(5)
-        _, info, _ = render_filtered_page(cards, [], "cm", 1, search_raw="Card 0")
-        assert "(1 scenarios)" in info
-
-    def test_per_page_applied(self):
-        cards = self._make_cards(15)
-        _, info, _ = render_filtered_page(cards, [], "cm", 1, per_page_raw="5")
-        assert "Page 1 of 3" in info
-
-    def test_page_validated_from_none(self):
-        cards = self._make_cards(5)
-        _, _, page = render_filtered_page(cards, [], "cm", None)
-        assert page == 1
-
-    def test_page_validated_from_negative(self):
-        cards = self._make_cards(5)
-        _, _, page = render_filtered_page(cards, [], "cm", -3)
-        assert page == 1
-
-    def test_custom_count_label(self):
-        cards = self._make_cards(3)
-        _, info, _ = render_filtered_page(cards, [], "cm", 1, count_label="favorites")
-        assert "(3 favorites)" in info
-
-    def test_empty_cards(self):
-        html_out, _, page = render_filtered_page([], [], "cm", 1)
-        assert "No scenarios match" in html_out
-        assert page == 1
-
-    def test_custom_empty_message(self):
-        html_out, _, _ = render_filtered_page(
-            [], [], "cm", 1, empty_message="Nothing found"
-        )
-        assert "Nothing found" in html_out
-
-    def test_search_sanitised_before_filtering(self):
-        """HTML tags in search are stripped before matching."""
-        cards = [{"card_id": "c1", "name": "alert"}]
-        _, info, _ = render_filtered_page(cards, [], "cm", 1, search_raw="<b>alert</b>")
-        assert "(1 scenarios)" in info
-
-    def test_invalid_per_page_uses_default(self):
-        cards = self._make_cards(15)
-        _, info, _ = render_filtered_page(cards, [], "cm", 1, per_page_raw="abc")
-        assert "Page 1 of 2" in info  # 15 / 10 default = 2 pages
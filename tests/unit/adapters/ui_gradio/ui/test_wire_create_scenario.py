@@ -120,7 +120,6 @@ class TestOnCreateScenario:
                 home_page_info=_FakeComponent(),
                 home_page_state=_FakeComponent(),
                 home_cards_cache_state=_FakeComponent(),
-                home_fav_ids_cache_state=_FakeComponent(),
             )
         )
         return btn._click_fn
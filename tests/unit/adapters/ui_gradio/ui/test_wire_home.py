@@ -4,6 +4,21 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+from adapters.ui_gradio.list_state_cache import (
+    ListState,
+    ListStateCache,
+    configure_list_state_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _list_state_cache():
+    cache = ListStateCache()
+    configure_list_state_cache(cache)
+    yield cache
+    configure_list_state_cache(None)
+
 
 class TestLoadRecentCards:
     """Verify load_recent_cards renders cards from Flask API."""
@@ -50,6 +65,83 @@ class TestLoadRecentCards:
         html = result[0]
         assert "c1" in html
 
+    @patch("adapters.ui_gradio.ui.wiring.wire_home.nav_svc")
+    def test_fetches_one_page_with_criteria(self, mock_nav):
+        mock_nav.list_cards.return_value = {"cards": [], "next_cursor": None}
+        mock_nav.list_favorites.return_value = {"card_ids": []}
+        from adapters.ui_gradio.ui.wiring.wire_home import load_recent_cards
+
+        load_recent_cards("Matched", "Standard", "cm", 1, "<b>osg</b>", "20", "u1")
+
+        mock_nav.list_cards.assert_called_once_with(
+            "u1",
+            "public",
+            limit=20,
+            cursor=None,
+            name_query="osg",
+            mode="matched",
+            table_preset="standard",
+        )
+
+    @patch("adapters.ui_gradio.ui.wiring.wire_home.nav_svc")
+    def test_next_page_uses_cached_cursor(self, mock_nav, _list_state_cache):
+        mock_nav.list_cards.return_value = {
+            "cards": [{"card_id": "c6", "owner_id": "u1"}],
+            "next_cursor": None,
+        }
+        from adapters.ui_gradio.ui.wiring.wire_home import go_to_next_page
+
+        cache = {"cards": [], "cursors": [None], "next_cursor": "c5"}
+        handle = _list_state_cache.put(ListState("u1", cache, []))
+        html, _, page, new_handle = go_to_next_page(
+            "All", "All", "cm", 1, handle, "", "5", "u1"
+        )
+
+        assert page == 2
+        assert "c6" in html
+        assert mock_nav.list_cards.call_args.kwargs["cursor"] == "c5"
+        assert new_handle == handle
+        state = _list_state_cache.get(handle, "u1")
+        assert state.page_cache["cursors"] == [None, "c5"]
+        mock_nav.list_favorites.assert_not_called()
+
+    @patch("adapters.ui_gradio.ui.wiring.wire_home.nav_svc")
+    def test_refresh_reuses_favorites_until_invalidated(
+        self, mock_nav, _list_state_cache
+    ):
+        mock_nav.list_cards.return_value = {"cards": [], "next_cursor": None}
+        mock_nav.list_favorites.return_value = {"card_ids": ["c1"]}
+        from adapters.ui_gradio.ui.wiring.wire_home import load_recent_cards
+
+        *_, handle = load_recent_cards("All", "All", "cm", 1, "", "10", "u1")
+        load_recent_cards("Matched", "All", "cm", 1, "", "10", "u1", handle)
+        assert mock_nav.list_favorites.call_count == 1
+
+        _list_state_cache.invalidate_actor("u1")
+        load_recent_cards("All", "All", "cm", 1, "", "10", "u1", handle)
+        assert mock_nav.list_favorites.call_count == 2
+
+    @patch("adapters.ui_gradio.ui.wiring.wire_home.nav_svc")
+    def test_unit_change_renders_without_fetching(self, mock_nav):
+        mock_nav.list_cards.return_value = {
+            "cards": [{"card_id": "c1", "owner_id": "u1"}],
+            "next_cursor": None,
+        }
+        mock_nav.list_favorites.return_value = {"card_ids": []}
+        from adapters.ui_gradio.ui.wiring.wire_home import (
+            load_recent_cards,
+            render_from_cache,
+        )
+
+        *_, handle = load_recent_cards("All", "All", "cm", 1, "", "10", "u1")
+        html, _, page, same = render_from_cache(
+            "All", "All", "in", 1, handle, "", "10", "u1"
+        )
+
+        assert "c1" in html
+        assert (page, same) == (1, handle)
+        assert mock_nav.list_cards.call_count == 1
+
     @patch("adapters.ui_gradio.ui.wiring.wire_home.nav_svc")
     def test_wire_home_page_registers_app_load(self, mock_nav):
         """wire_home_page should call app.load with the right outputs."""
@@ -68,7 +160,6 @@ class TestLoadRecentCards:
         mock_next_btn = MagicMock()
         mock_page_state = MagicMock()
         mock_cards_cache_state = MagicMock()
-        mock_fav_ids_cache_state = MagicMock()
 
         wire_home_page(
             ctx=HomePageCtx(
@@ -84,7 +175,6 @@ class TestLoadRecentCards:
                 home_next_btn=mock_next_btn,
                 home_page_state=mock_page_state,
                 home_cards_cache_state=mock_cards_cache_state,
-                home_fav_ids_cache_state=mock_fav_ids_cache_state,
                 app=mock_app,
             )
         )
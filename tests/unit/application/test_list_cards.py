@@ -19,7 +19,7 @@ from typing import Optional
 import pytest
 
 # Domain imports (real)
-from domain.cards.card import Card, GameMode
+from domain.cards.card import Card, CardSummary, GameMode
 from domain.errors import ValidationError
 from domain.maps.map_spec import MapSpec
 from domain.maps.table_size import TableSize
@@ -107,6 +107,49 @@ class FakeCardRepository:
     def list_for_owner(self, owner_id: str) -> list[Card]:
         return [c for c in self.cards if c.owner_id == owner_id]
 
+    def list_visible(self, *args, **kwargs) -> list[Card]:
+        raise AssertionError("list pages must not load full cards")
+
+    def list_visible_summaries(
+        self,
+        actor_id: str,
+        filter_value: str,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        name_query: Optional[str] = None,
+        mode: Optional[str] = None,
+        table_preset: Optional[str] = None,
+    ) -> list[CardSummary]:
+        """Naive linear filter mirroring the repository contract."""
+        if filter_value == "mine":
+            matched = [c for c in self.cards if c.owner_id == actor_id]
+        elif filter_value == "public":
+            matched = [c for c in self.cards if c.visibility == Visibility.PUBLIC]
+        elif filter_value == "shared_with_me":
+            matched = [
+                c
+                for c in self.cards
+                if c.visibility == Visibility.SHARED
+                and c.shared_with is not None
+                and actor_id in c.shared_with
+            ]
+        else:
+            matched = []
+        if name_query:
+            matched = [
+                c for c in matched if name_query.lower() in (c.name or "").lower()
+            ]
+        if mode:
+            matched = [c for c in matched if c.mode.value == mode]
+        if table_preset:
+            matched = [c for c in matched if c.table.preset_name == table_preset]
+        matched.sort(key=lambda c: c.card_id)
+        if cursor:
+            matched = [c for c in matched if c.card_id > cursor]
+        page = matched if limit is None else matched[:limit]
+        return [c.summary() for c in page]
+
 
 # =============================================================================
 # 1) MINE - RETURNS ONLY ACTOR'S OWN CARDS
@@ -339,9 +382,113 @@ class TestListCardsInvalidFilter:
             use_case.execute(request)
 
 
+# =============================================================================
+# 7) PAGINATION AND SEARCH CRITERIA
+# =============================================================================
+class TestListCardsPagination:
+    """limit / cursor page through results; criteria are passed through."""
+
+    def test_limit_returns_page_and_next_cursor(
+        self, table: TableSize, map_spec: MapSpec
+    ):
+        from application.use_cases.list_cards import ListCards, ListCardsRequest
+
+        cards = [
+            make_card(f"card-00{i}", "u1", Visibility.PRIVATE, table, map_spec)
+            for i in range(1, 6)
+        ]
+        use_case = ListCards(repository=FakeCardRepository(cards))
+
+        first = use_case.execute(
+            ListCardsRequest(actor_id="u1", filter="mine", limit=2)
+        )
+        second = use_case.execute(
+            ListCardsRequest(
+                actor_id="u1", filter="mine", limit=2, cursor=first.next_cursor
+            )
+        )
+        last = use_case.execute(
+            ListCardsRequest(
+                actor_id="u1", filter="mine", limit=2, cursor=second.next_cursor
+            )
+        )
+
+        assert [c.card_id for c in first.cards] == ["card-001", "card-002"]
+        assert first.next_cursor == "card-002"
+        assert [c.card_id for c in second.cards] == ["card-003", "card-004"]
+        assert [c.card_id for c in last.cards] == ["card-005"]
+        assert last.next_cursor is None
+
+    def test_unpaged_request_has_no_next_cursor(
+        self, table: TableSize, map_spec: MapSpec
+    ):
+        from application.use_cases.list_cards import ListCards, ListCardsRequest
+
+        card = make_card("card-001", "u1", Visibility.PRIVATE, table, map_spec)
+        use_case = ListCards(repository=FakeCardRepository([card]))
+
+        response = use_case.execute(ListCardsRequest(actor_id="u1", filter="mine"))
+
+        assert response.next_cursor is None
+
+    def test_name_mode_and_preset_criteria(self, table: TableSize, map_spec: MapSpec):
+        from dataclasses import replace
+
+        from application.use_cases.list_cards import ListCards, ListCardsRequest
+
+        osgiliath = replace(
+            make_card("card-001", "u1", Visibility.PUBLIC, table, map_spec),
+            name="Battle of Osgiliath",
+        )
+        casual = replace(
+            make_card(
+                "card-002",
+                "u1",
+                Visibility.PUBLIC,
+                table,
+                map_spec,
+                mode=GameMode.CASUAL,
+            ),
+            name="Osgiliath Ruins",
+        )
+        use_case = ListCards(repository=FakeCardRepository([osgiliath, casual]))
+
+        response = use_case.execute(
+            ListCardsRequest(
+                actor_id="u2",
+                filter="public",
+                name_query="  osgiliath ",
+                mode="Matched",
+                table_preset="Standard",
+            )
+        )
+
+        assert [c.card_id for c in response.cards] == ["card-001"]
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("limit", 0),
+            ("limit", 101),
+            ("limit", "10"),
+            ("mode", "skirmish"),
+            ("table_preset", "huge"),
+            ("name_query", "x" * 201),
+        ],
+        ids=["limit-zero", "limit-max", "limit-str", "mode", "preset", "query-long"],
+    )
+    def test_invalid_criteria_raise_validation_error(self, field: str, value: object):
+        from application.use_cases.list_cards import ListCards, ListCardsRequest
+
+        use_case = ListCards(repository=FakeCardRepository([]))
+        request = ListCardsRequest(actor_id="u1", filter="mine", **{field: value})
+
+        with pytest.raises(ValidationError):
+            use_case.execute(request)
+
+
 # =============================================================================
 # TODO(future): Additional tests for hardening phase:
-# - Test pagination
 # - Test sorting
 # - Test empty results
 # - Test large datasets
@@ -0,0 +1,184 @@
+"""Unit tests for ListFavoriteCards use case.
+
+ListFavoriteCards returns one page of the actor's favorite cards as list
+snapshots, resolving favorite ids with bulk fetches.
+
+Contract:
+1. Returns readable favorite cards ordered by card_id
+2. Pages with limit / cursor (keyset on card_id)
+3. Optional case-insensitive name search
+4. Prunes stale favorites in one call
+5. Invalid input → ValidationError
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import pytest
+from application.use_cases.list_favorite_cards import (
+    ListFavoriteCards,
+    ListFavoriteCardsRequest,
+)
+from domain.cards.card import Card, CardSummary, GameMode
+from domain.errors import ValidationError
+from domain.maps.map_spec import MapSpec
+from domain.maps.table_size import TableSize
+from domain.security.authz import Visibility
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+def make_card(
+    card_id: str,
+    owner_id: str = "u1",
+    visibility: Visibility = Visibility.PUBLIC,
+    name: str = "",
+) -> Card:
+    table = TableSize.standard()
+    shapes = [{"type": "rect", "x": 100, "y": 100, "width": 200, "height": 200}]
+    return Card(
+        card_id=card_id,
+        owner_id=owner_id,
+        visibility=visibility,
+        shared_with=None,
+        mode=GameMode.MATCHED,
+        seed=123,
+        table=table,
+        map_spec=MapSpec(table=table, shapes=shapes),
+        name=name,
+    )
+
+
+class FakeCardRepository:
+    """Card repository fake that only supports bulk reads."""
+
+    def __init__(self, cards: list[Card]) -> None:
+        self.cards = {c.card_id: c for c in cards}
+        self.get_summaries_calls: list[list[str]] = []
+
+    def get_by_id(self, card_id: str) -> Optional[Card]:
+        raise AssertionError("get_by_id must not be called per favorite")
+
+    def get_many(self, card_ids: Sequence[str]) -> list[Card]:
+        raise AssertionError("list pages must not load full cards")
+
+    def get_summaries(self, card_ids: Sequence[str]) -> list[CardSummary]:
+        self.get_summaries_calls.append(list(card_ids))
+        return [
+            self.cards[cid].summary()
+            for cid in sorted(set(card_ids))
+            if cid in self.cards
+        ]
+
+
+class FakeFavoritesRepository:
+    """Favorites fake recording bulk removals."""
+
+    def __init__(self, actor_id: str, card_ids: list[str]) -> None:
+        self.favorites = {(actor_id, cid) for cid in card_ids}
+        self.removed: list[list[str]] = []
+
+    def list_favorites(self, actor_id: str) -> list[str]:
+        return sorted(c for a, c in self.favorites if a == actor_id)
+
+    def remove_favorites(self, actor_id: str, card_ids: Sequence[str]) -> None:
+        self.removed.append(list(card_ids))
+        self.favorites.difference_update((actor_id, c) for c in card_ids)
+
+
+def _use_case(cards: list[Card], fav_ids: list[str], actor_id: str = "u2"):
+    card_repo = FakeCardRepository(cards)
+    fav_repo = FakeFavoritesRepository(actor_id, fav_ids)
+    return ListFavoriteCards(card_repo, fav_repo), card_repo, fav_repo
+
+
+def _ids(response) -> list[str]:
+    return [c.card_id for c in response.cards]
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+class TestListFavoriteCards:
+    def test_returns_snapshots_in_one_fetch(self):
+        cards = [make_card("c2", name="Beta"), make_card("c1", name="Alpha")]
+        uc, card_repo, _ = _use_case(cards, ["c1", "c2"])
+
+        resp = uc.execute(ListFavoriteCardsRequest(actor_id="u2"))
+
+        assert _ids(resp) == ["c1", "c2"]
+        assert resp.cards[0].name == "Alpha"
+        assert resp.cards[0].table_preset == "standard"
+        assert resp.next_cursor is None
+        assert len(card_repo.get_summaries_calls) == 1
+
+    def test_pages_with_limit_and_cursor(self):
+        cards = [make_card(f"c{i}") for i in range(1, 6)]
+        uc, _, _ = _use_case(cards, [c.card_id for c in cards])
+
+        first = uc.execute(ListFavoriteCardsRequest(actor_id="u2", limit=2))
+        second = uc.execute(
+            ListFavoriteCardsRequest(actor_id="u2", limit=2, cursor=first.next_cursor)
+        )
+        last = uc.execute(
+            ListFavoriteCardsRequest(actor_id="u2", limit=2, cursor=second.next_cursor)
+        )
+
+        assert (_ids(first), first.next_cursor) == (["c1", "c2"], "c2")
+        assert (_ids(second), second.next_cursor) == (["c3", "c4"], "c4")
+        assert (_ids(last), last.next_cursor) == (["c5"], None)
+
+    def test_page_fetch_is_bounded_by_limit(self):
+        cards = [make_card(f"c{i}") for i in range(1, 10)]
+        uc, card_repo, _ = _use_case(cards, [c.card_id for c in cards])
+
+        uc.execute(ListFavoriteCardsRequest(actor_id="u2", limit=3))
+
+        assert card_repo.get_summaries_calls == [["c1", "c2", "c3", "c4"]]
+
+    def test_name_query_filters_case_insensitively(self):
+        cards = [
+            make_card("c1", name="Batalla de Osgiliath"),
+            make_card("c2", name="Minas Tirith"),
+        ]
+        uc, _, _ = _use_case(cards, ["c1", "c2"])
+
+        resp = uc.execute(ListFavoriteCardsRequest(actor_id="u2", name_query="OSGIL"))
+
+        assert _ids(resp) == ["c1"]
+
+    def test_stale_favorites_pruned_in_one_call(self):
+        cards = [
+            make_card("c1"),
+            make_card("c2", visibility=Visibility.PRIVATE),  # unreadable by u2
+        ]
+        uc, _, fav_repo = _use_case(cards, ["c1", "c2", "c3"])
+
+        resp = uc.execute(ListFavoriteCardsRequest(actor_id="u2"))
+
+        assert _ids(resp) == ["c1"]
+        assert fav_repo.removed == [["c2", "c3"]]
+
+    def test_no_prune_when_nothing_stale(self):
+        uc, _, fav_repo = _use_case([make_card("c1")], ["c1"])
+
+        uc.execute(ListFavoriteCardsRequest(actor_id="u2"))
+
+        assert fav_repo.removed == []
+
+    @pytest.mark.parametrize(
+        "request_kwargs",
+        [
+            {"actor_id": ""},
+            {"actor_id": "u2", "limit": 0},
+            {"actor_id": "u2", "cursor": 5},
+            {"actor_id": "u2", "name_query": "x" * 201},
+        ],
+        ids=["empty-actor", "zero-limit", "int-cursor", "long-query"],
+    )
+    def test_invalid_request_raises(self, request_kwargs):
+        uc, _, _ = _use_case([], [])
+        with pytest.raises(ValidationError):
+            uc.execute(ListFavoriteCardsRequest(**request_kwargs))
@@ -13,12 +13,12 @@ MVP Contract:
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Sequence
 
 import pytest
 
 # Domain imports (real)
-from domain.cards.card import Card, GameMode
+from domain.cards.card import Card, CardSummary, GameMode
 from domain.errors import ValidationError
 from domain.maps.map_spec import MapSpec
 from domain.maps.table_size import TableSize
@@ -76,10 +76,21 @@ class FakeCardRepository:
 
     def __init__(self, cards: Optional[dict[str, Card]] = None) -> None:
         self.cards: dict[str, Card] = cards or {}
+        self.get_by_id_calls = 0
+        self.get_summaries_calls = 0
 
     def get_by_id(self, card_id: str) -> Optional[Card]:
+        self.get_by_id_calls += 1
         return self.cards.get(card_id)
 
+    def get_summaries(self, card_ids: Sequence[str]) -> list[CardSummary]:
+        self.get_summaries_calls += 1
+        return [
+            self.cards[cid].summary()
+            for cid in sorted(set(card_ids))
+            if cid in self.cards
+        ]
+
     def save(self, card: Card) -> None:
         self.cards[card.card_id] = card
 
@@ -101,6 +112,7 @@ class FakeFavoritesRepository:
 
     def __init__(self) -> None:
         self._favorites: set[tuple[str, str]] = set()
+        self.remove_calls = 0
 
     def is_favorite(self, actor_id: str, card_id: str) -> bool:
         return (actor_id, card_id) in self._favorites
@@ -115,6 +127,10 @@ class FakeFavoritesRepository:
     def list_favorites(self, actor_id: str) -> list[str]:
         return [card_id for (uid, card_id) in self._favorites if uid == actor_id]
 
+    def remove_favorites(self, actor_id: str, card_ids: Sequence[str]) -> None:
+        self.remove_calls += 1
+        self._favorites.difference_update((actor_id, c) for c in card_ids)
+
     def remove_all_for_card(self, card_id: str) -> None:
         self._favorites = {(a, c) for a, c in self._favorites if c != card_id}
 
@@ -352,6 +368,45 @@ class TestListFavoritesPrunesUnreadableCards:
         assert favorites_repo.is_favorite("u2", "c1")
 
 
+# =============================================================================
+# 3d) BATCHING: one bulk fetch, one bulk prune
+# =============================================================================
+class TestListFavoritesBatching:
+    """No per-favorite round trips."""
+
+    def test_single_get_summaries_and_single_prune(
+        self,
+        table: TableSize,
+        map_spec: MapSpec,
+        favorites_repo: FakeFavoritesRepository,
+    ):
+        from application.use_cases.list_favorites import (
+            ListFavorites,
+            ListFavoritesRequest,
+        )
+
+        cards = {
+            f"c{i}": make_card(f"c{i}", "u1", Visibility.PUBLIC, table, map_spec)
+            for i in range(5)
+        }
+        card_repo = FakeCardRepository(cards)
+        for cid in [*cards, "gone-1", "gone-2"]:
+            favorites_repo.set_favorite("u2", cid, True)
+
+        use_case = ListFavorites(
+            card_repository=card_repo,
+            favorites_repository=favorites_repo,
+        )
+        response = use_case.execute(ListFavoritesRequest(actor_id="u2"))
+
+        assert sorted(response.card_ids) == sorted(cards)
+        assert card_repo.get_summaries_calls == 1
+        assert card_repo.get_by_id_calls == 0
+        assert favorites_repo.remove_calls == 1
+        assert not favorites_repo.is_favorite("u2", "gone-1")
+        assert not favorites_repo.is_favorite("u2", "gone-2")
+
+
 # =============================================================================
 # 4) INVALID ACTOR_ID
 # =============================================================================
@@ -389,6 +444,5 @@ class TestListFavoritesInvalidActorId:
 # =============================================================================
 # TODO(future): Additional tests for hardening phase:
 # - Test empty favorites list
-# - Test pagination
 # - Test favorites count limit
 # =============================================================================
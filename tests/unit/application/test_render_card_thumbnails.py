@@ -0,0 +1,126 @@
+"""Unit tests for RenderCardThumbnails use case.
+
+RenderCardThumbnails renders the map previews of one list page:
+1. One bulk get_many fetch and one batch render call
+2. Cards the actor cannot read (or that are gone) are skipped
+3. Invalid input → ValidationError
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import pytest
+from application.use_cases.render_card_thumbnails import (
+    RenderCardThumbnails,
+    RenderCardThumbnailsRequest,
+)
+from domain.cards.card import Card, GameMode
+from domain.errors import ValidationError
+from domain.maps.map_spec import MapSpec
+from domain.maps.table_size import TableSize
+from domain.security.authz import Visibility
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+def make_card(card_id: str, visibility: Visibility = Visibility.PUBLIC) -> Card:
+    table = TableSize.standard()
+    shapes = [{"type": "rect", "x": 100, "y": 100, "width": 200, "height": 200}]
+    return Card(
+        card_id=card_id,
+        owner_id="u1",
+        visibility=visibility,
+        shared_with=None,
+        mode=GameMode.MATCHED,
+        seed=123,
+        table=table,
+        map_spec=MapSpec(table=table, shapes=shapes),
+    )
+
+
+class FakeCardRepository:
+    """Card repository fake that only supports bulk reads."""
+
+    def __init__(self, cards: list[Card]) -> None:
+        self.cards = {c.card_id: c for c in cards}
+        self.get_many_calls: list[list[str]] = []
+
+    def get_by_id(self, card_id: str) -> Optional[Card]:
+        raise AssertionError("get_by_id must not be called per card")
+
+    def get_many(self, card_ids: Sequence[str]) -> list[Card]:
+        self.get_many_calls.append(list(card_ids))
+        return [self.cards[cid] for cid in sorted(set(card_ids)) if cid in self.cards]
+
+
+class SpyThumbnailRenderer:
+    """Records each batch and returns one tagged SVG per map."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[tuple[dict, list[dict]]]] = []
+
+    def render_many(self, maps: Sequence[tuple[dict, list[dict]]]) -> list[str]:
+        self.batches.append(list(maps))
+        return [f"<svg n='{i}'/>" for i in range(len(maps))]
+
+
+def _use_case(cards: list[Card]):
+    repo = FakeCardRepository(cards)
+    renderer = SpyThumbnailRenderer()
+    return RenderCardThumbnails(repo, renderer), repo, renderer
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+class TestRenderCardThumbnails:
+    def test_renders_page_in_one_batch(self):
+        uc, repo, renderer = _use_case([make_card("c1"), make_card("c2")])
+
+        resp = uc.execute(
+            RenderCardThumbnailsRequest(actor_id="u2", card_ids=["c2", "c1"])
+        )
+
+        assert resp.thumbnails == {"c1": "<svg n='0'/>", "c2": "<svg n='1'/>"}
+        assert len(repo.get_many_calls) == 1
+        assert len(renderer.batches) == 1
+        table_mm, shapes = renderer.batches[0][0]
+        assert table_mm == {"width_mm": 1200, "height_mm": 1200}
+        assert shapes[0]["type"] == "rect"
+
+    def test_skips_unreadable_and_missing_cards(self):
+        uc, _, _ = _use_case(
+            [make_card("c1"), make_card("c2", visibility=Visibility.PRIVATE)]
+        )
+
+        resp = uc.execute(
+            RenderCardThumbnailsRequest(actor_id="u2", card_ids=["c1", "c2", "c3"])
+        )
+
+        assert set(resp.thumbnails) == {"c1"}
+
+    def test_empty_page_skips_repository(self):
+        uc, repo, renderer = _use_case([])
+
+        resp = uc.execute(RenderCardThumbnailsRequest(actor_id="u2"))
+
+        assert resp.thumbnails == {}
+        assert repo.get_many_calls == []
+        assert renderer.batches == []
+
+    @pytest.mark.parametrize(
+        "request_kwargs",
+        [
+            {"actor_id": ""},
+            {"actor_id": "u2", "card_ids": "c1"},
+            {"actor_id": "u2", "card_ids": [""]},
+            {"actor_id": "u2", "card_ids": [f"c{i}" for i in range(101)]},
+        ],
+        ids=["empty-actor", "str-ids", "blank-id", "too-many"],
+    )
+    def test_invalid_request_raises(self, request_kwargs):
+        uc, _, _ = _use_case([])
+        with pytest.raises(ValidationError):
+            uc.execute(RenderCardThumbnailsRequest(**request_kwargs))
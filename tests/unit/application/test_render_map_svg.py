@@ -406,3 +406,93 @@ class TestRenderMapSvgRendererError:
 
         # Renderer was called (error happened during render)
         assert len(failing_renderer.calls) == 1
+
+
+# =============================================================================
+# CONTENT HASH / RENDER CACHE TESTS
+# =============================================================================
+class DictRenderCache:
+    """Unbounded dict-backed render cache."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, str] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        return self.entries.get(key)
+
+    def put(self, key: str, svg: str) -> None:
+        self.entries[key] = svg
+
+
+class TestRenderMapSvgContentHash:
+    """Tests for the content hash and the optional render cache."""
+
+    def test_same_content_hashes_identically_across_cards(
+        self,
+        repo: FakeCardRepository,
+        renderer: SpySvgRenderer,
+    ) -> None:
+        from application.use_cases.render_map_svg import (
+            RenderMapSvg,
+            RenderMapSvgRequest,
+        )
+
+        repo.add(make_valid_card(card_id="c1"))
+        repo.add(make_valid_card(card_id="c2"))
+        use_case = RenderMapSvg(repository=repo, renderer=renderer)
+
+        first = use_case.execute(RenderMapSvgRequest(actor_id="u1", card_id="c1"))
+        second = use_case.execute(RenderMapSvgRequest(actor_id="u1", card_id="c2"))
+
+        assert len(first.content_hash) == 64
+        assert first.content_hash == second.content_hash
+
+    def test_hash_changes_with_shapes(self) -> None:
+        from application.use_cases.render_map_svg import map_content_hash
+
+        table_mm = {"width_mm": 1200, "height_mm": 1200}
+        shapes = make_valid_shapes()
+        moved = [{**shapes[0], "x": 101}]
+
+        assert map_content_hash(table_mm, shapes) != map_content_hash(table_mm, moved)
+
+    def test_cache_hit_skips_renderer(
+        self,
+        repo: FakeCardRepository,
+        renderer: SpySvgRenderer,
+    ) -> None:
+        from application.use_cases.render_map_svg import (
+            RenderMapSvg,
+            RenderMapSvgRequest,
+        )
+
+        repo.add(make_valid_card(card_id="c1"))
+        cache = DictRenderCache()
+        use_case = RenderMapSvg(repository=repo, renderer=renderer, render_cache=cache)
+        request = RenderMapSvgRequest(actor_id="u1", card_id="c1")
+
+        first = use_case.execute(request)
+        second = use_case.execute(request)
+
+        assert len(renderer.calls) == 1
+        assert second == first
+        assert cache.entries == {first.content_hash: "<svg></svg>"}
+
+    def test_cache_does_not_bypass_read_access(
+        self,
+        repo: FakeCardRepository,
+        renderer: SpySvgRenderer,
+    ) -> None:
+        from application.use_cases.render_map_svg import (
+            RenderMapSvg,
+            RenderMapSvgRequest,
+        )
+
+        repo.add(make_valid_card(card_id="c1", visibility=Visibility.PRIVATE))
+        use_case = RenderMapSvg(
+            repository=repo, renderer=renderer, render_cache=DictRenderCache()
+        )
+        use_case.execute(RenderMapSvgRequest(actor_id="u1", card_id="c1"))
+
+        with pytest.raises(Exception, match=r"(?i)forbidden|permission|access"):
+            use_case.execute(RenderMapSvgRequest(actor_id="u2", card_id="c1"))
@@ -259,6 +259,25 @@ class TestGenerateSeededShapes:
                 assert d["width"] > 0, f"seed={s}: {d['border']} width <= 0"
                 assert d["height"] > 0, f"seed={s}: {d['border']} height <= 0"
 
+    def test_memoized_results_are_fresh_copies(self):
+        """Mutating a result never leaks into later calls for the same seed."""
+        a = _generate_seeded_shapes(777, 1200, 1200)
+        expected = _generate_seeded_shapes(777, 1200, 1200)
+        for shapes in a.values():
+            shapes.clear()
+
+        assert _generate_seeded_shapes(777, 1200, 1200) == expected
+
+    def test_theme_resolution_memo_returns_fresh_dicts(self):
+        from application.use_cases._generate._themes import (
+            _resolve_seed_from_themes,
+        )
+
+        first = _resolve_seed_from_themes(777)
+        first["armies"] = "mutated"
+
+        assert _resolve_seed_from_themes(777)["armies"] != "mutated"
+
 
 # =============================================================================
 # _card_to_full_data / _card_to_preview
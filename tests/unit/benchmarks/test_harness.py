@@ -0,0 +1,138 @@
+"""Unit tests for the benchmark harness (benchmarks/).
+
+Contract:
+1. run_case reports positive per-call statistics
+2. compare flags cases slower than the threshold as regressions
+3. Results round-trip through JSON; foreign documents are rejected
+4. Collision workloads are collision-free (worst-case scans)
+5. The runner exits 1 on a regression against a baseline
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from domain.maps.collision import find_first_collision
+
+from benchmarks.__main__ import main
+from benchmarks.cases import COLLISION_DENSITIES, COLLISION_SHAPE_COUNTS, grid_layout
+from benchmarks.harness import (
+    STATUS_IMPROVED,
+    STATUS_MISSING,
+    STATUS_NEW,
+    STATUS_OK,
+    STATUS_REGRESSED,
+    BenchCase,
+    compare,
+    has_regressions,
+    load_results,
+    results_to_json,
+    run_case,
+)
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+def _doc(**medians: float) -> dict:
+    return {
+        "schema": 1,
+        "results": {name: {"median_s": value} for name, value in medians.items()},
+    }
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+class TestRunCase:
+    def test_reports_per_call_statistics(self):
+        calls = []
+        case = BenchCase(name="noop", group="g", setup=lambda: lambda: calls.append(1))
+
+        result = run_case(case, rounds=3, min_time=0.001)
+
+        assert result.rounds == 3
+        assert result.loops >= 1
+        assert 0 < result.min_s <= result.median_s
+        assert len(calls) >= 1 + 3 * result.loops
+
+    @pytest.mark.parametrize("kwargs", [{"rounds": 0}, {"min_time": 0}])
+    def test_non_positive_settings_raise(self, kwargs):
+        case = BenchCase(name="noop", group="g", setup=lambda: lambda: None)
+        with pytest.raises(ValueError):
+            run_case(case, **kwargs)
+
+
+class TestCompare:
+    def test_statuses(self):
+        current = _doc(same=1.0, slow=1.5, fast=0.5, added=1.0)
+        baseline = _doc(same=1.1, slow=1.0, fast=1.0, gone=1.0)
+
+        statuses = {c.name: c.status for c in compare(current, baseline, 0.25)}
+
+        assert statuses == {
+            "same": STATUS_OK,
+            "slow": STATUS_REGRESSED,
+            "fast": STATUS_IMPROVED,
+            "added": STATUS_NEW,
+            "gone": STATUS_MISSING,
+        }
+
+    def test_threshold_is_configurable(self):
+        comparisons = compare(_doc(a=1.5), _doc(a=1.0), threshold=0.6)
+
+        assert not has_regressions(comparisons)
+        assert comparisons[0].ratio == pytest.approx(1.5)
+
+    def test_negative_threshold_raises(self):
+        with pytest.raises(ValueError):
+            compare(_doc(), _doc(), threshold=-0.1)
+
+
+class TestResultsFiles:
+    def test_round_trip(self, tmp_path):
+        case = BenchCase(name="noop", group="g", setup=lambda: lambda: None)
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps(results_to_json([run_case(case, rounds=1)])))
+
+        loaded = load_results(path)
+
+        assert list(loaded["results"]) == ["noop"]
+
+    def test_foreign_document_rejected(self, tmp_path):
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"benchmarks": []}))
+
+        with pytest.raises(ValueError):
+            load_results(path)
+
+
+class TestGridLayout:
+    @pytest.mark.parametrize("count", COLLISION_SHAPE_COUNTS)
+    @pytest.mark.parametrize("density", COLLISION_DENSITIES)
+    def test_layout_is_collision_free(self, count, density):
+        shapes = grid_layout(count, 1200, 1200, density)
+
+        assert len(shapes) == count
+        assert find_first_collision(shapes) is None
+
+
+class TestRunner:
+    def test_exits_1_on_regression(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(_doc(**{"render.thumbnail[100px]": 1e-12})))
+
+        status = main(
+            [
+                *("-k", "render.thumbnail[100px]"),
+                *("--rounds", "1", "--min-time", "0.001"),
+                *("--compare", str(baseline)),
+            ]
+        )
+
+        assert status == 1
+        assert "regressed" in capsys.readouterr().out
+
+    def test_unknown_filter_exits_2(self, capsys):
+        assert main(["-k", "no-such-case"]) == 2
@@ -189,3 +189,44 @@ class TestUpdateProfile:
     def test_expired_session(self):
         result = auth_service.update_profile("nonexistent", "Name", "a@b.com")
         assert result["ok"] is False
+
+
+# ── password hashing pool saturated ─────────────────────────────────────────
+
+
+class TestHashingBusy:
+    @pytest.fixture()
+    def busy(self, monkeypatch):
+        from infrastructure.auth.password_hasher import PasswordHasherBusy
+
+        def reject(password, salt=None):
+            raise PasswordHasherBusy("saturated")
+
+        monkeypatch.setattr(user_store, "_hash_password", reject)
+
+    def test_login_rejected_without_counting_a_failure(self, busy):
+        for _ in range(5):
+            result = auth_service.authenticate("alice", "alice")
+            assert result["ok"] is False
+            assert result["retry_after"] == 1
+
+        assert user_store.is_locked("alice") == (False, None)
+
+    def test_register_rejected(self, busy):
+        result = auth_service.register(
+            "newuser", "Str0ng!pass", "Str0ng!pass", "New", "new@example.com"
+        )
+        assert result["ok"] is False
+        assert "retry_after" in result
+        assert user_store.user_exists("newuser") is False
+
+    def test_profile_not_half_applied(self, busy):
+        sid = session_store.create_session("alice")["session_id"]
+
+        result = auth_service.update_profile(
+            sid, "Alice 2", "a2@example.com", "N3w!passwd", "N3w!passwd"
+        )
+
+        assert result["ok"] is False
+        assert "retry_after" in result
+        assert user_store.get_user_profile("alice")["name"] == "Alice"
@@ -0,0 +1,391 @@
+"""Unit tests for infrastructure.auth.cached_session_store.
+
+Contract:
+1. get_session / get_csrf_token / is_recently_reauthed share one backend lookup
+2. Cache hits defer last_seen_at touches; flush_touches writes them in one call
+3. invalidate_session / revoke_all_sessions / rotate_session_id evict immediately,
+   including results of backend loads already in flight
+4. Entries expire after the TTL and on idle timeout / max lifetime
+5. The cache is bounded (LRU eviction)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from infrastructure.auth.cached_session_store import CachedSessionStore
+
+from tests.helpers.fake_clock import FakeClock
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+class FakeBackend:
+    """In-memory session backend counting round trips."""
+
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.sessions: dict[str, dict] = {}
+        self.revoked: set[str] = set()
+        self.get_calls = 0
+        self.touch_batches: list[dict[str, datetime]] = []
+        self._next = 0
+
+    def _new_record(self, actor_id: str, created_at: datetime) -> dict:
+        self._next += 1
+        now = self.clock.now_utc()
+        record = {
+            "session_id": f"sid{self._next}",
+            "actor_id": actor_id,
+            "created_at": created_at,
+            "last_seen_at": now,
+            "reauth_at": None,
+            "csrf_token": f"csrf{self._next}",
+        }
+        self.sessions[record["session_id"]] = record
+        return dict(record)
+
+    def create_session(self, actor_id: str) -> dict:
+        return self._new_record(actor_id, self.clock.now_utc())
+
+    def get_session(self, session_id: str) -> dict | None:
+        self.get_calls += 1
+        if session_id in self.revoked or session_id not in self.sessions:
+            return None
+        return dict(self.sessions[session_id])
+
+    def touch_sessions(self, touches: dict[str, datetime]) -> int:
+        self.touch_batches.append(dict(touches))
+        for sid, seen in touches.items():
+            self.sessions[sid]["last_seen_at"] = seen
+        return len(touches)
+
+    def invalidate_session(self, session_id: str) -> bool:
+        self.revoked.add(session_id)
+        return True
+
+    def revoke_all_sessions(self, username: str) -> int:
+        sids = [s for s, r in self.sessions.items() if r["actor_id"] == username]
+        self.revoked.update(sids)
+        return len(sids)
+
+    def rotate_session_id(self, old_session_id: str) -> dict | None:
+        old = self.sessions.get(old_session_id)
+        if old is None or old_session_id in self.revoked:
+            return None
+        self.revoked.add(old_session_id)
+        return self._new_record(old["actor_id"], old["created_at"])
+
+    def mark_reauth(self, session_id: str) -> bool:
+        self.sessions[session_id]["reauth_at"] = self.clock.now_utc()
+        return True
+
+    def is_recently_reauthed(self, session_id: str) -> bool:
+        raise AssertionError("served from the cached record")
+
+    def get_csrf_token(self, session_id: str) -> str | None:
+        raise AssertionError("served from the cached record")
+
+    def reset_sessions(self) -> None:
+        self.sessions.clear()
+
+    def active_session_count(self) -> int:
+        return len(self.sessions) - len(self.revoked)
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def backend(clock: FakeClock) -> FakeBackend:
+    return FakeBackend(clock)
+
+
+@pytest.fixture()
+def cache(backend: FakeBackend, clock: FakeClock) -> CachedSessionStore:
+    return CachedSessionStore(
+        backend, ttl_seconds=5, flush_interval_seconds=0, clock=clock
+    )
+
+
+def _login(backend: FakeBackend, actor_id: str = "alice") -> str:
+    """Create a session directly in the backend (cold cache)."""
+    return str(backend.create_session(actor_id)["session_id"])
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+class TestLookups:
+    def test_session_and_csrf_share_one_backend_lookup(self, cache, backend):
+        sid = _login(backend)
+
+        record = cache.get_session(sid)
+        token = cache.get_csrf_token(sid)
+        again = cache.get_session(sid)
+
+        assert record is not None and again is not None
+        assert record["actor_id"] == "alice"
+        assert token == record["csrf_token"]
+        assert backend.get_calls == 1
+
+    def test_created_session_is_served_from_cache(self, cache, backend):
+        sid = cache.create_session("alice")["session_id"]
+
+        assert cache.get_session(sid) is not None
+        assert backend.get_calls == 0
+
+    def test_unknown_session_returns_none(self, cache):
+        assert cache.get_session("missing") is None
+        assert cache.get_csrf_token("missing") is None
+        assert cache.get_session("") is None
+
+    def test_returned_records_are_copies(self, cache, backend):
+        sid = _login(backend)
+        record = cache.get_session(sid)
+        record["actor_id"] = "mallory"
+
+        assert cache.get_session(sid)["actor_id"] == "alice"
+
+    def test_reauth_window_read_from_cached_record(self, cache, backend, clock):
+        sid = _login(backend)
+        assert cache.is_recently_reauthed(sid) is False
+
+        cache.mark_reauth(sid)
+
+        assert cache.is_recently_reauthed(sid) is True
+        clock.advance(minutes=11)
+        cache.get_session(sid)  # keep the session alive
+        assert cache.is_recently_reauthed(sid) is False
+
+
+class TestWriteBehindTouches:
+    def test_hits_defer_touches_until_flush(self, cache, backend, clock):
+        sid = _login(backend)
+        cache.get_session(sid)
+        clock.advance(seconds=2)
+        cache.get_session(sid)
+        clock.advance(seconds=1)
+        cache.get_session(sid)
+
+        assert backend.touch_batches == []
+        assert cache.flush_touches() == 1
+        assert backend.touch_batches == [{sid: clock.now_utc()}]
+        assert cache.flush_touches() == 0
+
+    def test_flush_batches_all_sessions_in_one_call(self, cache, backend):
+        sids = [_login(backend, f"user{i}") for i in range(3)]
+        for sid in sids:
+            cache.get_session(sid)
+            cache.get_session(sid)
+
+        cache.flush_touches()
+
+        assert len(backend.touch_batches) == 1
+        assert set(backend.touch_batches[0]) == set(sids)
+
+    def test_csrf_reads_do_not_touch(self, cache, backend):
+        sid = _login(backend)
+        cache.get_session(sid)
+        cache.flush_touches()  # nothing pending from the load itself
+
+        cache.get_csrf_token(sid)
+
+        assert cache.flush_touches() == 0
+
+    def test_miss_flushes_pending_touch_before_reload(self, cache, backend, clock):
+        sid = _login(backend)
+        cache.get_session(sid)
+        clock.advance(seconds=3)
+        cache.get_session(sid)  # pending touch at t+3s
+        clock.advance(seconds=10)  # TTL expired
+
+        cache.get_session(sid)
+
+        assert backend.touch_batches == [{sid: clock.now_utc() - timedelta(seconds=10)}]
+
+    def test_failed_flush_keeps_touches_queued(self, cache, backend):
+        sid = _login(backend)
+        cache.get_session(sid)
+        cache.get_session(sid)
+
+        def boom(touches):
+            raise OSError("db down")
+
+        backend.touch_sessions = boom
+        assert cache.flush_touches() == 0
+        del backend.touch_sessions
+
+        assert cache.flush_touches() == 1
+
+    def test_close_flushes(self, backend, clock):
+        cache = CachedSessionStore(backend, flush_interval_seconds=60, clock=clock)
+        sid = _login(backend)
+        cache.get_session(sid)
+        cache.get_session(sid)
+
+        cache.close()
+
+        assert len(backend.touch_batches) == 1
+
+
+class TestInvalidation:
+    def test_invalidate_is_immediate(self, cache, backend):
+        sid = _login(backend)
+        cache.get_session(sid)
+
+        assert cache.invalidate_session(sid) is True
+
+        assert cache.get_session(sid) is None
+        assert cache.get_csrf_token(sid) is None
+
+    def test_invalidate_drops_pending_touch(self, cache, backend):
+        sid = _login(backend)
+        cache.get_session(sid)
+        cache.get_session(sid)
+
+        cache.invalidate_session(sid)
+
+        assert cache.flush_touches() == 0
+
+    def test_revoke_all_sessions_evicts_every_user_session(self, cache, backend):
+        alice = [_login(backend, "alice") for _ in range(2)]
+        bob = _login(backend, "bob")
+        for sid in [*alice, bob]:
+            cache.get_session(sid)
+
+        assert cache.revoke_all_sessions("alice") == 2
+
+        assert all(cache.get_session(sid) is None for sid in alice)
+        assert cache.get_session(bob) is not None
+
+    def test_rotate_evicts_old_and_caches_new(self, cache, backend):
+        old = _login(backend)
+        cache.get_session(old)
+
+        new = cache.rotate_session_id(old)
+
+        assert new is not None
+        assert cache.get_session(old) is None
+        calls = backend.get_calls
+        assert cache.get_csrf_token(new["session_id"]) == new["csrf_token"]
+        assert backend.get_calls == calls
+
+
+class TestRevocationDuringLoad:
+    """A load that straddles a revocation is returned but never cached."""
+
+    @staticmethod
+    def _revoke_mid_load(backend, revoke) -> None:
+        load = backend.get_session
+
+        def get_session(session_id):
+            record = load(session_id)
+            revoke()  # finishes before the load's result is cached
+            return record
+
+        backend.get_session = get_session
+
+    def test_invalidate_during_load(self, cache, backend):
+        sid = _login(backend)
+        self._revoke_mid_load(backend, lambda: cache.invalidate_session(sid))
+
+        assert cache.get_session(sid) is not None
+        assert len(cache) == 0
+        assert cache.get_session(sid) is None
+
+    def test_rotate_during_load(self, cache, backend):
+        sid = _login(backend)
+        rotated = []
+        self._revoke_mid_load(
+            backend, lambda: rotated.append(cache.rotate_session_id(sid))
+        )
+
+        cache.get_csrf_token(sid)
+
+        assert cache.get_session(sid) is None
+        assert cache.get_session(rotated[0]["session_id"]) is not None
+
+    def test_revoke_all_during_load(self, cache, backend):
+        sid = _login(backend, "alice")
+        self._revoke_mid_load(backend, lambda: cache.revoke_all_sessions("alice"))
+
+        cache.get_session(sid)
+
+        assert len(cache) == 0
+        assert cache.get_session(sid) is None
+
+    def test_mark_reauth_during_load(self, cache, backend):
+        sid = _login(backend)
+        self._revoke_mid_load(backend, lambda: cache.mark_reauth(sid))
+
+        cache.get_session(sid)
+
+        assert len(cache) == 0
+        assert cache.is_recently_reauthed(sid)
+
+    def test_revocation_of_other_session_keeps_load(self, cache, backend):
+        sid, other = _login(backend), _login(backend, "bob")
+        self._revoke_mid_load(backend, lambda: cache.invalidate_session(other))
+
+        cache.get_session(sid)
+
+        assert len(cache) == 1
+
+    def test_failed_load_releases_tombstones(self, cache, backend):
+        sid = _login(backend)
+        cache.invalidate_session(_login(backend))
+
+        def boom(session_id):
+            raise RuntimeError("db down")
+
+        load, backend.get_session = backend.get_session, boom
+        with pytest.raises(RuntimeError):
+            cache.get_session(sid)
+        backend.get_session = load
+
+        cache.get_session(sid)
+        assert len(cache) == 1
+
+
+class TestExpiry:
+    def test_ttl_expiry_reloads_from_backend(self, cache, backend, clock):
+        sid = _login(backend)
+        cache.get_session(sid)
+        clock.advance(seconds=6)
+
+        cache.get_session(sid)
+
+        assert backend.get_calls == 2
+
+    def test_idle_timeout_rechecked_on_hit(self, backend, clock):
+        cache = CachedSessionStore(
+            backend, ttl_seconds=3600, flush_interval_seconds=0, clock=clock
+        )
+        sid = _login(backend)
+        cache.get_session(sid)
+        backend.revoked.add(sid)  # the reload must come back empty
+        clock.advance(minutes=16)
+
+        assert cache.get_session(sid) is None
+
+    def test_lru_bound(self, backend, clock):
+        cache = CachedSessionStore(
+            backend, max_entries=2, flush_interval_seconds=0, clock=clock
+        )
+        for i in range(3):
+            cache.get_session(_login(backend, f"user{i}"))
+
+        assert len(cache) == 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"ttl_seconds": 0}, {"max_entries": 0}, {"flush_interval_seconds": -1}],
+    )
+    def test_invalid_settings_raise(self, backend, kwargs):
+        with pytest.raises(ValueError):
+            CachedSessionStore(backend, **kwargs)
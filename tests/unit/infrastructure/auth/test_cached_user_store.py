@@ -0,0 +1,243 @@
+"""Unit tests for infrastructure.auth.cached_user_store.
+
+Contract:
+1. get_user is served from memory within the TTL (one backend lookup)
+2. Only existing users are cached (registrations elsewhere are seen at once)
+3. update_profile / set_password / add_user invalidate the entry, including
+   a load already in flight
+4. Credentials and lockout state always go to the backend
+5. user_store delegates to a configured backend
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from infrastructure.auth import user_store
+from infrastructure.auth.cached_user_store import CachedUserStore
+from infrastructure.auth.user_store import UserRecord
+
+from tests.helpers.fake_clock import FakeClock
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+class FakeBackend:
+    """In-memory user backend counting round trips."""
+
+    def __init__(self) -> None:
+        self.users: dict[str, UserRecord] = {}
+        self.failures: dict[str, int] = {}
+        self.get_calls = 0
+        self.credential_calls = 0
+
+    def get_user(self, username: str) -> UserRecord | None:
+        self.get_calls += 1
+        record = self.users.get(username)
+        return record.copy() if record is not None else None
+
+    def get_credentials(self, username: str) -> tuple[bytes, bytes] | None:
+        self.credential_calls += 1
+        record = self.users.get(username)
+        if record is None:
+            return None
+        return record["password_hash"], record["salt"]
+
+    def add_user(self, username: str, record: UserRecord) -> bool:
+        if username in self.users:
+            return False
+        self.users[username] = record.copy()
+        return True
+
+    def update_profile(self, username: str, name: str, email: str) -> bool:
+        if username not in self.users:
+            return False
+        self.users[username].update(name=name, email=email)
+        return True
+
+    def set_password(self, username: str, password_hash: bytes, salt: bytes) -> bool:
+        if username not in self.users:
+            return False
+        self.users[username].update(password_hash=password_hash, salt=salt)
+        return True
+
+    def is_locked(self, username: str) -> tuple[bool, datetime | None]:
+        return self.failures.get(username, 0) >= 3, None
+
+    def record_failed_attempt(self, username: str) -> tuple[bool, datetime | None]:
+        self.failures[username] = self.failures.get(username, 0) + 1
+        return self.is_locked(username)
+
+    def clear_failed_attempts(self, username: str) -> None:
+        self.failures.pop(username, None)
+
+    def reset(self) -> None:
+        self.users.clear()
+        self.failures.clear()
+
+
+def _record(name: str = "Alice") -> UserRecord:
+    return UserRecord(
+        password_hash=b"hash", salt=b"salt", name=name, email="a@example.com"
+    )
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def backend() -> FakeBackend:
+    return FakeBackend()
+
+
+@pytest.fixture()
+def cache(backend: FakeBackend, clock: FakeClock) -> CachedUserStore:
+    return CachedUserStore(backend, ttl_seconds=30, clock=clock)
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+class TestReadThrough:
+    def test_hits_within_ttl_share_one_lookup(self, cache, backend):
+        backend.add_user("alice", _record())
+
+        first = cache.get_user("alice")
+        second = cache.get_user("alice")
+
+        assert first == second == _record()
+        assert backend.get_calls == 1
+
+    def test_ttl_expiry_reloads(self, cache, backend, clock):
+        backend.add_user("alice", _record())
+        cache.get_user("alice")
+        clock.advance(seconds=31)
+
+        cache.get_user("alice")
+
+        assert backend.get_calls == 2
+
+    def test_missing_users_are_not_cached(self, cache, backend):
+        assert cache.get_user("bob") is None
+        backend.add_user("bob", _record("Bob"))  # registered on another worker
+
+        assert cache.get_user("bob") is not None
+
+    def test_returned_records_are_copies(self, cache, backend):
+        backend.add_user("alice", _record())
+        cache.get_user("alice")["name"] = "Mallory"
+
+        assert cache.get_user("alice")["name"] == "Alice"
+
+    def test_lru_bound(self, backend, clock):
+        cache = CachedUserStore(backend, max_entries=2, clock=clock)
+        for i in range(3):
+            backend.add_user(f"user{i}", _record())
+            cache.get_user(f"user{i}")
+
+        assert len(cache) == 2
+
+    @pytest.mark.parametrize("kwargs", [{"ttl_seconds": 0}, {"max_entries": 0}])
+    def test_invalid_settings_raise(self, backend, kwargs):
+        with pytest.raises(ValueError):
+            CachedUserStore(backend, **kwargs)
+
+
+class TestInvalidation:
+    def test_profile_update_is_visible_immediately(self, cache, backend):
+        backend.add_user("alice", _record())
+        cache.get_user("alice")
+
+        assert cache.update_profile("alice", "Alice B", "b@example.com") is True
+
+        assert cache.get_user("alice")["name"] == "Alice B"
+
+    def test_password_change_drops_entry(self, cache, backend):
+        backend.add_user("alice", _record())
+        cache.get_user("alice")
+
+        cache.set_password("alice", b"new", b"salt2")
+
+        assert len(cache) == 0
+        assert cache.get_user("alice")["password_hash"] == b"new"
+
+    def test_write_during_load_is_not_cached_stale(self, cache, backend):
+        backend.add_user("alice", _record())
+        load = backend.get_user
+
+        def get_user(username):
+            record = load(username)  # read before the concurrent write
+            cache.update_profile("alice", "Alice B", "b@example.com")
+            return record
+
+        backend.get_user = get_user
+        assert cache.get_user("alice")["name"] == "Alice"
+        backend.get_user = load
+
+        assert len(cache) == 0
+        assert cache.get_user("alice")["name"] == "Alice B"
+
+    def test_write_to_other_user_during_load_keeps_entry(self, cache, backend):
+        backend.add_user("alice", _record())
+        backend.add_user("bob", _record("Bob"))
+        load = backend.get_user
+
+        def get_user(username):
+            cache.set_password("bob", b"new", b"salt2")
+            return load(username)
+
+        backend.get_user = get_user
+        cache.get_user("alice")
+
+        assert len(cache) == 1
+
+
+class TestPassThrough:
+    def test_credentials_never_cached(self, cache, backend):
+        backend.add_user("alice", _record())
+        cache.get_credentials("alice")
+        cache.get_credentials("alice")
+
+        assert backend.credential_calls == 2
+
+    def test_lockout_delegated(self, cache, backend):
+        for _ in range(3):
+            cache.record_failed_attempt("alice")
+
+        assert cache.is_locked("alice") == (True, None)
+        cache.clear_failed_attempts("alice")
+        assert cache.is_locked("alice") == (False, None)
+
+
+class TestUserStoreDelegation:
+    @pytest.fixture(autouse=True)
+    def _configured(self, cache):
+        user_store.configure_store(cache)
+        yield
+        user_store.configure_store(None)
+        user_store.reset_stores()
+
+    def test_register_login_and_profile_go_through_backend(self, backend):
+        assert user_store.create_user("erin", "S3cret!pw", "Erin", "e@example.com")
+        assert "erin" in backend.users
+        assert user_store.create_user("erin", "other", "Erin", "e@example.com") is False
+
+        assert user_store.verify_credentials("erin", "S3cret!pw") is True
+        assert user_store.verify_credentials("erin", "wrong") is False
+        assert user_store.update_user_profile("erin", "Erin B", "e@example.com")
+        assert user_store.get_user_profile("erin")["name"] == "Erin B"
+
+    def test_password_change_applies_to_next_login(self):
+        user_store.create_user("erin", "S3cret!pw", "Erin", "e@example.com")
+
+        assert user_store.change_password("erin", "N3w!secret") is True
+
+        assert user_store.verify_credentials("erin", "S3cret!pw") is False
+        assert user_store.verify_credentials("erin", "N3w!secret") is True
+
+    def test_no_in_memory_demo_seeding(self):
+        assert user_store.user_exists("alice") is False
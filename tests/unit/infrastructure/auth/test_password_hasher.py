@@ -0,0 +1,115 @@
+"""Unit tests for infrastructure.auth.password_hasher.
+
+Contract:
+1. Pool hashes equal the direct PBKDF2 hash
+2. Work beyond workers + max_queue is rejected immediately (PasswordHasherBusy)
+3. A hash exceeding the timeout raises PasswordHasherBusy
+4. stats() reports completed / rejected / in-flight counts
+5. The process-wide pool is lazy and replaceable
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from infrastructure.auth import password_hasher
+from infrastructure.auth.password_hasher import (
+    PasswordHasherBusy,
+    PasswordHashPool,
+    configure_hasher,
+    get_hasher,
+    pbkdf2,
+)
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+@pytest.fixture()
+def blocked_pbkdf2(monkeypatch):
+    """Make pool hashes block until the returned event is set."""
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def slow(password: str, salt: bytes) -> bytes:
+        started.release()
+        release.wait(5)
+        return b"hash"
+
+    monkeypatch.setattr(password_hasher, "pbkdf2", slow)
+    yield release, started
+    release.set()
+
+
+def _hash_in_thread(pool: PasswordHashPool) -> threading.Thread:
+    thread = threading.Thread(target=pool.hash, args=("pw", b"salt"), daemon=True)
+    thread.start()
+    return thread
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+class TestPasswordHashPool:
+    def test_hash_matches_direct_pbkdf2(self):
+        pool = PasswordHashPool(workers=1, max_queue=0)
+
+        assert pool.hash("secret", b"salt") == pbkdf2("secret", b"salt")
+        assert pool.stats()["completed"] == 1
+
+    def test_rejects_when_saturated(self, blocked_pbkdf2):
+        release, started = blocked_pbkdf2
+        pool = PasswordHashPool(workers=1, max_queue=1)
+        running = _hash_in_thread(pool)
+        assert started.acquire(timeout=5)
+        queued = _hash_in_thread(pool)
+
+        with pytest.raises(PasswordHasherBusy):
+            pool.hash("pw", b"salt")
+
+        stats = pool.stats()
+        assert stats["rejected"] == 1
+        assert stats["in_flight"] == 2
+        assert stats["queued"] == 1
+        release.set()
+        running.join(5)
+        queued.join(5)
+        assert pool.stats()["in_flight"] == 0
+
+    def test_capacity_is_released_after_work(self, blocked_pbkdf2):
+        release, _ = blocked_pbkdf2
+        release.set()
+        pool = PasswordHashPool(workers=1, max_queue=0)
+
+        for _ in range(3):
+            assert pool.hash("pw", b"salt") == b"hash"
+
+    def test_timeout_raises_busy(self, blocked_pbkdf2):
+        pool = PasswordHashPool(workers=1, max_queue=0, timeout_seconds=0.05)
+
+        with pytest.raises(PasswordHasherBusy):
+            pool.hash("pw", b"salt")
+
+        assert pool.stats()["timed_out"] == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"workers": 0}, {"max_queue": -1}, {"timeout_seconds": 0}],
+    )
+    def test_invalid_settings_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            PasswordHashPool(**kwargs)
+
+
+class TestProcessWidePool:
+    def test_lazy_from_env_and_replaceable(self, monkeypatch):
+        monkeypatch.setenv("PASSWORD_HASH_WORKERS", "3")
+        configure_hasher(None)
+        try:
+            assert get_hasher().stats()["workers"] == 3
+            custom = PasswordHashPool(workers=1)
+            configure_hasher(custom)
+            assert get_hasher() is custom
+        finally:
+            configure_hasher(None)
@@ -0,0 +1,121 @@
+"""Unit tests for infrastructure.auth.session_janitor.
+
+Contract:
+1. run_once purges with the configured batch size
+2. With a session factory, a pass only runs while holding the advisory lock
+3. The lock is released after the pass, even when it fails
+4. The background thread survives failing passes and stops on close
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from infrastructure.auth.session_janitor import ADVISORY_LOCK_KEY, SessionJanitor
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+class FakeStore:
+    """Session store recording cleanup calls."""
+
+    def __init__(self, removed: int = 0, fail: bool = False) -> None:
+        self.removed = removed
+        self.fail = fail
+        self.batch_sizes: list[int] = []
+        self.called = threading.Event()
+
+    def cleanup_expired_sessions(self, *, batch_size: int = 1000) -> int:
+        self.batch_sizes.append(batch_size)
+        self.called.set()
+        if self.fail:
+            raise RuntimeError("db down")
+        return self.removed
+
+
+class FakeResult:
+    def __init__(self, value: bool) -> None:
+        self._value = value
+
+    def scalar(self) -> bool:
+        return self._value
+
+
+class FakeDbSession:
+    """Stands in for a SQLAlchemy session running advisory-lock queries."""
+
+    def __init__(self, acquired: bool) -> None:
+        self.acquired = acquired
+        self.statements: list[str] = []
+        self.closed = False
+
+    def execute(self, statement, params):
+        assert params == {"key": ADVISORY_LOCK_KEY}
+        self.statements.append(str(statement))
+        return FakeResult(self.acquired)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+class TestRunOnce:
+    def test_purges_with_batch_size(self) -> None:
+        store = FakeStore(removed=7)
+        janitor = SessionJanitor(store, batch_size=50)
+
+        assert janitor.run_once() == 7
+        assert store.batch_sizes == [50]
+
+    def test_runs_under_advisory_lock(self) -> None:
+        store = FakeStore(removed=3)
+        db = FakeDbSession(acquired=True)
+        janitor = SessionJanitor(store, session_factory=lambda: db)
+
+        assert janitor.run_once() == 3
+        assert "pg_try_advisory_lock" in db.statements[0]
+        assert "pg_advisory_unlock" in db.statements[1]
+        assert db.closed
+
+    def test_skips_when_lock_held_elsewhere(self) -> None:
+        store = FakeStore(removed=3)
+        db = FakeDbSession(acquired=False)
+        janitor = SessionJanitor(store, session_factory=lambda: db)
+
+        assert janitor.run_once() is None
+        assert store.batch_sizes == []
+        assert len(db.statements) == 1
+        assert db.closed
+
+    def test_releases_lock_when_pass_fails(self) -> None:
+        db = FakeDbSession(acquired=True)
+        janitor = SessionJanitor(FakeStore(fail=True), session_factory=lambda: db)
+
+        with pytest.raises(RuntimeError):
+            janitor.run_once()
+        assert "pg_advisory_unlock" in db.statements[-1]
+        assert db.closed
+
+
+class TestBackgroundThread:
+    def test_runs_periodically_and_stops(self) -> None:
+        store = FakeStore(fail=True)
+        janitor = SessionJanitor(store, interval_seconds=0.01)
+
+        janitor.start()
+        assert store.called.wait(timeout=2)
+        assert janitor.running  # a failing pass does not kill the thread
+
+        janitor.close()
+        assert not janitor.running
+
+
+class TestSettings:
+    @pytest.mark.parametrize("kwargs", [{"interval_seconds": 0}, {"batch_size": 0}])
+    def test_rejects_invalid_settings(self, kwargs) -> None:
+        with pytest.raises(ValueError):
+            SessionJanitor(FakeStore(), **kwargs)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 from infrastructure.auth import session_store
 from infrastructure.auth.session_store import (
@@ -224,3 +226,139 @@ class TestResetSessions:
         create_session("bob")
         reset_sessions()
         assert active_session_count() == 0
+
+
+# ── journal persistence ──────────────────────────────────────────────────────
+
+
+@pytest.fixture()
+def journal(tmp_path, monkeypatch):
+    """Point the journal at a temp file (starting empty)."""
+    path = tmp_path / "sessions.jsonl"
+    monkeypatch.setattr(session_store, "_STORE_PATH", path)
+    reset_sessions()
+    return path
+
+
+def _replay_from_disk() -> None:
+    """Simulate a restart: drop memory, replay the journal."""
+    with session_store._lock:
+        session_store._SESSIONS.clear()
+        session_store._journal_records[0] = 0
+        session_store._load_from_disk()
+
+
+class TestJournal:
+    def test_appends_one_line_per_mutation(self, journal):
+        rec = create_session("alice")
+        get_session(rec["session_id"])
+        mark_reauth(rec["session_id"])
+        invalidate_session(rec["session_id"])
+        ops = [json.loads(line)["op"] for line in journal.read_text().splitlines()]
+        assert ops == ["put", "touch", "reauth", "del"]
+
+    def test_replay_restores_sessions(self, journal, fake_clock):
+        kept = create_session("alice")
+        fake_clock.advance(minutes=1)
+        get_session(kept["session_id"])
+        mark_reauth(kept["session_id"])
+        gone = create_session("bob")
+        invalidate_session(gone["session_id"])
+        rotated = rotate_session_id(create_session("carol")["session_id"])
+        expected = {
+            kept["session_id"]: dict(get_session(kept["session_id"])),
+            rotated["session_id"]: dict(get_session(rotated["session_id"])),
+        }
+
+        _replay_from_disk()
+
+        assert {sid: dict(r) for sid, r in session_store._SESSIONS.items()} == expected
+
+    def test_skips_torn_lines(self, journal):
+        rec = create_session("alice")
+        with journal.open("a", encoding="utf-8") as fh:
+            fh.write('{"op":"del","sid":')
+
+        _replay_from_disk()
+
+        assert active_session_count() == 1
+        assert get_csrf_token(rec["session_id"]) == rec["csrf_token"]
+
+    def test_compacts_to_live_sessions(self, journal, monkeypatch):
+        monkeypatch.setattr(session_store, "JOURNAL_COMPACT_RECORDS", 10)
+        rec = create_session("alice")
+        for _ in range(20):
+            get_session(rec["session_id"])
+
+        assert len(journal.read_text().splitlines()) < 10
+        _replay_from_disk()
+        assert get_session(rec["session_id"]) is not None
+
+    def test_reset_truncates_journal(self, journal):
+        create_session("alice")
+        reset_sessions()
+        assert journal.read_text() == ""
+
+    def test_busy_journal_does_not_block_requests(self, journal):
+        with session_store._journal_lock:
+            rec = create_session("alice")  # returns without waiting
+            assert journal.read_text() == ""
+
+        session_store.flush_journal()
+
+        ops = [json.loads(line)["op"] for line in journal.read_text().splitlines()]
+        assert ops == ["put"]
+        assert json.loads(journal.read_text())["sid"] == rec["session_id"]
+
+
+class TestLegacyMigration:
+    """Sessions saved in the pre-journal ``.sessions.json`` format survive."""
+
+    @staticmethod
+    def _legacy_snapshot(sid: str = "abc") -> str:
+        return json.dumps(
+            {
+                sid: {
+                    "session_id": sid,
+                    "actor_id": "alice",
+                    "created_at": "2026-01-01T10:00:00+00:00",
+                    "last_seen_at": "2026-01-01T10:05:00+00:00",
+                    "reauth_at": None,
+                    "csrf_token": "csrf",
+                }
+            }
+        )
+
+    def test_migrates_default_legacy_file(self, tmp_path, monkeypatch):
+        path = tmp_path / ".sessions.jsonl"
+        legacy = tmp_path / ".sessions.json"
+        legacy.write_text(self._legacy_snapshot(), encoding="utf-8")
+        monkeypatch.setattr(session_store, "_STORE_PATH", path)
+
+        _replay_from_disk()
+
+        assert session_store._SESSIONS["abc"]["actor_id"] == "alice"
+        assert not legacy.exists()
+        assert json.loads(path.read_text())["op"] == "put"
+        _replay_from_disk()
+        assert get_csrf_token("abc") == "csrf"
+
+    def test_loads_legacy_content_at_configured_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "custom.json"
+        path.write_text(self._legacy_snapshot(), encoding="utf-8")
+        monkeypatch.setattr(session_store, "_STORE_PATH", path)
+
+        _replay_from_disk()
+
+        assert get_csrf_token("abc") == "csrf"
+        assert json.loads(path.read_text())["op"] == "put"
+
+    def test_custom_path_ignores_default_legacy_file(self, tmp_path, monkeypatch):
+        (tmp_path / ".sessions.json").write_text(
+            self._legacy_snapshot(), encoding="utf-8"
+        )
+        monkeypatch.setattr(session_store, "_STORE_PATH", tmp_path / "custom.jsonl")
+
+        _replay_from_disk()
+
+        assert active_session_count() == 0
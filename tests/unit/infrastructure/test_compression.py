@@ -0,0 +1,191 @@
+"""Unit tests for infrastructure.compression.
+
+Contract:
+1. negotiate() honours q-values and ``*``, preferring br over gzip
+2. Only text-like types at or above the size threshold are compressed
+3. Bodies with a strong ETag are compressed once and served from the cache
+4. The compressed-body cache is bounded by entry count and total size
+5. The process-wide compressor is built from env (on by default)
+"""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+
+import pytest
+from infrastructure import compression
+from infrastructure.compression import (
+    CompressedBodyCache,
+    ResponseCompressor,
+    weak_etag,
+)
+
+BODY = b'{"cards": [' + b'{"card_id": "c1", "name": "Scenario"}, ' * 200 + b"{}]}"
+
+
+class FakeBrotli:
+    """Stands in for the optional ``brotli`` package."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def compress(self, body: bytes, quality: int = 11) -> bytes:
+        self.calls += 1
+        return b"br:" + zlib.compress(body)
+
+
+@pytest.fixture()
+def gzip_only() -> ResponseCompressor:
+    return ResponseCompressor(min_size=100, brotli=None)
+
+
+@pytest.fixture()
+def with_brotli() -> ResponseCompressor:
+    return ResponseCompressor(min_size=100, brotli=FakeBrotli())
+
+
+class TestNegotiate:
+    @pytest.mark.parametrize("header", [None, "", "identity", "deflate", "gzip;q=0"])
+    def test_identity_when_nothing_acceptable(self, with_brotli, header):
+        assert with_brotli.negotiate(header) is None
+
+    def test_brotli_preferred_on_tie(self, with_brotli):
+        assert with_brotli.negotiate("gzip, deflate, br") == "br"
+
+    def test_client_quality_wins(self, with_brotli):
+        assert with_brotli.negotiate("br;q=0.5, gzip;q=0.9") == "gzip"
+
+    def test_wildcard(self, with_brotli, gzip_only):
+        assert with_brotli.negotiate("*") == "br"
+        assert with_brotli.negotiate("br;q=0, *;q=0.1") == "gzip"
+        assert gzip_only.negotiate("*") == "gzip"
+
+    def test_brotli_not_offered_without_package(self, gzip_only):
+        assert gzip_only.negotiate("br") is None
+        assert gzip_only.negotiate("br, gzip") == "gzip"
+
+    def test_malformed_quality_is_refused(self, gzip_only):
+        assert gzip_only.negotiate("gzip;q=high") is None
+
+
+class TestCompressible:
+    @pytest.mark.parametrize(
+        "content_type",
+        ["application/json", "image/svg+xml", "text/html; charset=utf-8"],
+    )
+    def test_text_types_above_threshold(self, gzip_only, content_type):
+        assert gzip_only.compressible(content_type, 100)
+
+    def test_small_bodies_skipped(self, gzip_only):
+        assert not gzip_only.compressible("application/json", 99)
+
+    @pytest.mark.parametrize("content_type", ["image/png", "", None])
+    def test_other_types_skipped(self, gzip_only, content_type):
+        assert not gzip_only.compressible(content_type, 10_000)
+
+    def test_negative_threshold_rejected(self):
+        with pytest.raises(ValueError, match="invalid response compression"):
+            ResponseCompressor(min_size=-1)
+
+
+class TestCompress:
+    def test_gzip_round_trip(self, gzip_only):
+        encoded = gzip_only.compress(BODY, "gzip")
+        assert len(encoded) < len(BODY)
+        assert gzip.decompress(encoded) == BODY
+
+    def test_gzip_output_is_deterministic(self, gzip_only):
+        assert gzip_only.compress(BODY, "gzip") == gzip_only.compress(BODY, "gzip")
+
+    def test_brotli_used_when_available(self, with_brotli):
+        assert with_brotli.compress(BODY, "br").startswith(b"br:")
+
+    def test_unknown_coding_rejected(self, gzip_only):
+        with pytest.raises(ValueError, match="unsupported content coding"):
+            gzip_only.compress(BODY, "br")
+
+    def test_strong_etag_body_compressed_once(self):
+        fake = FakeBrotli()
+        compressor = ResponseCompressor(brotli=fake)
+
+        first = compressor.compress(BODY, "br", etag='"h1"', content_type="x/y")
+        second = compressor.compress(BODY, "br", etag='"h1"', content_type="x/y")
+
+        assert first == second
+        assert fake.calls == 1
+        assert len(compressor.cache) == 1
+
+    def test_cache_keyed_by_coding(self, with_brotli):
+        with_brotli.compress(BODY, "br", etag='"h1"')
+        gz = with_brotli.compress(BODY, "gzip", etag='"h1"')
+        assert gzip.decompress(gz) == BODY
+        assert len(with_brotli.cache) == 2
+
+    @pytest.mark.parametrize("etag", ["", 'W/"h1"'])
+    def test_dynamic_bodies_not_cached(self, gzip_only, etag):
+        gzip_only.compress(BODY, "gzip", etag=etag)
+        assert len(gzip_only.cache) == 0
+
+
+class TestCompressedBodyCache:
+    def test_lru_eviction_by_count(self):
+        cache = CompressedBodyCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+
+    def test_bounded_by_total_size(self):
+        cache = CompressedBodyCache(max_bytes=10)
+        cache.put("a", b"x" * 6)
+        cache.put("b", b"y" * 6)
+        assert len(cache) == 1
+        assert cache.total_bytes == 6
+
+    def test_oversized_body_not_cached(self):
+        cache = CompressedBodyCache(max_bytes=4)
+        cache.put("a", b"x" * 5)
+        assert len(cache) == 0
+
+    def test_invalid_limits_rejected(self):
+        with pytest.raises(ValueError, match="cache limits must be positive"):
+            CompressedBodyCache(max_entries=0)
+
+
+def test_weak_etag():
+    assert weak_etag('"h1"') == 'W/"h1"'
+    assert weak_etag('W/"h1"') == 'W/"h1"'
+
+
+class TestProcessWideCompressor:
+    def setup_method(self):
+        self._previous = compression.get_response_compressor()
+
+    def teardown_method(self):
+        compression.configure_response_compressor(self._previous)
+
+    def test_enabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("HTTP_COMPRESSION", raising=False)
+        assert isinstance(compression._compressor_from_env(), ResponseCompressor)
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("HTTP_COMPRESSION", "0")
+        assert compression._compressor_from_env() is None
+
+    def test_threshold_from_env(self, monkeypatch):
+        monkeypatch.setenv("HTTP_COMPRESSION_MIN_BYTES", "10")
+        compressor = compression._compressor_from_env()
+        assert compressor.compressible("application/json", 10)
+
+    def test_invalid_env_falls_back_to_defaults(self, monkeypatch):
+        monkeypatch.setenv("HTTP_COMPRESSION_MIN_BYTES", "-5")
+        compressor = compression._compressor_from_env()
+        assert not compressor.compressible("application/json", 1023)
+        assert compressor.compressible("application/json", 1024)
+
+    def test_configured_compressor_is_returned(self, gzip_only):
+        compression.configure_response_compressor(gzip_only)
+        assert compression.get_response_compressor() is gzip_only
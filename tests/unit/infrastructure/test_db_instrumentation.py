@@ -0,0 +1,117 @@
+"""Unit tests for infrastructure.db.instrumentation.
+
+Contract:
+1. Every checkout records its wait time and pool saturation
+2. Checkouts that time out on a full pool are counted
+3. Statements are timed; slow ones are counted; failures leave no state
+4. Pool settings come from DB_* variables (defaults on invalid values)
+"""
+
+from __future__ import annotations
+
+import pytest
+from infrastructure.db import session as db_session
+from infrastructure.db.instrumentation import (
+    DbStats,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    eng = create_engine(
+        f"sqlite:///{tmp_path / 'db.sqlite'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield eng
+    eng.dispose()
+
+
+class TestPoolInstrumentation:
+    def test_records_checkout_and_saturation(self, engine) -> None:
+        stats = DbStats()
+        instrument_engine(engine, stats)
+
+        with engine.connect():
+            snapshot = stats.snapshot()
+
+        assert snapshot["checkouts"] == 1
+        assert snapshot["in_use_max"] == 1
+        assert snapshot["saturated_checkouts"] == 1  # pool of one, fully used
+
+    def test_counts_checkout_timeouts(self, engine) -> None:
+        stats = DbStats()
+        instrument_engine(engine, stats)
+
+        with engine.connect(), pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+        snapshot = stats.snapshot()
+        assert snapshot["checkout_timeouts"] == 1
+        assert snapshot["checkout_wait_seconds_max"] >= 0.05
+
+    def test_stats_survive_pool_recreation(self, engine) -> None:
+        stats = DbStats()
+        instrument_engine(engine, stats)
+
+        engine.dispose()
+
+        assert engine.pool.stats is stats
+
+
+class TestStatementInstrumentation:
+    def test_times_statements_and_counts_slow_ones(self, engine) -> None:
+        stats = DbStats(slow_query_ms=0)
+        instrument_engine(engine, stats)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        snapshot = stats.snapshot()
+        assert snapshot["statements"] == 2
+        assert snapshot["slow_statements"] == 2
+        assert snapshot["statement_seconds_max"] > 0
+
+    def test_failed_statement_is_not_recorded(self, engine) -> None:
+        stats = DbStats()
+        instrument_engine(engine, stats)
+
+        with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            assert conn.info["instrumentation.started"] == []
+
+        assert stats.snapshot()["statements"] == 0
+
+
+class TestPoolSettings:
+    def test_reads_env(self, monkeypatch) -> None:
+        monkeypatch.setenv("DB_POOL_SIZE", "20")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+        monkeypatch.setenv("DB_POOL_RECYCLE_SECONDS", "60")
+        monkeypatch.setenv("DB_POOL_TIMEOUT_SECONDS", "2.5")
+        monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "5000")
+
+        kwargs = db_session._pool_kwargs()
+
+        assert kwargs["poolclass"] is InstrumentedQueuePool
+        assert (kwargs["pool_size"], kwargs["max_overflow"]) == (20, 0)
+        assert (kwargs["pool_recycle"], kwargs["pool_timeout"]) == (60, 2.5)
+        assert kwargs["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+    def test_invalid_values_use_defaults(self, monkeypatch) -> None:
+        monkeypatch.setenv("DB_POOL_SIZE", "many")
+        monkeypatch.delenv("DB_STATEMENT_TIMEOUT_MS", raising=False)
+
+        kwargs = db_session._pool_kwargs()
+
+        assert kwargs["pool_size"] == db_session.DEFAULT_POOL_SIZE
+        assert "connect_args" not in kwargs
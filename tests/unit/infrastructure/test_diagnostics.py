@@ -0,0 +1,47 @@
+"""Unit tests for infrastructure.observability.diagnostics.
+
+Contract:
+1. Only ``Authorization: Bearer <ADMIN_DIAGNOSTICS_TOKEN>`` is authorized
+2. Without a configured token every request is refused
+3. The token is read from the environment, independent of request profiling
+"""
+
+from __future__ import annotations
+
+import pytest
+from infrastructure.observability import diagnostics
+from infrastructure.observability.diagnostics import (
+    configure_diagnostics_token,
+    diagnostics_authorized,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_token():
+    yield
+    configure_diagnostics_token(None)
+
+
+def test_only_the_bearer_token_is_authorized():
+    configure_diagnostics_token("s3cret")
+
+    assert diagnostics_authorized({"Authorization": "Bearer s3cret"})
+    assert not diagnostics_authorized({"Authorization": "Bearer nope"})
+    assert not diagnostics_authorized({"Authorization": "s3cret"})
+    assert not diagnostics_authorized({"X-Profile-Token": "s3cret"})
+    assert not diagnostics_authorized({})
+
+
+def test_refuses_everything_without_a_token():
+    configure_diagnostics_token(None)
+
+    assert not diagnostics_authorized({"Authorization": "Bearer "})
+    assert not diagnostics_authorized({"Authorization": "Bearer anything"})
+
+
+def test_token_loaded_from_env_without_profiling(monkeypatch):
+    monkeypatch.setenv("ADMIN_DIAGNOSTICS_TOKEN", "tok")
+    monkeypatch.delenv("REQUEST_PROFILING", raising=False)
+    monkeypatch.setattr(diagnostics, "_loaded", [False])
+
+    assert diagnostics_authorized({"Authorization": "Bearer tok"})
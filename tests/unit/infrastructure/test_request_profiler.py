@@ -0,0 +1,104 @@
+"""Unit tests for infrastructure.observability.request_profiler.
+
+Contract:
+1. Only the configured token authorizes profiling
+2. stop() writes a loadable .pstats file and keeps the newest N files
+3. One request is profiled at a time
+4. The profiler is disabled unless REQUEST_PROFILING and a token are set
+"""
+
+from __future__ import annotations
+
+import pstats
+
+import pytest
+from infrastructure.observability import request_profiler
+from infrastructure.observability.request_profiler import (
+    RequestProfiler,
+    presented_token,
+)
+
+
+def test_only_the_configured_token_is_authorized(tmp_path):
+    profiler = RequestProfiler("s3cret", tmp_path)
+
+    assert profiler.authorized("s3cret")
+    assert not profiler.authorized("nope")
+    assert not profiler.authorized("")
+    assert not profiler.authorized(None)
+
+
+def test_presented_token_prefers_header_over_cookie():
+    assert presented_token({"X-Profile-Token": "h"}, {"sb_profile": "c"}) == "h"
+    assert presented_token({}, {"sb_profile": "c"}) == "c"
+    assert presented_token({}, {}) == ""
+
+
+def test_stop_writes_pstats_and_applies_retention(tmp_path):
+    profiler = RequestProfiler("tok", tmp_path, keep=2)
+
+    paths = []
+    for label in ("GET /cards", "GET /cards/1", "GET /favorites"):
+        profile = profiler.start()
+        assert profile is not None
+        sum(range(100))
+        paths.append(profiler.stop(profile, label))
+
+    kept = sorted(tmp_path.glob("*.pstats"))
+    assert len(kept) == 2
+    assert not paths[0].exists()
+    assert paths[-1].name.endswith("-GET_favorites.pstats")
+    pstats.Stats(str(paths[-1]))  # loadable
+
+
+def test_only_one_request_is_profiled_at_a_time(tmp_path):
+    profiler = RequestProfiler("tok", tmp_path)
+
+    first = profiler.start()
+    assert first is not None
+    assert profiler.start() is None
+    profiler.stop(first, "first")
+
+    again = profiler.start()
+    assert again is not None
+    profiler.stop(again, "again")
+
+
+@pytest.mark.parametrize("keep", [0, -1])
+def test_invalid_settings_are_rejected(tmp_path, keep):
+    with pytest.raises(ValueError):
+        RequestProfiler("tok", tmp_path, keep=keep)
+    with pytest.raises(ValueError):
+        RequestProfiler("", tmp_path)
+
+
+class TestProfilerFromEnv:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("REQUEST_PROFILING", raising=False)
+        monkeypatch.setenv("REQUEST_PROFILING_TOKEN", "tok")
+
+        assert request_profiler._profiler_from_env() is None
+
+    def test_requires_a_token(self, monkeypatch):
+        monkeypatch.setenv("REQUEST_PROFILING", "1")
+        monkeypatch.delenv("REQUEST_PROFILING_TOKEN", raising=False)
+
+        assert request_profiler._profiler_from_env() is None
+
+    def test_reads_directory(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("REQUEST_PROFILING", "1")
+        monkeypatch.setenv("REQUEST_PROFILING_TOKEN", "tok")
+        monkeypatch.setenv("REQUEST_PROFILING_DIR", str(tmp_path))
+
+        profiler = request_profiler._profiler_from_env()
+
+        assert profiler is not None
+        assert profiler.output_dir == tmp_path
+        assert profiler.authorized("tok")
+
+    def test_invalid_keep_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("REQUEST_PROFILING", "1")
+        monkeypatch.setenv("REQUEST_PROFILING_TOKEN", "tok")
+        monkeypatch.setenv("REQUEST_PROFILING_KEEP", "many")
+
+        assert request_profiler._profiler_from_env() is not None
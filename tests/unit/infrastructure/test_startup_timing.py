@@ -0,0 +1,79 @@
+"""Unit tests for infrastructure.observability.startup.
+
+Contract:
+1. StartupTimer records each phase once, in call order, even on error
+2. parse_importtime() reads ``-X importtime`` lines and skips the rest
+3. slowest_* rank by self time (packages summed by top-level name)
+"""
+
+from __future__ import annotations
+
+import pytest
+from infrastructure.observability.startup import (
+    ImportRecord,
+    StartupTimer,
+    parse_importtime,
+    slowest_modules,
+    slowest_packages,
+)
+
+_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     encodings.idna
+import time:      3000 |       3500 |   gradio.utils
+import time:       400 |       3900 | gradio
+Traceback (most recent call last):
+import time:      2500 |       2500 | pandas.core
+import time:       100 |       2600 | pandas
+"""
+
+
+class TestStartupTimer:
+    def test_phases_in_call_order(self):
+        timer = StartupTimer()
+        with timer.phase("flask"):
+            pass
+        with timer.phase("gradio"):
+            pass
+
+        assert list(timer.as_dict()) == ["flask", "gradio"]
+        assert timer.summary().startswith("flask=")
+        assert "(total " in timer.summary()
+
+    def test_phase_recorded_when_block_raises(self):
+        timer = StartupTimer()
+        with pytest.raises(RuntimeError), timer.phase("gradio"):
+            raise RuntimeError("boom")
+
+        assert "gradio" in timer.as_dict()
+
+
+class TestImportTime:
+    def test_parse_skips_header_and_noise(self):
+        records = parse_importtime(_IMPORTTIME)
+
+        assert [r.module for r in records] == [
+            "encodings.idna",
+            "gradio.utils",
+            "gradio",
+            "pandas.core",
+            "pandas",
+        ]
+        assert records[1] == ImportRecord("gradio.utils", 0.003, 0.0035, 1)
+        assert records[0].depth == 2
+
+    def test_slowest_modules_by_self_time(self):
+        records = parse_importtime(_IMPORTTIME)
+
+        assert [r.module for r in slowest_modules(records, 2)] == [
+            "gradio.utils",
+            "pandas.core",
+        ]
+
+    def test_slowest_packages_sum_self_time(self):
+        records = parse_importtime(_IMPORTTIME)
+
+        assert slowest_packages(records, 2) == [
+            ("gradio", pytest.approx(0.0034)),
+            ("pandas", pytest.approx(0.0026)),
+        ]
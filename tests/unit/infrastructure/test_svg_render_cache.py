@@ -0,0 +1,62 @@
+"""Unit tests for LruSvgCache (bounded content-addressed SVG cache)."""
+
+from __future__ import annotations
+
+import pytest
+from infrastructure.maps.svg_render_cache import LruSvgCache
+
+
+class TestLruSvgCache:
+    def test_get_returns_stored_document(self):
+        cache = LruSvgCache()
+        cache.put("h1", "<svg/>")
+
+        assert cache.get("h1") == "<svg/>"
+        assert cache.get("missing") is None
+        assert (len(cache), cache.total_bytes) == (1, 6)
+
+    def test_evicts_least_recently_used_over_entry_limit(self):
+        cache = LruSvgCache(max_entries=2)
+        cache.put("a", "<a/>")
+        cache.put("b", "<b/>")
+        cache.get("a")  # "b" is now the oldest
+        cache.put("c", "<c/>")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "<a/>"
+        assert cache.get("c") == "<c/>"
+
+    def test_evicts_until_under_byte_limit(self):
+        cache = LruSvgCache(max_bytes=10)
+        cache.put("a", "x" * 4)
+        cache.put("b", "x" * 4)
+        cache.put("c", "x" * 4)
+
+        assert cache.get("a") is None
+        assert (len(cache), cache.total_bytes) == (2, 8)
+
+    def test_replacing_a_key_updates_size(self):
+        cache = LruSvgCache()
+        cache.put("a", "x" * 4)
+        cache.put("a", "x" * 2)
+
+        assert (len(cache), cache.total_bytes) == (1, 2)
+
+    def test_oversized_document_is_not_cached(self):
+        cache = LruSvgCache(max_bytes=3)
+        cache.put("a", "x" * 4)
+
+        assert cache.get("a") is None
+        assert cache.total_bytes == 0
+
+    def test_clear(self):
+        cache = LruSvgCache()
+        cache.put("a", "<a/>")
+        cache.clear()
+
+        assert (len(cache), cache.total_bytes) == (0, 0)
+
+    @pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"max_bytes": 0}])
+    def test_rejects_non_positive_limits(self, kwargs):
+        with pytest.raises(ValueError):
+            LruSvgCache(**kwargs)
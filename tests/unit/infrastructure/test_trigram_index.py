@@ -0,0 +1,53 @@
+"""Unit tests for TrigramIndex — the in-memory name search index."""
+
+from __future__ import annotations
+
+from infrastructure.repositories.trigram_index import TrigramIndex, trigrams
+
+
+class TestTrigrams:
+    def test_lower_cased_overlapping_grams(self):
+        assert trigrams("AbcD") == {"abc", "bcd"}
+
+    def test_short_text_has_no_grams(self):
+        assert trigrams("ab") == set()
+        assert trigrams("") == set()
+
+
+class TestTrigramIndex:
+    def _index(self) -> TrigramIndex:
+        index = TrigramIndex()
+        index.add("c1", "Batalla de Osgiliath")
+        index.add("c2", "Minas Tirith")
+        index.add("c3", "Alcantarillas de Osgiliath")
+        return index
+
+    def test_candidates_contain_all_substring_matches(self):
+        assert self._index().candidates("osgil") == {"c1", "c3"}
+
+    def test_case_insensitive(self):
+        assert self._index().candidates("TIRITH") == {"c2"}
+
+    def test_no_match_returns_empty_set(self):
+        assert self._index().candidates("mordor") == set()
+
+    def test_short_query_returns_none(self):
+        assert self._index().candidates("de") is None
+
+    def test_add_replaces_previous_text(self):
+        index = self._index()
+        index.add("c2", "Osgiliath")
+        assert index.candidates("tirith") == set()
+        assert index.candidates("osgil") == {"c1", "c2", "c3"}
+
+    def test_remove(self):
+        index = self._index()
+        index.remove("c1")
+        index.remove("missing")
+        assert index.candidates("osgil") == {"c3"}
+        assert len(index) == 2
+
+    def test_none_text_not_indexed(self):
+        index = TrigramIndex()
+        index.add("c1", None)
+        assert len(index) == 0
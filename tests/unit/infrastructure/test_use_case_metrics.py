@@ -0,0 +1,124 @@
+"""Unit tests for infrastructure.observability.use_case_metrics.
+
+Contract:
+1. Every execute() lands in the latency histogram of its use case
+2. Calls that raise are counted per exception class and re-raised
+3. The in-flight gauge covers the duration of the call
+4. Other attributes are delegated to the wrapped use case
+5. render_prometheus() emits cumulative buckets, sum, count and gauges
+"""
+
+from __future__ import annotations
+
+import pytest
+from domain.errors import NotFoundError
+from infrastructure.observability.use_case_metrics import (
+    InstrumentedUseCase,
+    UseCaseMetrics,
+    instrument_use_case,
+)
+
+
+class _FakeUseCase:
+    def __init__(self, metrics: UseCaseMetrics | None = None) -> None:
+        self._metrics = metrics
+        self.in_flight_seen: int | None = None
+
+    def execute(self, request: str) -> str:
+        if self._metrics is not None:
+            self.in_flight_seen = self._metrics.snapshot()["fake"]["in_flight"]
+        if request == "missing":
+            raise NotFoundError("card not found")
+        return request.upper()
+
+    def resolve_seed_preview(self, seed: int) -> int:
+        return seed * 2
+
+
+class TestInstrumentedUseCase:
+    def test_records_successful_calls(self) -> None:
+        metrics = UseCaseMetrics()
+        wrapped = InstrumentedUseCase("fake", _FakeUseCase(), metrics)
+
+        assert wrapped.execute("a") == "A"
+        assert wrapped.execute(request="b") == "B"
+
+        snap = metrics.snapshot()["fake"]
+        assert (snap["count"], snap["errors"], snap["in_flight"]) == (2, 0, 0)
+
+    def test_counts_and_reraises_errors(self) -> None:
+        metrics = UseCaseMetrics()
+        wrapped = InstrumentedUseCase("fake", _FakeUseCase(), metrics)
+
+        with pytest.raises(NotFoundError):
+            wrapped.execute("missing")
+
+        assert metrics.snapshot()["fake"]["errors"] == 1
+        assert (
+            'use_case_errors_total{use_case="fake",error="NotFoundError"} 1'
+            in metrics.render_prometheus()
+        )
+
+    def test_in_flight_gauge_spans_the_call(self) -> None:
+        metrics = UseCaseMetrics()
+        use_case = _FakeUseCase(metrics)
+        wrapped = InstrumentedUseCase("fake", use_case, metrics)
+
+        wrapped.execute("a")
+
+        assert use_case.in_flight_seen == 1
+        assert metrics.snapshot()["fake"]["in_flight"] == 0
+
+    def test_delegates_other_attributes(self) -> None:
+        use_case = _FakeUseCase()
+        wrapped = InstrumentedUseCase("fake", use_case, UseCaseMetrics())
+
+        assert wrapped.resolve_seed_preview(21) == 42
+        assert wrapped.wrapped is use_case
+
+    def test_instrument_use_case_returns_recording_proxy(self) -> None:
+        metrics = UseCaseMetrics()
+        use_case = _FakeUseCase()
+
+        wrapped = instrument_use_case("fake", use_case, metrics)
+
+        assert isinstance(wrapped, InstrumentedUseCase)
+        assert wrapped.execute("a") == "A"
+        assert metrics.snapshot()["fake"]["count"] == 1
+
+
+class TestPrometheusRendering:
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        metrics = UseCaseMetrics(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            metrics.started("list_cards")
+            metrics.finished("list_cards", seconds)
+
+        text = metrics.render_prometheus()
+
+        assert (
+            'use_case_duration_seconds_bucket{use_case="list_cards",le="0.1"} 2' in text
+        )
+        assert (
+            'use_case_duration_seconds_bucket{use_case="list_cards",le="1.0"} 3' in text
+        )
+        assert (
+            'use_case_duration_seconds_bucket{use_case="list_cards",le="+Inf"} 4'
+            in text
+        )
+        assert 'use_case_duration_seconds_count{use_case="list_cards"} 4' in text
+        assert 'use_case_duration_seconds_sum{use_case="list_cards"} 3.65' in text
+        assert 'use_case_in_flight{use_case="list_cards"} 0' in text
+        assert "# TYPE use_case_duration_seconds histogram" in text
+
+    def test_registered_use_cases_are_exposed_before_first_call(self) -> None:
+        metrics = UseCaseMetrics()
+        metrics.register("get_card")
+
+        assert 'use_case_duration_seconds_count{use_case="get_card"} 0' in (
+            metrics.render_prometheus()
+        )
+
+    def test_rejects_unsorted_buckets(self) -> None:
+        with pytest.raises(ValueError):
+            UseCaseMetrics(buckets=(1.0, 0.1))
@@ -2,14 +2,62 @@
 
 from __future__ import annotations
 
+import random
+
+import pytest
 from domain.maps.collision import (
+    SpatialGrid,
     find_first_collision,
     has_no_collisions,
+    shape_geometry,
     shape_in_bounds,
     shapes_overlap,
 )
 
 
+def _brute_force_first_collision(shapes: list[dict]) -> tuple[int, int] | None:
+    for i in range(len(shapes)):
+        for j in range(i + 1, len(shapes)):
+            if shapes_overlap(shapes[i], shapes[j]):
+                return (i, j)
+    return None
+
+
+def _random_layout(rng: random.Random, n: int, size: int = 3000) -> list[dict]:
+    shapes: list[dict] = []
+    for _ in range(n):
+        roll = rng.random()
+        if roll < 0.2:
+            x, y = rng.randint(0, size - 300), rng.randint(0, size - 300)
+            points = [
+                {"x": x + rng.randint(0, 300), "y": y + rng.randint(0, 300)}
+                for _ in range(rng.randint(3, 6))
+            ]
+            shapes.append({"type": "polygon", "points": points})
+        elif roll < 0.6:
+            w, h = rng.randint(20, 300), rng.randint(20, 300)
+            shapes.append(
+                {
+                    "type": "rect",
+                    "x": rng.randint(0, size - w),
+                    "y": rng.randint(0, size - h),
+                    "width": w,
+                    "height": h,
+                }
+            )
+        else:
+            r = rng.randint(10, 150)
+            shapes.append(
+                {
+                    "type": "circle",
+                    "cx": rng.randint(r, size - r),
+                    "cy": rng.randint(r, size - r),
+                    "r": r,
+                }
+            )
+    return shapes
+
+
 # =============================================================================
 # RECT x RECT
 # =============================================================================
@@ -121,29 +169,133 @@ class TestRectCircleOverlap:
 
 
 # =============================================================================
-# POLYGON (skip / conservative)
+# POLYGON (SAT)
 # =============================================================================
-class TestPolygonOverlap:
-    """Polygons are conservatively treated as non-overlapping."""
+TRIANGLE = {
+    "type": "polygon",
+    "points": [{"x": 0, "y": 0}, {"x": 100, "y": 0}, {"x": 0, "y": 100}],
+}
 
-    def test_polygon_vs_rect_returns_false(self) -> None:
-        poly = {
-            "type": "polygon",
-            "points": [{"x": 0, "y": 0}, {"x": 50, "y": 0}, {"x": 25, "y": 50}],
-        }
-        rect = {"type": "rect", "x": 0, "y": 0, "width": 100, "height": 100}
-        assert not shapes_overlap(poly, rect)
 
-    def test_polygon_vs_polygon_returns_false(self) -> None:
-        a = {
-            "type": "polygon",
-            "points": [{"x": 0, "y": 0}, {"x": 50, "y": 0}, {"x": 25, "y": 50}],
-        }
-        b = {
-            "type": "polygon",
-            "points": [{"x": 10, "y": 10}, {"x": 60, "y": 10}, {"x": 35, "y": 60}],
-        }
-        assert not shapes_overlap(a, b)
+def _polygon(*points: tuple[int, int]) -> dict:
+    return {"type": "polygon", "points": [{"x": x, "y": y} for x, y in points]}
+
+
+class TestPolygonOverlap:
+    """Polygon pairs are tested with separating axes on the convex hull."""
+
+    def test_polygon_vs_rect_overlap(self) -> None:
+        rect = {"type": "rect", "x": 20, "y": 20, "width": 100, "height": 100}
+        assert shapes_overlap(TRIANGLE, rect)
+        assert shapes_overlap(rect, TRIANGLE)
+
+    def test_polygon_vs_rect_separated_by_hypotenuse(self) -> None:
+        # Boxes overlap, but the rect sits beyond the diagonal edge.
+        rect = {"type": "rect", "x": 70, "y": 70, "width": 50, "height": 50}
+        assert not shapes_overlap(TRIANGLE, rect)
+
+    def test_polygon_vs_rect_clearance(self) -> None:
+        rect = {"type": "rect", "x": 105, "y": 0, "width": 50, "height": 50}
+        assert shapes_overlap(TRIANGLE, rect, clearance=10)
+        assert not shapes_overlap(TRIANGLE, rect, clearance=5)
+
+    def test_polygon_vs_polygon_overlap(self) -> None:
+        other = _polygon((10, 10), (60, 10), (35, 60))
+        assert shapes_overlap(TRIANGLE, other)
+
+    def test_polygon_vs_polygon_separated_diagonally(self) -> None:
+        other = _polygon((100, 100), (60, 100), (100, 60))
+        assert not shapes_overlap(TRIANGLE, other)
+
+    def test_polygon_vs_circle_overlap(self) -> None:
+        circle = {"type": "circle", "cx": 60, "cy": 60, "r": 20}
+        assert shapes_overlap(TRIANGLE, circle)
+        assert shapes_overlap(circle, TRIANGLE)
+
+    def test_polygon_vs_circle_near_vertex(self) -> None:
+        # Beyond the right-angle vertex: only the vertex axis separates.
+        far = {"type": "circle", "cx": -20, "cy": -20, "r": 10}
+        near = {"type": "circle", "cx": -10, "cy": -10, "r": 10}
+        assert not shapes_overlap(TRIANGLE, far, clearance=10)
+        assert shapes_overlap(TRIANGLE, near, clearance=10)
+
+    def test_concave_polygon_uses_hull(self) -> None:
+        # U shape: the rect sits inside the notch, so the hull catches it.
+        u_shape = _polygon(
+            (0, 0), (30, 0), (30, 70), (70, 70), (70, 0), (100, 0), (100, 100), (0, 100)
+        )
+        rect = {"type": "rect", "x": 40, "y": 10, "width": 20, "height": 20}
+        assert shapes_overlap(u_shape, rect, clearance=0)
+
+    def test_collinear_polygon(self) -> None:
+        line = _polygon((0, 50), (50, 50), (100, 50))
+        rect = {"type": "rect", "x": 40, "y": 40, "width": 20, "height": 20}
+        assert shapes_overlap(line, rect)
+
+    def test_unknown_type_never_overlaps(self) -> None:
+        assert not shapes_overlap(TRIANGLE, {"type": "hexagon"})
+
+
+class TestDegeneratePolygonOverlap:
+    """Polygons whose hull collapses to a point or a segment (<= 2 points)."""
+
+    def test_point_inside_rect(self) -> None:
+        rect = {"type": "rect", "x": 0, "y": 0, "width": 100, "height": 100}
+        assert shapes_overlap(_polygon((50, 50)), rect)
+
+    def test_point_beyond_hypotenuse(self) -> None:
+        point = _polygon((60, 60), (60, 60))
+        assert not shapes_overlap(point, TRIANGLE, clearance=0)
+        assert not shapes_overlap(TRIANGLE, point, clearance=0)
+
+    def test_segment_parallel_to_hypotenuse(self) -> None:
+        # 20 / sqrt(2) ~= 14.1 mm from the diagonal edge.
+        segment = _polygon((70, 50), (50, 70))
+        assert not shapes_overlap(segment, TRIANGLE, clearance=10)
+        assert shapes_overlap(segment, TRIANGLE, clearance=20)
+
+    def test_crossing_segments(self) -> None:
+        assert shapes_overlap(
+            _polygon((0, 0), (100, 100)), _polygon((0, 100), (100, 0))
+        )
+
+    def test_point_vs_circle_uses_vertex_axis(self) -> None:
+        # Distance from the point to the center is 20 * sqrt(2) ~= 28.3 mm.
+        point = _polygon((0, 0))
+        circle = {"type": "circle", "cx": 20, "cy": 20, "r": 20}
+        assert not shapes_overlap(point, circle, clearance=5)
+        assert shapes_overlap(circle, point, clearance=10)
+
+    def test_point_at_circle_center(self) -> None:
+        circle = {"type": "circle", "cx": 50, "cy": 50, "r": 5}
+        assert shapes_overlap(_polygon((50, 50)), circle)
+
+
+class TestShapeGeometry:
+    """Precomputed collision data."""
+
+    def test_polygon_hull_drops_interior_points(self) -> None:
+        geometry = shape_geometry(_polygon((0, 0), (10, 0), (5, 2), (10, 10), (0, 10)))
+        assert geometry is not None
+        assert geometry.bounds == (0, 0, 10, 10)
+        assert set(geometry.hull) == {(0, 0), (10, 0), (10, 10), (0, 10)}
+        assert len(geometry.axes) == 4
+
+    def test_single_point_hull_has_no_axes(self) -> None:
+        geometry = shape_geometry(_polygon((5, 5), (5, 5)))
+        assert geometry is not None
+        assert geometry.hull == ((5, 5),)
+        assert geometry.axes == ()
+
+    def test_segment_hull_has_normal_and_direction_axes(self) -> None:
+        geometry = shape_geometry(_polygon((0, 0), (10, 0)))
+        assert geometry is not None
+        assert geometry.hull == ((0, 0), (10, 0))
+        assert geometry.axes == ((0.0, 1.0), (1.0, 0.0))
+
+    def test_unsupported_shapes_have_no_geometry(self) -> None:
+        assert shape_geometry({"type": "polygon", "points": []}) is None
+        assert shape_geometry({"type": "hexagon"}) is None
 
 
 # =============================================================================
@@ -183,6 +335,101 @@ class TestFindFirstCollision:
         shapes = [{"type": "rect", "x": 0, "y": 0, "width": 50, "height": 50}]
         assert find_first_collision(shapes) is None
 
+    def test_reports_lowest_pair_not_first_detected(self) -> None:
+        shapes = [
+            {"type": "rect", "x": 0, "y": 0, "width": 100, "height": 100},
+            {"type": "rect", "x": 1000, "y": 1000, "width": 100, "height": 100},
+            {"type": "rect", "x": 1050, "y": 1050, "width": 100, "height": 100},
+            {"type": "rect", "x": 50, "y": 50, "width": 100, "height": 100},
+        ]
+        # (1, 2) is seen first while scanning, but (0, 3) sorts first.
+        assert find_first_collision(shapes) == (0, 3)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_brute_force_scan(self, seed: int) -> None:
+        rng = random.Random(seed)
+        shapes = _random_layout(rng, rng.randint(2, 120))
+        expected = _brute_force_first_collision(shapes)
+        assert find_first_collision(shapes) == expected
+        assert has_no_collisions(shapes) == (expected is None)
+
+
+# =============================================================================
+# SpatialGrid broad phase
+# =============================================================================
+class TestSpatialGrid:
+    """Tests for the uniform-grid broad phase."""
+
+    def test_candidates_are_only_nearby_shapes(self) -> None:
+        grid = SpatialGrid(cell_size=100)
+        grid.insert(0, {"type": "rect", "x": 0, "y": 0, "width": 50, "height": 50})
+        grid.insert(1, {"type": "circle", "cx": 2000, "cy": 2000, "r": 40})
+        probe = {"type": "rect", "x": 55, "y": 0, "width": 30, "height": 30}
+
+        assert grid.candidates(probe) == [0]
+        assert grid.first_collision(probe) == 0
+
+    def test_clearance_reaches_into_neighbour_cells(self) -> None:
+        grid = SpatialGrid(clearance=10, cell_size=100)
+        grid.insert(0, {"type": "rect", "x": 0, "y": 0, "width": 95, "height": 50})
+        probe = {"type": "rect", "x": 100, "y": 0, "width": 50, "height": 50}
+
+        assert grid.collides(probe)
+
+    def test_allow_overlap_shapes_are_not_indexed(self) -> None:
+        grid = SpatialGrid()
+        grid.insert(
+            0,
+            {
+                "type": "rect",
+                "x": 0,
+                "y": 0,
+                "width": 100,
+                "height": 100,
+                "allow_overlap": True,
+            },
+        )
+
+        assert len(grid) == 0
+        assert not grid.collides(
+            {"type": "rect", "x": 0, "y": 0, "width": 100, "height": 100}
+        )
+
+    @pytest.mark.parametrize(
+        "shape",
+        [{"type": "hexagon"}, {"type": "polygon", "points": []}],
+        ids=["unknown-type", "empty-polygon"],
+    )
+    def test_shapes_without_bounds_are_not_indexed(self, shape: dict) -> None:
+        grid = SpatialGrid()
+        grid.insert(0, shape)
+
+        assert len(grid) == 0
+        assert grid.candidates(shape) == []
+
+    @pytest.mark.parametrize(
+        "shape",
+        [{"type": "hexagon"}, {"type": "polygon", "points": []}],
+        ids=["unknown-type", "empty-polygon"],
+    )
+    def test_query_without_bounds_finds_nothing(self, shape: dict) -> None:
+        grid = SpatialGrid()
+        grid.insert(0, {"type": "rect", "x": 0, "y": 0, "width": 100, "height": 100})
+
+        assert grid.candidates(shape) == []
+        assert grid.first_collision(shape) is None
+        assert not grid.collides(shape)
+
+    def test_negative_coordinates(self) -> None:
+        grid = SpatialGrid(cell_size=100)
+        grid.insert(0, {"type": "circle", "cx": -30, "cy": -30, "r": 50})
+
+        assert grid.collides({"type": "circle", "cx": 10, "cy": 10, "r": 10})
+
+    def test_rejects_non_positive_cell_size(self) -> None:
+        with pytest.raises(ValueError):
+            SpatialGrid(cell_size=0)
+
 
 # =============================================================================
 # has_no_collisions